@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import json
-import tomllib
 import uuid
+from dataclasses import replace
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -23,6 +23,7 @@ from dockyard.models import (
     SaveInput,
     VerificationState,
     checkpoint_to_jsonable,
+    review_item_to_jsonable,
     utc_now_iso,
 )
 from dockyard.runner import run_commands
@@ -265,6 +266,9 @@ def _load_template_data(template_path: str | None) -> dict:
     except (OSError, UnicodeDecodeError) as exc:
         raise DockyardError(f"Failed to read template: {path}") from exc
     suffix = path.suffix.lower()
+    # tomllib is only needed when a config/template file exists.
+    import tomllib
+
     try:
         parsed: dict[str, Any]
         if suffix == ".json":
@@ -441,6 +445,11 @@ def root_callback(
 @app.command("save")
 def save_command(
     root: str | None = typer.Option(None, "--root", help="Repository root override."),
+    branch: str | None = typer.Option(
+        None,
+        "--branch",
+        help="Record under this branch name; git state still comes from HEAD.",
+    ),
     editor: bool = typer.Option(False, "--editor", help="Open $EDITOR for decisions."),
     template: str | None = typer.Option(
         None,
@@ -466,13 +475,20 @@ def save_command(
     auto_review: bool = typer.Option(True, "--auto-review/--no-auto-review", help="Auto-create review when triggers fire."),
 ) -> None:
     """Create a new checkpoint for the current repo and branch."""
+    # Blank-option and template problems are pure argument/file errors; report
+    # them before opening the store or running the git inspection.
+    normalized_branch = _normalize_non_empty_option(branch, "--branch")
+    normalized_template = _normalize_non_empty_option(template, "--template")
+    template_data = _load_template_data(normalized_template)
     store, _ = _store()
     paths = resolve_paths()
     runtime_config = load_runtime_config(paths)
     snapshot = _resolve_repo_context(root=root, require_git=True)
     assert snapshot is not None
-    normalized_template = _normalize_non_empty_option(template, "--template")
-    template_data = _load_template_data(normalized_template)
+    if normalized_branch:
+        # Relabel only: HEAD sha and diff stats still describe the checked-out
+        # working tree, not the named branch.
+        snapshot = replace(snapshot, branch=normalized_branch)
 
     objective = objective or _template_or_default(template_data, "objective", None)
     decisions = decisions or _template_or_default(template_data, "decisions", None)
@@ -798,6 +814,7 @@ def review_add(
     checkpoint_id: str | None = typer.Option(None, "--checkpoint-id", help="Associated checkpoint ID."),
     repo: str | None = typer.Option(None, "--repo", help="Repo ID override."),
     branch: str | None = typer.Option(None, "--branch", help="Branch override."),
+    as_json: bool = typer.Option(False, "--json", help="Output created review as JSON."),
 ) -> None:
     """Create a manual review item."""
     store, _ = _store()
@@ -835,6 +852,9 @@ def review_add(
     )
     store.add_review_item(item)
     store.recompute_slip_status(repo_id=normalized_repo, branch=normalized_branch)
+    if as_json:
+        _emit_json(review_item_to_jsonable(item))
+        return
     console.print(f"[green]Created review[/green] {_safe_text(item.id)}")
 
 
@@ -853,13 +873,29 @@ def review_done(review_id: str = typer.Argument(..., help="Review item ID.")) ->
 
 
 @review_app.command("open")
-def review_open(review_id: str = typer.Argument(..., help="Review item ID.")) -> None:
+def review_open(
+    review_id: str = typer.Argument(..., help="Review item ID."),
+    as_json: bool = typer.Option(False, "--json", help="Output structured JSON."),
+) -> None:
     """Show review details and associated checkpoint context."""
     normalized_review_id = _normalize_non_empty_option(review_id, "Review ID")
     store, _ = _store()
     item = store.get_review(normalized_review_id)
     if not item:
         raise DockyardError(f"Review item not found: {normalized_review_id}")
+    if as_json:
+        payload = review_item_to_jsonable(item)
+        payload["files"] = _coerce_text_items(item.files)
+        payload["checkpoint"] = None
+        if item.checkpoint_id:
+            checkpoint = store.get_checkpoint(item.checkpoint_id)
+            payload["checkpoint"] = {
+                "id": item.checkpoint_id,
+                "status": "indexed" if checkpoint else "missing_from_index",
+                "objective": checkpoint.objective if checkpoint else None,
+            }
+        _emit_json(payload)
+        return
     console.print(
         Panel.fit(
             "\n".join(
@@ -948,10 +984,14 @@ def links_command(
         )
 
 
-def main() -> None:
-    """CLI process entrypoint."""
+def main(argv: list[str] | None = None) -> None:
+    """CLI process entrypoint.
+
+    Args:
+        argv: Optional argument list; defaults to process arguments.
+    """
     try:
-        app(standalone_mode=False)
+        app(args=argv, standalone_mode=False)
     except DockyardError as err:
         console.print(f"[red]Error:[/red] {_safe_text(err)}")
         raise SystemExit(2) from err
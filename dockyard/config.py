@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import os
 import re
-import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -60,9 +59,17 @@ def default_base_dir() -> Path:
     return Path.home() / ".local" / "share" / "dockyard"
 
 
-def resolve_paths() -> DockyardPaths:
-    """Resolve and create the Dockyard data directories."""
-    base = default_base_dir()
+def resolve_paths(base_dir: Path | None = None) -> DockyardPaths:
+    """Resolve and create the Dockyard data directories.
+
+    Args:
+        base_dir: Optional explicit base directory. Defaults to
+            `default_base_dir()`.
+
+    Returns:
+        Resolved dockyard paths.
+    """
+    base = base_dir or default_base_dir()
     checkpoints = base / "checkpoints"
     db_dir = base / "db"
     checkpoints.mkdir(parents=True, exist_ok=True)
@@ -114,6 +121,9 @@ def load_runtime_config(paths: DockyardPaths | None = None) -> DockyardRuntimeCo
     if not resolved.config_path.exists():
         return config
 
+    # tomllib is only needed when a config/template file exists.
+    import tomllib
+
     raw = resolved.config_path.read_text(encoding="utf-8")
     try:
         parsed = tomllib.loads(raw)
@@ -187,3 +187,26 @@ def checkpoint_to_jsonable(
         "open_reviews": open_reviews,
         "project_name": project_name,
     }
+
+
+def review_item_to_jsonable(item: ReviewItem) -> dict[str, Any]:
+    """Convert review item to JSON-serializable dictionary.
+
+    Args:
+        item: Review item model instance.
+
+    Returns:
+        JSON-friendly dictionary representing the review item.
+    """
+    return {
+        "id": item.id,
+        "repo_id": item.repo_id,
+        "branch": item.branch,
+        "checkpoint_id": item.checkpoint_id,
+        "created_at": item.created_at,
+        "reason": item.reason,
+        "severity": item.severity,
+        "status": item.status,
+        "notes": item.notes,
+        "files": item.files,
+    }
@@ -1,18 +1,84 @@
-"""Test fixtures for Dockyard."""
+"""Test fixtures for Dockyard.
+
+Session-scoped fixtures build their directories with `tmp_path_factory`,
+which pytest-xdist roots in a separate base temp directory per worker, so
+parallel workers never share or race on these templates.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
+from dockyard.config import resolve_paths
+from dockyard.models import VerificationState
+from dockyard.storage.sqlite_store import SQLiteStore
+from tests.service_utils import save_checkpoint
+
+GIT_TEMPLATE_ORIGIN_URL = "git@github.com:org/sample.git"
+SHARED_MEMORY_TEMPROOT = Path("/dev/shm")
+# Opt-in switch for rooting pytest temp directories in `/dev/shm`.
+SHARED_MEMORY_TEMPROOT_ENV = "DOCKYARD_TEST_SHM"
+# A full run writes roughly 140 MB of repos and indexes, and pytest keeps the
+# last three runs; smaller shared-memory mounts fall back to the default.
+SHARED_MEMORY_TEMPROOT_MIN_FREE = 512 * 1024 * 1024
+# Environment variables CLI subprocesses actually need: executable lookup,
+# home/locale/temp resolution (plus their Windows spellings), an explicit
+# PYTHONPATH or coverage hook, and the session's git and Dockyard isolation.
+CLI_ENV_PASSTHROUGH: tuple[str, ...] = (
+    "PATH",
+    "HOME",
+    "LANG",
+    "LC_ALL",
+    "LC_CTYPE",
+    "TMPDIR",
+    "TEMP",
+    "TMP",
+    "SYSTEMROOT",
+    "COMSPEC",
+    "PATHEXT",
+    "USERPROFILE",
+    "PYTHONPATH",
+    "COVERAGE_PROCESS_START",
+    "GIT_CONFIG_GLOBAL",
+    "DOCKYARD_HOME",
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Root temporary directories in RAM-backed `/dev/shm` when opted in.
+
+    Every CLI test writes repos, templates, and a SQLite index under
+    `tmp_path`; with `DOCKYARD_TEST_SHM=1` they stay off disk, avoiding fsync
+    latency. Setting the variable before xdist starts lets workers inherit
+    it, and pytest keeps its usual per-user, per-run numbering underneath.
+    An explicit `--basetemp` or `PYTEST_DEBUG_TEMPROOT` wins. Without the
+    opt-in, when `/dev/shm` is missing or unwritable, or when it has less
+    than `SHARED_MEMORY_TEMPROOT_MIN_FREE` bytes free (such as Docker's
+    default 64 MB mount), the default system temp directory is used.
+    """
+    if config.option.basetemp is not None:
+        return
+    if os.environ.get(SHARED_MEMORY_TEMPROOT_ENV) != "1":
+        return
+    if not os.access(SHARED_MEMORY_TEMPROOT, os.W_OK):
+        return
+    if shutil.disk_usage(SHARED_MEMORY_TEMPROOT).free < SHARED_MEMORY_TEMPROOT_MIN_FREE:
+        return
+    os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(SHARED_MEMORY_TEMPROOT))
+
 
 def _run(command: list[str], cwd: Path) -> str:
     """Run subprocess command and return stripped stdout."""
     result = subprocess.run(
         command,
-        cwd=str(cwd),
+        cwd=cwd,
         check=True,
         capture_output=True,
         text=True,
@@ -20,16 +86,161 @@ def _run(command: list[str], cwd: Path) -> str:
     return result.stdout.strip()
 
 
-@pytest.fixture()
-def git_repo(tmp_path: Path) -> Path:
-    """Create an initialized git repository with one commit."""
-    repo = tmp_path / "repo"
+def cli_base_env() -> dict[str, str]:
+    """Return the minimal environment for running the dock CLI in tests.
+
+    Only `CLI_ENV_PASSTHROUGH` variables are copied from `os.environ`, which
+    keeps each exec's environment block small and stops unrelated developer
+    settings (such as `EDITOR` or `GIT_DIR`) from leaking into tests.
+    """
+    return {key: os.environ[key] for key in CLI_ENV_PASSTHROUGH if key in os.environ}
+
+
+def _link_git_object_or_copy(src: str, dst: str) -> str:
+    """Hardlink immutable git object files; copy everything else.
+
+    Git never rewrites an object file in place, so linked objects stay safe
+    while refs, HEAD, config, and the index remain private per copy.
+    """
+    if f"{os.sep}objects{os.sep}" in src:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def copy_git_repo(template: Path, dest: Path) -> Path:
+    """Materialize a private working copy of a template git repository."""
+    shutil.copytree(template, dest, symlinks=True, copy_function=_link_git_object_or_copy)
+    return dest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def git_global_config(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Point git at a session-wide global config carrying the test identity.
+
+    Repositories created by tests (and CLI subprocesses inheriting the
+    environment) pick up `user.name`/`user.email` without per-repo config
+    calls, and are isolated from the developer's own global git config.
+    """
+    config_path = tmp_path_factory.mktemp("git_global") / "gitconfig"
+    config_path.write_text(
+        "[user]\n\tname = Dockyard Test\n\temail = dockyard@example.com\n",
+        encoding="utf-8",
+    )
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(config_path))
+        yield config_path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def default_dock_home(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Default `DOCKYARD_HOME` to a per-worker directory for the session.
+
+    Tests pass their own home explicitly; this only guarantees that one
+    which forgets can never reach the developer's real Dockyard data or
+    a home shared with another xdist worker.
+    """
+    dock_home = tmp_path_factory.mktemp("dock_default") / ".dockyard_data"
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("DOCKYARD_HOME", str(dock_home))
+        yield dock_home
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the seeded git repository once per test session.
+
+    Tests should not modify this repository; copy it via `git_repo` instead.
+    """
+    repo = tmp_path_factory.mktemp("git_template") / "repo"
     repo.mkdir(parents=True, exist_ok=True)
-    _run(["git", "init"], cwd=repo)
-    _run(["git", "config", "user.email", "dockyard@example.com"], cwd=repo)
-    _run(["git", "config", "user.name", "Dockyard Test"], cwd=repo)
-    _run(["git", "remote", "add", "origin", "git@github.com:org/sample.git"], cwd=repo)
+    # An empty template skips sample hooks and info/, so per-test copies
+    # only duplicate the files git actually needs.
+    _run(["git", "init", "--template="], cwd=repo)
+    _run(["git", "remote", "add", "origin", GIT_TEMPLATE_ORIGIN_URL], cwd=repo)
     (repo / "README.md").write_text("seed\n", encoding="utf-8")
     _run(["git", "add", "README.md"], cwd=repo)
     _run(["git", "commit", "-m", "initial"], cwd=repo)
     return repo
+
+
+@pytest.fixture(scope="session")
+def git_template_branch(git_repo_template: Path) -> str:
+    """Return the branch checked out in the session template repository."""
+    return _run(["git", "symbolic-ref", "--short", "HEAD"], cwd=git_repo_template)
+
+
+@pytest.fixture(scope="session")
+def git_template_repo_id() -> str:
+    """Return the Dockyard repo id derived from the template origin URL."""
+    return hashlib.sha1(GIT_TEMPLATE_ORIGIN_URL.encode("utf-8")).hexdigest()[:16]
+
+
+@pytest.fixture()
+def git_repo(tmp_path: Path, git_repo_template: Path) -> Path:
+    """Create an initialized git repository with one commit.
+
+    The repository is a private copy of the session template, so tests may
+    freely mutate it without re-running git setup commands.
+    """
+    return copy_git_repo(git_repo_template, tmp_path / "repo")
+
+
+@pytest.fixture(scope="session")
+def seeded_dock_home_template(
+    tmp_path_factory: pytest.TempPathFactory,
+    git_repo_template: Path,
+) -> Path:
+    """Create a Dockyard home holding one checkpoint for the template repo.
+
+    Tests should not modify this directory; copy it via `seeded_dock_home`.
+    """
+    dock_home = tmp_path_factory.mktemp("dock_seed") / ".dockyard_data"
+    save_checkpoint(
+        dock_home,
+        git_repo_template,
+        objective="Review baseline",
+        decisions="Need slip context for manual review items",
+        next_steps=["Add review items"],
+        resume_commands=["echo review"],
+        verification=VerificationState(
+            tests_run=True,
+            tests_command="pytest -q",
+            build_ok=True,
+            build_command="echo build",
+        ),
+    )
+    return dock_home
+
+
+@pytest.fixture()
+def seeded_dock_home(tmp_path: Path, seeded_dock_home_template: Path) -> Path:
+    """Return a private copy of the seeded Dockyard home under `tmp_path`.
+
+    The seed checkpoint shares the template's repo id and branch, so review
+    commands run inside `git_repo` attach to the seeded slip.
+    """
+    dock_home = tmp_path / ".dockyard_data"
+    shutil.copytree(seeded_dock_home_template, dock_home)
+    return dock_home
+
+
+@pytest.fixture(scope="session")
+def empty_dock_home(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Yield a session-wide Dockyard home with an initialized, empty ledger.
+
+    Only tests that never write to the ledger may use it; the schema is
+    created up front so read-only commands find nothing left to initialize.
+    Teardown fails the session if any test left a checkpoint or review behind.
+    """
+    dock_home = tmp_path_factory.mktemp("dock_empty") / ".dockyard_data"
+    paths = resolve_paths(dock_home)
+    store = SQLiteStore(paths.db_path)
+    store.initialize()
+    yield dock_home
+    assert store.list_harbor() == []
+    assert store.list_reviews(open_only=False) == []
+    assert not any(paths.checkpoints_dir.rglob("*.md"))
@@ -0,0 +1,178 @@
+"""Service-layer helpers for seeding Dockyard state in integration tests.
+
+These helpers call the same services as `dock save` / `dock review add`
+without spawning the CLI, so tests only pay CLI cost for the command whose
+output they actually assert on.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from dockyard.config import load_runtime_config, resolve_paths
+from dockyard.git_info import inspect_repository
+from dockyard.models import (
+    Checkpoint,
+    ReviewItem,
+    SaveInput,
+    VerificationState,
+    checkpoint_to_jsonable,
+    utc_now_iso,
+)
+from dockyard.services.checkpoints import create_checkpoint
+from dockyard.storage.sqlite_store import SQLiteStore
+
+
+def _store(dock_home: Path) -> SQLiteStore:
+    """Return initialized SQLite store rooted at the given dockyard home."""
+    store = SQLiteStore(resolve_paths(dock_home).db_path)
+    store.initialize()
+    return store
+
+
+def save_checkpoint(
+    dock_home: Path,
+    root: Path,
+    *,
+    objective: str,
+    decisions: str,
+    next_steps: Sequence[str],
+    risks_review: str = "none",
+    resume_commands: Sequence[str] = (),
+    tags: Sequence[str] = (),
+    verification: VerificationState | None = None,
+    create_review_on_trigger: bool = False,
+) -> Checkpoint:
+    """Create a checkpoint for a repository, mirroring `dock save --no-prompt`.
+
+    Args:
+        dock_home: Dockyard data directory (`DOCKYARD_HOME`).
+        root: Repository root to snapshot.
+        objective: Checkpoint objective.
+        decisions: Decisions/findings text.
+        next_steps: Next-step entries.
+        risks_review: Risks/review notes.
+        resume_commands: Resume commands.
+        tags: Slip tags.
+        verification: Optional verification state; defaults to unverified.
+        create_review_on_trigger: Whether heuristic triggers create reviews.
+
+    Returns:
+        Persisted checkpoint.
+    """
+    store = _store(dock_home)
+    paths = resolve_paths(dock_home)
+    checkpoint, _, _ = create_checkpoint(
+        store=store,
+        paths=paths,
+        git=inspect_repository(root_override=str(root)),
+        user_input=SaveInput(
+            objective=objective,
+            decisions=decisions,
+            next_steps=list(next_steps),
+            risks_review=risks_review,
+            resume_commands=list(resume_commands),
+            tags=list(tags),
+        ),
+        verification=verification or VerificationState(),
+        create_review_on_trigger=create_review_on_trigger,
+        review_heuristics=load_runtime_config(paths).review_heuristics,
+    )
+    return checkpoint
+
+
+def add_review(
+    dock_home: Path,
+    *,
+    repo_id: str,
+    branch: str,
+    reason: str,
+    severity: str = "med",
+    notes: str | None = None,
+    files: Sequence[str] = (),
+    checkpoint_id: str | None = None,
+) -> ReviewItem:
+    """Create an open review item, mirroring `dock review add`.
+
+    Args:
+        dock_home: Dockyard data directory (`DOCKYARD_HOME`).
+        repo_id: Repository identifier for the review.
+        branch: Branch for the review.
+        reason: Review reason.
+        severity: Review severity (`low`, `med`, `high`).
+        notes: Optional notes text.
+        files: Associated file paths.
+        checkpoint_id: Optional associated checkpoint ID.
+
+    Returns:
+        Persisted review item.
+    """
+    store = _store(dock_home)
+    item = ReviewItem(
+        id=f"rev_{uuid.uuid4().hex[:10]}",
+        repo_id=repo_id,
+        branch=branch,
+        checkpoint_id=checkpoint_id,
+        created_at=utc_now_iso(),
+        reason=reason,
+        severity=severity,
+        status="open",
+        notes=notes,
+        files=list(files),
+    )
+    store.add_review_item(item)
+    store.recompute_slip_status(repo_id=repo_id, branch=branch)
+    return item
+
+
+def rename_berth(dock_home: Path, repo_id: str, name: str) -> None:
+    """Rename an existing berth, e.g. to force a name/repo-id collision.
+
+    Args:
+        dock_home: Dockyard data directory (`DOCKYARD_HOME`).
+        repo_id: Repository identifier of the berth to rename.
+        name: New berth name.
+
+    Raises:
+        LookupError: If no berth exists for `repo_id`.
+    """
+    store = _store(dock_home)
+    berth = store.resolve_berth(repo_id)
+    if berth is None or berth.repo_id != repo_id:
+        raise LookupError(f"No berth for {repo_id}")
+    store.upsert_berth(replace(berth, name=name, updated_at=utc_now_iso()))
+
+
+def resume_payload(dock_home: Path, repo_id: str, branch: str | None = None) -> dict[str, Any]:
+    """Return the `dock resume --json` payload for a repository.
+
+    Args:
+        dock_home: Dockyard data directory (`DOCKYARD_HOME`).
+        repo_id: Repository identifier to resume.
+        branch: Optional branch filter.
+
+    Returns:
+        JSON-compatible resume payload.
+
+    Raises:
+        LookupError: If no checkpoint exists for the requested context.
+    """
+    store = _store(dock_home)
+    checkpoint = store.get_latest_checkpoint(repo_id=repo_id, branch=branch)
+    if checkpoint is None:
+        raise LookupError(f"No checkpoint for {repo_id}/{branch}")
+    berth = store.resolve_berth(repo_id)
+    return checkpoint_to_jsonable(
+        checkpoint,
+        open_reviews=store.count_open_reviews(checkpoint.repo_id, checkpoint.branch),
+        project_name=berth.name if berth else checkpoint.repo_id,
+    )
+
+
+def harbor_rows(dock_home: Path) -> list[dict[str, Any]]:
+    """Return the `dock ls --json` rows for a dockyard home."""
+    return _store(dock_home).list_harbor()
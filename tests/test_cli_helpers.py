@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -18,8 +21,58 @@ from dockyard.cli import (
     _normalize_text_values,
     _safe_preview,
     _safe_text,
+    _validate_template_data,
     _verification_from_inputs,
 )
+from dockyard.errors import DockyardError
+
+INVALID_TEMPLATE_FIELD_CASES: list[tuple[dict[str, Any], str]] = [
+    ({"objective": 123}, "Template field 'objective' must be a string"),
+    ({"decisions": 123}, "Template field 'decisions' must be a string"),
+    ({"risks_review": 123}, "Template field 'risks_review' must be a string"),
+    ({"next_steps": "not-a-list"}, "Template field 'next_steps' must be an array of strings"),
+    ({"next_steps": ["step", 7]}, "Template field 'next_steps' must be an array of strings"),
+    (
+        {"resume_commands": "echo not-a-list"},
+        "Template field 'resume_commands' must be an array of strings",
+    ),
+    (
+        {"resume_commands": ["echo good", 7]},
+        "Template field 'resume_commands' must be an array of strings",
+    ),
+    ({"tags": "alpha"}, "Template field 'tags' must be an array of strings"),
+    ({"tags": ["alpha", 7]}, "Template field 'tags' must be an array of strings"),
+    ({"links": "https://example.invalid"}, "Template field 'links' must be an array of strings"),
+    (
+        {"links": ["https://example.invalid", 7]},
+        "Template field 'links' must be an array of strings",
+    ),
+    ({"verification": "not-a-table"}, "Template field 'verification' must be a table/object"),
+    (
+        {"verification": {"tests_run": 123}},
+        "Template field 'tests_run' must be bool or bool-like string",
+    ),
+    (
+        {"verification": {"tests_run": "maybe"}},
+        "Template field 'tests_run' must be bool or bool-like string",
+    ),
+    (
+        {"verification": {"build_ok": "maybe"}},
+        "Template field 'build_ok' must be bool or bool-like string",
+    ),
+    (
+        {"verification": {"lint_ok": "maybe"}},
+        "Template field 'lint_ok' must be bool or bool-like string",
+    ),
+    (
+        {"verification": {"smoke_ok": "perhaps"}},
+        "Template field 'smoke_ok' must be bool or bool-like string",
+    ),
+    ({"verification": {"tests_command": 123}}, "Template field 'tests_command' must be a string"),
+    ({"verification": {"build_command": 123}}, "Template field 'build_command' must be a string"),
+    ({"verification": {"lint_command": 123}}, "Template field 'lint_command' must be a string"),
+    ({"verification": {"smoke_notes": 123}}, "Template field 'smoke_notes' must be a string"),
+]
 
 
 def test_normalize_editor_text_drops_scaffold_line() -> None:
@@ -331,3 +384,25 @@ def test_verification_from_inputs_trims_non_blank_text_fields() -> None:
     assert verification.build_command == "make build"
     assert verification.lint_command == "ruff check"
     assert verification.smoke_notes == "smoke passed"
+
+
+def test_cli_import_defers_toml_parser() -> None:
+    """Importing the CLI should not load tomllib until a TOML file is parsed."""
+    probe = subprocess.run(
+        [sys.executable, "-c", "import sys, dockyard.cli; print('tomllib' in sys.modules)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert probe.stdout.strip() == "False"
+
+
+def test_validate_template_data_rejects_invalid_field_types() -> None:
+    """Each schema violation should raise an error naming the offending field."""
+    template_path = Path("template.json")
+    base = {"objective": "valid", "decisions": "valid", "next_steps": ["step"]}
+    for overrides, expected_fragment in INVALID_TEMPLATE_FIELD_CASES:
+        with pytest.raises(DockyardError) as excinfo:
+            _validate_template_data({**base, **overrides}, path=template_path)
+        assert expected_fragment in str(excinfo.value), overrides
+        assert str(template_path) in str(excinfo.value)
@@ -1,13 +1,31 @@
-"""Integration tests for CLI command flows."""
+"""Integration tests for CLI command flows.
+
+The `s` and `dock` commands are registered against the same handler as
+`save` (see `test_save_aliases_resolve_to_same_handler`), so save-flow tests
+that do not exercise alias parsing run only the `save` spelling.
+
+Tests are safe under `pytest -n auto`: each test owns its `tmp_path` repo and
+`DOCKYARD_HOME` (only read-only tests share `empty_dock_home`), session
+fixtures are built per xdist worker, and the process-wide cwd/environment
+swaps in `_invoke_dock` are restored before it returns. Tests do not depend
+on which worker or in what order they run, so any `--dist` mode works.
+"""
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import hashlib
+import io
+import itertools
 import json
 import os
 import re
 import sqlite3
 import subprocess
+import sys
+import textwrap
+import traceback
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,15 +33,128 @@ from types import MappingProxyType
 from typing import Any, Literal
 
 import pytest
+from rich.console import Console
 
+import dockyard.cli as cli_module
+from dockyard.models import VerificationState
+from tests.conftest import GIT_TEMPLATE_ORIGIN_URL, cli_base_env, copy_git_repo
 from tests.metadata_utils import case_ids, pair_scope_cases_with_context
+from tests.service_utils import add_review, harbor_rows, rename_berth, save_checkpoint
+
+pytestmark = pytest.mark.integration
 
 RunArgs = Sequence[str]
 RunCommands = Sequence[str]
 RunCwdKind = Literal["repo", "tmp"]
 RunCommandName = Literal["resume", "r", "undock"]
 RunScopeVariantId = Literal["default", "berth", "branch", "berth_branch"]
-DOCKYARD_COMMAND_PREFIX: tuple[str, ...] = ("python3", "-m", "dockyard")
+# The running interpreter is resolved once here, so CLI subprocesses skip a
+# PATH lookup per call and always import the dockyard under test.
+DOCKYARD_COMMAND_PREFIX: tuple[str, ...] = (sys.executable, "-m", "dockyard")
+REVIEW_ID_PATTERN: re.Pattern[str] = re.compile(r"rev_[a-f0-9]+")
+SAVE_VERIFICATION_ARGS: tuple[str, ...] = (
+    "--tests-run",
+    "--tests-command",
+    "pytest -q",
+    "--build-ok",
+    "--build-command",
+    "echo build",
+    "--lint-fail",
+    "--smoke-fail",
+)
+# Verification recorded by SAVE_VERIFICATION_ARGS, for slips seeded through
+# `save_checkpoint` rather than a full `dock save` run.
+SAVE_VERIFICATION = VerificationState(
+    tests_run=True,
+    tests_command="pytest -q",
+    build_ok=True,
+    build_command="echo build",
+)
+# Objectives of the `alpha`-tagged checkpoints in `tag_limit_corpus`.
+TAG_LIMIT_TAGGED_OBJECTIVES = ("tlc-tagged-one", "tlc-tagged-two")
+UNKNOWN_SECTION_CONFIG_TOML = '[other_section]\nfoo = "bar"\n'
+# Narrows risky paths to `critical/` so the default `security/` trigger no
+# longer fires; every other trigger is set high enough to stay quiet.
+HEURISTICS_SKIP_SECURITY_CONFIG_TOML = textwrap.dedent(
+    """\
+    [review_heuristics]
+    risky_path_patterns = ["(^|/)critical/"]
+    files_changed_threshold = 999
+    churn_threshold = 9999
+    non_trivial_files_threshold = 999
+    non_trivial_churn_threshold = 9999
+    branch_prefixes = ["urgent/"]
+    """
+)
+# Forces a review on any snapshot via a zero files-changed threshold while
+# keeping the other trigger paths effectively disabled.
+HEURISTICS_FORCE_REVIEW_CONFIG_TOML = textwrap.dedent(
+    """\
+    [review_heuristics]
+    files_changed_threshold = 0
+    churn_threshold = 9999
+    non_trivial_files_threshold = 999
+    non_trivial_churn_threshold = 9999
+    risky_path_patterns = ["(^|/)never-match/"]
+    branch_prefixes = ["never/"]
+    """
+)
+# Valid JSON whose top level is not an object, so template validation rejects it.
+NON_OBJECT_TEMPLATE_BYTES = json.dumps(["not", "an", "object"]).encode("utf-8")
+# (case id, file name, contents or None for a missing file, expected error)
+TEMPLATE_FILE_ERROR_CASES: tuple[tuple[str, str, bytes | None, str], ...] = (
+    ("missing", "not-there.json", None, "Template not found"),
+    ("malformed_toml", "bad_template.toml", b"[broken\nvalue = 1", "Failed to parse template"),
+    ("yaml_extension", "template.yaml", b"objective: bad\n", "Template must be .json or .toml"),
+    ("tml_extension", "template.tml", b'objective = "bad"\n', "Template must be .json or .toml"),
+    (
+        "non_object",
+        "list_template.json",
+        NON_OBJECT_TEMPLATE_BYTES,
+        "Template must contain an object/table",
+    ),
+    ("non_utf8", "non_utf_template.json", b"\xff\xfe\x00", "Failed to read template"),
+)
+LS_SEARCH_ARGUMENT_ERROR_CASES: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("ls_limit_zero", ("ls", "--limit", "0"), "--limit must be >= 1."),
+    ("ls_stale_negative", ("ls", "--stale", "-1"), "--stale must be >= 0."),
+    ("ls_blank_tag", ("ls", "--tag", "   "), "--tag must be a non-empty string."),
+    ("search_limit_zero", ("search", "anything", "--limit", "0"), "--limit must be >= 1."),
+    ("search_blank_tag", ("search", "query", "--tag", "   "), "--tag must be a non-empty string."),
+    ("alias_blank_query", ("f", "   "), "Query must be a non-empty string."),
+    ("alias_blank_tag", ("f", "query", "--tag", "   "), "--tag must be a non-empty string."),
+    ("alias_blank_repo", ("f", "query", "--repo", "   "), "--repo must be a non-empty string."),
+    (
+        "alias_blank_branch",
+        ("f", "query", "--branch", "   "),
+        "--branch must be a non-empty string.",
+    ),
+    ("search_blank_query", ("search", "   "), "Query must be a non-empty string."),
+    ("alias_limit_zero", ("f", "query", "--limit", "0"), "--limit must be >= 1."),
+    ("harbor_limit_zero", ("harbor", "--limit", "0"), "--limit must be >= 1."),
+    ("harbor_stale_negative", ("harbor", "--stale", "-1"), "--stale must be >= 0."),
+    ("harbor_blank_tag", ("harbor", "--tag", "   "), "--tag must be a non-empty string."),
+)
+NO_SUBCOMMAND_FILTER_ERROR_CASES: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("stale_negative", ("--stale", "-1"), "--stale must be >= 0."),
+    ("limit_zero", ("--limit", "0"), "--limit must be >= 1."),
+    ("blank_tag", ("--tag", "   "), "--tag must be a non-empty string."),
+    (
+        "combined_stale_negative",
+        ("--tag", "alpha", "--stale", "-1", "--limit", "1"),
+        "--stale must be >= 0.",
+    ),
+    (
+        "combined_limit_zero",
+        ("--tag", "alpha", "--stale", "0", "--limit", "0"),
+        "--limit must be >= 1.",
+    ),
+    (
+        "combined_blank_tag",
+        ("--tag", "   ", "--stale", "0", "--limit", "1"),
+        "--tag must be a non-empty string.",
+    ),
+)
 
 
 @dataclass(frozen=True)
@@ -144,6 +275,22 @@ class RunNoCommandCaseMeta:
     next_step: str
 
 
+@dataclass(frozen=True)
+class RepoIdFallbackCaseMeta:
+    """Scenario metadata for save repo-id derivation from configured remotes."""
+
+    case_id: str
+    remotes: tuple[tuple[str, str], ...]
+    expected_source_url: str | None
+
+    @property
+    def expected_repo_id(self) -> str | None:
+        """Return repo id for the expected remote URL, or None for path-hash fallback."""
+        if self.expected_source_url is None:
+            return None
+        return hashlib.sha1(self.expected_source_url.encode("utf-8")).hexdigest()[:16]
+
+
 RUN_COMMAND_CASES: tuple[RunCommandMeta, ...] = (
     RunCommandMeta(name="resume", slug="resume", case_id="resume", label="resume"),
     RunCommandMeta(name="r", slug="r", case_id="r_alias", label="resume alias"),
@@ -380,6 +527,76 @@ RUN_DEFAULT_FAILURE_IDS: tuple[str, ...] = case_ids(RUN_DEFAULT_FAILURE_CASES)
 RUN_BRANCH_SUCCESS_IDS: tuple[str, ...] = case_ids(RUN_BRANCH_SUCCESS_CASES)
 RUN_BRANCH_FAILURE_IDS: tuple[str, ...] = case_ids(RUN_BRANCH_FAILURE_CASES)
 RUN_NO_COMMAND_IDS: tuple[str, ...] = case_ids(RUN_NO_COMMAND_CASES)
+REPO_ID_FALLBACK_CASES: tuple[RepoIdFallbackCaseMeta, ...] = (
+    RepoIdFallbackCaseMeta(
+        case_id="origin_preferred",
+        remotes=(
+            ("origin", GIT_TEMPLATE_ORIGIN_URL),
+            ("upstream", "https://example.com/team/upstream.git"),
+        ),
+        expected_source_url=GIT_TEMPLATE_ORIGIN_URL,
+    ),
+    RepoIdFallbackCaseMeta(
+        case_id="non_origin_fallback",
+        remotes=(("upstream", "https://example.com/team/fallback-upstream.git"),),
+        expected_source_url="https://example.com/team/fallback-upstream.git",
+    ),
+    RepoIdFallbackCaseMeta(
+        case_id="blank_origin_path_hash",
+        remotes=(("origin", ""),),
+        expected_source_url=None,
+    ),
+    RepoIdFallbackCaseMeta(
+        case_id="case_insensitive_ordering",
+        remotes=(
+            ("Zeta", "https://example.com/team/zeta.git"),
+            ("alpha", "https://example.com/team/alpha.git"),
+        ),
+        expected_source_url="https://example.com/team/alpha.git",
+    ),
+    RepoIdFallbackCaseMeta(
+        case_id="case_collision_ordering",
+        remotes=(
+            ("alpha", "https://example.com/team/alpha-lower.git"),
+            ("Alpha", "https://example.com/team/alpha-upper.git"),
+        ),
+        expected_source_url="https://example.com/team/alpha-upper.git",
+    ),
+)
+REPO_ID_FALLBACK_IDS: tuple[str, ...] = case_ids(REPO_ID_FALLBACK_CASES)
+
+
+class _LazyCompletedProcess(subprocess.CompletedProcess):
+    """Completed process that decodes captured bytes only when accessed."""
+
+    @property
+    def stdout(self) -> str:
+        """Return captured stdout, decoding it on first access."""
+        if isinstance(self._stdout, bytes):
+            self._stdout = self._stdout.decode("utf-8", errors="replace")
+        return self._stdout
+
+    @stdout.setter
+    def stdout(self, value: bytes | str) -> None:
+        self._stdout = value
+
+    @property
+    def stdout_bytes(self) -> bytes:
+        """Return captured stdout as bytes without forcing a decode."""
+        if isinstance(self._stdout, str):
+            return self._stdout.encode("utf-8")
+        return self._stdout
+
+    @property
+    def stderr(self) -> str:
+        """Return captured stderr, decoding it on first access."""
+        if isinstance(self._stderr, bytes):
+            self._stderr = self._stderr.decode("utf-8", errors="replace")
+        return self._stderr
+
+    @stderr.setter
+    def stderr(self, value: bytes | str) -> None:
+        self._stderr = value
 
 
 def _run_dock(
@@ -397,15 +614,81 @@ def _run_dock(
         expect_code: Expected return code.
 
     Returns:
-        Completed process result.
+        Completed process result; stdout/stderr are decoded lazily.
     """
-    completed = subprocess.run(
-        _dockyard_command(*args),
-        cwd=str(cwd),
+    command = _dockyard_command(*args)
+    raw = subprocess.run(
+        command,
+        cwd=cwd,
         env=env,
         check=False,
         capture_output=True,
-        text=True,
+        close_fds=False,
+    )
+    completed = _LazyCompletedProcess(command, raw.returncode, raw.stdout, raw.stderr)
+    assert completed.returncode == expect_code, (
+        f"Unexpected code {completed.returncode} for args={args}\n"
+        f"stdout:\n{completed.stdout}\n"
+        f"stderr:\n{completed.stderr}"
+    )
+    return completed
+
+
+def _invoke_dock(
+    args: RunArgs,
+    cwd: Path,
+    env: dict[str, str],
+    expect_code: int = 0,
+) -> subprocess.CompletedProcess[str]:
+    """Run dock CLI in-process and assert expected return code.
+
+    Mirrors `_run_dock` without paying interpreter startup per call. The
+    process environment, working directory, and CLI console are swapped for
+    the duration of the call. Commands whose child processes write to the
+    inherited stdout (such as `resume --run`) should keep using `_run_dock`.
+
+    Args:
+        args: CLI argument list excluding `python3 -m dockyard`.
+        cwd: Working directory for command execution.
+        env: Process environment variables.
+        expect_code: Expected return code.
+
+    Returns:
+        Completed process result built from captured output.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    saved_env = dict(os.environ)
+    saved_cwd = Path.cwd()
+    saved_console = cli_module.console
+    returncode = 0
+    os.environ.clear()
+    os.environ.update(env)
+    os.chdir(cwd)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            cli_module.console = Console()
+            try:
+                cli_module.main(list(args))
+            except SystemExit as exc:
+                if exc.code is None or isinstance(exc.code, int):
+                    returncode = exc.code or 0
+                else:
+                    print(exc.code, file=stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        cli_module.console = saved_console
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+    completed = subprocess.CompletedProcess(
+        _dockyard_command(*args),
+        returncode,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
     )
     assert completed.returncode == expect_code, (
         f"Unexpected code {completed.returncode} for args={args}\n"
@@ -415,22 +698,266 @@ def _run_dock(
     return completed
 
 
-def _git_current_branch(repo: Path) -> str:
-    """Return current branch name for test repo."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-        cwd=str(repo),
+def _run_dock_json(
+    args: RunArgs,
+    cwd: Path,
+    env: dict[str, str],
+    expect_code: int = 0,
+) -> Any:
+    """Run dock CLI in a subprocess and return its stdout decoded as JSON.
+
+    The captured bytes are parsed directly, skipping the intermediate text
+    decode that `.stdout` would perform.
+
+    Args:
+        args: CLI argument list excluding `python3 -m dockyard`; should
+            request JSON output.
+        cwd: Working directory for command execution.
+        env: Process environment variables.
+        expect_code: Expected return code.
+
+    Returns:
+        Parsed JSON payload.
+    """
+    return json.loads(_run_dock(args, cwd=cwd, env=env, expect_code=expect_code).stdout_bytes)
+
+
+def _invoke_dock_json(
+    args: RunArgs,
+    cwd: Path,
+    env: dict[str, str],
+    expect_code: int = 0,
+) -> Any:
+    """Run dock CLI in-process and return its stdout decoded as JSON.
+
+    Args:
+        args: CLI argument list excluding `python3 -m dockyard`; should
+            request JSON output.
+        cwd: Working directory for command execution.
+        env: Process environment variables.
+        expect_code: Expected return code.
+
+    Returns:
+        Parsed JSON payload.
+    """
+    return json.loads(_invoke_dock(args, cwd=cwd, env=env, expect_code=expect_code).stdout)
+
+
+def _assert_no_traceback(result: subprocess.CompletedProcess[str]) -> None:
+    """Assert neither captured output stream contains a Python traceback."""
+    assert "Traceback" not in result.stdout
+    assert "Traceback" not in result.stderr
+
+
+def _assert_output_contains(result: subprocess.CompletedProcess[str], *expected: str) -> None:
+    """Assert a command reported each `expected` fragment, without a traceback.
+
+    Each stream is searched separately, so no combined output string is built.
+    """
+    for fragment in expected:
+        assert fragment in result.stderr or fragment in result.stdout, (
+            f"{fragment!r} not in output\nstdout:\n{result.stdout}\nstderr:\n{result.stderr}"
+        )
+    _assert_no_traceback(result)
+
+
+def _assert_cli_error(result: subprocess.CompletedProcess[str], *expected: str) -> None:
+    """Assert a command failed and reported each `expected` fragment, without a traceback."""
+    assert result.returncode != 0, f"command unexpectedly succeeded\nstdout:\n{result.stdout}"
+    _assert_output_contains(result, *expected)
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Run a git command in `repo` and return its stdout.
+
+    Test repositories are trusted, so `close_fds=False` skips the per-spawn
+    scan for inherited descriptors, as `_run_dock` does.
+    """
+    return subprocess.run(
+        ["git", *args],
+        cwd=repo,
         check=True,
         capture_output=True,
         text=True,
+        close_fds=False,
+    ).stdout
+
+
+def _git_branch_status(repo: Path) -> tuple[str, str, list[str]]:
+    """Return HEAD commit, branch name, and changed entries from one git call.
+
+    `git status --porcelain=v2 --branch` reports all three at once, replacing
+    separate `rev-parse HEAD`, `rev-parse --abbrev-ref HEAD`, and `status`
+    subprocesses.
+    """
+    headers: dict[str, str] = {}
+    changes: list[str] = []
+    for line in _git(repo, "status", "--porcelain=v2", "--branch").splitlines():
+        if line.startswith("# "):
+            key, _, value = line[2:].partition(" ")
+            headers[key] = value
+        else:
+            changes.append(line)
+    return headers["branch.oid"], headers["branch.head"], changes
+
+
+def _set_git_remotes(repo: Path, remotes: dict[str, str]) -> None:
+    """Replace the repo's configured remotes by rewriting `.git/config` directly.
+
+    Avoids one `git remote` subprocess per change; remotes are written in
+    mapping order with the default fetch refspec.
+    """
+    config_path = repo / ".git" / "config"
+    kept: list[str] = []
+    in_remote = False
+    for line in config_path.read_text(encoding="utf-8").splitlines():
+        if line.startswith("["):
+            in_remote = line.startswith("[remote ")
+        if not in_remote:
+            kept.append(line)
+    for name, url in remotes.items():
+        kept.append(f'[remote "{name}"]')
+        kept.append(f"\turl = {url}")
+        kept.append(f"\tfetch = +refs/heads/*:refs/remotes/{name}/*")
+    config_path.write_text("\n".join(kept) + "\n", encoding="utf-8")
+
+
+def _copy_git_repo_template(
+    template: Path,
+    dest: Path,
+    origin_url: str,
+    branch: str | None = None,
+) -> Path:
+    """Create a committed repo at `dest` from the session template with a new origin.
+
+    Replaces `git init`/`remote add`/`add`/`commit` (and `checkout -b` when
+    `branch` is given) with a directory copy plus ref and config writes, so
+    no git subprocesses are spawned.
+    """
+    copy_git_repo(template, dest)
+    _set_git_remotes(dest, {"origin": origin_url})
+    if branch is not None:
+        _checkout_new_branch(dest, branch)
+    return dest
+
+
+def _git_checkout(repo: Path, branch: str) -> None:
+    """Switch `repo` to an existing branch, discarding git's status output.
+
+    Stdout goes to `DEVNULL` rather than an unread pipe; stderr is kept so a
+    failed checkout raises `CalledProcessError` carrying git's message.
+    """
+    subprocess.run(
+        ["git", "checkout", branch],
+        cwd=repo,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    )
+
+
+def _checkout_new_branch(repo: Path, branch: str) -> None:
+    """Create `branch` at the current commit and switch to it, like `git checkout -b`.
+
+    Writes the branch ref and `HEAD` directly instead of spawning git. The
+    index and working tree are untouched, exactly as with `checkout -b`.
+    """
+    git_dir = repo / ".git"
+    head_ref = (git_dir / "HEAD").read_text(encoding="utf-8").removeprefix("ref: ").strip()
+    branch_ref = git_dir / "refs" / "heads" / branch
+    if branch_ref.exists():
+        raise FileExistsError(f"Branch already exists: {branch}")
+    branch_ref.parent.mkdir(parents=True, exist_ok=True)
+    branch_ref.write_text((git_dir / head_ref).read_text(encoding="utf-8"), encoding="utf-8")
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+
+
+def _switch_branch(repo: Path, branch: str) -> None:
+    """Switch `repo` to an existing branch, skipping git when no files change.
+
+    Tests hop onto scratch branches without committing, so returning to the
+    base branch only needs `HEAD` repointed: the index and working tree
+    already match. Falls back to `_git_checkout` when the loose branch ref is
+    missing or names a different commit than `HEAD`.
+    """
+    git_dir = repo / ".git"
+    head_ref = (git_dir / "HEAD").read_text(encoding="utf-8").removeprefix("ref: ").strip()
+    try:
+        target_oid = (git_dir / "refs" / "heads" / branch).read_text(encoding="utf-8")
+        same_commit = target_oid == (git_dir / head_ref).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        same_commit = False
+    if not same_commit:
+        _git_checkout(repo, branch)
+        return
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+
+
+def _mutate_dock_db(db_path: Path, statements: Sequence[tuple[str, Sequence[Any]]]) -> None:
+    """Apply `(sql, params)` statements to a Dockyard index in one transaction.
+
+    The index is a throwaway test database, so journaling and fsync are
+    skipped and all statements share a single `BEGIN IMMEDIATE`/`COMMIT`.
+    """
+    with contextlib.closing(sqlite3.connect(db_path, isolation_level=None)) as conn:
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("BEGIN IMMEDIATE")
+        for sql, params in statements:
+            conn.execute(sql, params)
+        conn.execute("COMMIT")
+
+
+def _patch_review_row(db_path: Path, review_id: str, **fields: Any) -> None:
+    """Overwrite columns of one review row, e.g. to simulate legacy/blank data."""
+    assignments = ", ".join(f"{column} = ?" for column in fields)
+    _mutate_dock_db(
+        db_path,
+        [(f"UPDATE review_items SET {assignments} WHERE id = ?", (*fields.values(), review_id))],
     )
-    return result.stdout.strip()
+
+
+def _assert_panel_fields(output: str, expected: Mapping[str, str]) -> None:
+    """Assert `key: value` lines rendered in Rich panels match `expected`.
+
+    Output is parsed once; the first occurrence of each key wins, and a
+    mismatch reports every expected field side by side.
+    """
+    fields: dict[str, str] = {}
+    for line in output.splitlines():
+        key, sep, value = line.strip().strip("│|").strip().partition(": ")
+        if sep:
+            fields.setdefault(key, value.strip())
+    assert {key: fields.get(key) for key in expected} == dict(expected)
+
+
+def _write_fixture_bytes(path: Path, data: bytes) -> Path:
+    """Write fixture bytes with raw `os.open`/`os.write` calls and return `path`.
+
+    Skips the buffered file-object layers `Path.write_bytes` builds for
+    each small template file.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    flags |= getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    return path
+
+
+def _write_json_template(path: Path, payload: Any) -> Path:
+    """Write a JSON save template (or malformed payload) and return its path."""
+    return _write_fixture_bytes(path, json.dumps(payload).encode("utf-8"))
 
 
 def _assert_resume_top_lines_contract(output: str) -> None:
     """Assert resume top-lines include required summary markers in order."""
-    lines = [line for line in output.splitlines() if line.strip()]
-    top = lines[:15]
+    top = list(itertools.islice((line for line in output.splitlines() if line.strip()), 15))
     required_markers = [
         "Project/Branch:",
         "Last Checkpoint:",
@@ -471,15 +998,131 @@ def _resolve_run_cwd(git_repo: Path, tmp_path: Path, run_cwd_kind: RunCwdKind) -
     return git_repo if run_cwd_kind == "repo" else tmp_path
 
 
+@functools.cache
+def _environ_snapshot() -> Mapping[str, str]:
+    """Return a read-only snapshot of the minimal CLI environment.
+
+    The snapshot is taken lazily so session fixtures such as
+    `git_global_config` have already exported their variables.
+    """
+    return MappingProxyType(cli_base_env())
+
+
+def _dock_env(dock_home: Path | str) -> dict[str, str]:
+    """Return a fresh environment copy with `DOCKYARD_HOME` pointed at `dock_home`."""
+    return {**_environ_snapshot(), "DOCKYARD_HOME": str(dock_home)}
+
+
+def _write_text_creating_parents(path: Path, text: str) -> Path:
+    """Write `text` to `path`, creating parent directories only when missing.
+
+    The write is attempted first, so the common case of an existing parent
+    costs no extra `mkdir`/`stat` calls.
+    """
+    try:
+        path.write_text(text, encoding="utf-8")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _write_dock_config(dock_home: Path, text: str) -> Path:
+    """Write `config.toml` into a Dockyard home, creating the home if needed."""
+    return _write_text_creating_parents(dock_home / "config.toml", text)
+
+
 def _dockyard_command(*args: str) -> list[str]:
     """Build dockyard command with shared Python module prefix."""
     return [*DOCKYARD_COMMAND_PREFIX, *args]
 
 
+def _save_args(
+    root: Path | str,
+    objective: str,
+    decisions: str,
+    next_step: str,
+    *,
+    risks: str = "none",
+    command: str = "echo noop",
+    command_name: str = "save",
+    tags: Sequence[str] = (),
+    auto_review: bool = False,
+) -> tuple[str, ...]:
+    """Build non-interactive save arguments with the shared verification flags.
+
+    Args:
+        root: Repository root passed via `--root`, verbatim when a string.
+        objective: Checkpoint objective.
+        decisions: Checkpoint decisions text.
+        next_step: Single next-step entry.
+        risks: Risks/review text.
+        command: Single resume command.
+        command_name: Save command spelling (`save`, `s`, or `dock`).
+        tags: Slip tags, each passed via `--tag`.
+        auto_review: Whether heuristic review triggers may create reviews;
+            when false, `--no-auto-review` is appended.
+
+    Returns:
+        CLI argument tuple excluding the `python3 -m dockyard` prefix.
+    """
+    return (
+        command_name,
+        "--root",
+        str(root),
+        "--no-prompt",
+        "--objective",
+        objective,
+        "--decisions",
+        decisions,
+        "--next-step",
+        next_step,
+        "--risks",
+        risks,
+        "--command",
+        command,
+        *itertools.chain.from_iterable(("--tag", tag) for tag in tags),
+        *SAVE_VERIFICATION_ARGS,
+        *(() if auto_review else ("--no-auto-review",)),
+    )
+
+
+def test_dock_env_helper_returns_independent_copies(tmp_path: Path) -> None:
+    """Dock-env helper should hand out fresh dicts carrying the git test config."""
+    first = _dock_env(tmp_path / "first")
+    first["EXTRA_SETTING"] = "mutated"
+
+    second = _dock_env(tmp_path / "second")
+    assert second is not first
+    assert "EXTRA_SETTING" not in second
+    assert second["DOCKYARD_HOME"] == str(tmp_path / "second")
+    assert "GIT_CONFIG_GLOBAL" in second
+
+
+def test_cli_base_env_passes_only_allowlisted_variables(monkeypatch: pytest.MonkeyPatch) -> None:
+    """CLI environment should drop variables outside the passthrough list."""
+    monkeypatch.setenv("EDITOR", "unrelated-editor")
+    monkeypatch.setenv("LANG", "C.UTF-8")
+
+    env = cli_base_env()
+    assert "EDITOR" not in env
+    assert env["LANG"] == "C.UTF-8"
+    assert env["PATH"] == os.environ["PATH"]
+
+
+def test_dock_env_helper_sets_dockyard_home(tmp_path: Path) -> None:
+    """Dock-env helper should layer DOCKYARD_HOME over a fresh environment copy."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    assert env["DOCKYARD_HOME"] == str(tmp_path / ".dockyard_data")
+    assert "GIT_CONFIG_GLOBAL" in env
+    assert _dock_env(tmp_path) is not env
+
+
 def test_dockyard_command_helper_uses_shared_prefix() -> None:
     """Dockyard command helper should prepend the dockyard module prefix."""
     assert _dockyard_command("resume", "--json") == [
-        "python3",
+        sys.executable,
         "-m",
         "dockyard",
         "resume",
@@ -493,18 +1136,42 @@ def test_dockyard_command_helper_returns_fresh_lists() -> None:
     second = _dockyard_command("ls")
 
     first.append("--json")
-    assert second == ["python3", "-m", "dockyard", "ls"]
+    assert second == [sys.executable, "-m", "dockyard", "ls"]
 
 
 def test_dockyard_command_helper_supports_empty_suffix() -> None:
     """Dockyard command helper should support empty command suffix."""
-    assert _dockyard_command() == ["python3", "-m", "dockyard"]
+    assert _dockyard_command() == [sys.executable, "-m", "dockyard"]
+
+
+def test_save_args_helper_appends_shared_verification_flags(tmp_path: Path) -> None:
+    """Save-args helper should render the root, text fields, and fixed flags."""
+    args = _save_args(tmp_path, "obj", "dec", "step", risks="risk", command_name="s")
+
+    assert args[:14] == (
+        "s",
+        "--root",
+        str(tmp_path),
+        "--no-prompt",
+        "--objective",
+        "obj",
+        "--decisions",
+        "dec",
+        "--next-step",
+        "step",
+        "--risks",
+        "risk",
+        "--command",
+        "echo noop",
+    )
+    assert args[14:] == (*SAVE_VERIFICATION_ARGS, "--no-auto-review")
+    with_auto_review = _save_args(tmp_path, "obj", "dec", "step", auto_review=True)
+    assert with_auto_review[14:] == SAVE_VERIFICATION_ARGS
 
 
 def test_run_dock_helper_accepts_expected_nonzero_exit_code(tmp_path: Path) -> None:
     """Run helper should allow callers to assert expected non-zero exit codes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(
         ["--definitely-invalid-flag"],
@@ -517,18 +1184,27 @@ def test_run_dock_helper_accepts_expected_nonzero_exit_code(tmp_path: Path) -> N
 
 def test_run_dock_helper_defaults_to_zero_exit_code(tmp_path: Path) -> None:
     """Run helper should default to expecting successful zero exit code."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(["--help"], cwd=tmp_path, env=env)
     assert result.returncode == 0
     assert "Usage:" in result.stdout
 
 
+def test_run_dock_helper_returns_decoded_text_streams(tmp_path: Path) -> None:
+    """Run helper should expose stdout/stderr as text despite raw capture."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    result = _run_dock(["--help"], cwd=tmp_path, env=env)
+    assert isinstance(result, subprocess.CompletedProcess)
+    assert isinstance(result.stdout, str)
+    assert isinstance(result.stderr, str)
+    assert result.stdout is result.stdout
+
+
 def test_run_dock_helper_raises_on_unexpected_exit_code(tmp_path: Path) -> None:
     """Run helper should raise assertion when return code mismatches expectation."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     with pytest.raises(AssertionError, match="Unexpected code .*--definitely-invalid-flag"):
         _run_dock(
@@ -539,6 +1215,85 @@ def test_run_dock_helper_raises_on_unexpected_exit_code(tmp_path: Path) -> None:
         )
 
 
+def test_invoke_dock_helper_accepts_expected_nonzero_exit_code(tmp_path: Path) -> None:
+    """In-process helper should surface CLI usage errors as exit code 2."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    result = _invoke_dock(
+        ["--definitely-invalid-flag"],
+        cwd=tmp_path,
+        env=env,
+        expect_code=2,
+    )
+    assert result.returncode == 2
+    assert "No such option" in result.stderr
+
+
+def test_invoke_dock_helper_restores_process_state(tmp_path: Path) -> None:
+    """In-process helper should restore cwd, environment, and CLI console."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+    cwd_before = Path.cwd()
+    environ_before = dict(os.environ)
+    console_before = cli_module.console
+
+    failed = _invoke_dock(["resume"], cwd=tmp_path, env=env, expect_code=2)
+    assert "Not in a git repo" in failed.stdout
+    _assert_no_traceback(failed)
+    assert Path.cwd() == cwd_before
+    assert dict(os.environ) == environ_before
+    assert cli_module.console is console_before
+
+
+def test_write_fixture_bytes_helper_truncates_existing_file(tmp_path: Path) -> None:
+    """Raw fixture writer should replace, not append to, an existing file."""
+    target = tmp_path / "template.json"
+    target.write_bytes(b"previous contents that are longer")
+
+    assert _write_fixture_bytes(target, b'{"objective": "x"}') == target
+    assert target.read_bytes() == b'{"objective": "x"}'
+
+
+def test_set_git_remotes_helper_replaces_configured_remotes(
+    git_repo: Path,
+    git_template_branch: str,
+) -> None:
+    """Remote helper should leave git with exactly the requested remotes."""
+    _set_git_remotes(
+        git_repo,
+        {"upstream": "https://example.com/team/up.git", "Alpha": "https://example.com/a.git"},
+    )
+
+    remotes = _git(git_repo, "remote").split()
+    assert sorted(remotes) == ["Alpha", "upstream"]
+    assert _git_branch_status(git_repo)[1] == git_template_branch
+
+
+def test_checkout_new_branch_helper_matches_git_checkout(git_repo: Path) -> None:
+    """Branch helper should leave git on the new branch at the same commit."""
+    head_before, _, _ = _git_branch_status(git_repo)
+
+    _checkout_new_branch(git_repo, "feature/helper-check")
+
+    assert _git_branch_status(git_repo) == (head_before, "feature/helper-check", [])
+    with pytest.raises(FileExistsError):
+        _checkout_new_branch(git_repo, "feature/helper-check")
+
+
+def test_switch_branch_helper_matches_git_checkout(
+    git_repo: Path,
+    git_template_branch: str,
+) -> None:
+    """Switch helper should return to the base branch like `git checkout`."""
+    head_before, _, _ = _git_branch_status(git_repo)
+    _checkout_new_branch(git_repo, "feature/switch-check")
+
+    _switch_branch(git_repo, git_template_branch)
+
+    assert _git_branch_status(git_repo) == (head_before, git_template_branch, [])
+    with pytest.raises(subprocess.CalledProcessError):
+        _switch_branch(git_repo, "feature/missing-branch")
+
+
 def test_build_run_args_renders_expected_scope_variants(tmp_path: Path) -> None:
     """Run-args helper should include optional berth and branch selectors."""
     git_repo = tmp_path / "demo-repo"
@@ -572,8 +1327,7 @@ def test_resolve_run_cwd_selects_repo_or_tmp(git_repo: Path, tmp_path: Path) ->
 
 def test_cli_flow_and_aliases(git_repo: Path, tmp_path: Path) -> None:
     """Validate save/ls/resume/review/link flows including `dock dock` alias."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     save_result = _run_dock(
         [
@@ -635,7 +1389,7 @@ def test_cli_flow_and_aliases(git_repo: Path, tmp_path: Path) -> None:
         cwd=git_repo,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", add_review.stdout)
+    review_match = REVIEW_ID_PATTERN.search(add_review.stdout)
     assert review_match is not None
     review_id = review_match.group(0)
 
@@ -657,35 +1411,16 @@ def test_cli_flow_and_aliases(git_repo: Path, tmp_path: Path) -> None:
 
 def test_resume_json_reports_open_review_count(git_repo: Path, tmp_path: Path) -> None:
     """Resume JSON should reflect unresolved review debt for current slip."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Open review count objective",
-            "--decisions",
             "Validate resume json review count",
-            "--next-step",
             "Create unresolved review",
-            "--risks",
-            "manual review pending",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks="manual review pending",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -695,127 +1430,58 @@ def test_resume_json_reports_open_review_count(git_repo: Path, tmp_path: Path) -
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["open_reviews"] == 1
 
 
 def test_resume_json_handles_long_text_fields(git_repo: Path, tmp_path: Path) -> None:
     """Resume JSON should remain parseable with long text payloads."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     long_risk = "risktoken " + ("x" * 500)
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Long JSON objective",
-            "--decisions",
             "long payload regression test",
-            "--next-step",
             "run resume json",
-            "--risks",
-            long_risk,
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks=long_risk,
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["risks_review"] == long_risk
 
 
 def test_resume_json_preserves_unicode_text(git_repo: Path, tmp_path: Path) -> None:
     """Resume JSON output should preserve unicode characters."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     unicode_decisions = "Confirm naïve parser won’t mangle unicode"
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Unicode resume objective",
-            "--decisions",
-            unicode_decisions,
-            "--next-step",
-            "run resume json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        _save_args(git_repo, "Unicode resume objective", unicode_decisions, "run resume json"),
         cwd=git_repo,
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["decisions"] == unicode_decisions
 
 
 def test_resume_json_preserves_multiline_text(git_repo: Path, tmp_path: Path) -> None:
     """Resume JSON should preserve multiline decisions text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     multiline_decisions = "line one\nline two\nline three"
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Multiline resume objective",
-            "--decisions",
-            multiline_decisions,
-            "--next-step",
-            "run resume json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        _save_args(git_repo, "Multiline resume objective", multiline_decisions, "run resume json"),
         cwd=git_repo,
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["decisions"] == multiline_decisions
 
 
@@ -828,37 +1494,18 @@ def test_resume_alias_json_preserves_long_unicode_multiline_text(
     run_cwd_kind: str,
 ) -> None:
     """Resume aliases should preserve long/unicode/multiline JSON payload text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     multiline_unicode_decisions = "line one\nConfirm naïve façade safety\nline three"
     long_risks = "risklong " + ("z" * 500)
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Alias JSON text preservation objective",
-            "--decisions",
             multiline_unicode_decisions,
-            "--next-step",
             "run resume json",
-            "--risks",
-            long_risks,
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks=long_risks,
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -879,37 +1526,16 @@ def test_resume_alias_json_preserves_long_unicode_multiline_text(
 
 def test_json_outputs_do_not_include_ansi_sequences(git_repo: Path, tmp_path: Path) -> None:
     """JSON output modes should emit plain parseable text without ANSI codes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "JSON plain output objective",
-            "--decisions",
-            "Ensure no ANSI escapes in JSON",
-            "--next-step",
-            "run json commands",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="JSON plain output objective",
+        decisions="Ensure no ANSI escapes in JSON",
+        next_steps=["run json commands"],
+        verification=SAVE_VERIFICATION,
     )
 
     resume_output = _run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout
@@ -925,37 +1551,12 @@ def test_json_outputs_do_not_include_ansi_sequences(git_repo: Path, tmp_path: Pa
 
 def test_json_outputs_preserve_unicode_characters(git_repo: Path, tmp_path: Path) -> None:
     """JSON modes should keep unicode characters unescaped for readability."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     unicode_objective = "Unicode façade objective"
     unicode_decisions = "Keep naïve check in place"
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            unicode_objective,
-            "--decisions",
-            unicode_decisions,
-            "--next-step",
-            "run json commands",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        _save_args(git_repo, unicode_objective, unicode_decisions, "run json commands"),
         cwd=git_repo,
         env=env,
     )
@@ -973,75 +1574,39 @@ def test_json_outputs_preserve_unicode_characters(git_repo: Path, tmp_path: Path
 
 def test_save_alias_s_works(git_repo: Path, tmp_path: Path) -> None:
     """Short alias `s` should behave the same as `save`."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     saved = _run_dock(
-        [
-            "s",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Alias s objective",
-            "--decisions",
             "Alias s decisions",
-            "--next-step",
             "Alias s next step",
-            "--risks",
-            "none",
-            "--command",
-            "echo alias-s",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo alias-s",
+            command_name="s",
+        ),
         cwd=git_repo,
         env=env,
     )
     assert "Saved checkpoint" in saved.stdout
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["objective"] == "Alias s objective"
 
 
 def test_save_alias_s_accepts_trimmed_root_override(git_repo: Path, tmp_path: Path) -> None:
     """Save alias `s` should accept trimmed root override values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     saved = _run_dock(
-        [
-            "s",
-            "--root",
+        _save_args(
             f"  {git_repo}  ",
-            "--no-prompt",
-            "--objective",
             "Alias s trimmed root objective",
-            "--decisions",
             "Alias s trimmed root decisions",
-            "--next-step",
             "alias s step",
-            "--risks",
-            "none",
-            "--command",
-            "echo alias-s-trimmed",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo alias-s-trimmed",
+            command_name="s",
+        ),
         cwd=tmp_path,
         env=env,
     )
@@ -1050,8 +1615,7 @@ def test_save_alias_s_accepts_trimmed_root_override(git_repo: Path, tmp_path: Pa
 
 def test_save_alias_s_rejects_blank_root_override(git_repo: Path, tmp_path: Path) -> None:
     """Save alias `s` should reject blank root override values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         [
@@ -1072,15 +1636,12 @@ def test_save_alias_s_rejects_blank_root_override(git_repo: Path, tmp_path: Path
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--root must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--root must be a non-empty string.")
 
 
 def test_save_alias_s_rejects_blank_template_path(git_repo: Path, tmp_path: Path) -> None:
     """Save alias `s` should reject blank template option values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         [
@@ -1103,15 +1664,12 @@ def test_save_alias_s_rejects_blank_template_path(git_repo: Path, tmp_path: Path
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--template must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--template must be a non-empty string.")
 
 
 def test_save_alias_s_rejects_tml_template_extension(git_repo: Path, tmp_path: Path) -> None:
     """Save alias `s` should reject unsupported `.tml` templates."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     bad_template = tmp_path / "alias_s_template.tml"
     bad_template.write_text('objective = "bad extension"\n', encoding="utf-8")
@@ -1139,18 +1697,15 @@ def test_save_alias_s_rejects_tml_template_extension(git_repo: Path, tmp_path: P
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template must be .json or .toml" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template must be .json or .toml")
 
 
 def test_save_alias_s_template_non_utf8_file_is_actionable(git_repo: Path, tmp_path: Path) -> None:
     """Save alias `s` should show actionable errors for non-UTF8 templates."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     bad_template = tmp_path / "alias_s_non_utf8_template.json"
-    bad_template.write_bytes(b"\xff\xfe\x00")
+    _write_fixture_bytes(bad_template, b"\xff\xfe\x00")
 
     failed = _run_dock(
         [
@@ -1175,9 +1730,7 @@ def test_save_alias_s_template_non_utf8_file_is_actionable(git_repo: Path, tmp_p
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Failed to read template:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Failed to read template:")
 
 
 def test_save_alias_s_template_directory_path_is_actionable(
@@ -1185,8 +1738,7 @@ def test_save_alias_s_template_directory_path_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should fail clearly when template path is a directory."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         [
@@ -1211,9 +1763,7 @@ def test_save_alias_s_template_directory_path_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Failed to read template:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Failed to read template:")
 
 
 def test_save_alias_s_missing_template_path_is_actionable(
@@ -1221,8 +1771,7 @@ def test_save_alias_s_missing_template_path_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should fail clearly for missing template files."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     missing_template = tmp_path / "alias-s-missing-template.json"
 
     failed = _run_dock(
@@ -1248,9 +1797,7 @@ def test_save_alias_s_missing_template_path_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template not found:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template not found:")
 
 
 def test_save_alias_s_invalid_template_content_is_actionable(
@@ -1258,8 +1805,7 @@ def test_save_alias_s_invalid_template_content_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should fail clearly for malformed template content."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     bad_template = tmp_path / "alias_s_bad_template.toml"
     bad_template.write_text("[broken\nvalue = 1", encoding="utf-8")
 
@@ -1286,9 +1832,7 @@ def test_save_alias_s_invalid_template_content_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Failed to parse template:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Failed to parse template:")
 
 
 def test_save_alias_s_template_list_field_type_error_is_actionable(
@@ -1296,18 +1840,14 @@ def test_save_alias_s_template_list_field_type_error_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should surface schema list-field type errors cleanly."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    bad_template = tmp_path / "alias_s_bad_types.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": "bad list shape",
-                "decisions": "invalid next_steps type",
-                "next_steps": "not-a-list",
-            }
-        ),
-        encoding="utf-8",
+    env = _dock_env(tmp_path / ".dockyard_data")
+    bad_template = _write_json_template(
+        tmp_path / "alias_s_bad_types.json",
+        {
+            "objective": "bad list shape",
+            "decisions": "invalid next_steps type",
+            "next_steps": "not-a-list",
+        },
     )
 
     failed = _run_dock(
@@ -1333,9 +1873,7 @@ def test_save_alias_s_template_list_field_type_error_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'next_steps' must be an array of strings" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template field 'next_steps' must be an array of strings")
 
 
 def test_save_alias_s_template_verification_type_error_is_actionable(
@@ -1343,8 +1881,7 @@ def test_save_alias_s_template_verification_type_error_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should surface verification type errors cleanly."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     bad_template = tmp_path / "alias_s_bad_verification.toml"
     bad_template.write_text(
         "\n".join(
@@ -1383,9 +1920,7 @@ def test_save_alias_s_template_verification_type_error_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'tests_run' must be bool or bool-like string" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template field 'tests_run' must be bool or bool-like string")
 
 
 def test_save_alias_s_template_bool_like_invalid_string_is_rejected(
@@ -1393,20 +1928,16 @@ def test_save_alias_s_template_bool_like_invalid_string_is_rejected(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should reject unknown bool-like verification values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    bad_template = tmp_path / "alias_s_bad_bool_like.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": "Alias s invalid bool-like",
-                "decisions": "bad tests_run value",
-                "next_steps": ["step"],
-                "risks_review": "none",
-                "verification": {"tests_run": "maybe"},
-            }
-        ),
-        encoding="utf-8",
+    env = _dock_env(tmp_path / ".dockyard_data")
+    bad_template = _write_json_template(
+        tmp_path / "alias_s_bad_bool_like.json",
+        {
+            "objective": "Alias s invalid bool-like",
+            "decisions": "bad tests_run value",
+            "next_steps": ["step"],
+            "risks_review": "none",
+            "verification": {"tests_run": "maybe"},
+        },
     )
 
     failed = _run_dock(
@@ -1432,9 +1963,7 @@ def test_save_alias_s_template_bool_like_invalid_string_is_rejected(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'tests_run' must be bool or bool-like string" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template field 'tests_run' must be bool or bool-like string")
 
 
 def test_save_alias_s_template_must_be_object_or_table(
@@ -1442,10 +1971,9 @@ def test_save_alias_s_template_must_be_object_or_table(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should reject non-object template payloads."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     bad_template = tmp_path / "alias_s_list_template.json"
-    bad_template.write_text(json.dumps(["not", "an", "object"]), encoding="utf-8")
+    _write_fixture_bytes(bad_template, NON_OBJECT_TEMPLATE_BYTES)
 
     failed = _run_dock(
         [
@@ -1470,9 +1998,7 @@ def test_save_alias_s_template_must_be_object_or_table(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template must contain an object/table" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template must contain an object/table")
 
 
 def test_save_alias_s_unsupported_template_extension_is_actionable(
@@ -1480,8 +2006,7 @@ def test_save_alias_s_unsupported_template_extension_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should reject unsupported template extensions."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     bad_template = tmp_path / "alias_s_template.yaml"
     bad_template.write_text("objective: bad extension\n", encoding="utf-8")
 
@@ -1508,38 +2033,36 @@ def test_save_alias_s_unsupported_template_extension_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template must be .json or .toml" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template must be .json or .toml")
 
 
-def test_save_alias_s_with_json_template_no_prompt(git_repo: Path, tmp_path: Path) -> None:
+def test_save_alias_s_with_json_template_no_prompt(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Save alias `s` should support JSON templates in no-prompt mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    template_path = tmp_path / "alias_s_save_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Alias s template checkpoint objective",
-                "decisions": "Alias s template decisions block",
-                "next_steps": ["Alias s template next step 1", "Alias s template next step 2"],
-                "risks_review": "Alias s template risk notes",
-                "resume_commands": ["echo alias-s-template-cmd"],
-                "tags": ["alias-s-template", "mvp"],
-                "links": ["https://example.com/alias-s-template-doc"],
-                "verification": {
-                    "tests_run": True,
-                    "tests_command": "pytest -q",
-                    "build_ok": True,
-                    "build_command": "echo build",
-                    "lint_ok": False,
-                    "smoke_ok": False,
-                },
-            }
-        ),
-        encoding="utf-8",
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / "alias_s_save_template.json",
+        {
+            "objective": "Alias s template checkpoint objective",
+            "decisions": "Alias s template decisions block",
+            "next_steps": ["Alias s template next step 1", "Alias s template next step 2"],
+            "risks_review": "Alias s template risk notes",
+            "resume_commands": ["echo alias-s-template-cmd"],
+            "tags": ["alias-s-template", "mvp"],
+            "links": ["https://example.com/alias-s-template-doc"],
+            "verification": {
+                "tests_run": True,
+                "tests_command": "pytest -q",
+                "build_ok": True,
+                "build_command": "echo build",
+                "lint_ok": False,
+                "smoke_ok": False,
+            },
+        },
     )
 
     _run_dock(
@@ -1556,7 +2079,7 @@ def test_save_alias_s_with_json_template_no_prompt(git_repo: Path, tmp_path: Pat
         env=env,
     )
 
-    resume_payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    resume_payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert resume_payload["objective"] == "Alias s template checkpoint objective"
     assert resume_payload["next_steps"] == ["Alias s template next step 1", "Alias s template next step 2"]
     assert resume_payload["verification"]["tests_run"] is True
@@ -1565,17 +2088,18 @@ def test_save_alias_s_with_json_template_no_prompt(git_repo: Path, tmp_path: Pat
 
     links_output = _run_dock(["links"], cwd=git_repo, env=env).stdout
     assert "https://example.com/alias-s-template-doc" in links_output
-    tagged_rows = json.loads(
-        _run_dock(["ls", "--tag", "alias-s-template", "--json"], cwd=tmp_path, env=env).stdout
+    tagged_rows = _run_dock_json(
+        ["ls", "--tag", "alias-s-template", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(tagged_rows) == 1
-    assert tagged_rows[0]["branch"] == _git_current_branch(git_repo)
+    assert tagged_rows[0]["branch"] == git_template_branch
 
 
 def test_save_alias_s_with_toml_template_no_prompt(git_repo: Path, tmp_path: Path) -> None:
     """Save alias `s` should accept TOML templates in no-prompt mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     template_path = tmp_path / "alias_s_save_template.toml"
     template_path.write_text(
@@ -1610,7 +2134,7 @@ def test_save_alias_s_with_toml_template_no_prompt(git_repo: Path, tmp_path: Pat
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["objective"] == "Alias s TOML objective"
     assert payload["verification"]["tests_run"] is True
     assert payload["verification"]["build_ok"] is True
@@ -1623,21 +2147,17 @@ def test_save_alias_s_template_path_accepts_trimmed_value(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should trim whitespace around template path values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    template_path = tmp_path / "alias_s_trimmed_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Alias s trimmed template objective",
-                "decisions": "Template path trimming behavior",
-                "next_steps": ["run resume"],
-                "risks_review": "none",
-                "resume_commands": ["echo alias-s-trimmed-template"],
-            }
-        ),
-        encoding="utf-8",
+    template_path = _write_json_template(
+        tmp_path / "alias_s_trimmed_template.json",
+        {
+            "objective": "Alias s trimmed template objective",
+            "decisions": "Template path trimming behavior",
+            "next_steps": ["run resume"],
+            "risks_review": "none",
+            "resume_commands": ["echo alias-s-trimmed-template"],
+        },
     )
 
     _run_dock(
@@ -1653,7 +2173,7 @@ def test_save_alias_s_template_path_accepts_trimmed_value(
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["objective"] == "Alias s trimmed template objective"
 
 
@@ -1662,26 +2182,22 @@ def test_save_alias_s_template_bool_like_strings_are_coerced(
     tmp_path: Path,
 ) -> None:
     """Save alias `s` should coerce bool-like verification template values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    template_path = tmp_path / "alias_s_bool_like_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Alias s bool-like objective",
-                "decisions": "Use string booleans in template",
-                "next_steps": ["Run resume json"],
-                "risks_review": "none",
-                "verification": {
-                    "tests_run": "yes",
-                    "build_ok": "1",
-                    "lint_ok": "no",
-                    "smoke_ok": "false",
-                },
-            }
-        ),
-        encoding="utf-8",
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / "alias_s_bool_like_template.json",
+        {
+            "objective": "Alias s bool-like objective",
+            "decisions": "Use string booleans in template",
+            "next_steps": ["Run resume json"],
+            "risks_review": "none",
+            "verification": {
+                "tests_run": "yes",
+                "build_ok": "1",
+                "lint_ok": "no",
+                "smoke_ok": "false",
+            },
+        },
     )
 
     _run_dock(
@@ -1697,7 +2213,7 @@ def test_save_alias_s_template_bool_like_strings_are_coerced(
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["verification"]["tests_run"] is True
     assert payload["verification"]["build_ok"] is True
     assert payload["verification"]["lint_ok"] is False
@@ -1706,35 +2222,16 @@ def test_save_alias_s_template_bool_like_strings_are_coerced(
 
 def test_save_accepts_trimmed_root_override(git_repo: Path, tmp_path: Path) -> None:
     """Save should accept root override values with surrounding whitespace."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     saved = _run_dock(
-        [
-            "save",
-            "--root",
+        _save_args(
             f"  {git_repo}  ",
-            "--no-prompt",
-            "--objective",
             "Trimmed root objective",
-            "--decisions",
             "Trimmed root decisions",
-            "--next-step",
             "trimmed root step",
-            "--risks",
-            "none",
-            "--command",
-            "echo trimmed-root",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo trimmed-root",
+        ),
         cwd=tmp_path,
         env=env,
     )
@@ -1743,8 +2240,7 @@ def test_save_accepts_trimmed_root_override(git_repo: Path, tmp_path: Path) -> N
 
 def test_save_rejects_blank_root_override(git_repo: Path, tmp_path: Path) -> None:
     """Save should reject blank root override values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         [
@@ -1765,52 +2261,104 @@ def test_save_rejects_blank_root_override(git_repo: Path, tmp_path: Path) -> Non
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--root must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--root must be a non-empty string.")
 
 
-def test_save_alias_dock_accepts_trimmed_root_override(git_repo: Path, tmp_path: Path) -> None:
-    """Dock alias should accept trimmed root override values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_save_branch_override_records_checkpoint_without_checkout(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """Save should relabel the branch without switching or re-reading git state."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+    default_branch = git_template_branch
+    head_sha = _git_branch_status(git_repo)[0]
 
     saved = _run_dock(
         [
-            "dock",
+            "save",
             "--root",
-            f"  {git_repo}  ",
+            str(git_repo),
+            "--branch",
+            "  feature/branch-override  ",
             "--no-prompt",
             "--objective",
-            "Dock alias trimmed root objective",
+            "Branch override objective",
             "--decisions",
-            "Dock alias trimmed root decisions",
+            "Branch override decisions",
             "--next-step",
-            "dock alias step",
+            "branch override step",
             "--risks",
             "none",
-            "--command",
-            "echo dock-alias",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
             "--no-auto-review",
         ],
         cwd=tmp_path,
         env=env,
     )
+    assert "feature/branch-override" in saved.stdout
+    assert _git_branch_status(git_repo)[1] == default_branch
+
+    payload = _run_dock_json(
+        ["resume", "--branch", "feature/branch-override", "--json"],
+        cwd=git_repo,
+        env=env,
+    )
+    assert payload["branch"] == "feature/branch-override"
+    assert payload["objective"] == "Branch override objective"
+    # Only the label changes; the sha is still the checked-out HEAD.
+    assert payload["head_sha"] == head_sha
+
+
+def test_save_rejects_blank_branch_override(git_repo: Path, tmp_path: Path) -> None:
+    """Save should reject blank branch overrides before opening the store."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    failed = _run_dock(
+        [
+            "save",
+            "--branch",
+            "   ",
+            "--no-prompt",
+            "--objective",
+            "Blank branch objective",
+            "--decisions",
+            "Blank branch decisions",
+            "--next-step",
+            "blank branch step",
+            "--risks",
+            "none",
+        ],
+        cwd=git_repo,
+        env=env,
+        expect_code=2,
+    )
+    _assert_cli_error(failed, "--branch must be a non-empty string.")
+    assert not dock_home.exists()
+
+
+def test_save_alias_dock_accepts_trimmed_root_override(git_repo: Path, tmp_path: Path) -> None:
+    """Dock alias should accept trimmed root override values."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    saved = _run_dock(
+        _save_args(
+            f"  {git_repo}  ",
+            "Dock alias trimmed root objective",
+            "Dock alias trimmed root decisions",
+            "dock alias step",
+            command="echo dock-alias",
+            command_name="dock",
+        ),
+        cwd=tmp_path,
+        env=env,
+    )
     assert "Saved checkpoint" in saved.stdout
 
 
 def test_save_alias_dock_rejects_blank_root_override(git_repo: Path, tmp_path: Path) -> None:
     """Dock alias should reject blank root override values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         [
@@ -1831,15 +2379,12 @@ def test_save_alias_dock_rejects_blank_root_override(git_repo: Path, tmp_path: P
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--root must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--root must be a non-empty string.")
 
 
 def test_save_alias_dock_rejects_blank_template_path(git_repo: Path, tmp_path: Path) -> None:
     """Dock alias should reject blank template option values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         [
@@ -1862,9 +2407,7 @@ def test_save_alias_dock_rejects_blank_template_path(git_repo: Path, tmp_path: P
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--template must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--template must be a non-empty string.")
 
 
 def test_save_alias_dock_rejects_tml_template_extension(
@@ -1872,8 +2415,7 @@ def test_save_alias_dock_rejects_tml_template_extension(
     tmp_path: Path,
 ) -> None:
     """Dock alias should reject unsupported `.tml` templates."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     bad_template = tmp_path / "alias_dock_template.tml"
     bad_template.write_text('objective = "bad extension"\n', encoding="utf-8")
@@ -1901,9 +2443,7 @@ def test_save_alias_dock_rejects_tml_template_extension(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template must be .json or .toml" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template must be .json or .toml")
 
 
 def test_save_alias_dock_template_non_utf8_file_is_actionable(
@@ -1911,11 +2451,10 @@ def test_save_alias_dock_template_non_utf8_file_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Dock alias should show actionable errors for non-UTF8 templates."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     bad_template = tmp_path / "alias_dock_non_utf8_template.json"
-    bad_template.write_bytes(b"\xff\xfe\x00")
+    _write_fixture_bytes(bad_template, b"\xff\xfe\x00")
 
     failed = _run_dock(
         [
@@ -1940,9 +2479,7 @@ def test_save_alias_dock_template_non_utf8_file_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Failed to read template:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Failed to read template:")
 
 
 def test_save_alias_dock_template_directory_path_is_actionable(
@@ -1950,8 +2487,7 @@ def test_save_alias_dock_template_directory_path_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Dock alias should fail clearly when template path is a directory."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         [
@@ -1976,9 +2512,7 @@ def test_save_alias_dock_template_directory_path_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Failed to read template:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Failed to read template:")
 
 
 def test_save_alias_dock_missing_template_path_is_actionable(
@@ -1986,8 +2520,7 @@ def test_save_alias_dock_missing_template_path_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Dock alias should fail clearly for missing template files."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     missing_template = tmp_path / "alias-dock-missing-template.json"
 
     failed = _run_dock(
@@ -2013,9 +2546,7 @@ def test_save_alias_dock_missing_template_path_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template not found:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template not found:")
 
 
 def test_save_alias_dock_invalid_template_content_is_actionable(
@@ -2023,8 +2554,7 @@ def test_save_alias_dock_invalid_template_content_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Dock alias should fail clearly for malformed template content."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     bad_template = tmp_path / "alias_dock_bad_template.toml"
     bad_template.write_text("[broken\nvalue = 1", encoding="utf-8")
 
@@ -2051,9 +2581,7 @@ def test_save_alias_dock_invalid_template_content_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Failed to parse template:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Failed to parse template:")
 
 
 def test_save_alias_dock_template_list_field_type_error_is_actionable(
@@ -2061,18 +2589,14 @@ def test_save_alias_dock_template_list_field_type_error_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Dock alias should surface schema list-field type errors cleanly."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    bad_template = tmp_path / "alias_dock_bad_types.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": "bad list shape",
-                "decisions": "invalid next_steps type",
-                "next_steps": "not-a-list",
-            }
-        ),
-        encoding="utf-8",
+    env = _dock_env(tmp_path / ".dockyard_data")
+    bad_template = _write_json_template(
+        tmp_path / "alias_dock_bad_types.json",
+        {
+            "objective": "bad list shape",
+            "decisions": "invalid next_steps type",
+            "next_steps": "not-a-list",
+        },
     )
 
     failed = _run_dock(
@@ -2098,9 +2622,7 @@ def test_save_alias_dock_template_list_field_type_error_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'next_steps' must be an array of strings" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template field 'next_steps' must be an array of strings")
 
 
 def test_save_alias_dock_template_verification_type_error_is_actionable(
@@ -2108,8 +2630,7 @@ def test_save_alias_dock_template_verification_type_error_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Dock alias should surface verification type errors cleanly."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     bad_template = tmp_path / "alias_dock_bad_verification.toml"
     bad_template.write_text(
         "\n".join(
@@ -2148,9 +2669,7 @@ def test_save_alias_dock_template_verification_type_error_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'tests_run' must be bool or bool-like string" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template field 'tests_run' must be bool or bool-like string")
 
 
 def test_save_alias_dock_template_bool_like_invalid_string_is_rejected(
@@ -2158,20 +2677,16 @@ def test_save_alias_dock_template_bool_like_invalid_string_is_rejected(
     tmp_path: Path,
 ) -> None:
     """Dock alias should reject unknown bool-like verification values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    bad_template = tmp_path / "alias_dock_bad_bool_like.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": "Dock alias invalid bool-like",
-                "decisions": "bad tests_run value",
-                "next_steps": ["step"],
-                "risks_review": "none",
-                "verification": {"tests_run": "maybe"},
-            }
-        ),
-        encoding="utf-8",
+    env = _dock_env(tmp_path / ".dockyard_data")
+    bad_template = _write_json_template(
+        tmp_path / "alias_dock_bad_bool_like.json",
+        {
+            "objective": "Dock alias invalid bool-like",
+            "decisions": "bad tests_run value",
+            "next_steps": ["step"],
+            "risks_review": "none",
+            "verification": {"tests_run": "maybe"},
+        },
     )
 
     failed = _run_dock(
@@ -2197,9 +2712,7 @@ def test_save_alias_dock_template_bool_like_invalid_string_is_rejected(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'tests_run' must be bool or bool-like string" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template field 'tests_run' must be bool or bool-like string")
 
 
 def test_save_alias_dock_template_must_be_object_or_table(
@@ -2207,10 +2720,9 @@ def test_save_alias_dock_template_must_be_object_or_table(
     tmp_path: Path,
 ) -> None:
     """Dock alias should reject non-object template payloads."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     bad_template = tmp_path / "alias_dock_list_template.json"
-    bad_template.write_text(json.dumps(["not", "an", "object"]), encoding="utf-8")
+    _write_fixture_bytes(bad_template, NON_OBJECT_TEMPLATE_BYTES)
 
     failed = _run_dock(
         [
@@ -2235,9 +2747,7 @@ def test_save_alias_dock_template_must_be_object_or_table(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template must contain an object/table" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template must contain an object/table")
 
 
 def test_save_alias_dock_unsupported_template_extension_is_actionable(
@@ -2245,8 +2755,7 @@ def test_save_alias_dock_unsupported_template_extension_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Dock alias should reject unsupported template extensions."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     bad_template = tmp_path / "alias_dock_template.yaml"
     bad_template.write_text("objective: bad extension\n", encoding="utf-8")
 
@@ -2273,38 +2782,36 @@ def test_save_alias_dock_unsupported_template_extension_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template must be .json or .toml" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Template must be .json or .toml")
 
 
-def test_save_alias_dock_with_json_template_no_prompt(git_repo: Path, tmp_path: Path) -> None:
+def test_save_alias_dock_with_json_template_no_prompt(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Dock alias should support JSON templates in no-prompt mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    template_path = tmp_path / "alias_dock_save_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Dock alias template checkpoint objective",
-                "decisions": "Dock alias template decisions block",
-                "next_steps": ["Dock alias template next step 1", "Dock alias template next step 2"],
-                "risks_review": "Dock alias template risk notes",
-                "resume_commands": ["echo alias-dock-template-cmd"],
-                "tags": ["alias-dock-template", "mvp"],
-                "links": ["https://example.com/alias-dock-template-doc"],
-                "verification": {
-                    "tests_run": True,
-                    "tests_command": "pytest -q",
-                    "build_ok": True,
-                    "build_command": "echo build",
-                    "lint_ok": False,
-                    "smoke_ok": False,
-                },
-            }
-        ),
-        encoding="utf-8",
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / "alias_dock_save_template.json",
+        {
+            "objective": "Dock alias template checkpoint objective",
+            "decisions": "Dock alias template decisions block",
+            "next_steps": ["Dock alias template next step 1", "Dock alias template next step 2"],
+            "risks_review": "Dock alias template risk notes",
+            "resume_commands": ["echo alias-dock-template-cmd"],
+            "tags": ["alias-dock-template", "mvp"],
+            "links": ["https://example.com/alias-dock-template-doc"],
+            "verification": {
+                "tests_run": True,
+                "tests_command": "pytest -q",
+                "build_ok": True,
+                "build_command": "echo build",
+                "lint_ok": False,
+                "smoke_ok": False,
+            },
+        },
     )
 
     _run_dock(
@@ -2321,7 +2828,7 @@ def test_save_alias_dock_with_json_template_no_prompt(git_repo: Path, tmp_path:
         env=env,
     )
 
-    resume_payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    resume_payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert resume_payload["objective"] == "Dock alias template checkpoint objective"
     assert resume_payload["next_steps"] == ["Dock alias template next step 1", "Dock alias template next step 2"]
     assert resume_payload["verification"]["tests_run"] is True
@@ -2330,17 +2837,18 @@ def test_save_alias_dock_with_json_template_no_prompt(git_repo: Path, tmp_path:
 
     links_output = _run_dock(["links"], cwd=git_repo, env=env).stdout
     assert "https://example.com/alias-dock-template-doc" in links_output
-    tagged_rows = json.loads(
-        _run_dock(["ls", "--tag", "alias-dock-template", "--json"], cwd=tmp_path, env=env).stdout
+    tagged_rows = _run_dock_json(
+        ["ls", "--tag", "alias-dock-template", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(tagged_rows) == 1
-    assert tagged_rows[0]["branch"] == _git_current_branch(git_repo)
+    assert tagged_rows[0]["branch"] == git_template_branch
 
 
 def test_save_alias_dock_with_toml_template_no_prompt(git_repo: Path, tmp_path: Path) -> None:
     """Dock alias should accept TOML templates in no-prompt mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     template_path = tmp_path / "alias_dock_save_template.toml"
     template_path.write_text(
@@ -2375,7 +2883,7 @@ def test_save_alias_dock_with_toml_template_no_prompt(git_repo: Path, tmp_path:
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["objective"] == "Dock alias TOML objective"
     assert payload["verification"]["tests_run"] is True
     assert payload["verification"]["build_ok"] is True
@@ -2388,21 +2896,17 @@ def test_save_alias_dock_template_path_accepts_trimmed_value(
     tmp_path: Path,
 ) -> None:
     """Dock alias should trim whitespace around template path values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    template_path = tmp_path / "alias_dock_trimmed_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Dock alias trimmed template objective",
-                "decisions": "Template path trimming behavior",
-                "next_steps": ["run resume"],
-                "risks_review": "none",
-                "resume_commands": ["echo alias-dock-trimmed-template"],
-            }
-        ),
-        encoding="utf-8",
+    template_path = _write_json_template(
+        tmp_path / "alias_dock_trimmed_template.json",
+        {
+            "objective": "Dock alias trimmed template objective",
+            "decisions": "Template path trimming behavior",
+            "next_steps": ["run resume"],
+            "risks_review": "none",
+            "resume_commands": ["echo alias-dock-trimmed-template"],
+        },
     )
 
     _run_dock(
@@ -2418,7 +2922,7 @@ def test_save_alias_dock_template_path_accepts_trimmed_value(
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["objective"] == "Dock alias trimmed template objective"
 
 
@@ -2427,26 +2931,22 @@ def test_save_alias_dock_template_bool_like_strings_are_coerced(
     tmp_path: Path,
 ) -> None:
     """Dock alias should coerce bool-like verification template values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    template_path = tmp_path / "alias_dock_bool_like_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Dock alias bool-like objective",
-                "decisions": "Use string booleans in template",
-                "next_steps": ["Run resume json"],
-                "risks_review": "none",
-                "verification": {
-                    "tests_run": "yes",
-                    "build_ok": "1",
-                    "lint_ok": "no",
-                    "smoke_ok": "false",
-                },
-            }
-        ),
-        encoding="utf-8",
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / "alias_dock_bool_like_template.json",
+        {
+            "objective": "Dock alias bool-like objective",
+            "decisions": "Use string booleans in template",
+            "next_steps": ["Run resume json"],
+            "risks_review": "none",
+            "verification": {
+                "tests_run": "yes",
+                "build_ok": "1",
+                "lint_ok": "no",
+                "smoke_ok": "false",
+            },
+        },
     )
 
     _run_dock(
@@ -2462,7 +2962,7 @@ def test_save_alias_dock_template_bool_like_strings_are_coerced(
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["verification"]["tests_run"] is True
     assert payload["verification"]["build_ok"] is True
     assert payload["verification"]["lint_ok"] is False
@@ -2471,8 +2971,7 @@ def test_save_alias_dock_template_bool_like_strings_are_coerced(
 
 def test_save_verification_text_fields_are_normalized(git_repo: Path, tmp_path: Path) -> None:
     """Save should trim non-blank verification text and drop blank entries."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
         [
@@ -2506,7 +3005,7 @@ def test_save_verification_text_fields_are_normalized(git_repo: Path, tmp_path:
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     verification = payload["verification"]
     assert verification["tests_run"] is True
     assert verification["build_ok"] is True
@@ -2520,8 +3019,7 @@ def test_save_verification_text_fields_are_normalized(git_repo: Path, tmp_path:
 
 def test_save_editor_populates_decisions(git_repo: Path, tmp_path: Path) -> None:
     """Save should capture decisions from the configured editor."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     editor_script = tmp_path / "fake_editor.sh"
     editor_script.write_text(
         "\n".join(
@@ -2564,14 +3062,13 @@ def test_save_editor_populates_decisions(git_repo: Path, tmp_path: Path) -> None
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["decisions"] == "Decisions captured in editor"
 
 
 def test_save_editor_with_explicit_decisions_skips_editor(git_repo: Path, tmp_path: Path) -> None:
     """Explicit decisions should take precedence over editor invocation."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     env["EDITOR"] = str(tmp_path / "missing-editor-command")
 
     _run_dock(
@@ -2604,7 +3101,7 @@ def test_save_editor_with_explicit_decisions_skips_editor(git_repo: Path, tmp_pa
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["decisions"] == "Use explicit decisions value"
 
 
@@ -2613,8 +3110,7 @@ def test_save_editor_ignores_placeholder_only_content(
     tmp_path: Path,
 ) -> None:
     """Placeholder-only editor text should not satisfy required decisions field."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     editor_script = tmp_path / "placeholder_editor.sh"
     editor_script.write_text(
         "\n".join(
@@ -2648,9 +3144,10 @@ def test_save_editor_ignores_placeholder_only_content(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--no-prompt requires --objective, --decisions, and at least one --next-step." in output
-    assert "Traceback" not in output
+    _assert_cli_error(
+        failed,
+        "--no-prompt requires --objective, --decisions, and at least one --next-step.",
+    )
 
 
 def test_save_editor_ignores_indented_placeholder_only_content(
@@ -2658,8 +3155,7 @@ def test_save_editor_ignores_indented_placeholder_only_content(
     tmp_path: Path,
 ) -> None:
     """Indented scaffold-only editor text should still be treated as missing."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     editor_script = tmp_path / "indented_placeholder_editor.sh"
     editor_script.write_text(
         "\n".join(
@@ -2693,9 +3189,10 @@ def test_save_editor_ignores_indented_placeholder_only_content(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--no-prompt requires --objective, --decisions, and at least one --next-step." in output
-    assert "Traceback" not in output
+    _assert_cli_error(
+        failed,
+        "--no-prompt requires --objective, --decisions, and at least one --next-step.",
+    )
 
 
 def test_save_editor_ignores_repeated_scaffold_lines(
@@ -2703,8 +3200,7 @@ def test_save_editor_ignores_repeated_scaffold_lines(
     tmp_path: Path,
 ) -> None:
     """Repeated scaffold lines should be stripped before persistence."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     editor_script = tmp_path / "repeated_scaffold_editor.sh"
     editor_script.write_text(
         "\n".join(
@@ -2746,7 +3242,7 @@ def test_save_editor_ignores_repeated_scaffold_lines(
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["decisions"] == "Core editor decision"
 
 
@@ -2755,8 +3251,7 @@ def test_save_editor_preserves_non_scaffold_hash_lines(
     tmp_path: Path,
 ) -> None:
     """Non-scaffold hash-prefixed lines from editor should be preserved."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     editor_script = tmp_path / "heading_editor.sh"
     editor_script.write_text(
         "\n".join(
@@ -2798,7 +3293,7 @@ def test_save_editor_preserves_non_scaffold_hash_lines(
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["decisions"] == "# Keep this heading\nDecision detail"
 
 
@@ -2807,8 +3302,7 @@ def test_save_editor_preserves_intentional_blank_lines(
     tmp_path: Path,
 ) -> None:
     """Editor text normalization should preserve internal blank lines."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     editor_script = tmp_path / "paragraph_editor.sh"
     editor_script.write_text(
         "\n".join(
@@ -2850,7 +3344,7 @@ def test_save_editor_preserves_intentional_blank_lines(
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["decisions"] == "First paragraph\n\nSecond paragraph"
 
 
@@ -2859,8 +3353,7 @@ def test_save_editor_trims_outer_blank_lines(
     tmp_path: Path,
 ) -> None:
     """Editor normalization should trim leading/trailing empty lines."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     editor_script = tmp_path / "trim_editor.sh"
     editor_script.write_text(
         "\n".join(
@@ -2902,7 +3395,7 @@ def test_save_editor_trims_outer_blank_lines(
         cwd=git_repo,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["decisions"] == "Core decision line"
 
 
@@ -2962,48 +3455,31 @@ def test_run_aliases_compact_multiline_command_labels(
     run_cwd_kind: str,
 ) -> None:
     """Run aliases should compact multiline command labels in --run output."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Run multiline command label baseline",
-            "--decisions",
             "Mutate command payload to include line breaks",
-            "--next-step",
             f"run {command_name} --run",
-            "--risks",
-            "none",
-            "--command",
-            "echo baseline",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo baseline",
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET resume_commands_json = ?",
-        (json.dumps(["echo run-one\necho run-two"]),),
+    _mutate_dock_db(
+        db_path,
+        [
+            (
+                "UPDATE checkpoints SET resume_commands_json = ?",
+                (json.dumps(["echo run-one\necho run-two"]),),
+            ),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     args = [command_name, "--run"]
     run_cwd = git_repo
@@ -3023,11 +3499,13 @@ def test_run_aliases_compact_multiline_command_labels(
 def test_run_branch_scopes_execute_commands_on_success(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
     case: RunBranchSuccessCaseMeta,
 ) -> None:
     """Branch-scoped run variants should execute recorded commands."""
     _assert_run_executes_commands_for_scope(
         git_repo=git_repo,
+        git_branch=git_template_branch,
         tmp_path=tmp_path,
         command_name=case.command_name,
         include_berth=case.include_berth,
@@ -3048,11 +3526,13 @@ def test_run_branch_scopes_execute_commands_on_success(
 def test_run_branch_scopes_stop_on_failure(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
     case: RunBranchFailureCaseMeta,
 ) -> None:
     """Branch-scoped run variants should stop on first failing command."""
     _assert_run_stops_on_failure_for_scope(
         git_repo=git_repo,
+        git_branch=git_template_branch,
         tmp_path=tmp_path,
         command_name=case.command_name,
         include_berth=case.include_berth,
@@ -3070,11 +3550,13 @@ def test_run_branch_scopes_stop_on_failure(
 def test_run_berth_scope_executes_commands_on_success(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
     command_name: RunCommandName,
 ) -> None:
     """Berth-scoped run aliases should execute recorded commands successfully."""
     _assert_run_executes_commands_for_scope(
         git_repo=git_repo,
+        git_branch=git_template_branch,
         tmp_path=tmp_path,
         command_name=command_name,
         include_berth=True,
@@ -3094,11 +3576,13 @@ def test_run_berth_scope_executes_commands_on_success(
 def test_run_berth_scope_stops_on_failure(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
     command_name: RunCommandName,
 ) -> None:
     """Berth-scoped run aliases should stop execution on first failure."""
     _assert_run_stops_on_failure_for_scope(
         git_repo=git_repo,
+        git_branch=git_template_branch,
         tmp_path=tmp_path,
         command_name=command_name,
         include_berth=True,
@@ -3114,48 +3598,31 @@ def test_run_berth_scope_stops_on_failure(
 
 def test_resume_handles_scalar_list_payload_fields(git_repo: Path, tmp_path: Path) -> None:
     """Resume handoff/run should coerce scalar list payloads safely."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Scalar list payload baseline",
-            "--decisions",
             "Mutate list fields to scalar strings",
-            "--next-step",
             "seed step",
-            "--risks",
-            "none",
-            "--command",
-            "echo seed",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo seed",
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET next_steps_json = ?, resume_commands_json = ?",
-        (json.dumps("step one\nstep two"), json.dumps("echo run-one\necho run-two")),
+    _mutate_dock_db(
+        db_path,
+        [
+            (
+                "UPDATE checkpoints SET next_steps_json = ?, resume_commands_json = ?",
+                (json.dumps("step one\nstep two"), json.dumps("echo run-one\necho run-two")),
+            ),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     handoff_output = _run_dock(["resume", "--handoff"], cwd=git_repo, env=env).stdout
     assert "  - step one step two" in handoff_output
@@ -3187,8 +3654,7 @@ def _seed_checkpoint_for_run(
     Returns:
         Environment mapping configured with Dockyard home.
     """
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     save_args = [
         "save",
@@ -3302,6 +3768,7 @@ def _assert_run_no_commands_noop(
 def _assert_run_executes_commands_for_scope(
     *,
     git_repo: Path,
+    git_branch: str,
     tmp_path: Path,
     command_name: RunCommandName,
     include_berth: bool,
@@ -3313,7 +3780,7 @@ def _assert_run_executes_commands_for_scope(
     resume_commands: RunCommands,
 ) -> None:
     """Assert scoped run mode executes recorded commands successfully."""
-    branch = _git_current_branch(git_repo) if include_branch else None
+    branch = git_branch if include_branch else None
     _assert_run_executes_commands_on_success(
         git_repo=git_repo,
         tmp_path=tmp_path,
@@ -3334,6 +3801,7 @@ def _assert_run_executes_commands_for_scope(
 def _assert_run_stops_on_failure_for_scope(
     *,
     git_repo: Path,
+    git_branch: str,
     tmp_path: Path,
     command_name: RunCommandName,
     include_berth: bool,
@@ -3346,7 +3814,7 @@ def _assert_run_stops_on_failure_for_scope(
     skipped_command: str,
 ) -> None:
     """Assert scoped run mode stops on first failing command."""
-    branch = _git_current_branch(git_repo) if include_branch else None
+    branch = git_branch if include_branch else None
     _assert_run_stops_on_first_failure(
         git_repo=git_repo,
         tmp_path=tmp_path,
@@ -3368,6 +3836,7 @@ def _assert_run_stops_on_failure_for_scope(
 def _assert_run_no_commands_noop_for_scope(
     *,
     git_repo: Path,
+    git_branch: str,
     tmp_path: Path,
     command_name: RunCommandName,
     include_berth: bool,
@@ -3381,6 +3850,7 @@ def _assert_run_no_commands_noop_for_scope(
 
     Args:
         git_repo: Repository path used for checkpoint save context.
+        git_branch: Branch checked out in `git_repo`, used as the branch selector.
         tmp_path: Temporary path used for Dockyard home and optional run cwd.
         command_name: Command token (resume/r/undock).
         include_berth: Whether run args should include trimmed berth selector.
@@ -3390,7 +3860,7 @@ def _assert_run_no_commands_noop_for_scope(
         decisions: Checkpoint decisions text.
         next_step: Checkpoint next-step text.
     """
-    branch = _git_current_branch(git_repo) if include_branch else None
+    branch = git_branch if include_branch else None
     _assert_run_no_commands_noop(
         git_repo=git_repo,
         tmp_path=tmp_path,
@@ -3415,11 +3885,13 @@ def _assert_run_no_commands_noop_for_scope(
 def test_run_scopes_with_no_commands_are_noop_success(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
     case: RunNoCommandCaseMeta,
 ) -> None:
     """Run scope variants should no-op when no commands are recorded."""
     _assert_run_no_commands_noop_for_scope(
         git_repo=git_repo,
+        git_branch=git_template_branch,
         tmp_path=tmp_path,
         command_name=case.command_name,
         include_berth=case.include_berth,
@@ -3440,48 +3912,31 @@ def test_run_aliases_skip_blank_command_entries(
     run_cwd_kind: RunCwdKind,
 ) -> None:
     """Run aliases should ignore blank entries and normalize command spacing."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             f"{command_name} blank run command baseline",
-            "--decisions",
             "Mutate run command payload with blank entries",
-            "--next-step",
             f"run {command_name} --run",
-            "--risks",
-            "none",
-            "--command",
-            "echo keep-me",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo keep-me",
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET resume_commands_json = ?",
-        (json.dumps(["   ", "\n\t", "  echo keep-me  "]),),
+    _mutate_dock_db(
+        db_path,
+        [
+            (
+                "UPDATE checkpoints SET resume_commands_json = ?",
+                (json.dumps(["   ", "\n\t", "  echo keep-me  "]),),
+            ),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     output = _run_dock(
         _build_run_args(
@@ -3516,13 +3971,12 @@ def test_run_aliases_all_blank_commands_are_noop_success(
     )
 
     db_path = Path(env["DOCKYARD_HOME"]) / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET resume_commands_json = ?",
-        (json.dumps(["   ", "\n\t", ""]),),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE checkpoints SET resume_commands_json = ?", (json.dumps(["   ", "\n\t", ""]),)),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     output = _run_dock(
         _build_run_args(
@@ -3541,35 +3995,16 @@ def test_resume_run_with_berth_executes_in_repo_root(
     tmp_path: Path,
 ) -> None:
     """Resume --run with berth arg should execute commands in repo root."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Run from berth context",
-            "--decisions",
             "Ensure execution cwd resolves from berth root path",
-            "--next-step",
             "Run resume with berth outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "pwd > run_pwd.txt",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="pwd > run_pwd.txt",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -3585,35 +4020,16 @@ def test_resume_alias_run_with_berth_executes_in_repo_root(
     tmp_path: Path,
 ) -> None:
     """Resume alias `r` with berth should execute commands in repo root."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Alias run from berth context",
-            "--decisions",
             "Ensure alias execution cwd resolves from berth root path",
-            "--next-step",
             "Run alias with berth outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "pwd > run_pwd_alias_r.txt",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="pwd > run_pwd_alias_r.txt",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -3629,35 +4045,16 @@ def test_undock_alias_run_with_berth_executes_in_repo_root(
     tmp_path: Path,
 ) -> None:
     """Undock alias with berth should execute commands in repo root."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Undock run from berth context",
-            "--decisions",
             "Ensure undock execution cwd resolves from berth root path",
-            "--next-step",
             "Run undock with berth outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "pwd > run_pwd_alias_undock.txt",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="pwd > run_pwd_alias_undock.txt",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -3673,55 +4070,35 @@ def test_resume_run_with_berth_missing_root_path_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Resume --run should fail cleanly when persisted berth root is missing."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Missing run root path objective",
-            "--decisions",
             "Ensure run path validation is actionable",
-            "--next-step",
             "Attempt resume --run with stale berth root",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     repo_id = payload["repo_id"]
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE berths SET root_path = ? WHERE repo_id = ?",
-        (str(tmp_path / "missing-run-root"), repo_id),
+    _mutate_dock_db(
+        db_path,
+        [
+            (
+                "UPDATE berths SET root_path = ? WHERE repo_id = ?",
+                (str(tmp_path / "missing-run-root"), repo_id),
+            ),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     failed = _run_dock(["resume", git_repo.name, "--run"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Repository root for --run does not exist:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Repository root for --run does not exist:")
 
 
 @pytest.mark.parametrize("command_name", ["r", "undock"])
@@ -3731,55 +4108,35 @@ def test_resume_alias_run_with_berth_missing_root_path_is_actionable(
     command_name: str,
 ) -> None:
     """Resume aliases should fail cleanly when persisted berth root is missing."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Missing alias run root path objective",
-            "--decisions",
             "Ensure alias run path validation is actionable",
-            "--next-step",
             "Attempt alias --run with stale berth root",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     repo_id = payload["repo_id"]
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE berths SET root_path = ? WHERE repo_id = ?",
-        (str(tmp_path / f"missing-run-root-{command_name}"), repo_id),
+    _mutate_dock_db(
+        db_path,
+        [
+            (
+                "UPDATE berths SET root_path = ? WHERE repo_id = ?",
+                (str(tmp_path / f"missing-run-root-{command_name}"), repo_id),
+            ),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     failed = _run_dock([command_name, git_repo.name, "--run"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Repository root for --run does not exist:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Repository root for --run does not exist:")
 
 
 @pytest.mark.parametrize("command_name", ["resume", "r", "undock"])
@@ -3787,53 +4144,36 @@ def test_run_with_branch_and_missing_root_path_is_actionable(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Run-enabled resume commands should fail cleanly with branch + stale root."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Missing branch-scoped run root path objective",
-            "--decisions",
             "Ensure branch-scoped run path validation is actionable",
-            "--next-step",
             "Attempt branch-scoped --run with stale berth root",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     repo_id = payload["repo_id"]
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE berths SET root_path = ? WHERE repo_id = ?",
-        (str(tmp_path / f"missing-run-root-branch-{command_name}"), repo_id),
+    _mutate_dock_db(
+        db_path,
+        [
+            (
+                "UPDATE berths SET root_path = ? WHERE repo_id = ?",
+                (str(tmp_path / f"missing-run-root-branch-{command_name}"), repo_id),
+            ),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     failed = _run_dock(
         [command_name, git_repo.name, "--branch", branch, "--run"],
@@ -3841,9 +4181,7 @@ def test_run_with_branch_and_missing_root_path_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Repository root for --run does not exist:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Repository root for --run does not exist:")
 
 
 def test_save_truncates_next_steps_and_commands_to_mvp_limits(
@@ -3851,8 +4189,7 @@ def test_save_truncates_next_steps_and_commands_to_mvp_limits(
     tmp_path: Path,
 ) -> None:
     """Save should cap next steps to 3 and resume commands to 5."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
         [
@@ -3904,7 +4241,7 @@ def test_save_truncates_next_steps_and_commands_to_mvp_limits(
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["next_steps"] == ["step-1", "step-2", "step-3"]
     assert payload["resume_commands"] == ["cmd-1", "cmd-2", "cmd-3", "cmd-4", "cmd-5"]
 
@@ -3918,8 +4255,7 @@ def test_save_aliases_normalize_tag_and_link_values(
     run_cwd_kind: str,
 ) -> None:
     """Save aliases should trim and de-duplicate tag/link values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
 
     _run_dock(
@@ -3966,8 +4302,8 @@ def test_save_aliases_normalize_tag_and_link_values(
         env=env,
     )
 
-    alpha_rows = json.loads(_run_dock(["ls", "--tag", "alpha", "--json"], cwd=tmp_path, env=env).stdout)
-    beta_rows = json.loads(_run_dock(["ls", "--tag", "beta", "--json"], cwd=tmp_path, env=env).stdout)
+    alpha_rows = _run_dock_json(["ls", "--tag", "alpha", "--json"], cwd=tmp_path, env=env)
+    beta_rows = _run_dock_json(["ls", "--tag", "beta", "--json"], cwd=tmp_path, env=env)
     assert len(alpha_rows) == 1
     assert len(beta_rows) == 1
     assert "alpha " not in json.dumps(alpha_rows, ensure_ascii=False)
@@ -3979,24 +4315,18 @@ def test_save_aliases_normalize_tag_and_link_values(
 
 def test_error_output_has_no_traceback(tmp_path: Path) -> None:
     """Dockyard user-facing errors should be actionable without traceback spam."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(["resume"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Error:" in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Error:")
 
 
 def test_resume_unknown_berth_is_actionable(tmp_path: Path) -> None:
     """Unknown berth resume should fail cleanly with guidance."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(["resume", "missing-berth"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Unknown berth: missing-berth" in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Unknown berth: missing-berth")
 
 
 @pytest.mark.parametrize("command_name", ["r", "undock"])
@@ -4005,13 +4335,10 @@ def test_resume_alias_unknown_berth_is_actionable(
     command_name: str,
 ) -> None:
     """Resume aliases should fail cleanly for unknown berth names."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock([command_name, "missing-berth"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Unknown berth: missing-berth" in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Unknown berth: missing-berth")
 
 
 @pytest.mark.parametrize("command_name", ["resume", "r", "undock"])
@@ -4022,28 +4349,22 @@ def test_resume_unknown_berth_output_modes_are_actionable(
     output_flag: str,
 ) -> None:
     """Unknown-berth failures should stay actionable across output modes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     args = [command_name, "missing-berth"]
     if output_flag:
         args.append(output_flag)
 
     result = _run_dock(args, cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Unknown berth: missing-berth" in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Unknown berth: missing-berth")
 
 
 def test_resume_unknown_berth_preserves_literal_markup_text(tmp_path: Path) -> None:
     """Unknown-berth errors should preserve literal bracketed tokens."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(["resume", "[red]missing[/red]"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Unknown berth: [red]missing[/red]" in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Unknown berth: [red]missing[/red]")
 
 
 @pytest.mark.parametrize("command_name", ["r", "undock"])
@@ -4052,13 +4373,10 @@ def test_resume_alias_unknown_berth_preserves_literal_markup_text(
     command_name: str,
 ) -> None:
     """Resume aliases should preserve literal bracketed tokens in berth errors."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock([command_name, "[red]missing[/red]"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Unknown berth: [red]missing[/red]" in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Unknown berth: [red]missing[/red]")
 
 
 @pytest.mark.parametrize("command_name", ["resume", "r", "undock"])
@@ -4069,50 +4387,38 @@ def test_resume_unknown_berth_literal_markup_output_modes_preserved(
     output_flag: str,
 ) -> None:
     """Literal markup text in unknown-berth errors should survive output modes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     args = [command_name, "[red]missing[/red]"]
     if output_flag:
         args.append(output_flag)
 
     result = _run_dock(args, cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Unknown berth: [red]missing[/red]" in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Unknown berth: [red]missing[/red]")
 
 
 def test_resume_rejects_blank_berth_argument(tmp_path: Path) -> None:
     """Resume should reject blank berth argument values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(["resume", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Berth must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Berth must be a non-empty string.")
 
 
 def test_resume_alias_rejects_blank_berth_argument(tmp_path: Path) -> None:
     """Resume alias should reject blank berth argument values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(["r", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Berth must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Berth must be a non-empty string.")
 
 
 def test_undock_rejects_blank_berth_argument(tmp_path: Path) -> None:
     """Undock alias should reject blank berth argument values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(["undock", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Berth must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Berth must be a non-empty string.")
 
 
 @pytest.mark.parametrize("command_name", ["resume", "r", "undock"])
@@ -4123,120 +4429,72 @@ def test_resume_blank_berth_output_modes_are_rejected(
     output_flag: str,
 ) -> None:
     """Blank berth arguments should be rejected across output modes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     args = [command_name, "   "]
     if output_flag:
         args.append(output_flag)
 
     result = _run_dock(args, cwd=tmp_path, env=env, expect_code=2)
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Berth must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(result, "Berth must be a non-empty string.")
 
 
 def test_resume_rejects_blank_branch_option(git_repo: Path, tmp_path: Path) -> None:
     """Resume should reject blank --branch option values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(["resume", "--branch", "   "], cwd=git_repo, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--branch must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--branch must be a non-empty string.")
 
 
 def test_resume_alias_rejects_blank_branch_option(git_repo: Path, tmp_path: Path) -> None:
     """Resume alias should reject blank --branch option values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(["r", "--branch", "   "], cwd=git_repo, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--branch must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--branch must be a non-empty string.")
 
 
 def test_resume_alias_branch_flag_accepts_trimmed_value(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Resume alias should resolve --branch values after trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Alias trimmed branch objective",
-            "--decisions",
             "Resolve alias branch values with surrounding whitespace",
-            "--next-step",
             "resume alias with branch",
-            "--risks",
-            "none",
-            "--command",
-            "echo alias-branch",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo alias-branch",
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    selected = json.loads(
-        _run_dock(["r", "--branch", f"  {branch}  ", "--json"], cwd=git_repo, env=env).stdout
-    )
+    selected = _run_dock_json(["r", "--branch", f"  {branch}  ", "--json"], cwd=git_repo, env=env)
     assert selected["branch"] == branch
     assert selected["objective"] == "Alias trimmed branch objective"
 
 
 def test_no_subcommand_defaults_to_harbor(git_repo: Path, tmp_path: Path) -> None:
     """Invoking dockyard without subcommand should run harbor listing."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Seed default listing",
-            "--decisions",
-            "Need default command behavior",
-            "--next-step",
-            "Run bare dock command",
-            "--risks",
-            "None",
-            "--command",
-            "echo ok",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Seed default listing",
+        decisions="Need default command behavior",
+        next_steps=["Run bare dock command"],
+        risks_review="None",
+        resume_commands=["echo ok"],
+        verification=SAVE_VERIFICATION,
     )
 
     result = _run_dock([], cwd=tmp_path, env=env)
@@ -4245,8 +4503,7 @@ def test_no_subcommand_defaults_to_harbor(git_repo: Path, tmp_path: Path) -> Non
 
 def test_root_help_includes_no_subcommand_ls_flags(tmp_path: Path) -> None:
     """Root help should advertise ls-style flags for bare callback usage."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     result = _run_dock(["--help"], cwd=tmp_path, env=env)
     help_text = result.stdout
@@ -4258,52 +4515,31 @@ def test_root_help_includes_no_subcommand_ls_flags(tmp_path: Path) -> None:
 
 def test_no_subcommand_json_empty_store_returns_array(tmp_path: Path) -> None:
     """Bare dock JSON mode should return [] for an empty dataset."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    payload = json.loads(_run_dock(["--json"], cwd=tmp_path, env=env).stdout)
+    payload = _run_dock_json(["--json"], cwd=tmp_path, env=env)
     assert payload == []
 
 
 def test_no_subcommand_supports_ls_flags(git_repo: Path, tmp_path: Path) -> None:
     """Bare dock invocation should honor ls-style filter/output flags."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback flag parity",
-            "--decisions",
-            "Support bare command ls flags",
-            "--next-step",
-            "run bare dock json with filters",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "callback-flags",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback flag parity",
+        decisions="Support bare command ls flags",
+        next_steps=["run bare dock json with filters"],
+        tags=["callback-flags"],
+        verification=SAVE_VERIFICATION,
     )
 
-    payload = json.loads(
-        _run_dock(["--json", "--tag", "callback-flags", "--limit", "1"], cwd=tmp_path, env=env).stdout
+    payload = _run_dock_json(
+        ["--json", "--tag", "callback-flags", "--limit", "1"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(payload) == 1
     assert payload[0]["objective"] == "Default callback flag parity"
@@ -4312,286 +4548,119 @@ def test_no_subcommand_supports_ls_flags(git_repo: Path, tmp_path: Path) -> None
 
 def test_no_subcommand_supports_stale_flag(git_repo: Path, tmp_path: Path) -> None:
     """Bare dock invocation should accept stale filter flag like ls."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback stale flag parity",
-            "--decisions",
-            "Support bare command stale flag",
-            "--next-step",
-            "run bare dock stale filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback stale flag parity",
+        decisions="Support bare command stale flag",
+        next_steps=["run bare dock stale filter"],
+        verification=SAVE_VERIFICATION,
     )
 
-    payload = json.loads(_run_dock(["--json", "--stale", "0"], cwd=tmp_path, env=env).stdout)
+    payload = _run_dock_json(["--json", "--stale", "0"], cwd=tmp_path, env=env)
     assert len(payload) == 1
     assert payload[0]["objective"] == "Default callback stale flag parity"
 
 
 def test_no_subcommand_supports_stale_flag_in_repo_context(git_repo: Path, tmp_path: Path) -> None:
     """Bare dock invocation should honor stale filter flag from repo cwd."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback stale flag parity in repo",
-            "--decisions",
-            "Support bare command stale flag from repo cwd",
-            "--next-step",
-            "run bare dock stale filter from repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback stale flag parity in repo",
+        decisions="Support bare command stale flag from repo cwd",
+        next_steps=["run bare dock stale filter from repo"],
+        verification=SAVE_VERIFICATION,
     )
 
-    payload = json.loads(_run_dock(["--json", "--stale", "0"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["--json", "--stale", "0"], cwd=git_repo, env=env)
     assert len(payload) == 1
     assert payload[0]["objective"] == "Default callback stale flag parity in repo"
 
 
-def test_no_subcommand_rejects_invalid_stale_flag(tmp_path: Path) -> None:
-    """Bare dock invocation should validate stale option bounds."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["--stale", "-1"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--stale must be >= 0." in output
-    assert "Traceback" not in output
-
-
-def test_no_subcommand_rejects_invalid_limit_flag(tmp_path: Path) -> None:
-    """Bare dock invocation should validate limit option bounds."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["--limit", "0"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--limit must be >= 1." in output
-    assert "Traceback" not in output
-
-
-def test_no_subcommand_rejects_blank_tag_filter(tmp_path: Path) -> None:
-    """Bare dock invocation should reject blank tag filter values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["--tag", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--tag must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"])
 @pytest.mark.parametrize(
     ("args", "expected_fragment"),
-    [
-        (("--tag", "alpha", "--stale", "-1", "--limit", "1"), "--stale must be >= 0."),
-        (("--tag", "alpha", "--stale", "0", "--limit", "0"), "--limit must be >= 1."),
-        (("--tag", "   ", "--stale", "0", "--limit", "1"), "--tag must be a non-empty string."),
-    ],
+    [pytest.param(*case[1:], id=case[0]) for case in NO_SUBCOMMAND_FILTER_ERROR_CASES],
 )
-def test_no_subcommand_rejects_invalid_combined_filters(
+def test_no_subcommand_rejects_invalid_filters(
+    git_repo: Path,
     tmp_path: Path,
+    empty_dock_home: Path,
     args: tuple[str, ...],
     expected_fragment: str,
+    run_cwd_kind: RunCwdKind,
 ) -> None:
-    """Bare dock should reject invalid values in combined filter sets."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(list(args), cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize(
-    ("args", "expected_fragment"),
-    [
-        (("--stale", "-1"), "--stale must be >= 0."),
-        (("--limit", "0"), "--limit must be >= 1."),
-        (("--tag", "   "), "--tag must be a non-empty string."),
-        (("--tag", "alpha", "--stale", "-1", "--limit", "1"), "--stale must be >= 0."),
-        (("--tag", "alpha", "--stale", "0", "--limit", "0"), "--limit must be >= 1."),
-        (("--tag", "   ", "--stale", "0", "--limit", "1"), "--tag must be a non-empty string."),
-    ],
-)
-def test_no_subcommand_rejects_invalid_filters_in_repo_context(
-    git_repo: Path,
-    tmp_path: Path,
-    args: tuple[str, ...],
-    expected_fragment: str,
-) -> None:
-    """Bare dock invalid-filter validation should match in-repo behavior."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(list(args), cwd=git_repo, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
+    """Bare dock should validate filters the same way inside and outside a repo."""
+    failed = _invoke_dock(
+        list(args),
+        cwd=_resolve_run_cwd(git_repo, tmp_path, run_cwd_kind),
+        env=_dock_env(empty_dock_home),
+        expect_code=2,
+    )
+    _assert_cli_error(failed, expected_fragment)
 
 
 def test_no_subcommand_trims_tag_filter(git_repo: Path, tmp_path: Path) -> None:
     """Bare dock invocation should trim tag filter values before lookup."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback trimmed tag parity",
-            "--decisions",
-            "Trim tag value in bare callback path",
-            "--next-step",
-            "run bare dock with trimmed tag",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback trimmed tag parity",
+        decisions="Trim tag value in bare callback path",
+        next_steps=["run bare dock with trimmed tag"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(_run_dock(["--json", "--tag", "  alpha  "], cwd=tmp_path, env=env).stdout)
+    rows = _run_dock_json(["--json", "--tag", "  alpha  "], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert rows[0]["objective"] == "Default callback trimmed tag parity"
 
 
-def test_no_subcommand_supports_combined_tag_stale_filters(git_repo: Path, tmp_path: Path) -> None:
+def test_no_subcommand_supports_combined_tag_stale_filters(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Bare dock callback should honor combined tag and stale filters."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback combined filters alpha",
-            "--decisions",
-            "Validate combined tag/stale filters",
-            "--next-step",
-            "run bare dock combined filters alpha",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/no-subcommand-combined-filter"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback combined filters beta",
-            "--decisions",
-            "Ensure other tag is filtered out",
-            "--next-step",
-            "run bare dock combined filters beta",
-            "--risks",
-            "none",
-            "--command",
-            "echo beta",
-            "--tag",
-            "beta",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(["git", "checkout", base_branch], cwd=str(git_repo), check=True, capture_output=True)
-
-    rows = json.loads(_run_dock(["--json", "--tag", "alpha", "--stale", "0"], cwd=tmp_path, env=env).stdout)
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback combined filters alpha",
+        decisions="Validate combined tag/stale filters",
+        next_steps=["run bare dock combined filters alpha"],
+        resume_commands=["echo alpha"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/no-subcommand-combined-filter")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback combined filters beta",
+        decisions="Ensure other tag is filtered out",
+        next_steps=["run bare dock combined filters beta"],
+        resume_commands=["echo beta"],
+        tags=["beta"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    rows = _run_dock_json(["--json", "--tag", "alpha", "--stale", "0"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert rows[0]["objective"] == "Default callback combined filters alpha"
     assert "alpha" in rows[0]["tags"]
@@ -4606,83 +4675,37 @@ def test_no_subcommand_supports_combined_tag_stale_filters(git_repo: Path, tmp_p
 def test_no_subcommand_supports_combined_tag_stale_filters_in_repo_context(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Bare callback should honor tag+stale filters when run in repo cwd."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback combined filters alpha in repo",
-            "--decisions",
-            "Validate combined tag/stale filters in repo context",
-            "--next-step",
-            "run bare dock combined filters alpha in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/no-subcommand-combined-filter-in-repo"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback combined filters beta in repo",
-            "--decisions",
-            "Ensure other tag is filtered out in repo context",
-            "--next-step",
-            "run bare dock combined filters beta in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo beta",
-            "--tag",
-            "beta",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(["git", "checkout", base_branch], cwd=str(git_repo), check=True, capture_output=True)
-
-    rows = json.loads(_run_dock(["--json", "--tag", "alpha", "--stale", "0"], cwd=git_repo, env=env).stdout)
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback combined filters alpha in repo",
+        decisions="Validate combined tag/stale filters in repo context",
+        next_steps=["run bare dock combined filters alpha in repo"],
+        resume_commands=["echo alpha"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/no-subcommand-combined-filter-in-repo")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback combined filters beta in repo",
+        decisions="Ensure other tag is filtered out in repo context",
+        next_steps=["run bare dock combined filters beta in repo"],
+        resume_commands=["echo beta"],
+        tags=["beta"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    rows = _run_dock_json(["--json", "--tag", "alpha", "--stale", "0"], cwd=git_repo, env=env)
     assert len(rows) == 1
     assert rows[0]["objective"] == "Default callback combined filters alpha in repo"
     assert "alpha" in rows[0]["tags"]
@@ -4697,89 +4720,41 @@ def test_no_subcommand_supports_combined_tag_stale_filters_in_repo_context(
 def test_no_subcommand_supports_combined_tag_stale_limit_filters(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Bare callback should honor combined tag/stale/limit constraints."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback combined filter limit alpha base",
-            "--decisions",
-            "Validate combined tag/stale/limit filters (base branch)",
-            "--next-step",
-            "run bare dock combined filters with limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-base",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/no-subcommand-combined-filter-limit"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback combined filter limit alpha feature",
-            "--decisions",
-            "Second alpha entry should be pruned by limit",
-            "--next-step",
-            "validate combined filters with limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-feature",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback combined filter limit alpha base",
+        decisions="Validate combined tag/stale/limit filters (base branch)",
+        next_steps=["run bare dock combined filters with limit"],
+        resume_commands=["echo alpha-base"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/no-subcommand-combined-filter-limit")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback combined filter limit alpha feature",
+        decisions="Second alpha entry should be pruned by limit",
+        next_steps=["validate combined filters with limit"],
+        resume_commands=["echo alpha-feature"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    rows = _run_dock_json(
+        ["--json", "--tag", "alpha", "--stale", "0", "--limit", "1"],
+        cwd=tmp_path,
         env=env,
     )
-    subprocess.run(["git", "checkout", base_branch], cwd=str(git_repo), check=True, capture_output=True)
-
-    rows = json.loads(
-        _run_dock(
-            ["--json", "--tag", "alpha", "--stale", "0", "--limit", "1"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
     assert len(rows) == 1
     assert rows[0]["objective"] in {
         "Default callback combined filter limit alpha base",
@@ -4797,89 +4772,41 @@ def test_no_subcommand_supports_combined_tag_stale_limit_filters(
 def test_no_subcommand_supports_combined_tag_stale_limit_filters_in_repo_context(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Bare callback should honor tag+stale+limit in repo cwd."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback combined filter limit alpha base in repo",
-            "--decisions",
-            "Validate combined tag/stale/limit filters in repo (base branch)",
-            "--next-step",
-            "run bare dock combined filters with limit in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-base",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback combined filter limit alpha base in repo",
+        decisions="Validate combined tag/stale/limit filters in repo (base branch)",
+        next_steps=["run bare dock combined filters with limit in repo"],
+        resume_commands=["echo alpha-base"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/no-subcommand-combined-filter-limit-in-repo"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
+    _checkout_new_branch(git_repo, "feature/no-subcommand-combined-filter-limit-in-repo")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback combined filter limit alpha feature in repo",
+        decisions="Second alpha entry should be pruned by limit in repo context",
+        next_steps=["validate combined filters with limit in repo"],
+        resume_commands=["echo alpha-feature"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback combined filter limit alpha feature in repo",
-            "--decisions",
-            "Second alpha entry should be pruned by limit in repo context",
-            "--next-step",
-            "validate combined filters with limit in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-feature",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    _switch_branch(git_repo, base_branch)
+
+    rows = _run_dock_json(
+        ["--json", "--tag", "alpha", "--stale", "0", "--limit", "1"],
         cwd=git_repo,
         env=env,
     )
-    subprocess.run(["git", "checkout", base_branch], cwd=str(git_repo), check=True, capture_output=True)
-
-    rows = json.loads(
-        _run_dock(
-            ["--json", "--tag", "alpha", "--stale", "0", "--limit", "1"],
-            cwd=git_repo,
-            env=env,
-        ).stdout
-    )
     assert len(rows) == 1
     assert rows[0]["objective"] in {
         "Default callback combined filter limit alpha base in repo",
@@ -4896,49 +4823,28 @@ def test_no_subcommand_supports_combined_tag_stale_limit_filters_in_repo_context
 
 def test_no_subcommand_tag_filter_no_match_is_informative(git_repo: Path, tmp_path: Path) -> None:
     """Bare callback should handle missing tag filters cleanly."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback missing tag baseline",
-            "--decisions",
-            "ensure callback no-match semantics are stable",
-            "--next-step",
-            "run bare dock with missing tag filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-base",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback missing tag baseline",
+        decisions="ensure callback no-match semantics are stable",
+        next_steps=["run bare dock with missing tag filter"],
+        resume_commands=["echo alpha-base"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
     table_output = _run_dock(["--tag", "missing-tag"], cwd=tmp_path, env=env)
     assert "Dockyard Harbor" in table_output.stdout
     assert "Default callback missing tag baseline" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock(["--tag", "missing-tag", "--json"], cwd=tmp_path, env=env)
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 def test_no_subcommand_tag_filter_no_match_is_informative_in_repo(
@@ -4946,49 +4852,28 @@ def test_no_subcommand_tag_filter_no_match_is_informative_in_repo(
     tmp_path: Path,
 ) -> None:
     """Bare callback should handle missing tag filters in repository cwd."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback missing tag baseline in repo",
-            "--decisions",
-            "ensure in-repo callback no-match semantics stay stable",
-            "--next-step",
-            "run bare dock with missing tag filter in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-base",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback missing tag baseline in repo",
+        decisions="ensure in-repo callback no-match semantics stay stable",
+        next_steps=["run bare dock with missing tag filter in repo"],
+        resume_commands=["echo alpha-base"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
     table_output = _run_dock(["--tag", "missing-tag"], cwd=git_repo, env=env)
     assert "Dockyard Harbor" in table_output.stdout
     assert "Default callback missing tag baseline in repo" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock(["--tag", "missing-tag", "--json"], cwd=git_repo, env=env)
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 def test_no_subcommand_tag_filter_no_match_with_limit_is_informative_in_repo(
@@ -4996,49 +4881,28 @@ def test_no_subcommand_tag_filter_no_match_with_limit_is_informative_in_repo(
     tmp_path: Path,
 ) -> None:
     """Bare callback should handle missing tag+limit filters in repo cwd."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback missing tag+limit baseline in repo",
-            "--decisions",
-            "ensure in-repo callback no-match semantics stay stable",
-            "--next-step",
-            "run bare dock with missing tag+limit filter in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-base",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback missing tag+limit baseline in repo",
+        decisions="ensure in-repo callback no-match semantics stay stable",
+        next_steps=["run bare dock with missing tag+limit filter in repo"],
+        resume_commands=["echo alpha-base"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
     table_output = _run_dock(["--tag", "missing-tag", "--limit", "1"], cwd=git_repo, env=env)
     assert "Dockyard Harbor" in table_output.stdout
     assert "Default callback missing tag+limit baseline in repo" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock(["--tag", "missing-tag", "--limit", "1", "--json"], cwd=git_repo, env=env)
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 def test_no_subcommand_tag_filter_no_match_with_stale_is_informative_in_repo(
@@ -5046,39 +4910,18 @@ def test_no_subcommand_tag_filter_no_match_with_stale_is_informative_in_repo(
     tmp_path: Path,
 ) -> None:
     """Bare callback should handle missing tag+stale filters in repo cwd."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback missing tag+stale baseline in repo",
-            "--decisions",
-            "ensure in-repo callback no-match stale semantics stay stable",
-            "--next-step",
-            "run bare dock with missing tag+stale filter in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-base",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback missing tag+stale baseline in repo",
+        decisions="ensure in-repo callback no-match stale semantics stay stable",
+        next_steps=["run bare dock with missing tag+stale filter in repo"],
+        resume_commands=["echo alpha-base"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
     table_output = _run_dock(
@@ -5088,7 +4931,7 @@ def test_no_subcommand_tag_filter_no_match_with_stale_is_informative_in_repo(
     )
     assert "Dockyard Harbor" in table_output.stdout
     assert "Default callback missing tag+stale baseline in repo" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock(
         ["--tag", "missing-tag", "--stale", "0", "--json"],
@@ -5096,7 +4939,7 @@ def test_no_subcommand_tag_filter_no_match_with_stale_is_informative_in_repo(
         env=env,
     )
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 def test_no_subcommand_tag_filter_no_match_with_stale_limit_is_informative_in_repo(
@@ -5104,39 +4947,18 @@ def test_no_subcommand_tag_filter_no_match_with_stale_limit_is_informative_in_re
     tmp_path: Path,
 ) -> None:
     """Bare callback should handle missing tag+stale+limit filters in repo cwd."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default callback missing tag+stale+limit baseline in repo",
-            "--decisions",
-            "ensure in-repo callback no-match stale semantics stay stable",
-            "--next-step",
-            "run bare dock with missing tag+stale+limit filter in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-base",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default callback missing tag+stale+limit baseline in repo",
+        decisions="ensure in-repo callback no-match stale semantics stay stable",
+        next_steps=["run bare dock with missing tag+stale+limit filter in repo"],
+        resume_commands=["echo alpha-base"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
     table_output = _run_dock(
@@ -5146,7 +4968,7 @@ def test_no_subcommand_tag_filter_no_match_with_stale_limit_is_informative_in_re
     )
     assert "Dockyard Harbor" in table_output.stdout
     assert "Default callback missing tag+stale+limit baseline in repo" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock(
         ["--tag", "missing-tag", "--stale", "0", "--limit", "1", "--json"],
@@ -5154,200 +4976,98 @@ def test_no_subcommand_tag_filter_no_match_with_stale_limit_is_informative_in_re
         env=env,
     )
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 def test_harbor_json_empty_store_returns_array(tmp_path: Path) -> None:
     """Harbor alias should support JSON mode for empty datasets."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    payload = json.loads(_run_dock(["harbor", "--json"], cwd=tmp_path, env=env).stdout)
+    payload = _invoke_dock_json(["harbor", "--json"], cwd=tmp_path, env=env)
     assert payload == []
 
 
 def test_ls_json_empty_store_returns_array(tmp_path: Path) -> None:
     """Primary ls command should return [] for empty JSON output."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    payload = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
+    payload = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
     assert payload == []
 
 
 def test_ls_json_handles_long_objective_text(git_repo: Path, tmp_path: Path) -> None:
     """Ls JSON output should remain parseable with long objective text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     long_objective = "objtoken " + ("y" * 500)
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            long_objective,
-            "--decisions",
-            "long objective regression",
-            "--next-step",
-            "run ls json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    _invoke_dock(
+        _save_args(git_repo, long_objective, "long objective regression", "run ls json"),
         cwd=git_repo,
         env=env,
     )
 
-    rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
     assert len(rows) >= 1
     assert long_objective in [row["objective"] for row in rows]
-    harbor_rows = json.loads(_run_dock(["harbor", "--json"], cwd=tmp_path, env=env).stdout)
+    harbor_rows = _invoke_dock_json(["harbor", "--json"], cwd=tmp_path, env=env)
     assert long_objective in [row["objective"] for row in harbor_rows]
-    callback_rows = json.loads(_run_dock(["--json"], cwd=tmp_path, env=env).stdout)
+    callback_rows = _invoke_dock_json(["--json"], cwd=tmp_path, env=env)
     assert long_objective in [row["objective"] for row in callback_rows]
 
 
 def test_ls_json_preserves_unicode_objective(git_repo: Path, tmp_path: Path) -> None:
     """Ls JSON output should preserve unicode objective text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     unicode_objective = "Unicode objective: façade safety"
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            unicode_objective,
-            "--decisions",
-            "unicode ls regression",
-            "--next-step",
-            "run ls json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    _invoke_dock(
+        _save_args(git_repo, unicode_objective, "unicode ls regression", "run ls json"),
         cwd=git_repo,
         env=env,
     )
 
-    rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
     assert unicode_objective in [row["objective"] for row in rows]
-    harbor_rows = json.loads(_run_dock(["harbor", "--json"], cwd=tmp_path, env=env).stdout)
+    harbor_rows = _invoke_dock_json(["harbor", "--json"], cwd=tmp_path, env=env)
     assert unicode_objective in [row["objective"] for row in harbor_rows]
-    callback_rows = json.loads(_run_dock(["--json"], cwd=tmp_path, env=env).stdout)
+    callback_rows = _invoke_dock_json(["--json"], cwd=tmp_path, env=env)
     assert unicode_objective in [row["objective"] for row in callback_rows]
 
 
 def test_ls_json_preserves_multiline_objective(git_repo: Path, tmp_path: Path) -> None:
     """Ls JSON should preserve multiline objective text without parse issues."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     multiline_objective = "line one\nline two"
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            multiline_objective,
-            "--decisions",
-            "multiline objective regression",
-            "--next-step",
-            "run ls json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    _invoke_dock(
+        _save_args(git_repo, multiline_objective, "multiline objective regression", "run ls json"),
         cwd=git_repo,
         env=env,
     )
 
-    rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
     assert multiline_objective in [row["objective"] for row in rows]
-    harbor_rows = json.loads(_run_dock(["harbor", "--json"], cwd=tmp_path, env=env).stdout)
+    harbor_rows = _invoke_dock_json(["harbor", "--json"], cwd=tmp_path, env=env)
     assert multiline_objective in [row["objective"] for row in harbor_rows]
-    callback_rows = json.loads(_run_dock(["--json"], cwd=tmp_path, env=env).stdout)
+    callback_rows = _invoke_dock_json(["--json"], cwd=tmp_path, env=env)
     assert multiline_objective in [row["objective"] for row in callback_rows]
 
 
 def test_harbor_json_preserves_multiline_next_steps(git_repo: Path, tmp_path: Path) -> None:
     """Harbor and callback JSON should preserve multiline next-step entries."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     objective = "Multiline next steps harbor json"
     multiline_next_step = "line one\nline two"
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            objective,
-            "--decisions",
-            "multiline next-step regression",
-            "--next-step",
-            multiline_next_step,
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    _invoke_dock(
+        _save_args(git_repo, objective, "multiline next-step regression", multiline_next_step),
         cwd=git_repo,
         env=env,
     )
 
-    ls_rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
-    harbor_rows = json.loads(_run_dock(["harbor", "--json"], cwd=tmp_path, env=env).stdout)
-    callback_rows = json.loads(_run_dock(["--json"], cwd=tmp_path, env=env).stdout)
+    ls_rows = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
+    harbor_rows = _invoke_dock_json(["harbor", "--json"], cwd=tmp_path, env=env)
+    callback_rows = _invoke_dock_json(["--json"], cwd=tmp_path, env=env)
 
     ls_target = next(row for row in ls_rows if row.get("objective") == objective)
     harbor_target = next(row for row in harbor_rows if row.get("objective") == objective)
@@ -5359,44 +5079,19 @@ def test_harbor_json_preserves_multiline_next_steps(git_repo: Path, tmp_path: Pa
 
 def test_harbor_json_preserves_unicode_next_steps(git_repo: Path, tmp_path: Path) -> None:
     """Dashboard JSON paths should preserve unicode next-step entries."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     objective = "Unicode next steps harbor json"
     unicode_next_step = "Validate façade before mañana handoff"
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            objective,
-            "--decisions",
-            "unicode next-step regression",
-            "--next-step",
-            unicode_next_step,
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    _invoke_dock(
+        _save_args(git_repo, objective, "unicode next-step regression", unicode_next_step),
         cwd=git_repo,
         env=env,
     )
 
-    ls_rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
-    harbor_rows = json.loads(_run_dock(["harbor", "--json"], cwd=tmp_path, env=env).stdout)
-    callback_rows = json.loads(_run_dock(["--json"], cwd=tmp_path, env=env).stdout)
+    ls_rows = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
+    harbor_rows = _invoke_dock_json(["harbor", "--json"], cwd=tmp_path, env=env)
+    callback_rows = _invoke_dock_json(["--json"], cwd=tmp_path, env=env)
 
     ls_target = next(row for row in ls_rows if row.get("objective") == objective)
     harbor_target = next(row for row in harbor_rows if row.get("objective") == objective)
@@ -5408,130 +5103,67 @@ def test_harbor_json_preserves_unicode_next_steps(git_repo: Path, tmp_path: Path
 
 def test_harbor_alias_supports_tag_filter(git_repo: Path, tmp_path: Path) -> None:
     """Harbor alias should honor tag filtering like ls."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Harbor tag filter objective",
-            "--decisions",
-            "Use harbor alias with tag filter",
-            "--next-step",
-            "run harbor alias",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "harbor-tag",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Harbor tag filter objective",
+        decisions="Use harbor alias with tag filter",
+        next_steps=["run harbor alias"],
+        tags=["harbor-tag"],
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(_run_dock(["harbor", "--tag", "harbor-tag", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json(["harbor", "--tag", "harbor-tag", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert "harbor-tag" in rows[0]["tags"]
 
 
-def test_harbor_alias_tag_filter_applies_before_limit(git_repo: Path, tmp_path: Path) -> None:
+def test_harbor_alias_tag_filter_applies_before_limit(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Harbor alias should apply tag filtering before --limit truncation."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "harbor-limit-tagged",
-            "--decisions",
-            "tagged harbor baseline",
-            "--next-step",
-            "run harbor tag+limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo tagged",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/harbor-tag-limit"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "harbor-limit-untagged",
-            "--decisions",
-            "newer untagged harbor row should be filtered before limit",
-            "--next-step",
-            "run harbor tag+limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo untagged",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="harbor-limit-tagged",
+        decisions="tagged harbor baseline",
+        next_steps=["run harbor tag+limit"],
+        resume_commands=["echo tagged"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/harbor-tag-limit")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="harbor-limit-untagged",
+        decisions="newer untagged harbor row should be filtered before limit",
+        next_steps=["run harbor tag+limit"],
+        resume_commands=["echo untagged"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    rows = _invoke_dock_json(
+        ["harbor", "--tag", "alpha", "--limit", "1", "--json"],
+        cwd=tmp_path,
         env=env,
     )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    rows = json.loads(_run_dock(["harbor", "--tag", "alpha", "--limit", "1", "--json"], cwd=tmp_path, env=env).stdout)
     assert len(rows) == 1
     assert rows[0]["objective"] == "harbor-limit-tagged"
 
-    output = _run_dock(["harbor", "--tag", "alpha", "--limit", "1"], cwd=tmp_path, env=env).stdout
+    output = _invoke_dock(
+        ["harbor", "--tag", "alpha", "--limit", "1"], cwd=tmp_path, env=env
+    ).stdout
     assert base_branch in output
     assert "feature/harbor-tag-limit" not in output
     assert "No checkpoints yet." not in output
@@ -5540,49 +5172,27 @@ def test_harbor_alias_tag_filter_applies_before_limit(git_repo: Path, tmp_path:
 
 def test_harbor_alias_tag_filter_no_match_is_informative(git_repo: Path, tmp_path: Path) -> None:
     """Harbor alias should show empty guidance for missing tag filters."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Harbor tag no-match objective",
-            "--decisions",
-            "harbor tag no-match baseline",
-            "--next-step",
-            "run harbor tag no-match",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Harbor tag no-match objective",
+        decisions="harbor tag no-match baseline",
+        next_steps=["run harbor tag no-match"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    table_output = _run_dock(["harbor", "--tag", "missing-tag"], cwd=tmp_path, env=env)
+    table_output = _invoke_dock(["harbor", "--tag", "missing-tag"], cwd=tmp_path, env=env)
     assert "Dockyard Harbor" in table_output.stdout
     assert "Harbor tag no-match objective" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
-    json_output = _run_dock(["harbor", "--tag", "missing-tag", "--json"], cwd=tmp_path, env=env)
+    json_output = _invoke_dock(["harbor", "--tag", "missing-tag", "--json"], cwd=tmp_path, env=env)
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 @pytest.mark.parametrize(
@@ -5600,37 +5210,16 @@ def test_dashboard_tag_filter_no_match_is_informative(
     label: str,
 ) -> None:
     """Dashboard commands should handle missing tag filters cleanly."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
+        _save_args(
             str(git_repo),
-            "--no-prompt",
-            "--objective",
             f"Dashboard {label} tag no-match objective",
-            "--decisions",
             "dashboard tag no-match baseline",
-            "--next-step",
             "run dashboard tag no-match",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            tags=("alpha",),
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -5638,11 +5227,11 @@ def test_dashboard_tag_filter_no_match_is_informative(
     table_output = _run_dock([*command_prefix, "--tag", "missing-tag"], cwd=tmp_path, env=env)
     assert "Dockyard Harbor" in table_output.stdout
     assert f"Dashboard {label} tag no-match objective" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock([*command_prefix, "--tag", "missing-tag", "--json"], cwd=tmp_path, env=env)
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 @pytest.mark.parametrize(
@@ -5660,37 +5249,16 @@ def test_dashboard_tag_filter_no_match_with_limit_is_informative(
     label: str,
 ) -> None:
     """Dashboard commands should stay informative for tag misses with limit."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
+        _save_args(
             str(git_repo),
-            "--no-prompt",
-            "--objective",
             f"Dashboard {label} tag limit no-match objective",
-            "--decisions",
             "dashboard tag+limit no-match baseline",
-            "--next-step",
             "run dashboard tag+limit no-match",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            tags=("alpha",),
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -5702,7 +5270,7 @@ def test_dashboard_tag_filter_no_match_with_limit_is_informative(
     )
     assert "Dockyard Harbor" in table_output.stdout
     assert f"Dashboard {label} tag limit no-match objective" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock(
         [*command_prefix, "--tag", "missing-tag", "--limit", "1", "--json"],
@@ -5710,7 +5278,7 @@ def test_dashboard_tag_filter_no_match_with_limit_is_informative(
         env=env,
     )
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 @pytest.mark.parametrize(
@@ -5728,37 +5296,16 @@ def test_dashboard_tag_filter_no_match_with_stale_limit_is_informative(
     label: str,
 ) -> None:
     """Dashboard commands should stay informative for tag misses with stale+limit."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
+        _save_args(
             str(git_repo),
-            "--no-prompt",
-            "--objective",
             f"Dashboard {label} tag stale limit no-match objective",
-            "--decisions",
             "dashboard tag+stale+limit no-match baseline",
-            "--next-step",
             "run dashboard tag+stale+limit no-match",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            tags=("alpha",),
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -5770,7 +5317,7 @@ def test_dashboard_tag_filter_no_match_with_stale_limit_is_informative(
     )
     assert "Dockyard Harbor" in table_output.stdout
     assert f"Dashboard {label} tag stale limit no-match objective" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock(
         [*command_prefix, "--tag", "missing-tag", "--stale", "0", "--limit", "1", "--json"],
@@ -5778,7 +5325,7 @@ def test_dashboard_tag_filter_no_match_with_stale_limit_is_informative(
         env=env,
     )
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 @pytest.mark.parametrize(
@@ -5796,37 +5343,16 @@ def test_dashboard_tag_filter_no_match_with_stale_limit_is_informative_in_repo(
     label: str,
 ) -> None:
     """Dashboard commands should stay informative in repo for tag+stale+limit misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
+        _save_args(
             str(git_repo),
-            "--no-prompt",
-            "--objective",
             f"Dashboard {label} tag stale limit no-match objective in repo",
-            "--decisions",
             "dashboard tag+stale+limit no-match baseline in repo",
-            "--next-step",
             "run dashboard tag+stale+limit no-match in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            tags=("alpha",),
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -5838,7 +5364,7 @@ def test_dashboard_tag_filter_no_match_with_stale_limit_is_informative_in_repo(
     )
     assert "Dockyard Harbor" in table_output.stdout
     assert f"Dashboard {label} tag stale limit no-match objective in repo" not in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
     json_output = _run_dock(
         [*command_prefix, "--tag", "missing-tag", "--stale", "0", "--limit", "1", "--json"],
@@ -5846,7 +5372,7 @@ def test_dashboard_tag_filter_no_match_with_stale_limit_is_informative_in_repo(
         env=env,
     )
     assert json.loads(json_output.stdout) == []
-    assert "Traceback" not in f"{json_output.stdout}\n{json_output.stderr}"
+    _assert_no_traceback(json_output)
 
 
 def test_no_subcommand_defaults_to_harbor_inside_repo(
@@ -5854,39 +5380,18 @@ def test_no_subcommand_defaults_to_harbor_inside_repo(
     tmp_path: Path,
 ) -> None:
     """Default no-subcommand path should work when invoked inside repo."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Default command in-repo baseline",
-            "--decisions",
-            "Ensure callback path is stable in repo cwd",
-            "--next-step",
-            "run bare dock command",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Default command in-repo baseline",
+        decisions="Ensure callback path is stable in repo cwd",
+        next_steps=["run bare dock command"],
+        verification=SAVE_VERIFICATION,
     )
-    result = _run_dock([], cwd=git_repo, env=env)
+    result = _invoke_dock([], cwd=git_repo, env=env)
     assert "Dockyard Harbor" in result.stdout
 
 
@@ -5895,8 +5400,7 @@ def test_resume_output_includes_required_summary_fields(
     tmp_path: Path,
 ) -> None:
     """Resume output should include required summary fields in top lines."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
         [
@@ -5941,11 +5445,11 @@ def test_resume_branch_in_repo_preserves_top_lines_contract(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Branch-scoped in-repo resume paths should keep top-lines contract."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
         [
@@ -5988,11 +5492,11 @@ def test_resume_trimmed_branch_in_repo_preserves_top_lines_contract(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Trimmed branch-scoped in-repo resume paths should keep top-lines contract."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
         [
@@ -6035,38 +5539,19 @@ def test_resume_trimmed_branch_in_repo_reports_expected_header(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Trimmed in-repo branch resume should render canonical header."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             f"{command_name} trimmed in-repo branch header objective",
-            "--decisions",
             "Validate canonical project/branch header rendering for trimmed in-repo branch",
-            "--next-step",
             "Resume by trimmed branch in repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -6082,8 +5567,7 @@ def test_resume_by_berth_from_outside_repo_preserves_top_lines_contract(
     command_name: str,
 ) -> None:
     """Explicit-berth resume paths should keep top-lines contract outside repos."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
         [
@@ -6126,38 +5610,19 @@ def test_resume_by_berth_from_outside_repo_reports_expected_header(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Explicit-berth outside-repo resume should render canonical header."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             f"{command_name} berth header objective",
-            "--decisions",
             "Validate canonical project/branch header rendering for explicit berth",
-            "--next-step",
             "Resume by berth from outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -6173,8 +5638,7 @@ def test_resume_by_trimmed_berth_from_outside_repo_preserves_top_lines_contract(
     command_name: str,
 ) -> None:
     """Trimmed explicit-berth resume paths should keep top-lines contract outside repos."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
         [
@@ -6217,38 +5681,19 @@ def test_resume_by_trimmed_berth_from_outside_repo_reports_expected_header(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Trimmed explicit-berth outside-repo resume should render canonical header."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             f"{command_name} trimmed berth header objective",
-            "--decisions",
             "Validate canonical project/branch header rendering for trimmed berth",
-            "--next-step",
             "Resume by trimmed berth from outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -6262,11 +5707,11 @@ def test_resume_by_berth_branch_from_outside_repo_preserves_top_lines_contract(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Branch-scoped explicit-berth resume paths should keep top-lines contract."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
         [
@@ -6313,11 +5758,11 @@ def test_resume_by_trimmed_berth_branch_from_outside_repo_preserves_top_lines_co
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Trimmed berth/branch outside-repo resume paths should keep top-lines contract."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
         [
@@ -6364,38 +5809,19 @@ def test_resume_by_trimmed_berth_branch_from_outside_repo_reports_expected_heade
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Trimmed berth/branch outside-repo resume should render canonical header."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             f"{command_name} trimmed berth+branch header objective",
-            "--decisions",
             "Validate canonical project/branch header rendering",
-            "--next-step",
             "Resume by trimmed berth+branch from outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -6413,54 +5839,28 @@ def test_resume_output_handles_empty_next_steps_payload(
     tmp_path: Path,
 ) -> None:
     """Resume output should show placeholder when checkpoint has no next steps."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Empty next steps rendering",
-            "--decisions",
             "Corrupt next-steps list to validate fallback",
-            "--next-step",
             "original step",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET next_steps_json = ?",
-        ("[]",),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE checkpoints SET next_steps_json = ?", ("[]",))])
 
     result = _run_dock(["resume"], cwd=git_repo, env=env)
     assert "Next Steps:" in result.stdout
     assert "(none recorded)" in result.stdout
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
+    payload = _run_dock_json(["resume", "--json"], cwd=git_repo, env=env)
     assert payload["next_steps"] == []
 
 
@@ -6469,48 +5869,28 @@ def test_resume_handoff_shows_placeholders_for_empty_lists(
     tmp_path: Path,
 ) -> None:
     """Handoff output should show placeholders when steps/commands are empty."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Empty handoff list baseline",
-            "--decisions",
             "Corrupt list payload fields to empty arrays",
-            "--next-step",
             "seed initial step",
-            "--risks",
-            "none",
-            "--command",
-            "echo seed",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo seed",
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET next_steps_json = ?, resume_commands_json = ?",
-        ("[]", "[]"),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE checkpoints SET next_steps_json = ?, resume_commands_json = ?", ("[]", "[]")),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     output = _run_dock(["resume", "--handoff"], cwd=git_repo, env=env).stdout
     assert "- Next Steps:" in output
@@ -6523,48 +5903,29 @@ def test_resume_handoff_falls_back_for_blank_objective_and_risks(
     tmp_path: Path,
 ) -> None:
     """Handoff should render explicit fallbacks for blank objective/risks."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Handoff fallback baseline",
-            "--decisions",
             "Corrupt objective and risk fields to blanks",
-            "--next-step",
             "seed step",
-            "--risks",
-            "seed risk",
-            "--command",
-            "echo seed",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks="seed risk",
+            command="echo seed",
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET objective = ?, risks_review = ?",
-        ("   ", "   "),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE checkpoints SET objective = ?, risks_review = ?", ("   ", "   ")),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     output = _run_dock(["resume", "--handoff"], cwd=git_repo, env=env).stdout
     assert "- Objective: (none)" in output
@@ -6576,35 +5937,15 @@ def test_resume_output_compacts_multiline_summary_fields(
     tmp_path: Path,
 ) -> None:
     """Resume output should compact multiline objective and next-step text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Line one\nLine two",
-            "--decisions",
             "Normalize multiline summary fields",
-            "--next-step",
             "Step one\nStep two",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -6617,51 +5958,26 @@ def test_resume_output_compacts_multiline_summary_fields(
 def test_resume_output_compacts_multiline_project_label(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Resume output should compact multiline berth labels in header."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Project label compaction",
-            "--decisions",
             "Normalize berth label line breaks",
-            "--next-step",
             "run resume",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE berths SET name = ?",
-        ("Repo line 1\nRepo line 2",),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE berths SET name = ?", ("Repo line 1\nRepo line 2",))])
 
     result = _run_dock(["resume"], cwd=git_repo, env=env)
     assert f"Project/Branch: Repo line 1 Repo line 2 / {branch}" in result.stdout
@@ -6672,48 +5988,27 @@ def test_resume_output_compacts_multiline_checkpoint_timestamp(
     tmp_path: Path,
 ) -> None:
     """Resume output should compact multiline checkpoint timestamp values."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Checkpoint timestamp compaction",
-            "--decisions",
             "Normalize multiline checkpoint timestamp display",
-            "--next-step",
             "run resume",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET created_at = ?",
-        ("2000-01-01\n00:00:00+00:00",),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE checkpoints SET created_at = ?", ("2000-01-01\n00:00:00+00:00",)),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     result = _run_dock(["resume"], cwd=git_repo, env=env)
     assert "Last Checkpoint: 2000-01-01 00:00:00+00:00 (" in result.stdout
@@ -6724,48 +6019,22 @@ def test_resume_output_falls_back_for_blank_checkpoint_timestamp(
     tmp_path: Path,
 ) -> None:
     """Resume output should fallback when checkpoint timestamp is blank."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Checkpoint timestamp fallback",
-            "--decisions",
             "Keep resume top-lines resilient for blank timestamps",
-            "--next-step",
             "run resume",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE checkpoints SET created_at = ?",
-        ("   ",),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE checkpoints SET created_at = ?", ("   ",))])
 
     result = _run_dock(["resume"], cwd=git_repo, env=env)
     assert "Last Checkpoint: (unknown) (unknown ago)" in result.stdout
@@ -6774,51 +6043,26 @@ def test_resume_output_falls_back_for_blank_checkpoint_timestamp(
 def test_resume_output_falls_back_for_blank_project_label(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Resume output should fallback to unknown when berth label is blank."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Project label blank fallback",
-            "--decisions",
             "Ensure resume label fallback remains explicit",
-            "--next-step",
             "run resume",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE berths SET name = ?",
-        ("   ",),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE berths SET name = ?", ("   ",))])
 
     result = _run_dock(["resume"], cwd=git_repo, env=env)
     assert f"Project/Branch: (unknown) / {branch}" in result.stdout
@@ -6829,35 +6073,17 @@ def test_resume_handoff_preserves_literal_markup_like_text(
     tmp_path: Path,
 ) -> None:
     """Resume and handoff output should preserve literal bracketed text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "[red]Literal objective[/red]",
-            "--decisions",
             "[bold]Literal decision[/bold]",
-            "--next-step",
             "[green]Literal step[/green]",
-            "--risks",
-            "[yellow]Literal risk[/yellow]",
-            "--command",
-            "[blue]echo literal[/blue]",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks="[yellow]Literal risk[/yellow]",
+            command="[blue]echo literal[/blue]",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -6878,35 +6104,17 @@ def test_resume_handoff_compacts_multiline_fields(
     tmp_path: Path,
 ) -> None:
     """Handoff output should compact multiline objective/step/risk/command text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "objective line one\nline two",
-            "--decisions",
             "handoff compaction baseline",
-            "--next-step",
             "step one\nstep two",
-            "--risks",
-            "risk one\nrisk two",
-            "--command",
-            "echo one\necho two",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks="risk one\nrisk two",
+            command="echo one\necho two",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -6923,35 +6131,17 @@ def test_resume_by_berth_from_outside_repo_with_handoff(
     tmp_path: Path,
 ) -> None:
     """Resume should work outside repo when berth is provided explicitly."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Cross-repo resume lookup",
-            "--decisions",
             "Use berth argument from outside repo context",
-            "--next-step",
             "Resume by berth",
-            "--risks",
-            "None",
-            "--command",
-            "echo continue",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks="None",
+            command="echo continue",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -6965,9 +6155,7 @@ def test_resume_by_berth_from_outside_repo_with_handoff(
     assert "Cross-repo resume lookup" in result.stdout
     assert "### Dockyard Handoff" in result.stdout
 
-    payload = json.loads(
-        _run_dock(["resume", git_repo.name, "--json"], cwd=tmp_path, env=env).stdout
-    )
+    payload = _run_dock_json(["resume", git_repo.name, "--json"], cwd=tmp_path, env=env)
     assert payload["project_name"] == git_repo.name
 
 
@@ -6976,35 +6164,16 @@ def test_resume_supports_handoff_and_json_for_trimmed_explicit_berth(
     tmp_path: Path,
 ) -> None:
     """Resume should support handoff/json output with trimmed explicit berth."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Resume trimmed berth handoff/json objective",
-            "--decisions",
             "Validate resume parity for handoff/json output with trimmed berth",
-            "--next-step",
             "Run resume outside repo with trimmed berth",
-            "--risks",
-            "none",
-            "--command",
-            "echo resume-trimmed",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo resume-trimmed",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -7013,9 +6182,7 @@ def test_resume_supports_handoff_and_json_for_trimmed_explicit_berth(
     assert "Resume trimmed berth handoff/json objective" in handoff
     assert "### Dockyard Handoff" in handoff
 
-    payload = json.loads(
-        _run_dock(["resume", f"  {git_repo.name}  ", "--json"], cwd=tmp_path, env=env).stdout
-    )
+    payload = _run_dock_json(["resume", f"  {git_repo.name}  ", "--json"], cwd=tmp_path, env=env)
     assert payload["project_name"] == git_repo.name
     assert payload["objective"] == "Resume trimmed berth handoff/json objective"
 
@@ -7025,35 +6192,16 @@ def test_resume_by_berth_accepts_trimmed_lookup_value(
     tmp_path: Path,
 ) -> None:
     """Resume should resolve berth lookup values after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Trimmed berth resume objective",
-            "--decisions",
             "Resolve berth value with surrounding whitespace",
-            "--next-step",
             "resume outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo continue",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo continue",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -7067,35 +6215,16 @@ def test_resume_alias_accepts_trimmed_berth_lookup_value(
     tmp_path: Path,
 ) -> None:
     """Resume alias should resolve berth lookup after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Alias trimmed berth objective",
-            "--decisions",
             "Resolve alias berth value with surrounding whitespace",
-            "--next-step",
             "resume outside repo via alias",
-            "--risks",
-            "none",
-            "--command",
-            "echo continue",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo continue",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -7109,35 +6238,16 @@ def test_resume_alias_supports_handoff_and_json_for_explicit_berth(
     tmp_path: Path,
 ) -> None:
     """Resume alias should support handoff/json output with explicit berth."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Resume alias handoff/json objective",
-            "--decisions",
             "Validate resume alias handoff and json parity",
-            "--next-step",
             "run alias outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo alias-resume",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo alias-resume",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -7146,7 +6256,7 @@ def test_resume_alias_supports_handoff_and_json_for_explicit_berth(
     assert "Resume alias handoff/json objective" in handoff
     assert "### Dockyard Handoff" in handoff
 
-    payload = json.loads(_run_dock(["r", f"  {git_repo.name}  ", "--json"], cwd=tmp_path, env=env).stdout)
+    payload = _run_dock_json(["r", f"  {git_repo.name}  ", "--json"], cwd=tmp_path, env=env)
     assert payload["project_name"] == git_repo.name
     assert payload["objective"] == "Resume alias handoff/json objective"
 
@@ -7156,39 +6266,21 @@ def test_resume_commands_support_handoff_and_json_for_explicit_berth_branch_outs
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Resume commands should support berth+branch handoff/json outside repos."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
     objective = f"{command_name} berth+branch handoff/json objective"
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             objective,
-            "--decisions",
             "Validate berth+branch handoff/json parity outside repo context",
-            "--next-step",
             "run resume command from outside repo with berth+branch",
-            "--risks",
-            "none",
-            "--command",
-            "echo alias-resume-branch",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo alias-resume-branch",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -7201,12 +6293,10 @@ def test_resume_commands_support_handoff_and_json_for_explicit_berth_branch_outs
     assert objective in handoff
     assert "### Dockyard Handoff" in handoff
 
-    payload = json.loads(
-        _run_dock(
-            [command_name, f"  {git_repo.name}  ", "--branch", f"  {branch}  ", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    payload = _run_dock_json(
+        [command_name, f"  {git_repo.name}  ", "--branch", f"  {branch}  ", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert payload["project_name"] == git_repo.name
     assert payload["branch"] == branch
@@ -7216,90 +6306,42 @@ def test_resume_commands_support_handoff_and_json_for_explicit_berth_branch_outs
 def test_resume_branch_flag_selects_requested_branch(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Resume --branch should return checkpoint for selected branch context."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    base_branch = _git_current_branch(git_repo)
+    base_branch = git_template_branch
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Main branch objective",
-            "--decisions",
             "baseline",
-            "--next-step",
             "main task",
-            "--risks",
-            "none",
-            "--command",
-            "echo main",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo main",
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/resume-target"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _checkout_new_branch(git_repo, "feature/resume-target")
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Feature branch objective",
-            "--decisions",
             "feature baseline",
-            "--next-step",
             "feature task",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo feature",
+        ),
         cwd=git_repo,
         env=env,
     )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _switch_branch(git_repo, base_branch)
 
-    selected = json.loads(
-        _run_dock(
-            ["resume", "--branch", "feature/resume-target", "--json"],
-            cwd=git_repo,
-            env=env,
-        ).stdout
+    selected = _run_dock_json(
+        ["resume", "--branch", "feature/resume-target", "--json"],
+        cwd=git_repo,
+        env=env,
     )
     assert selected["branch"] == "feature/resume-target"
     assert selected["objective"] == "Feature branch objective"
@@ -7308,44 +6350,28 @@ def test_resume_branch_flag_selects_requested_branch(
 def test_resume_branch_flag_accepts_trimmed_value(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Resume --branch should resolve values after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Trimmed branch resume objective",
-            "--decisions",
             "Validate trimmed branch filter handling",
-            "--next-step",
             "resume with padded branch",
-            "--risks",
-            "none",
-            "--command",
-            "echo branch",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo branch",
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    selected = json.loads(
-        _run_dock(["resume", "--branch", f"  {branch}  ", "--json"], cwd=git_repo, env=env).stdout
+    selected = _run_dock_json(
+        ["resume", "--branch", f"  {branch}  ", "--json"],
+        cwd=git_repo,
+        env=env,
     )
     assert selected["branch"] == branch
     assert selected["objective"] == "Trimmed branch resume objective"
@@ -7354,48 +6380,28 @@ def test_resume_branch_flag_accepts_trimmed_value(
 def test_resume_by_berth_accepts_trimmed_branch_option(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Resume should trim --branch when combined with explicit berth lookup."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Berth + branch trim objective",
-            "--decisions",
             "Use trimmed branch with explicit berth context",
-            "--next-step",
             "resume by berth+branch",
-            "--risks",
-            "none",
-            "--command",
-            "echo branch",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo branch",
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    payload = json.loads(
-        _run_dock(
-            ["resume", f"  {git_repo.name}  ", "--branch", f"  {branch}  ", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    payload = _run_dock_json(
+        ["resume", f"  {git_repo.name}  ", "--branch", f"  {branch}  ", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert payload["branch"] == branch
     assert payload["project_name"] == git_repo.name
@@ -7406,35 +6412,16 @@ def test_resume_unknown_branch_for_known_repo_is_actionable(
     tmp_path: Path,
 ) -> None:
     """Resume should fail cleanly when requested branch has no checkpoint."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Known repo checkpoint",
-            "--decisions",
             "Used to validate unknown branch handling",
-            "--next-step",
             "resume missing branch",
-            "--risks",
-            "none",
-            "--command",
-            "echo main",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo main",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -7445,9 +6432,7 @@ def test_resume_unknown_branch_for_known_repo_is_actionable(
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "No checkpoint found for the requested context." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "No checkpoint found for the requested context.")
 
 
 @pytest.mark.parametrize("command_name", ["resume", "r", "undock"])
@@ -7459,35 +6444,16 @@ def test_resume_commands_unknown_explicit_berth_branch_is_actionable(
     output_flag: str,
 ) -> None:
     """Resume commands should fail cleanly for unknown branch + explicit berth."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             f"{command_name} unknown explicit berth branch objective",
-            "--decisions",
             "Validate unknown explicit berth+branch handling",
-            "--next-step",
             "resume missing explicit berth+branch",
-            "--risks",
-            "none",
-            "--command",
-            "echo main",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo main",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -7497,101 +6463,44 @@ def test_resume_commands_unknown_explicit_berth_branch_is_actionable(
         args.append(output_flag)
 
     failed = _run_dock(args, cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "No checkpoint found for the requested context." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "No checkpoint found for the requested context.")
 
 
 @pytest.mark.parametrize("command_name", ["resume", "r", "undock"])
 def test_resume_commands_prefer_repo_id_lookup_over_colliding_berth_name(
     git_repo: Path,
+    git_repo_template: Path,
     tmp_path: Path,
     command_name: str,
 ) -> None:
     """Resume commands should prioritize exact repo-id lookup over berth name collisions."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    other_repo = tmp_path / "resume-collision-other"
-    other_repo.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "dockyard@example.com"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Dockyard Test"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", "git@github.com:org/resume-other.git"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
+    other_repo = _copy_git_repo_template(
+        git_repo_template,
+        tmp_path / "resume-collision-other",
+        "git@github.com:org/resume-other.git",
     )
-    (other_repo / "README.md").write_text("seed\n", encoding="utf-8")
-    subprocess.run(["git", "add", "README.md"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=str(other_repo), check=True, capture_output=True)
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(other_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            other_repo,
             "resume-collision-other",
-            "--decisions",
             "other repo checkpoint for resume lookup collision test",
-            "--next-step",
             "query resume by repo id",
-            "--risks",
-            "none",
-            "--command",
-            "echo other",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo other",
+        ),
         cwd=other_repo,
         env=env,
     )
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "resume-collision-target",
-            "--decisions",
             "target repo checkpoint for resume lookup collision test",
-            "--next-step",
             "query resume by repo id",
-            "--risks",
-            "none",
-            "--command",
-            "echo target",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo target",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -7610,148 +6519,90 @@ def test_resume_commands_prefer_repo_id_lookup_over_colliding_berth_name(
     conn.commit()
     conn.close()
 
-    payload = json.loads(_run_dock([command_name, target_repo_id, "--json"], cwd=tmp_path, env=env).stdout)
+    payload = _run_dock_json([command_name, target_repo_id, "--json"], cwd=tmp_path, env=env)
     assert payload["repo_id"] == target_repo_id
     assert payload["objective"] == "resume-collision-target"
 
 
 def test_alias_commands_harbor_search_and_resume(git_repo: Path, tmp_path: Path) -> None:
     """Hidden aliases should mirror primary command behavior."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+    _invoke_dock(
+        _save_args(
+            git_repo,
             "Alias coverage objective",
-            "--decisions",
             "Verify harbor/f/r aliases route correctly",
-            "--next-step",
             "Use alias commands",
-            "--risks",
-            "None",
-            "--command",
-            "echo alias",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks="None",
+            command="echo alias",
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    harbor_result = _run_dock(["harbor"], cwd=tmp_path, env=env)
+    harbor_result = _invoke_dock(["harbor"], cwd=tmp_path, env=env)
     assert "Dockyard Harbor" in harbor_result.stdout
 
-    search_alias = _run_dock(["f", "Alias coverage"], cwd=tmp_path, env=env)
+    search_alias = _invoke_dock(["f", "Alias coverage"], cwd=tmp_path, env=env)
     assert "Dockyard Search Results" in search_alias.stdout
     assert "master" in search_alias.stdout or "main" in search_alias.stdout
-    search_alias_json = json.loads(_run_dock(["f", "Alias coverage", "--json"], cwd=tmp_path, env=env).stdout)
+    search_alias_json = _invoke_dock_json(["f", "Alias coverage", "--json"], cwd=tmp_path, env=env)
     assert len(search_alias_json) >= 1
     assert "branch" in search_alias_json[0]
-    no_match_alias = _run_dock(["f", "definitely-no-match", "--json"], cwd=tmp_path, env=env)
+    no_match_alias = _invoke_dock(["f", "definitely-no-match", "--json"], cwd=tmp_path, env=env)
     assert json.loads(no_match_alias.stdout) == []
-    assert "Traceback" not in f"{no_match_alias.stdout}\n{no_match_alias.stderr}"
-    filtered_alias_result = _run_dock(["f", "Alias coverage", "--tag", "missing-tag", "--json"], cwd=tmp_path, env=env)
+    _assert_no_traceback(no_match_alias)
+    filtered_alias_result = _invoke_dock(
+        ["f", "Alias coverage", "--tag", "missing-tag", "--json"],
+        cwd=tmp_path,
+        env=env,
+    )
     filtered_alias_json = json.loads(filtered_alias_result.stdout)
     assert filtered_alias_json == []
-    assert "Traceback" not in f"{filtered_alias_result.stdout}\n{filtered_alias_result.stderr}"
+    _assert_no_traceback(filtered_alias_result)
 
-    resume_alias = _run_dock(["r"], cwd=git_repo, env=env)
+    resume_alias = _invoke_dock(["r"], cwd=git_repo, env=env)
     assert "Objective: Alias coverage objective" in resume_alias.stdout
 
 
 def test_search_alias_json_handles_unicode_query(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should handle unicode query strings in JSON mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Unicode façade objective",
-            "--decisions",
-            "unicode alias search coverage",
-            "--next-step",
-            "run alias json search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Unicode façade objective",
+        decisions="unicode alias search coverage",
+        next_steps=["run alias json search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(_run_dock(["f", "façade", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json(["f", "façade", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert "façade" in rows[0]["objective"]
 
 
 def test_search_alias_repo_filter_accepts_berth_name(git_repo: Path, tmp_path: Path) -> None:
     """Search alias repo filter should accept berth names."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias repo filter objective",
-            "--decisions",
-            "Alias repo filter decision",
-            "--next-step",
-            "run alias repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias repo filter objective",
+        decisions="Alias repo filter decision",
+        next_steps=["run alias repo filter"],
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(
-        _run_dock(
-            ["f", "Alias repo filter objective", "--repo", git_repo.name, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    rows = _invoke_dock_json(
+        ["f", "Alias repo filter objective", "--repo", git_repo.name, "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(rows) == 1
     assert rows[0]["berth_name"] == git_repo.name
@@ -7764,52 +6615,29 @@ def test_search_json_repo_filtered_rows_follow_expected_schema(
     command_name: str,
 ) -> None:
     """Repo-filtered JSON search rows should expose a stable schema."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"Search json schema objective ({command_name})",
+        decisions="Validate JSON row schema for repo-filtered search results",
+        next_steps=["run json search with --repo filter"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    rows = _invoke_dock_json(
         [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+            command_name,
             f"Search json schema objective ({command_name})",
-            "--decisions",
-            "Validate JSON row schema for repo-filtered search results",
-            "--next-step",
-            "run json search with --repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            "--repo",
+            git_repo.name,
+            "--json",
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
     )
-
-    rows = json.loads(
-        _run_dock(
-            [
-                command_name,
-                f"Search json schema objective ({command_name})",
-                "--repo",
-                git_repo.name,
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
     assert len(rows) >= 1
     assert {row["berth_name"] for row in rows} == {git_repo.name}
 
@@ -7821,96 +6649,56 @@ def test_search_json_repo_filtered_rows_follow_expected_schema(
 
 def test_search_alias_repo_filter_no_match_returns_empty_json(git_repo: Path, tmp_path: Path) -> None:
     """Search alias repo filter should return [] when berth does not match."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias repo filter no-match objective",
-            "--decisions",
-            "Alias repo filter no-match decision",
-            "--next-step",
-            "run alias repo filter miss",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias repo filter no-match objective",
+        decisions="Alias repo filter no-match decision",
+        next_steps=["run alias repo filter miss"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         ["f", "Alias repo filter no-match objective", "--repo", "missing-berth", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
-def test_search_alias_supports_tag_filter(git_repo: Path, tmp_path: Path) -> None:
+def test_search_alias_supports_tag_filter(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Search alias should honor --tag filtering semantics."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    default_branch = _git_current_branch(git_repo)
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    default_branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag filter objective default",
-            "--decisions",
-            "default tag checkpoint",
-            "--next-step",
-            "validate tag filtering",
-            "--risks",
-            "none",
-            "--command",
-            "echo default",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/alias-tag-filter"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias tag filter objective default",
+        decisions="default tag checkpoint",
+        next_steps=["validate tag filtering"],
+        resume_commands=["echo default"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
-    _run_dock(
+    # Branch-labelled row for filter matching only; its sha and diff stats
+    # are the default branch's, since --branch just relabels.
+    _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
+            "--branch",
+            "feature/alias-tag-filter",
             "--no-prompt",
             "--objective",
             "Alias tag filter objective feature",
@@ -7937,108 +6725,69 @@ def test_search_alias_supports_tag_filter(git_repo: Path, tmp_path: Path) -> Non
         cwd=git_repo,
         env=env,
     )
-    subprocess.run(
-        ["git", "checkout", default_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
 
-    alpha_rows = json.loads(
-        _run_dock(
-            ["f", "Alias tag filter objective", "--tag", "alpha", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    alpha_rows = _invoke_dock_json(
+        ["f", "Alias tag filter objective", "--tag", "alpha", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(alpha_rows) == 1
     assert alpha_rows[0]["branch"] == default_branch
 
-    beta_rows = json.loads(
-        _run_dock(
-            ["f", "Alias tag filter objective", "--tag", "beta", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    beta_rows = _invoke_dock_json(
+        ["f", "Alias tag filter objective", "--tag", "beta", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(beta_rows) == 1
     assert beta_rows[0]["branch"] == "feature/alias-tag-filter"
-    beta_repo_rows = json.loads(
-        _run_dock(
-            ["f", "Alias tag filter objective", "--tag", "beta", "--repo", git_repo.name, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    beta_repo_rows = _invoke_dock_json(
+        ["f", "Alias tag filter objective", "--tag", "beta", "--repo", git_repo.name, "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(beta_repo_rows) == 1
     assert beta_repo_rows[0]["branch"] == "feature/alias-tag-filter"
-    beta_repo_table = _run_dock(
-        ["f", "Alias tag filter objective", "--tag", "beta", "--repo", git_repo.name],
-        cwd=tmp_path,
-        env=env,
-    ).stdout
-    assert "feature" in beta_repo_table
-    assert "default" not in beta_repo_table
-    assert "Traceback" not in beta_repo_table
-    missing_repo_result = _run_dock(
+    missing_repo_result = _invoke_dock(
         ["f", "Alias tag filter objective", "--tag", "beta", "--repo", "missing-berth", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(missing_repo_result.stdout) == []
-    assert "Traceback" not in f"{missing_repo_result.stdout}\n{missing_repo_result.stderr}"
-    beta_feature_rows = json.loads(
-        _run_dock(
-            [
-                "f",
-                "Alias tag filter objective",
-                "--tag",
-                "beta",
-                "--branch",
-                "feature/alias-tag-filter",
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    _assert_no_traceback(missing_repo_result)
+    beta_feature_rows = _invoke_dock_json(
+        [
+            "f",
+            "Alias tag filter objective",
+            "--tag",
+            "beta",
+            "--branch",
+            "feature/alias-tag-filter",
+            "--json",
+        ],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(beta_feature_rows) == 1
     assert beta_feature_rows[0]["branch"] == "feature/alias-tag-filter"
-    beta_feature_table = _run_dock(
+    beta_repo_branch_rows = _invoke_dock_json(
         [
             "f",
             "Alias tag filter objective",
             "--tag",
             "beta",
+            "--repo",
+            git_repo.name,
             "--branch",
             "feature/alias-tag-filter",
+            "--json",
         ],
         cwd=tmp_path,
         env=env,
-    ).stdout
-    assert "feature" in beta_feature_table
-    assert "default" not in beta_feature_table
-    assert "Traceback" not in beta_feature_table
-    beta_repo_branch_rows = json.loads(
-        _run_dock(
-            [
-                "f",
-                "Alias tag filter objective",
-                "--tag",
-                "beta",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                "feature/alias-tag-filter",
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
     )
     assert len(beta_repo_branch_rows) == 1
     assert beta_repo_branch_rows[0]["branch"] == "feature/alias-tag-filter"
-    wrong_branch_result = _run_dock(
+    wrong_branch_result = _invoke_dock(
         [
             "f",
             "Alias tag filter objective",
@@ -8052,55 +6801,37 @@ def test_search_alias_supports_tag_filter(git_repo: Path, tmp_path: Path) -> Non
         env=env,
     )
     assert json.loads(wrong_branch_result.stdout) == []
-    assert "Traceback" not in f"{wrong_branch_result.stdout}\n{wrong_branch_result.stderr}"
+    _assert_no_traceback(wrong_branch_result)
 
 
-def test_search_alias_supports_branch_filter(git_repo: Path, tmp_path: Path) -> None:
+def test_search_alias_supports_branch_filter(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Search alias should honor --branch filtering semantics."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    default_branch = _git_current_branch(git_repo)
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    default_branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "asbf-default",
-            "--decisions",
-            "default branch checkpoint",
-            "--next-step",
-            "run alias branch filters",
-            "--risks",
-            "none",
-            "--command",
-            "echo default",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/alias-branch-filter"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="asbf-default",
+        decisions="default branch checkpoint",
+        next_steps=["run alias branch filters"],
+        resume_commands=["echo default"],
+        verification=SAVE_VERIFICATION,
     )
-    _run_dock(
+    # Branch-labelled row for filter matching only; its sha and diff stats
+    # are the default branch's, since --branch just relabels.
+    _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
+            "--branch",
+            "feature/alias-branch-filter",
             "--no-prompt",
             "--objective",
             "asbf-feature",
@@ -8125,247 +6856,138 @@ def test_search_alias_supports_branch_filter(git_repo: Path, tmp_path: Path) ->
         cwd=git_repo,
         env=env,
     )
-    subprocess.run(
-        ["git", "checkout", default_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
 
-    rows = json.loads(
-        _run_dock(
-            ["f", "asbf", "--branch", "feature/alias-branch-filter", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    rows = _invoke_dock_json(
+        ["f", "asbf", "--branch", "feature/alias-branch-filter", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(rows) == 1
     assert rows[0]["branch"] == "feature/alias-branch-filter"
-    default_rows = json.loads(
-        _run_dock(
-            ["f", "asbf", "--branch", default_branch, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    default_rows = _invoke_dock_json(
+        ["f", "asbf", "--branch", default_branch, "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(default_rows) == 1
     assert default_rows[0]["branch"] == default_branch
-    missing_branch_result = _run_dock(
+    missing_branch_result = _invoke_dock(
         ["f", "asbf", "--branch", "missing/branch", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(missing_branch_result.stdout) == []
-    assert "Traceback" not in f"{missing_branch_result.stdout}\n{missing_branch_result.stderr}"
-    combo_rows = json.loads(
-        _run_dock(
-            [
-                "f",
-                "asbf",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                "feature/alias-branch-filter",
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    _assert_no_traceback(missing_branch_result)
+    combo_rows = _invoke_dock_json(
+        [
+            "f",
+            "asbf",
+            "--repo",
+            git_repo.name,
+            "--branch",
+            "feature/alias-branch-filter",
+            "--json",
+        ],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(combo_rows) == 1
     assert combo_rows[0]["branch"] == "feature/alias-branch-filter"
-    feature_table = _run_dock(
-        ["f", "asbf", "--branch", "feature/alias-branch-filter"],
+
+
+def test_search_alias_repo_branch_filter_semantics_non_json(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """Alias search should honor combined repo+branch filters in table mode."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    default_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias repo branch semantics objective default",
+        decisions="default branch checkpoint for alias repo+branch filtering",
+        next_steps=["run alias repo+branch filter"],
+        resume_commands=["echo default"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/alias-repo-branch-filter")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias repo branch semantics objective feature",
+        decisions="feature branch checkpoint for alias repo+branch filtering",
+        next_steps=["run alias repo+branch filter"],
+        resume_commands=["echo feature"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, default_branch)
+
+    filtered = _invoke_dock(
+        [
+            "f",
+            "Alias repo branch semantics objective",
+            "--repo",
+            git_repo.name,
+            "--branch",
+            "feature/alias-repo-branch-filter",
+        ],
         cwd=tmp_path,
         env=env,
     ).stdout
-    assert "asbf-feature" in feature_table
-    assert "asbf-default" not in feature_table
-    assert "Traceback" not in feature_table
-
-
-def test_search_alias_repo_branch_filter_semantics_non_json(git_repo: Path, tmp_path: Path) -> None:
-    """Alias search should honor combined repo+branch filters in table mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    default_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias repo branch semantics objective default",
-            "--decisions",
-            "default branch checkpoint for alias repo+branch filtering",
-            "--next-step",
-            "run alias repo+branch filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo default",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/alias-repo-branch-filter"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias repo branch semantics objective feature",
-            "--decisions",
-            "feature branch checkpoint for alias repo+branch filtering",
-            "--next-step",
-            "run alias repo+branch filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", default_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    filtered = _run_dock(
-        [
-            "f",
-            "Alias repo branch semantics objective",
-            "--repo",
-            git_repo.name,
-            "--branch",
-            "feature/alias-repo-branch-filter",
-        ],
-        cwd=tmp_path,
-        env=env,
-    ).stdout
-    assert "feature" in filtered
-    assert "default" not in filtered
+    assert "feature" in filtered
+    assert "default" not in filtered
 
 
 def test_search_alias_shows_no_match_message(tmp_path: Path) -> None:
     """Search alias should show empty-result guidance in non-JSON mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    result = _run_dock(["f", "no-match-query"], cwd=tmp_path, env=env)
+    result = _invoke_dock(["f", "no-match-query"], cwd=tmp_path, env=env)
     assert result.returncode == 0
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_repo_filter_no_match_message(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should show no-match guidance for repo-filter misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias repo filter message objective",
-            "--decisions",
-            "Alias repo filter message decision",
-            "--next-step",
-            "validate repo filter miss message",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias repo filter message objective",
+        decisions="Alias repo filter message decision",
+        next_steps=["validate repo filter miss message"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         ["f", "Alias repo filter message objective", "--repo", "missing-berth"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_repo_branch_filter_no_match_json(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should return [] when combined repo+branch filters miss."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias repo branch json no-match objective",
-            "--decisions",
-            "Alias repo branch json no-match decision",
-            "--next-step",
-            "validate repo+branch json miss",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias repo branch json no-match objective",
+        decisions="Alias repo branch json no-match decision",
+        next_steps=["validate repo+branch json miss"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             "f",
             "Alias repo branch json no-match objective",
@@ -8379,44 +7001,23 @@ def test_search_alias_repo_branch_filter_no_match_json(git_repo: Path, tmp_path:
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_repo_branch_filter_no_match_message(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should show no-match guidance for repo+branch misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias repo branch message objective",
-            "--decisions",
-            "Alias repo branch message decision",
-            "--next-step",
-            "validate repo+branch miss message",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias repo branch message objective",
+        decisions="Alias repo branch message decision",
+        next_steps=["validate repo+branch miss message"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             "f",
             "Alias repo branch message objective",
@@ -8429,314 +7030,161 @@ def test_search_alias_repo_branch_filter_no_match_message(git_repo: Path, tmp_pa
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_tag_filter_no_match_message(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should show no-match guidance for tag-filter misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag filter message objective",
-            "--decisions",
-            "Alias tag filter message decision",
-            "--next-step",
-            "validate tag filter miss message",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    result = _run_dock(
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias tag filter message objective",
+        decisions="Alias tag filter message decision",
+        next_steps=["validate tag filter miss message"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
         ["f", "Alias tag filter message objective", "--tag", "missing-tag"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_branch_filter_no_match_message(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should show no-match guidance for branch-filter misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias branch filter message objective",
-            "--decisions",
-            "Alias branch filter message decision",
-            "--next-step",
-            "validate branch filter miss message",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias branch filter message objective",
+        decisions="Alias branch filter message decision",
+        next_steps=["validate branch filter miss message"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         ["f", "Alias branch filter message objective", "--branch", "missing/branch"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_tag_branch_filter_no_match_json(git_repo: Path, tmp_path: Path) -> None:
     """Search alias JSON should return [] for combined tag+branch misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag branch json objective",
-            "--decisions",
-            "Alias tag branch json decision",
-            "--next-step",
-            "validate tag+branch json miss",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    result = _run_dock(
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias tag branch json objective",
+        decisions="Alias tag branch json decision",
+        next_steps=["validate tag+branch json miss"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
         ["f", "Alias tag branch json objective", "--tag", "alpha", "--branch", "missing/branch", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_tag_branch_filter_no_match_message(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should show no-match guidance for combined tag+branch misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag branch message objective",
-            "--decisions",
-            "Alias tag branch message decision",
-            "--next-step",
-            "validate tag+branch miss message",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    result = _run_dock(
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias tag branch message objective",
+        decisions="Alias tag branch message decision",
+        next_steps=["validate tag+branch miss message"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
         ["f", "Alias tag branch message objective", "--tag", "alpha", "--branch", "missing/branch"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_tag_repo_filter_no_match_message(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should show no-match guidance for tag+repo misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag repo message objective",
-            "--decisions",
-            "Alias tag repo message decision",
-            "--next-step",
-            "validate tag+repo miss message",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    result = _run_dock(
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias tag repo message objective",
+        decisions="Alias tag repo message decision",
+        next_steps=["validate tag+repo miss message"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
         ["f", "Alias tag repo message objective", "--tag", "alpha", "--repo", "missing-berth"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_tag_repo_filter_no_match_json(git_repo: Path, tmp_path: Path) -> None:
     """Search alias JSON should return [] for combined tag+repo misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag repo json objective",
-            "--decisions",
-            "Alias tag repo json decision",
-            "--next-step",
-            "validate tag+repo json miss",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    result = _run_dock(
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias tag repo json objective",
+        decisions="Alias tag repo json decision",
+        next_steps=["validate tag+repo json miss"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
         ["f", "Alias tag repo json objective", "--tag", "alpha", "--repo", "missing-berth", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_tag_repo_branch_filter_no_match_json(git_repo: Path, tmp_path: Path) -> None:
     """Search alias should return [] for combined tag+repo+branch misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag repo branch json objective",
-            "--decisions",
-            "Alias tag repo branch json decision",
-            "--next-step",
-            "validate tag+repo+branch json miss",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias tag repo branch json objective",
+        decisions="Alias tag repo branch json decision",
+        next_steps=["validate tag+repo+branch json miss"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             "f",
             "Alias tag repo branch json objective",
@@ -8752,7 +7200,7 @@ def test_search_alias_tag_repo_branch_filter_no_match_json(git_repo: Path, tmp_p
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_alias_tag_repo_branch_filter_no_match_message(
@@ -8760,41 +7208,19 @@ def test_search_alias_tag_repo_branch_filter_no_match_message(
     tmp_path: Path,
 ) -> None:
     """Search alias should show no-match guidance for tag+repo+branch misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag repo branch message objective",
-            "--decisions",
-            "Alias tag repo branch message decision",
-            "--next-step",
-            "validate tag+repo+branch miss",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias tag repo branch message objective",
+        decisions="Alias tag repo branch message decision",
+        next_steps=["validate tag+repo+branch miss"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             "f",
             "Alias tag repo branch message objective",
@@ -8809,40 +7235,21 @@ def test_search_alias_tag_repo_branch_filter_no_match_message(
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_undock_alias_matches_resume_behavior(git_repo: Path, tmp_path: Path) -> None:
     """`undock` alias should resolve to the same resume behavior."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            git_repo,
             "Undock alias objective",
-            "--decisions",
             "Undock should mirror resume command output",
-            "--next-step",
             "Run undock alias",
-            "--risks",
-            "none",
-            "--command",
-            "echo undock",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command="echo undock",
+        ),
         cwd=git_repo,
         env=env,
     )
@@ -8853,24 +7260,18 @@ def test_undock_alias_matches_resume_behavior(git_repo: Path, tmp_path: Path) ->
 
 def test_undock_alias_rejects_blank_berth_argument(tmp_path: Path) -> None:
     """Undock alias should reject blank berth argument values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(["undock", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Berth must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Berth must be a non-empty string.")
 
 
 def test_undock_alias_rejects_blank_branch_option(git_repo: Path, tmp_path: Path) -> None:
     """Undock alias should reject blank --branch option values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(["undock", "--branch", "   "], cwd=git_repo, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--branch must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--branch must be a non-empty string.")
 
 
 def test_undock_alias_accepts_trimmed_berth_lookup_value(
@@ -8878,37 +7279,17 @@ def test_undock_alias_accepts_trimmed_berth_lookup_value(
     tmp_path: Path,
 ) -> None:
     """Undock alias should resolve berth lookup after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Undock trimmed berth objective",
-            "--decisions",
-            "Resolve undock berth value with surrounding whitespace",
-            "--next-step",
-            "resume outside repo via undock",
-            "--risks",
-            "none",
-            "--command",
-            "echo undock",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Undock trimmed berth objective",
+        decisions="Resolve undock berth value with surrounding whitespace",
+        next_steps=["resume outside repo via undock"],
+        resume_commands=["echo undock"],
+        verification=SAVE_VERIFICATION,
     )
 
     result = _run_dock(["undock", f"  {git_repo.name}  "], cwd=tmp_path, env=env)
@@ -8918,44 +7299,27 @@ def test_undock_alias_accepts_trimmed_berth_lookup_value(
 def test_undock_alias_branch_flag_accepts_trimmed_value(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Undock alias should resolve --branch values after trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Undock trimmed branch objective",
-            "--decisions",
-            "Resolve undock branch values with surrounding whitespace",
-            "--next-step",
-            "resume undock with branch",
-            "--risks",
-            "none",
-            "--command",
-            "echo undock-branch",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Undock trimmed branch objective",
+        decisions="Resolve undock branch values with surrounding whitespace",
+        next_steps=["resume undock with branch"],
+        resume_commands=["echo undock-branch"],
+        verification=SAVE_VERIFICATION,
     )
 
-    selected = json.loads(
-        _run_dock(["undock", "--branch", f"  {branch}  ", "--json"], cwd=git_repo, env=env).stdout
+    selected = _run_dock_json(
+        ["undock", "--branch", f"  {branch}  ", "--json"],
+        cwd=git_repo,
+        env=env,
     )
     assert selected["branch"] == branch
     assert selected["objective"] == "Undock trimmed branch objective"
@@ -8966,46 +7330,24 @@ def test_undock_alias_supports_handoff_and_json_for_explicit_berth(
     tmp_path: Path,
 ) -> None:
     """Undock alias should mirror resume handoff/json berth lookup behavior."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Undock handoff/json objective",
-            "--decisions",
-            "Validate undock alias parity for handoff and json output",
-            "--next-step",
-            "Run undock alias outside repo",
-            "--risks",
-            "none",
-            "--command",
-            "echo undock",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Undock handoff/json objective",
+        decisions="Validate undock alias parity for handoff and json output",
+        next_steps=["Run undock alias outside repo"],
+        resume_commands=["echo undock"],
+        verification=SAVE_VERIFICATION,
     )
 
     handoff = _run_dock(["undock", f"  {git_repo.name}  ", "--handoff"], cwd=tmp_path, env=env).stdout
     assert "Undock handoff/json objective" in handoff
     assert "### Dockyard Handoff" in handoff
 
-    payload = json.loads(
-        _run_dock(["undock", f"  {git_repo.name}  ", "--json"], cwd=tmp_path, env=env).stdout
-    )
+    payload = _run_dock_json(["undock", f"  {git_repo.name}  ", "--json"], cwd=tmp_path, env=env)
     assert payload["project_name"] == git_repo.name
     assert payload["objective"] == "Undock handoff/json objective"
 
@@ -9017,14 +7359,11 @@ def test_review_open_shows_associated_checkpoint(
     command_name: str,
 ) -> None:
     """Auto-created review should link back to associated checkpoint details."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    security_dir = git_repo / "security"
-    security_dir.mkdir(exist_ok=True)
-    (security_dir / "guard.py").write_text("print('guard')\n", encoding="utf-8")
+    _write_text_creating_parents(git_repo / "security" / "guard.py", "print('guard')\n")
 
-    _run_dock(
+    _invoke_dock(
         [
             command_name,
             "--root",
@@ -9049,12 +7388,12 @@ def test_review_open_shows_associated_checkpoint(
         env=env,
     )
 
-    list_result = _run_dock(["review"], cwd=tmp_path, env=env)
-    review_match = re.search(r"rev_[a-f0-9]+", list_result.stdout)
+    list_result = _invoke_dock(["review"], cwd=tmp_path, env=env)
+    review_match = REVIEW_ID_PATTERN.search(list_result.stdout)
     assert review_match is not None
     review_id = review_match.group(0)
 
-    open_result = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env)
+    open_result = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env)
     assert "Review Item" in open_result.stdout
     assert "checkpoint_id: cp_" in open_result.stdout
     assert "Associated Checkpoint" in open_result.stdout
@@ -9062,46 +7401,39 @@ def test_review_open_shows_associated_checkpoint(
 
 
 @pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_review_open_shows_missing_checkpoint_notice(
+def test_save_aliases_resolve_to_same_handler(tmp_path: Path, command_name: str) -> None:
+    """Save aliases should dispatch to the shared save command handler."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    callbacks = {
+        command.name: command.callback for command in cli_module.app.registered_commands
+    }
+    assert callbacks[command_name] is cli_module.save_command
+
+    help_text = _invoke_dock([command_name, "--help"], cwd=tmp_path, env=env).stdout
+    assert "--objective" in help_text
+    assert "--no-prompt" in help_text
+
+
+def test_review_open_json_reports_missing_checkpoint(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
 ) -> None:
-    """Review open should indicate when checkpoint link is missing."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Review open JSON should mark a linked checkpoint missing from the index."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Missing checkpoint notice baseline ({command_name})",
-            "--decisions",
+    _invoke_dock(
+        _save_args(
+            git_repo,
+            "Missing checkpoint notice baseline",
             "Create manual review tied to fake checkpoint id",
-            "--next-step",
             "Open review and inspect message",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    created = _run_dock(
+    created_payload = _invoke_dock_json(
         [
             "review",
             "add",
@@ -9111,168 +7443,130 @@ def test_review_open_shows_missing_checkpoint_notice(
             "low",
             "--checkpoint-id",
             "cp_missing_123",
+            "--json",
         ],
         cwd=git_repo,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    assert created_payload["status"] == "open"
+    assert created_payload["checkpoint_id"] == "cp_missing_123"
+    review_id = created_payload["id"]
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env)
-    assert "Associated Checkpoint" in opened.stdout
-    assert "checkpoint_id: cp_missing_123" in opened.stdout
-    assert "status: missing from index" in opened.stdout
+    payload = _invoke_dock_json(["review", "open", review_id, "--json"], cwd=tmp_path, env=env)
+    assert payload["checkpoint_id"] == "cp_missing_123"
+    assert payload["checkpoint"] == {
+        "id": "cp_missing_123",
+        "status": "missing_from_index",
+        "objective": None,
+    }
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_review_open_displays_file_list(
+def test_review_open_json_reports_indexed_checkpoint(git_repo: Path, tmp_path: Path) -> None:
+    """Review open JSON should include linked checkpoint objective when indexed."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    checkpoint = save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Indexed checkpoint objective",
+        decisions="Link review to a stored checkpoint",
+        next_steps=["Open review JSON"],
+    )
+    review = add_review(
+        dock_home,
+        repo_id=checkpoint.repo_id,
+        branch=checkpoint.branch,
+        reason="indexed_link",
+        checkpoint_id=checkpoint.id,
+    )
+
+    payload = _invoke_dock_json(["review", "open", review.id, "--json"], cwd=tmp_path, env=env)
+    assert payload["id"] == review.id
+    assert payload["checkpoint"] == {
+        "id": checkpoint.id,
+        "status": "indexed",
+        "objective": "Indexed checkpoint objective",
+    }
+
+
+def test_review_open_json_includes_file_list(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
 ) -> None:
-    """Review open output should include associated file paths."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Review open JSON should include associated file paths."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Review file display baseline ({command_name})",
-            "--decisions",
-            "Create review with file metadata",
-            "--next-step",
-            "Open review details",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    checkpoint = save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Review file display baseline",
+        decisions="Create review with file metadata",
+        next_steps=["Open review details"],
     )
-    created = _run_dock(
-        [
-            "review",
-            "add",
-            "--reason",
-            "file_display",
-            "--severity",
-            "low",
-            "--file",
-            "src/a.py",
-            "--file",
-            "src/b.py",
-        ],
-        cwd=git_repo,
-        env=env,
+    review = add_review(
+        dock_home,
+        repo_id=checkpoint.repo_id,
+        branch=checkpoint.branch,
+        reason="file_display",
+        severity="low",
+        files=["src/a.py", "src/b.py"],
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env)
-    assert "files: src/a.py, src/b.py" in opened.stdout
+    payload = _invoke_dock_json(["review", "open", review.id, "--json"], cwd=tmp_path, env=env)
+    assert payload["files"] == ["src/a.py", "src/b.py"]
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_review_open_displays_notes(
+def test_review_open_json_includes_notes(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
 ) -> None:
-    """Review open output should include optional notes text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Review open JSON should include optional notes text."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Review notes baseline ({command_name})",
-            "--decisions",
-            "Create review with notes",
-            "--next-step",
-            "Open review details",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    checkpoint = save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Review notes baseline",
+        decisions="Create review with notes",
+        next_steps=["Open review details"],
     )
-    created = _run_dock(
-        [
-            "review",
-            "add",
-            "--reason",
-            "notes_display",
-            "--severity",
-            "low",
-            "--notes",
-            "needs careful review",
-        ],
-        cwd=git_repo,
-        env=env,
+    review = add_review(
+        dock_home,
+        repo_id=checkpoint.repo_id,
+        branch=checkpoint.branch,
+        reason="notes_display",
+        severity="low",
+        notes="needs careful review",
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env)
-    assert "created_at:" in opened.stdout
-    assert "checkpoint_id: (none)" in opened.stdout
-    assert "notes: needs careful review" in opened.stdout
+    payload = _invoke_dock_json(["review", "open", review.id, "--json"], cwd=tmp_path, env=env)
+    assert payload["created_at"] == review.created_at
+    assert payload["checkpoint_id"] is None
+    assert payload["checkpoint"] is None
+    assert payload["notes"] == "needs careful review"
 
 
 def test_review_add_outside_repo_requires_explicit_context(tmp_path: Path) -> None:
     """Review add should fail outside git repo when repo/branch are omitted."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    failed = _run_dock(
+    failed = _invoke_dock(
         ["review", "add", "--reason", "no_context", "--severity", "low"],
         cwd=tmp_path,
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "not inside a git repository" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "not inside a git repository")
 
 
 def test_review_add_outside_repo_with_explicit_context_succeeds(tmp_path: Path) -> None:
     """Review add should work outside repo when repo and branch are provided."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    created = _run_dock(
+    created = _invoke_dock(
         [
             "review",
             "add",
@@ -9290,17 +7584,16 @@ def test_review_add_outside_repo_with_explicit_context_succeeds(tmp_path: Path)
     )
     assert "Created review" in created.stdout
 
-    listed = _run_dock(["review", "--all"], cwd=tmp_path, env=env).stdout
+    listed = _invoke_dock(["review", "--all"], cwd=tmp_path, env=env).stdout
     assert "manual_repo/manual_branch" in listed
     assert "manual_outside_repo" in listed
 
 
 def test_review_add_partial_override_requires_both_repo_and_branch(tmp_path: Path) -> None:
     """Partial context overrides should fail with actionable guidance."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    failed = _run_dock(
+    failed = _invoke_dock(
         [
             "review",
             "add",
@@ -9315,11 +7608,9 @@ def test_review_add_partial_override_requires_both_repo_and_branch(tmp_path: Pat
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Provide both --repo and --branch when overriding context." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "Provide both --repo and --branch when overriding context.")
 
-    failed_branch_only = _run_dock(
+    failed_branch_only = _invoke_dock(
         [
             "review",
             "add",
@@ -9341,10 +7632,9 @@ def test_review_add_partial_override_requires_both_repo_and_branch(tmp_path: Pat
 
 def test_review_add_rejects_blank_repo_or_branch_override(tmp_path: Path) -> None:
     """Review add should reject blank repo/branch override values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    blank_repo = _run_dock(
+    blank_repo = _invoke_dock(
         [
             "review",
             "add",
@@ -9365,7 +7655,7 @@ def test_review_add_rejects_blank_repo_or_branch_override(tmp_path: Path) -> Non
     assert "--repo must be a non-empty string." in blank_repo_output
     assert "Traceback" not in blank_repo_output
 
-    blank_branch = _run_dock(
+    blank_branch = _invoke_dock(
         [
             "review",
             "add",
@@ -9390,44 +7680,26 @@ def test_review_add_rejects_blank_repo_or_branch_override(tmp_path: Path) -> Non
 def test_review_add_accepts_berth_name_override(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
+    git_template_repo_id: str,
 ) -> None:
     """Review add should resolve berth name in --repo override."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+    _invoke_dock(
+        _save_args(
+            git_repo,
             "Berth name review add baseline",
-            "--decisions",
             "Need berth metadata available",
-            "--next-step",
             "create manual review by berth name",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+        ),
         cwd=git_repo,
         env=env,
     )
-    repo_id = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)["repo_id"]
+    repo_id = git_template_repo_id
 
-    _run_dock(
+    _invoke_dock(
         [
             "review",
             "add",
@@ -9443,119 +7715,45 @@ def test_review_add_accepts_berth_name_override(
         cwd=tmp_path,
         env=env,
     )
-    listed = _run_dock(["review"], cwd=tmp_path, env=env).stdout
+    listed = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
     assert f"{repo_id}/{branch}" in listed
     assert "berth_name_override" in listed
 
 
 def test_review_add_prefers_repo_id_over_colliding_berth_name(
     git_repo: Path,
+    git_repo_template: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Review add should resolve exact repo-id before colliding berth names."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
-
-    other_repo = tmp_path / "review-collision-other"
-    other_repo.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "dockyard@example.com"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Dockyard Test"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", "git@github.com:org/review-other.git"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    (other_repo / "README.md").write_text("seed\n", encoding="utf-8")
-    subprocess.run(["git", "add", "README.md"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=str(other_repo), check=True, capture_output=True)
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(other_repo),
-            "--no-prompt",
-            "--objective",
-            "review-collision-other",
-            "--decisions",
-            "other berth setup for review override collision test",
-            "--next-step",
-            "add review using repo id",
-            "--risks",
-            "none",
-            "--command",
-            "echo other",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=other_repo,
-        env=env,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "review-collision-target",
-            "--decisions",
-            "target berth setup for review override collision test",
-            "--next-step",
-            "add review using repo id",
-            "--risks",
-            "none",
-            "--command",
-            "echo target",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    other_repo = _copy_git_repo_template(
+        git_repo_template,
+        tmp_path / "review-collision-other",
+        "git@github.com:org/review-other.git",
     )
 
-    db_path = tmp_path / ".dockyard_data" / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    target_repo_id = conn.execute(
-        "SELECT repo_id FROM berths WHERE root_path = ?",
-        (str(git_repo),),
-    ).fetchone()[0]
-    other_repo_id = conn.execute(
-        "SELECT repo_id FROM berths WHERE root_path = ?",
-        (str(other_repo),),
-    ).fetchone()[0]
-    conn.execute("UPDATE berths SET name = ? WHERE repo_id = ?", (target_repo_id, other_repo_id))
-    conn.commit()
-    conn.close()
-
-    _run_dock(
+    dock_home = tmp_path / ".dockyard_data"
+    other_repo_id = save_checkpoint(
+        dock_home,
+        other_repo,
+        objective="review-collision-other",
+        decisions="other berth setup for review override collision test",
+        next_steps=["add review using repo id"],
+    ).repo_id
+    target_repo_id = save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="review-collision-target",
+        decisions="target berth setup for review override collision test",
+        next_steps=["add review using repo id"],
+    ).repo_id
+    rename_berth(dock_home, other_repo_id, target_repo_id)
+
+    _invoke_dock(
         [
             "review",
             "add",
@@ -9571,6244 +7769,2573 @@ def test_review_add_prefers_repo_id_over_colliding_berth_name(
         cwd=tmp_path,
         env=env,
     )
-    listed = _run_dock(["review"], cwd=tmp_path, env=env).stdout
+    listed = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
     assert f"{target_repo_id}/{branch}" in listed
     assert f"{other_repo_id}/{branch}" not in listed
     assert "review_repo_id_collision" in listed
 
 
-def test_save_repo_id_uses_non_origin_remote_when_origin_missing(
+@pytest.mark.parametrize("case", REPO_ID_FALLBACK_CASES, ids=REPO_ID_FALLBACK_IDS)
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
+def test_save_repo_id_follows_remote_preference_order(
     git_repo: Path,
     tmp_path: Path,
+    case: RepoIdFallbackCaseMeta,
+    run_cwd_kind: RunCwdKind,
 ) -> None:
-    """Save/resume flow should derive repo id from non-origin remote fallback."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Save should derive repo id from origin, sorted fallback remotes, then path hash."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+    _set_git_remotes(git_repo, dict(case.remotes))
 
-    subprocess.run(
-        ["git", "remote", "remove", "origin"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    upstream_url = "https://example.com/team/fallback-upstream.git"
-    subprocess.run(
-        ["git", "remote", "add", "upstream", upstream_url],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    _run_dock(
+    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
+    _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
             "--no-prompt",
             "--objective",
-            "Repo id non-origin fallback objective",
+            f"repo id {case.case_id} objective",
             "--decisions",
-            "Derive repo id from upstream remote",
+            "Derive repo id from configured remotes",
             "--next-step",
-            "assert deterministic repo id fallback",
+            "assert deterministic repo id",
             "--risks",
             "none",
             "--command",
             "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
             "--no-auto-review",
         ],
-        cwd=git_repo,
+        cwd=run_cwd,
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["repo_id"] == hashlib.sha1(upstream_url.encode("utf-8")).hexdigest()[:16]
+    expected_repo_id = (
+        case.expected_repo_id or hashlib.sha1(str(git_repo).encode("utf-8")).hexdigest()[:16]
+    )
+    payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert payload["repo_id"] == expected_repo_id
 
 
-def test_save_repo_id_falls_back_to_path_hash_when_origin_is_blank(
+def test_review_add_accepts_trimmed_repo_and_branch_override(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
+    git_template_repo_id: str,
 ) -> None:
-    """Save/resume flow should path-hash repo id when remotes are unusable."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    subprocess.run(
-        ["git", "config", "remote.origin.url", ""],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    """Review add should trim repo/branch override values."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo id path fallback objective",
-            "--decisions",
-            "Derive repo id from repo path hash",
-            "--next-step",
-            "assert deterministic path fallback repo id",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    _invoke_dock(
+        _save_args(
+            git_repo,
+            "Trimmed override baseline",
+            "Ensure override values are normalized",
+            "create manual review",
+        ),
         cwd=git_repo,
         env=env,
     )
+    repo_id = git_template_repo_id
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["repo_id"] == hashlib.sha1(str(git_repo).encode("utf-8")).hexdigest()[:16]
+    _invoke_dock(
+        [
+            "review",
+            "add",
+            "--reason",
+            "trimmed_override",
+            "--severity",
+            "low",
+            "--repo",
+            f"  {git_repo.name}  ",
+            "--branch",
+            f"  {branch}  ",
+        ],
+        cwd=tmp_path,
+        env=env,
+    )
+    listed = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert f"{repo_id}/{branch}" in listed
+    assert "trimmed_override" in listed
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_aliases_repo_id_prefer_origin_when_multiple_remotes_exist(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
-) -> None:
-    """Save aliases should prioritize origin URL over other remotes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    origin_url = subprocess.run(
-        ["git", "config", "--get", "remote.origin.url"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-        text=True,
-    ).stdout.strip()
-    subprocess.run(
-        ["git", "remote", "add", "upstream", "https://example.com/team/upstream.git"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
+def test_review_lifecycle_recomputes_slip_status(git_repo: Path, tmp_path: Path) -> None:
+    """Slip status should reflect review add/done transitions."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    checkpoint = save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Status recompute baseline",
+        decisions="Start with verified checkpoint so status is green",
+        next_steps=["Add high review then resolve it"],
+        risks_review="None",
+        resume_commands=["echo status"],
+        verification=VerificationState(
+            tests_run=True,
+            tests_command="pytest -q",
+            build_ok=True,
+            build_command="echo build",
+        ),
     )
+    assert harbor_rows(dock_home)[0]["status"] == "green"
 
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} repo id origin preference objective",
-            "--decisions",
-            "Use origin even when other remotes exist",
-            "--next-step",
-            "assert origin preference repo id",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=run_cwd,
-        env=env,
+    review = add_review(
+        dock_home,
+        repo_id=checkpoint.repo_id,
+        branch=checkpoint.branch,
+        reason="critical_validation",
+        severity="high",
     )
+    assert harbor_rows(dock_home)[0]["status"] == "red"
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["repo_id"] == hashlib.sha1(origin_url.encode("utf-8")).hexdigest()[:16]
+    _invoke_dock(["review", "done", review.id], cwd=tmp_path, env=env)
+    after_done_rows = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
+    assert after_done_rows[0]["status"] == "green"
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_aliases_use_non_origin_remote_for_repo_id_fallback(
+@pytest.mark.parametrize(
+    ("dashboard_args", "dashboard_label"),
+    [
+        (["ls", "--json"], "ls"),
+        (["harbor", "--json"], "harbor"),
+        (["--json"], "callback"),
+    ],
+    ids=["ls", "harbor", "callback"],
+)
+def test_review_lifecycle_recomputes_slip_status_across_dashboard_aliases(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
+    dashboard_args: list[str],
+    dashboard_label: str,
 ) -> None:
-    """Save command aliases should honor non-origin remote repo-id fallback."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    subprocess.run(
-        ["git", "remote", "remove", "origin"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    upstream_url = "https://example.com/team/alias-fallback-upstream.git"
-    subprocess.run(
-        ["git", "remote", "add", "upstream", upstream_url],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
+    """Slip status recomputation should be consistent across dashboard aliases."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    objective = f"Status recompute alias baseline ({dashboard_label})"
+    _invoke_dock(
+        _save_args(
+            git_repo,
+            objective,
+            "Start with verified checkpoint so status is green",
+            "Add high review then resolve it",
+            risks="None",
+            command="echo status",
+        ),
+        cwd=git_repo,
+        env=env,
     )
 
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    _run_dock(
+    def _status_for_objective() -> str:
+        rows = _invoke_dock_json(dashboard_args, cwd=tmp_path, env=env)
+        target = next(row for row in rows if row.get("objective") == objective)
+        return str(target["status"])
+
+    assert _status_for_objective() == "green"
+
+    review_id = _invoke_dock_json(
         [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} alias non-origin repo-id objective",
-            "--decisions",
-            "Use non-origin remote in alias fallback flow",
-            "--next-step",
-            "assert alias fallback repo id",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            "review",
+            "add",
+            "--reason",
+            f"critical_validation_{dashboard_label}",
+            "--severity",
+            "high",
+            "--json",
         ],
-        cwd=run_cwd,
+        cwd=git_repo,
         env=env,
-    )
+    )["id"]
+    assert _status_for_objective() == "red"
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["repo_id"] == hashlib.sha1(upstream_url.encode("utf-8")).hexdigest()[:16]
+    _invoke_dock(["review", "done", review_id], cwd=tmp_path, env=env)
+    assert _status_for_objective() == "green"
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_aliases_use_path_hash_repo_id_fallback_when_origin_blank(
+def test_review_cli_list_prioritizes_high_severity(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
+    seeded_dock_home: Path,
 ) -> None:
-    """Save command aliases should path-hash repo id when origin URL is blank."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    subprocess.run(
-        ["git", "config", "remote.origin.url", ""],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    """Review CLI listing should show high-severity items before lower ones."""
+    env = _dock_env(seeded_dock_home)
 
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} alias path-hash repo-id objective",
-            "--decisions",
-            "Use path-hash fallback when origin URL is blank",
-            "--next-step",
-            "assert alias path-hash repo id fallback",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=run_cwd,
+    _invoke_dock(
+        ["review", "add", "--reason", "low_item", "--severity", "low"],
+        cwd=git_repo,
+        env=env,
+    )
+    _invoke_dock(
+        ["review", "add", "--reason", "high_item", "--severity", "high"],
+        cwd=git_repo,
         env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["repo_id"] == hashlib.sha1(str(git_repo).encode("utf-8")).hexdigest()[:16]
+    review_output = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    lines = list(itertools.islice((line for line in review_output.splitlines() if line.strip()), 2))
+    assert len(lines) == 2
+    assert "high_item" in lines[0]
+    assert "low_item" in lines[1]
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_aliases_repo_id_fallback_remote_ordering_is_case_insensitive(
+def test_review_default_command_supports_all_flag(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
+    seeded_dock_home: Path,
 ) -> None:
-    """Save aliases should choose fallback remotes using case-insensitive sort."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    subprocess.run(
-        ["git", "remote", "remove", "origin"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    alpha_url = "https://example.com/team/alpha.git"
-    subprocess.run(
-        ["git", "remote", "add", "Zeta", "https://example.com/team/zeta.git"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "alpha", alpha_url],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    """`dock review --all` should include resolved items without subcommand."""
+    env = _dock_env(seeded_dock_home)
 
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} repo id case-insensitive fallback objective",
-            "--decisions",
-            "Prefer alpha before Zeta in fallback ordering",
-            "--next-step",
-            "assert case-insensitive fallback ordering",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=run_cwd,
+    review_id = _invoke_dock_json(
+        ["review", "add", "--reason", "all_flag_item", "--severity", "low", "--json"],
+        cwd=git_repo,
         env=env,
-    )
+    )["id"]
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["repo_id"] == hashlib.sha1(alpha_url.encode("utf-8")).hexdigest()[:16]
+    _invoke_dock(["review", "done", review_id], cwd=tmp_path, env=env)
 
+    open_only = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert "all_flag_item" not in open_only
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_aliases_repo_id_fallback_remote_case_collision_ordering_is_deterministic(
+    with_all = _invoke_dock(["review", "--all"], cwd=tmp_path, env=env).stdout
+    assert "all_flag_item" in with_all
+    assert "done" in with_all
+
+
+def test_review_listing_tie_breaks_by_recency_within_same_severity(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
+    seeded_dock_home: Path,
 ) -> None:
-    """Save aliases should deterministically resolve case-colliding remotes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    subprocess.run(
-        ["git", "remote", "remove", "origin"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    alpha_upper_url = "https://example.com/team/alpha-upper.git"
-    subprocess.run(
-        ["git", "remote", "add", "alpha", "https://example.com/team/alpha-lower.git"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "Alpha", alpha_upper_url],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    """Review listings should order same-severity items by newest timestamp."""
+    dock_home = seeded_dock_home
+    env = _dock_env(dock_home)
 
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    _run_dock(
+    older_id = _invoke_dock_json(
+        ["review", "add", "--reason", "recency_older", "--severity", "med", "--json"],
+        cwd=git_repo,
+        env=env,
+    )["id"]
+
+    newer_id = _invoke_dock_json(
+        ["review", "add", "--reason", "recency_newer", "--severity", "med", "--json"],
+        cwd=git_repo,
+        env=env,
+    )["id"]
+
+    db_path = dock_home / "db" / "index.sqlite"
+    _mutate_dock_db(
+        db_path,
         [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} repo id case-collision fallback objective",
-            "--decisions",
-            "Use deterministic ordering for case-colliding remote names",
-            "--next-step",
-            "assert deterministic case-collision ordering",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            ("UPDATE review_items SET created_at = ? WHERE id = ?", ("2000-01-01T00:00:00+00:00", older_id)),
+            ("UPDATE review_items SET created_at = ? WHERE id = ?", ("2005-01-01T00:00:00+00:00", newer_id)),
         ],
-        cwd=run_cwd,
-        env=env,
     )
 
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["repo_id"] == hashlib.sha1(alpha_upper_url.encode("utf-8")).hexdigest()[:16]
+    default_output = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
 
+    default_ids = REVIEW_ID_PATTERN.findall(default_output)
+    assert newer_id in default_ids and older_id in default_ids
+    assert default_ids.index(newer_id) < default_ids.index(older_id)
 
-def test_review_add_accepts_trimmed_repo_and_branch_override(
+
+def test_review_default_listing_delegates_to_list_subcommand(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Bare `review` should render through the `review list` handler."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+    calls: list[bool] = []
+    monkeypatch.setattr(cli_module, "review_list", lambda all_items: calls.append(all_items))
+
+    _invoke_dock(["review"], cwd=tmp_path, env=env)
+    _invoke_dock(["review", "--all"], cwd=tmp_path, env=env)
+
+    assert calls == [False, True]
+
+
+def test_review_list_subcommand_matches_default_listing(
     git_repo: Path,
     tmp_path: Path,
+    seeded_dock_home: Path,
 ) -> None:
-    """Review add should trim repo/branch override values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
+    """`review list` should mirror default `review` open-item listing."""
+    env = _dock_env(seeded_dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Trimmed override baseline",
-            "--decisions",
-            "Ensure override values are normalized",
-            "--next-step",
-            "create manual review",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    review_id = _invoke_dock_json(
+        ["review", "add", "--reason", "list_parity_item", "--severity", "med", "--json"],
         cwd=git_repo,
         env=env,
-    )
-    repo_id = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)["repo_id"]
+    )["id"]
 
-    _run_dock(
-        [
-            "review",
-            "add",
-            "--reason",
-            "trimmed_override",
-            "--severity",
-            "low",
-            "--repo",
-            f"  {git_repo.name}  ",
-            "--branch",
-            f"  {branch}  ",
-        ],
-        cwd=tmp_path,
-        env=env,
-    )
-    listed = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert f"{repo_id}/{branch}" in listed
-    assert "trimmed_override" in listed
+    default_listing = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    list_listing = _invoke_dock(["review", "list"], cwd=tmp_path, env=env).stdout
+    assert review_id in default_listing
+    assert review_id in list_listing
+    assert "list_parity_item" in default_listing
+    assert "list_parity_item" in list_listing
+    assert REVIEW_ID_PATTERN.findall(default_listing) == REVIEW_ID_PATTERN.findall(list_listing)
 
 
-def test_review_lifecycle_recomputes_slip_status(git_repo: Path, tmp_path: Path) -> None:
-    """Slip status should reflect review add/done transitions."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_review_list_all_subcommand_matches_default_all_listing(
+    git_repo: Path,
+    tmp_path: Path,
+    seeded_dock_home: Path,
+) -> None:
+    """`review list --all` should mirror default `review --all` ordering/content."""
+    env = _dock_env(seeded_dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Status recompute baseline",
-            "--decisions",
-            "Start with verified checkpoint so status is green",
-            "--next-step",
-            "Add high review then resolve it",
-            "--risks",
-            "None",
-            "--command",
-            "echo status",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    open_id = _invoke_dock_json(
+        ["review", "add", "--reason", "all_parity_open", "--severity", "high", "--json"],
         cwd=git_repo,
         env=env,
-    )
-
-    initial_rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
-    assert initial_rows[0]["status"] == "green"
+    )["id"]
 
-    review_added = _run_dock(
-        [
-            "review",
-            "add",
-            "--reason",
-            "critical_validation",
-            "--severity",
-            "high",
-        ],
+    done_id = _invoke_dock_json(
+        ["review", "add", "--reason", "all_parity_done", "--severity", "low", "--json"],
         cwd=git_repo,
         env=env,
-    )
-    review_match = re.search(r"rev_[a-f0-9]+", review_added.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    )["id"]
 
-    after_add_rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
-    assert after_add_rows[0]["status"] == "red"
+    _invoke_dock(["review", "done", done_id], cwd=tmp_path, env=env)
+
+    default_all = _invoke_dock(["review", "--all"], cwd=tmp_path, env=env).stdout
+    list_all = _invoke_dock(["review", "list", "--all"], cwd=tmp_path, env=env).stdout
+
+    assert open_id in default_all and done_id in default_all
+    assert open_id in list_all and done_id in list_all
+    assert "all_parity_open" in default_all and "all_parity_done" in default_all
+    assert "all_parity_open" in list_all and "all_parity_done" in list_all
+    assert REVIEW_ID_PATTERN.findall(default_all) == REVIEW_ID_PATTERN.findall(list_all)
 
-    _run_dock(["review", "done", review_id], cwd=tmp_path, env=env)
-    after_done_rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
-    assert after_done_rows[0]["status"] == "green"
+
+def test_review_done_unknown_id_is_actionable(empty_dock_home: Path) -> None:
+    """Unknown review id resolution should fail without traceback noise."""
+    env = _dock_env(empty_dock_home)
+
+    failed = _invoke_dock(
+        ["review", "done", "rev_missing"],
+        cwd=empty_dock_home.parent,
+        env=env,
+        expect_code=2,
+    )
+    _assert_cli_error(failed, "Review item not found: rev_missing")
 
 
 @pytest.mark.parametrize(
-    ("dashboard_args", "dashboard_label"),
-    [
-        (["ls", "--json"], "ls"),
-        (["harbor", "--json"], "harbor"),
-        (["--json"], "callback"),
-    ],
-    ids=["ls", "harbor", "callback"],
+    ("subcommand", "expected_template"),
+    [("done", "Resolved review {review_id}"), ("open", "id: {review_id}")],
+    ids=["done", "open"],
 )
-def test_review_lifecycle_recomputes_slip_status_across_dashboard_aliases(
+def test_review_subcommands_accept_trimmed_review_id(
     git_repo: Path,
     tmp_path: Path,
-    dashboard_args: list[str],
-    dashboard_label: str,
+    seeded_dock_home: Path,
+    subcommand: str,
+    expected_template: str,
 ) -> None:
-    """Slip status recomputation should be consistent across dashboard aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Review done/open should accept review IDs with surrounding whitespace."""
+    env = _dock_env(seeded_dock_home)
 
-    objective = f"Status recompute alias baseline ({dashboard_label})"
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            objective,
-            "--decisions",
-            "Start with verified checkpoint so status is green",
-            "--next-step",
-            "Add high review then resolve it",
-            "--risks",
-            "None",
-            "--command",
-            "echo status",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    review_id = _invoke_dock_json(
+        ["review", "add", "--reason", f"trimmed_{subcommand}", "--severity", "low", "--json"],
         cwd=git_repo,
         env=env,
+    )["id"]
+
+    output = _invoke_dock(["review", subcommand, f"  {review_id}  "], cwd=tmp_path, env=env).stdout
+    assert expected_template.format(review_id=review_id) in output
+
+
+def test_review_done_and_open_reject_blank_review_ids(empty_dock_home: Path) -> None:
+    """Review done/open should reject blank review IDs."""
+    env = _dock_env(empty_dock_home)
+
+    done_failed = _invoke_dock(
+        ["review", "done", "   "],
+        cwd=empty_dock_home.parent,
+        env=env,
+        expect_code=2,
     )
+    done_output = f"{done_failed.stdout}\n{done_failed.stderr}"
+    assert "Review ID must be a non-empty string." in done_output
+    assert "Traceback" not in done_output
 
-    def _status_for_objective() -> str:
-        rows = json.loads(_run_dock(dashboard_args, cwd=tmp_path, env=env).stdout)
-        target = next(row for row in rows if row.get("objective") == objective)
-        return str(target["status"])
+    open_failed = _invoke_dock(
+        ["review", "open", "   "],
+        cwd=empty_dock_home.parent,
+        env=env,
+        expect_code=2,
+    )
+    open_output = f"{open_failed.stdout}\n{open_failed.stderr}"
+    assert "Review ID must be a non-empty string." in open_output
+    assert "Traceback" not in open_output
 
-    assert _status_for_objective() == "green"
 
-    review_added = _run_dock(
-        [
-            "review",
-            "add",
-            "--reason",
-            f"critical_validation_{dashboard_label}",
-            "--severity",
-            "high",
-        ],
+@pytest.mark.parametrize(
+    "args",
+    [["review", "--all"], ["review", "list", "--all"], ["review", "list"]],
+    ids=["review_all", "review_list_all", "review_list"],
+)
+def test_review_listing_with_no_items_is_informative(empty_dock_home: Path, args: list[str]) -> None:
+    """Review listings should render empty-ledger guidance when no items exist."""
+    env = _dock_env(empty_dock_home)
+
+    result = _invoke_dock(args, cwd=empty_dock_home.parent, env=env)
+    assert "No review items." in result.stdout
+
+
+def test_review_add_validates_severity(
+    git_repo: Path,
+    tmp_path: Path,
+    seeded_dock_home: Path,
+) -> None:
+    """Review add should reject severities outside low/med/high."""
+    env = _dock_env(seeded_dock_home)
+
+    bad = _invoke_dock(
+        ["review", "add", "--reason", "invalid", "--severity", "critical"],
         cwd=git_repo,
         env=env,
+        expect_code=2,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", review_added.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
-    assert _status_for_objective() == "red"
+    _assert_cli_error(bad, "Invalid severity")
 
-    _run_dock(["review", "done", review_id], cwd=tmp_path, env=env)
-    assert _status_for_objective() == "green"
+    blank = _invoke_dock(
+        ["review", "add", "--reason", "invalid", "--severity", "   "],
+        cwd=git_repo,
+        env=env,
+        expect_code=2,
+    )
+    blank_output = f"{blank.stdout}\n{blank.stderr}"
+    assert "Severity must be a non-empty string." in blank_output
+    assert "Traceback" not in blank_output
 
+    # Upper-case values should normalize successfully.
+    good = _invoke_dock(
+        ["review", "add", "--reason", "valid", "--severity", "HIGH"],
+        cwd=git_repo,
+        env=env,
+    )
+    assert "Created review" in good.stdout
 
-def test_review_cli_list_prioritizes_high_severity(git_repo: Path, tmp_path: Path) -> None:
-    """Review CLI listing should show high-severity items before lower ones."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Review ordering baseline",
-            "--decisions",
-            "Need slip context for manual review items",
-            "--next-step",
-            "Add low then high review items",
-            "--risks",
-            "None",
-            "--command",
-            "echo reviews",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+def test_review_add_requires_non_empty_reason(
+    git_repo: Path,
+    tmp_path: Path,
+    seeded_dock_home: Path,
+) -> None:
+    """Review add should reject empty/whitespace reason strings."""
+    env = _dock_env(seeded_dock_home)
+
+    bad = _invoke_dock(
+        ["review", "add", "--reason", "   ", "--severity", "low"],
         cwd=git_repo,
         env=env,
+        expect_code=2,
     )
+    _assert_cli_error(bad, "--reason must be a non-empty string.")
 
-    _run_dock(
-        ["review", "add", "--reason", "low_item", "--severity", "low"],
+
+def test_review_add_trims_reason_whitespace(
+    git_repo: Path,
+    tmp_path: Path,
+    seeded_dock_home: Path,
+) -> None:
+    """Review reason should be trimmed before persistence."""
+    env = _dock_env(seeded_dock_home)
+
+    review_id = _invoke_dock_json(
+        ["review", "add", "--reason", "   padded_reason   ", "--severity", "low", "--json"],
         cwd=git_repo,
         env=env,
-    )
-    _run_dock(
-        ["review", "add", "--reason", "high_item", "--severity", "high"],
+    )["id"]
+
+    opened = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env)
+    assert "reason: padded_reason" in opened.stdout
+
+
+def test_review_add_trims_notes_and_checkpoint_id(
+    git_repo: Path,
+    tmp_path: Path,
+    seeded_dock_home: Path,
+) -> None:
+    """Review add should trim notes and checkpoint-id fields."""
+    env = _dock_env(seeded_dock_home)
+
+    review_id = _invoke_dock_json(
+        [
+            "review",
+            "add",
+            "--reason",
+            "trim optional fields",
+            "--severity",
+            "low",
+            "--checkpoint-id",
+            "  cp_trim_test  ",
+            "--notes",
+            "  keep this note  ",
+            "--json",
+        ],
         cwd=git_repo,
         env=env,
-    )
+    )["id"]
 
-    review_output = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    lines = [line for line in review_output.splitlines() if line.strip()]
-    assert len(lines) >= 2
-    assert "high_item" in lines[0]
-    assert "low_item" in lines[1]
-    review_list_output = _run_dock(["review", "list"], cwd=tmp_path, env=env).stdout
-    list_lines = [line for line in review_list_output.splitlines() if line.strip()]
-    assert len(list_lines) >= 2
-    assert "high_item" in list_lines[0]
-    assert "low_item" in list_lines[1]
+    opened = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
+    assert "checkpoint_id: cp_trim_test" in opened
+    assert "notes: keep this note" in opened
+    assert "checkpoint_id:   cp_trim_test" not in opened
+    assert "notes:   keep this note" not in opened
 
 
-def test_review_default_command_supports_all_flag(git_repo: Path, tmp_path: Path) -> None:
-    """`dock review --all` should include resolved items without subcommand."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_review_add_blank_checkpoint_id_is_treated_as_missing(
+    git_repo: Path,
+    tmp_path: Path,
+    seeded_dock_home: Path,
+) -> None:
+    """Blank checkpoint-id input should not trigger missing-checkpoint panel."""
+    env = _dock_env(seeded_dock_home)
 
-    _run_dock(
+    review_id = _invoke_dock_json(
         [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Review all flag baseline",
-            "--decisions",
-            "Need context for manual review lifecycle",
-            "--next-step",
-            "Create and resolve review",
-            "--risks",
-            "None",
-            "--command",
-            "echo review",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            "review",
+            "add",
+            "--reason",
+            "blank checkpoint id",
+            "--severity",
+            "low",
+            "--checkpoint-id",
+            "   ",
+            "--notes",
+            "   ",
+            "--json",
         ],
         cwd=git_repo,
         env=env,
-    )
+    )["id"]
+
+    opened = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
+    assert "checkpoint_id: (none)" in opened
+    assert "notes: (none)" in opened
+    assert "Associated Checkpoint" not in opened
 
-    created = _run_dock(
-        ["review", "add", "--reason", "all_flag_item", "--severity", "low"],
+
+def test_review_list_compacts_multiline_reason_text(
+    git_repo: Path,
+    tmp_path: Path,
+    seeded_dock_home: Path,
+) -> None:
+    """Review list should compact multiline reasons into one-line previews."""
+    env = _dock_env(seeded_dock_home)
+
+    _invoke_dock(
+        ["review", "add", "--reason", "line one\nline two", "--severity", "med"],
         cwd=git_repo,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
-
-    _run_dock(["review", "done", review_id], cwd=tmp_path, env=env)
-
-    open_only = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert "all_flag_item" not in open_only
 
-    with_all = _run_dock(["review", "--all"], cwd=tmp_path, env=env).stdout
-    assert "all_flag_item" in with_all
-    assert "done" in with_all
-    with_all_subcommand = _run_dock(["review", "list", "--all"], cwd=tmp_path, env=env).stdout
-    assert "all_flag_item" in with_all_subcommand
-    assert "done" in with_all_subcommand
+    listed = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert "line one line two" in listed
+    assert "line one\nline two" not in listed
 
 
-def test_review_listing_tie_breaks_by_recency_within_same_severity(
+def test_review_list_falls_back_for_blank_metadata_fields(
     git_repo: Path,
     tmp_path: Path,
+    seeded_dock_home: Path,
 ) -> None:
-    """Review listings should order same-severity items by newest timestamp."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    """Review list should show explicit fallbacks for blank row metadata."""
+    dock_home = seeded_dock_home
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Review recency tie-break baseline",
-            "--decisions",
-            "Ensure same-severity reviews sort by recency",
-            "--next-step",
-            "list review items",
-            "--risks",
-            "none",
-            "--command",
-            "echo review",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    review_id = _invoke_dock_json(
+        ["review", "add", "--reason", "normal reason", "--severity", "med", "--json"],
         cwd=git_repo,
         env=env,
+    )["id"]
+
+    db_path = dock_home / "db" / "index.sqlite"
+    _patch_review_row(
+        db_path,
+        review_id,
+        severity="   ",
+        status="   ",
+        repo_id="   ",
+        branch="   ",
+        reason="   ",
     )
 
-    created_older = _run_dock(
-        ["review", "add", "--reason", "recency_older", "--severity", "med"],
+    listed = _invoke_dock(["review", "--all"], cwd=tmp_path, env=env).stdout
+    assert "(unknown) | (unknown)" in listed
+    assert "(unknown)/(unknown)" in listed
+    assert "| (none)" in listed
+
+
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+def test_review_outputs_preserve_literal_markup_like_text(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Review list/open output should preserve literal bracketed text."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    _invoke_dock(
+        _save_args(
+            git_repo,
+            f"Review literal text baseline ({command_name})",
+            "Need context for manual review add",
+            "create review with bracketed fields",
+            command_name=command_name,
+        ),
         cwd=git_repo,
         env=env,
     )
-    older_match = re.search(r"rev_[a-f0-9]+", created_older.stdout)
-    assert older_match is not None
-    older_id = older_match.group(0)
-
-    created_newer = _run_dock(
-        ["review", "add", "--reason", "recency_newer", "--severity", "med"],
+    review_id = _invoke_dock_json(
+        [
+            "review",
+            "add",
+            "--reason",
+            "[red]urgent[/red]",
+            "--severity",
+            "low",
+            "--notes",
+            "[bold]needs eyes[/bold]",
+            "--file",
+            "[cyan]src/core.py[/cyan]",
+            "--json",
+        ],
         cwd=git_repo,
         env=env,
-    )
-    newer_match = re.search(r"rev_[a-f0-9]+", created_newer.stdout)
-    assert newer_match is not None
-    newer_id = newer_match.group(0)
-
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute("UPDATE review_items SET created_at = ? WHERE id = ?", ("2000-01-01T00:00:00+00:00", older_id))
-    conn.execute("UPDATE review_items SET created_at = ? WHERE id = ?", ("2005-01-01T00:00:00+00:00", newer_id))
-    conn.commit()
-    conn.close()
+    )["id"]
 
-    default_output = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    list_output = _run_dock(["review", "list"], cwd=tmp_path, env=env).stdout
+    listed = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert "[red]urgent[/red]" in listed
 
-    default_ids = re.findall(r"rev_[a-f0-9]+", default_output)
-    list_ids = re.findall(r"rev_[a-f0-9]+", list_output)
-    assert newer_id in default_ids and older_id in default_ids
-    assert newer_id in list_ids and older_id in list_ids
-    assert default_ids.index(newer_id) < default_ids.index(older_id)
-    assert list_ids.index(newer_id) < list_ids.index(older_id)
+    opened = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
+    _assert_panel_fields(
+        opened,
+        {
+            "reason": "[red]urgent[/red]",
+            "notes": "[bold]needs eyes[/bold]",
+            "files": "[cyan]src/core.py[/cyan]",
+        },
+    )
 
 
-def test_review_list_subcommand_matches_default_listing(git_repo: Path, tmp_path: Path) -> None:
-    """`review list` should mirror default `review` open-item listing."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+def test_review_open_compacts_multiline_metadata_fields(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Review open output should compact multiline metadata values."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Review list parity objective",
-            "--decisions",
-            "Validate review list subcommand parity",
-            "--next-step",
-            "compare review outputs",
-            "--risks",
-            "none",
-            "--command",
-            "echo review",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+    _invoke_dock(
+        _save_args(
+            git_repo,
+            f"Review open compaction baseline ({command_name})",
+            "Need review context",
+            "create multiline review metadata",
+            command_name=command_name,
+        ),
         cwd=git_repo,
         env=env,
     )
-    created = _run_dock(
-        ["review", "add", "--reason", "list_parity_item", "--severity", "med"],
+    review_id = _invoke_dock_json(
+        [
+            "review",
+            "add",
+            "--reason",
+            "reason line one\nline two",
+            "--severity",
+            "med",
+            "--notes",
+            "notes line one\nline two",
+            "--file",
+            "src/one.py\nsrc/two.py",
+            "--json",
+        ],
         cwd=git_repo,
         env=env,
+    )["id"]
+
+    opened = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
+    _assert_panel_fields(
+        opened,
+        {
+            "reason": "reason line one line two",
+            "notes": "notes line one line two",
+            "files": "src/one.py src/two.py",
+        },
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
 
-    default_listing = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    list_listing = _run_dock(["review", "list"], cwd=tmp_path, env=env).stdout
-    assert review_id in default_listing
-    assert review_id in list_listing
-    assert "list_parity_item" in default_listing
-    assert "list_parity_item" in list_listing
 
+def test_review_open_falls_back_for_blank_metadata_fields(tmp_path: Path) -> None:
+    """Review open should show explicit fallbacks for blank metadata."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-def test_review_list_all_subcommand_matches_default_all_listing(git_repo: Path, tmp_path: Path) -> None:
-    """`review list --all` should mirror default `review --all` ordering/content."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    review_id = add_review(
+        dock_home,
+        repo_id="repo_blank_metadata",
+        branch="main",
+        reason="normal reason",
+    ).id
 
-    _run_dock(
+    db_path = dock_home / "db" / "index.sqlite"
+    _patch_review_row(
+        db_path,
+        review_id,
+        repo_id="   ",
+        branch="   ",
+        created_at="   ",
+        severity="   ",
+        status="   ",
+        reason="   ",
+    )
+
+    opened = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
+    _assert_panel_fields(
+        opened,
+        {
+            "repo": "(unknown)",
+            "branch": "(unknown)",
+            "created_at": "(unknown)",
+            "checkpoint_id": "(none)",
+            "severity": "(unknown)",
+            "status": "(unknown)",
+            "reason": "(none)",
+            "notes": "(none)",
+            "files": "(none)",
+        },
+    )
+
+
+def test_review_open_handles_scalar_files_payload(tmp_path: Path) -> None:
+    """Review open should coerce scalar files payload in panel and JSON output."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    review_id = add_review(
+        dock_home,
+        repo_id="repo_scalar_files",
+        branch="main",
+        reason="files scalar",
+        severity="low",
+    ).id
+
+    db_path = dock_home / "db" / "index.sqlite"
+    _patch_review_row(db_path, review_id, files_json=json.dumps("src/scalar.py"))
+
+    opened = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
+    _assert_panel_fields(opened, {"files": "src/scalar.py"})
+
+    payload = _invoke_dock_json(["review", "open", review_id, "--json"], cwd=tmp_path, env=env)
+    assert payload["files"] == ["src/scalar.py"]
+
+
+def test_review_add_normalizes_file_entries(
+    git_repo: Path,
+    tmp_path: Path,
+    seeded_dock_home: Path,
+) -> None:
+    """Review add should drop blank and duplicate --file entries before persistence.
+
+    Normalization rules themselves are unit-tested via `_normalize_text_values`
+    in `test_cli_helpers.py`; this covers the `--file` option plumbing.
+    """
+    env = _dock_env(seeded_dock_home)
+
+    review_id = _invoke_dock_json(
+        [
+            "review",
+            "add",
+            "--reason",
+            "file normalization",
+            "--severity",
+            "low",
+            "--file",
+            "   ",
+            "--file",
+            " src/dup.py ",
+            "--file",
+            "src/dup.py",
+            "--file",
+            "src/real.py",
+            "--json",
+        ],
+        cwd=git_repo,
+        env=env,
+    )["id"]
+
+    opened = _invoke_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
+    _assert_panel_fields(opened, {"files": "src/dup.py, src/real.py"})
+
+
+def test_save_with_template_no_prompt(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """Template-based save should work in no-prompt mode."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / "save_template.json",
+        {
+            "objective": "Template checkpoint objective",
+            "decisions": "Template decisions block",
+            "next_steps": ["Template next step 1", "Template next step 2"],
+            "risks_review": "Template risk notes",
+            "resume_commands": ["echo template-cmd"],
+            "tags": ["template", "mvp"],
+            "links": ["https://example.com/template-doc"],
+            "verification": {
+                "tests_run": True,
+                "tests_command": "pytest -q",
+                "build_ok": True,
+                "build_command": "echo build",
+                "lint_ok": False,
+                "smoke_ok": False,
+            },
+        },
+    )
+
+    _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
+            "--template",
+            str(template_path),
             "--no-prompt",
-            "--objective",
-            "Review list --all parity objective",
-            "--decisions",
-            "Validate review --all and review list --all parity",
-            "--next-step",
-            "compare all-review outputs",
-            "--risks",
-            "none",
-            "--command",
-            "echo review",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
             "--no-auto-review",
         ],
         cwd=git_repo,
         env=env,
     )
 
-    created_open = _run_dock(
-        ["review", "add", "--reason", "all_parity_open", "--severity", "high"],
-        cwd=git_repo,
-        env=env,
-    )
-    open_match = re.search(r"rev_[a-f0-9]+", created_open.stdout)
-    assert open_match is not None
-    open_id = open_match.group(0)
-
-    created_done = _run_dock(
-        ["review", "add", "--reason", "all_parity_done", "--severity", "low"],
-        cwd=git_repo,
-        env=env,
-    )
-    done_match = re.search(r"rev_[a-f0-9]+", created_done.stdout)
-    assert done_match is not None
-    done_id = done_match.group(0)
+    resume_payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert resume_payload["objective"] == "Template checkpoint objective"
+    assert resume_payload["next_steps"] == ["Template next step 1", "Template next step 2"]
+    assert resume_payload["verification"]["tests_run"] is True
+    assert resume_payload["verification"]["build_ok"] is True
+    assert resume_payload["verification"]["lint_ok"] is False
 
-    _run_dock(["review", "done", done_id], cwd=tmp_path, env=env)
+    links_output = _invoke_dock(["links"], cwd=git_repo, env=env).stdout
+    assert "https://example.com/template-doc" in links_output
+    tagged_rows = _invoke_dock_json(["ls", "--tag", "template", "--json"], cwd=tmp_path, env=env)
+    assert len(tagged_rows) == 1
+    assert tagged_rows[0]["branch"] == git_template_branch
 
-    default_all = _run_dock(["review", "--all"], cwd=tmp_path, env=env).stdout
-    list_all = _run_dock(["review", "list", "--all"], cwd=tmp_path, env=env).stdout
 
-    assert open_id in default_all and done_id in default_all
-    assert open_id in list_all and done_id in list_all
-    assert "all_parity_open" in default_all and "all_parity_done" in default_all
-    assert "all_parity_open" in list_all and "all_parity_done" in list_all
-    assert re.findall(r"rev_[a-f0-9]+", default_all) == re.findall(r"rev_[a-f0-9]+", list_all)
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+def test_save_alias_template_no_prompt_outside_repo_succeeds(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+    command_name: str,
+) -> None:
+    """Template save aliases should succeed outside repo with explicit --root."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / f"{command_name}_outside_template.json",
+        {
+            "objective": f"{command_name} outside template objective",
+            "decisions": f"{command_name} outside template decisions",
+            "next_steps": [f"run {command_name} outside template resume"],
+            "risks_review": "none",
+            "resume_commands": [f"echo {command_name}-outside-template"],
+            "tags": [f"{command_name}-outside-template"],
+            "verification": {
+                "tests_run": True,
+                "tests_command": "pytest -q",
+                "build_ok": True,
+                "build_command": "echo build",
+                "lint_ok": False,
+                "smoke_ok": False,
+            },
+        },
+    )
 
+    saved = _invoke_dock(
+        [
+            command_name,
+            "--root",
+            str(git_repo),
+            "--template",
+            str(template_path),
+            "--no-prompt",
+            "--no-auto-review",
+        ],
+        cwd=tmp_path,
+        env=env,
+    )
+    assert "Saved checkpoint" in saved.stdout
 
-def test_review_done_unknown_id_is_actionable(tmp_path: Path) -> None:
-    """Unknown review id resolution should fail without traceback noise."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    resume_payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert resume_payload["objective"] == f"{command_name} outside template objective"
+    tagged_rows = _invoke_dock_json(
+        ["ls", "--tag", f"{command_name}-outside-template", "--json"],
+        cwd=tmp_path,
+        env=env,
+    )
+    assert len(tagged_rows) == 1
+    assert tagged_rows[0]["branch"] == git_template_branch
 
-    failed = _run_dock(["review", "done", "rev_missing"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Review item not found: rev_missing" in output
-    assert "Traceback" not in output
 
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+def test_save_alias_toml_template_no_prompt_outside_repo_succeeds(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+    command_name: str,
+) -> None:
+    """TOML template save aliases should succeed outside repo with --root."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-def test_review_done_accepts_trimmed_review_id(git_repo: Path, tmp_path: Path) -> None:
-    """Review done should accept review IDs with surrounding whitespace."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    template_path = tmp_path / f"{command_name}_outside_template.toml"
+    template_path.write_text(
+        textwrap.dedent(
+            f"""\
+            objective = "{command_name} outside TOML objective"
+            decisions = "{command_name} outside TOML decisions"
+            risks_review = "none"
+            next_steps = ["run {command_name} outside TOML resume"]
+            resume_commands = ["echo {command_name}-outside-toml"]
+            tags = ["{command_name}-outside-toml"]
+
+            [verification]
+            tests_run = true
+            tests_command = "pytest -q"
+            build_ok = true
+            build_command = "echo build"
+            lint_ok = false
+            smoke_ok = false
+            """
+        ),
+        encoding="utf-8",
+    )
 
-    _run_dock(
+    saved = _invoke_dock(
         [
-            "save",
+            command_name,
             "--root",
             str(git_repo),
+            "--template",
+            str(template_path),
             "--no-prompt",
-            "--objective",
-            "Review done trimmed id baseline",
-            "--decisions",
-            "Need review context",
-            "--next-step",
-            "resolve review by padded id",
-            "--risks",
-            "none",
-            "--command",
-            "echo review",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
             "--no-auto-review",
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
     )
-    created = _run_dock(
-        ["review", "add", "--reason", "trimmed_done", "--severity", "low"],
-        cwd=git_repo,
+    assert "Saved checkpoint" in saved.stdout
+
+    resume_payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert resume_payload["objective"] == f"{command_name} outside TOML objective"
+    tagged_rows = _invoke_dock_json(
+        ["ls", "--tag", f"{command_name}-outside-toml", "--json"],
+        cwd=tmp_path,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    assert len(tagged_rows) == 1
+    assert tagged_rows[0]["branch"] == git_template_branch
 
-    resolved = _run_dock(["review", "done", f"  {review_id}  "], cwd=tmp_path, env=env).stdout
-    assert f"Resolved review {review_id}" in resolved
 
+def test_save_with_toml_template_no_prompt(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """TOML template should be accepted by save --template."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-def test_review_open_accepts_trimmed_review_id(git_repo: Path, tmp_path: Path) -> None:
-    """Review open should accept review IDs with surrounding whitespace."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    template_path = tmp_path / "save_template.toml"
+    template_path.write_text(
+        textwrap.dedent(
+            """\
+            objective = "TOML objective"
+            decisions = "TOML decisions"
+            risks_review = "TOML risk"
+            next_steps = ["TOML next"]
+            resume_commands = ["echo toml"]
+            tags = ["toml"]
+
+            [verification]
+            tests_run = true
+            tests_command = "pytest -q"
+            build_ok = true
+            build_command = "echo build"
+            lint_ok = false
+            smoke_ok = false
+            """
+        ),
+        encoding="utf-8",
+    )
 
-    _run_dock(
+    _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
+            "--template",
+            str(template_path),
             "--no-prompt",
-            "--objective",
-            "Review open trimmed id baseline",
-            "--decisions",
-            "Need review context",
-            "--next-step",
-            "open review by padded id",
-            "--risks",
-            "none",
-            "--command",
-            "echo review",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
             "--no-auto-review",
         ],
         cwd=git_repo,
         env=env,
     )
-    created = _run_dock(
-        ["review", "add", "--reason", "trimmed_open", "--severity", "low"],
-        cwd=git_repo,
-        env=env,
-    )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
-
-    opened = _run_dock(["review", "open", f"  {review_id}  "], cwd=tmp_path, env=env).stdout
-    assert f"id: {review_id}" in opened
-
-
-def test_review_done_and_open_reject_blank_review_ids(tmp_path: Path) -> None:
-    """Review done/open should reject blank review IDs."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    done_failed = _run_dock(["review", "done", "   "], cwd=tmp_path, env=env, expect_code=2)
-    done_output = f"{done_failed.stdout}\n{done_failed.stderr}"
-    assert "Review ID must be a non-empty string." in done_output
-    assert "Traceback" not in done_output
 
-    open_failed = _run_dock(["review", "open", "   "], cwd=tmp_path, env=env, expect_code=2)
-    open_output = f"{open_failed.stdout}\n{open_failed.stderr}"
-    assert "Review ID must be a non-empty string." in open_output
-    assert "Traceback" not in open_output
+    resume_payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert resume_payload["objective"] == "TOML objective"
+    assert resume_payload["verification"]["tests_run"] is True
+    assert resume_payload["verification"]["build_ok"] is True
+    tagged_rows = _invoke_dock_json(["ls", "--tag", "toml", "--json"], cwd=tmp_path, env=env)
+    assert len(tagged_rows) == 1
+    assert tagged_rows[0]["branch"] == git_template_branch
 
 
-def test_review_all_with_no_items_is_informative(tmp_path: Path) -> None:
-    """Review --all should report no items when ledger is empty."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_save_template_path_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
+    """Save should resolve template path values after whitespace trimming."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    result = _run_dock(["review", "--all"], cwd=tmp_path, env=env)
-    assert "No review items." in result.stdout
+    template_path = _write_json_template(
+        tmp_path / "trimmed_template.json",
+        {
+            "objective": "Trimmed template objective",
+            "decisions": "Template path trimming behavior",
+            "next_steps": ["run resume"],
+            "risks_review": "none",
+            "resume_commands": ["echo trimmed-template"],
+        },
+    )
 
+    _invoke_dock(
+        [
+            "save",
+            "--root",
+            str(git_repo),
+            "--template",
+            f"  {template_path}  ",
+            "--no-prompt",
+            "--no-auto-review",
+        ],
+        cwd=git_repo,
+        env=env,
+    )
+    payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert payload["objective"] == "Trimmed template objective"
 
-def test_review_list_all_with_no_items_is_informative(tmp_path: Path) -> None:
-    """`review list --all` should render empty-ledger guidance."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
 
-    result = _run_dock(["review", "list", "--all"], cwd=tmp_path, env=env)
-    assert "No review items." in result.stdout
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+def test_save_alias_template_path_accepts_trimmed_value_outside_repo(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Save aliases should trim template path values outside repo contexts."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
+    template_path = _write_json_template(
+        tmp_path / f"{command_name}_outside_trimmed_template.json",
+        {
+            "objective": f"{command_name} outside trimmed template objective",
+            "decisions": "Template path trimming behavior outside repo",
+            "next_steps": ["run resume"],
+            "risks_review": "none",
+            "resume_commands": [f"echo {command_name}-outside-trimmed-template"],
+        },
+    )
 
-def test_review_list_with_no_items_is_informative(tmp_path: Path) -> None:
-    """`review list` should render empty-ledger guidance."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    saved = _invoke_dock(
+        [
+            command_name,
+            "--root",
+            str(git_repo),
+            "--template",
+            f"  {template_path}  ",
+            "--no-prompt",
+            "--no-auto-review",
+        ],
+        cwd=tmp_path,
+        env=env,
+    )
+    assert "Saved checkpoint" in saved.stdout
 
-    result = _run_dock(["review", "list"], cwd=tmp_path, env=env)
-    assert "No review items." in result.stdout
+    payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert payload["objective"] == f"{command_name} outside trimmed template objective"
 
 
-def test_review_add_validates_severity(git_repo: Path, tmp_path: Path) -> None:
-    """Review add should reject severities outside low/med/high."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_save_rejects_blank_template_path(git_repo: Path, tmp_path: Path) -> None:
+    """Save should reject blank template option values."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    _run_dock(
+    failed = _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
+            "--template",
+            "   ",
             "--no-prompt",
             "--objective",
-            "Severity validation baseline",
+            "fallback objective",
             "--decisions",
-            "Need repo context for review add",
+            "fallback decisions",
             "--next-step",
-            "Try invalid severity",
+            "fallback step",
             "--risks",
-            "None",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            "none",
         ],
         cwd=git_repo,
         env=env,
-    )
-
-    bad = _run_dock(
-        ["review", "add", "--reason", "invalid", "--severity", "critical"],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{bad.stdout}\n{bad.stderr}"
-    assert "Invalid severity" in output
-    assert "Traceback" not in output
-
-    blank = _run_dock(
-        ["review", "add", "--reason", "invalid", "--severity", "   "],
-        cwd=git_repo,
-        env=env,
         expect_code=2,
     )
-    blank_output = f"{blank.stdout}\n{blank.stderr}"
-    assert "Severity must be a non-empty string." in blank_output
-    assert "Traceback" not in blank_output
+    _assert_cli_error(failed, "--template must be a non-empty string.")
 
-    # Upper-case values should normalize successfully.
-    good = _run_dock(
-        ["review", "add", "--reason", "valid", "--severity", "HIGH"],
-        cwd=git_repo,
-        env=env,
-    )
-    assert "Created review" in good.stdout
 
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+@pytest.mark.parametrize(
+    ("template_value", "expected_fragment"),
+    [
+        ("   ", "--template must be a non-empty string."),
+        ("__MISSING_TEMPLATE__", "Template not found"),
+        ("__DIRECTORY_TEMPLATE__", "Failed to read template:"),
+    ],
+)
+def test_save_alias_template_path_validation_outside_repo_is_actionable(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+    template_value: str,
+    expected_fragment: str,
+) -> None:
+    """Template-path validation should stay actionable outside repo for aliases."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-def test_review_add_requires_non_empty_reason(git_repo: Path, tmp_path: Path) -> None:
-    """Review add should reject empty/whitespace reason strings."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    missing_template = tmp_path / f"{command_name}_outside_missing_template.json"
+    rendered_template = template_value
+    if template_value == "__MISSING_TEMPLATE__":
+        rendered_template = str(missing_template)
+    elif template_value == "__DIRECTORY_TEMPLATE__":
+        rendered_template = str(tmp_path)
 
-    _run_dock(
+    failed = _invoke_dock(
         [
-            "save",
+            command_name,
             "--root",
             str(git_repo),
+            "--template",
+            rendered_template,
             "--no-prompt",
             "--objective",
-            "Reason validation baseline",
+            f"{command_name} outside template path validation objective",
             "--decisions",
-            "Need repo context for review add",
+            "should fail before save",
             "--next-step",
-            "try empty reason",
+            "fix template path",
             "--risks",
-            "None",
+            "none",
             "--command",
             "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
         ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    bad = _run_dock(
-        ["review", "add", "--reason", "   ", "--severity", "low"],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
         expect_code=2,
     )
-    output = f"{bad.stdout}\n{bad.stderr}"
-    assert "--reason must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, expected_fragment)
 
 
-def test_review_add_trims_reason_whitespace(git_repo: Path, tmp_path: Path) -> None:
-    """Review reason should be trimmed before persistence."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_save_template_directory_path_is_actionable(
+    git_repo: Path,
+    tmp_path: Path,
+) -> None:
+    """Directory-valued template paths should fail with actionable error text."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    _run_dock(
+    failed = _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
+            "--template",
+            str(tmp_path),
             "--no-prompt",
             "--objective",
-            "Reason trimming baseline",
+            "fallback objective",
             "--decisions",
-            "Need context for manual review add",
+            "fallback decisions",
             "--next-step",
-            "create review with padded reason",
+            "fallback step",
             "--risks",
             "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
         ],
         cwd=git_repo,
         env=env,
+        expect_code=2,
     )
-    created = _run_dock(
-        ["review", "add", "--reason", "   padded_reason   ", "--severity", "low"],
-        cwd=git_repo,
-        env=env,
-    )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
-
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env)
-    assert "reason: padded_reason" in opened.stdout
+    _assert_cli_error(failed, "Failed to read template:")
 
 
-def test_review_add_trims_notes_and_checkpoint_id(git_repo: Path, tmp_path: Path) -> None:
-    """Review add should trim notes and checkpoint-id fields."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_save_template_non_utf8_file_is_actionable(
+    git_repo: Path,
+    tmp_path: Path,
+) -> None:
+    """Non-UTF8 template files should fail with actionable read error."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    _run_dock(
+    bad_template = tmp_path / "non_utf8_template.json"
+    _write_fixture_bytes(bad_template, b"\xff\xfe\x00")
+    failed = _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
+            "--template",
+            str(bad_template),
             "--no-prompt",
             "--objective",
-            "Review optional field trimming baseline",
+            "fallback objective",
             "--decisions",
-            "Ensure notes and checkpoint-id are normalized",
+            "fallback decisions",
             "--next-step",
-            "open review details",
+            "fallback step",
             "--risks",
             "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
         ],
         cwd=git_repo,
         env=env,
+        expect_code=2,
+    )
+    _assert_cli_error(failed, "Failed to read template:")
+
+
+def test_template_bool_like_strings_are_coerced(git_repo: Path, tmp_path: Path) -> None:
+    """Template bool-like strings should coerce to verification booleans."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / "bool_like_template.json",
+        {
+            "objective": "Bool-like objective",
+            "decisions": "Use string booleans in template",
+            "next_steps": ["Run resume json"],
+            "risks_review": "none",
+            "verification": {
+                "tests_run": "yes",
+                "build_ok": "1",
+                "lint_ok": "no",
+                "smoke_ok": "false",
+            },
+        },
     )
-    created = _run_dock(
+
+    _invoke_dock(
         [
-            "review",
-            "add",
-            "--reason",
-            "trim optional fields",
-            "--severity",
-            "low",
-            "--checkpoint-id",
-            "  cp_trim_test  ",
-            "--notes",
-            "  keep this note  ",
+            "save",
+            "--root",
+            str(git_repo),
+            "--template",
+            str(template_path),
+            "--no-prompt",
+            "--no-auto-review",
         ],
         cwd=git_repo,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert payload["verification"]["tests_run"] is True
+    assert payload["verification"]["build_ok"] is True
+    assert payload["verification"]["lint_ok"] is False
+    assert payload["verification"]["smoke_ok"] is False
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
-    assert "checkpoint_id: cp_trim_test" in opened
-    assert "notes: keep this note" in opened
-    assert "checkpoint_id:   cp_trim_test" not in opened
-    assert "notes:   keep this note" not in opened
 
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+def test_save_alias_template_bool_like_strings_are_coerced_outside_repo(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Bool-like template verification values should coerce outside repo for aliases."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / f"{command_name}_outside_bool_like_template.json",
+        {
+            "objective": f"{command_name} outside bool-like objective",
+            "decisions": "Use string booleans in outside-repo alias template",
+            "next_steps": ["Run resume json"],
+            "risks_review": "none",
+            "verification": {
+                "tests_run": "yes",
+                "build_ok": "1",
+                "lint_ok": "no",
+                "smoke_ok": "false",
+            },
+        },
+    )
 
-def test_review_add_blank_checkpoint_id_is_treated_as_missing(
+    _invoke_dock(
+        [
+            command_name,
+            "--root",
+            str(git_repo),
+            "--template",
+            str(template_path),
+            "--no-prompt",
+            "--no-auto-review",
+        ],
+        cwd=tmp_path,
+        env=env,
+    )
+    payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    assert payload["verification"]["tests_run"] is True
+    assert payload["verification"]["build_ok"] is True
+    assert payload["verification"]["lint_ok"] is False
+    assert payload["verification"]["smoke_ok"] is False
+
+
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
+def test_template_verification_text_fields_are_normalized(
     git_repo: Path,
     tmp_path: Path,
+    command_name: str,
+    run_cwd_kind: str,
 ) -> None:
-    """Blank checkpoint-id input should not trigger missing-checkpoint panel."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Template verification text fields should trim values and drop blanks."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    template_path = _write_json_template(
+        tmp_path / "verification_text_normalization_template.json",
+        {
+            "objective": "Template verification text normalization objective",
+            "decisions": "Trim verification command and note text from template values",
+            "next_steps": ["Inspect resume json"],
+            "risks_review": "none",
+            "verification": {
+                "tests_run": "yes",
+                "tests_command": "   ",
+                "build_ok": "1",
+                "build_command": "  make build  ",
+                "lint_ok": "true",
+                "lint_command": "  ruff check  ",
+                "smoke_ok": "y",
+                "smoke_notes": "  smoke passed  ",
+            },
+        },
+    )
 
-    _run_dock(
+    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
+    _invoke_dock(
+        [
+            command_name,
+            "--root",
+            str(git_repo),
+            "--template",
+            str(template_path),
+            "--no-prompt",
+            "--no-auto-review",
+        ],
+        cwd=run_cwd,
+        env=env,
+    )
+
+    payload = _invoke_dock_json(["resume", "--json"], cwd=git_repo, env=env)
+    verification = payload["verification"]
+    assert verification["tests_run"] is True
+    assert verification["build_ok"] is True
+    assert verification["lint_ok"] is True
+    assert verification["smoke_ok"] is True
+    assert verification["tests_command"] is None
+    assert verification["build_command"] == "make build"
+    assert verification["lint_command"] == "ruff check"
+    assert verification["smoke_notes"] == "smoke passed"
+
+
+def test_template_bool_like_invalid_string_is_rejected(
+    git_repo: Path,
+    tmp_path: Path,
+) -> None:
+    """Unknown bool-like strings in template verification should fail."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    bad_template = _write_json_template(
+        tmp_path / "bad_bool_like.json",
+        {
+            "objective": "Invalid bool-like",
+            "decisions": "bad tests_run value",
+            "next_steps": ["step"],
+            "risks_review": "none",
+            "verification": {"tests_run": "maybe"},
+        },
+    )
+    failed = _invoke_dock(
         [
             "save",
             "--root",
             str(git_repo),
+            "--template",
+            str(bad_template),
             "--no-prompt",
             "--objective",
-            "Blank checkpoint id baseline",
+            "override",
             "--decisions",
-            "Ensure blank checkpoint id normalizes to None",
+            "override",
             "--next-step",
-            "open review",
+            "override",
             "--risks",
             "none",
             "--command",
             "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    created = _run_dock(
-        [
-            "review",
-            "add",
-            "--reason",
-            "blank checkpoint id",
-            "--severity",
-            "low",
-            "--checkpoint-id",
-            "   ",
-            "--notes",
-            "   ",
         ],
         cwd=git_repo,
         env=env,
+        expect_code=2,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
-
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
-    assert "checkpoint_id: (none)" in opened
-    assert "notes: (none)" in opened
-    assert "Associated Checkpoint" not in opened
+    _assert_cli_error(failed, "Template field 'tests_run' must be bool or bool-like string")
 
 
-def test_review_list_compacts_multiline_reason_text(git_repo: Path, tmp_path: Path) -> None:
-    """Review list should compact multiline reasons into one-line previews."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+def test_save_alias_template_bool_like_invalid_string_is_rejected_outside_repo(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Unknown bool-like template values should fail cleanly outside repo for aliases."""
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    _run_dock(
+    bad_template = _write_json_template(
+        tmp_path / f"{command_name}_outside_bad_bool_like.json",
+        {
+            "objective": f"{command_name} outside invalid bool-like",
+            "decisions": "bad tests_run value outside repo",
+            "next_steps": ["step"],
+            "risks_review": "none",
+            "verification": {"tests_run": "maybe"},
+        },
+    )
+    failed = _invoke_dock(
         [
-            "save",
+            command_name,
             "--root",
             str(git_repo),
+            "--template",
+            str(bad_template),
             "--no-prompt",
             "--objective",
-            "Review list multiline reason baseline",
+            "override",
             "--decisions",
-            "Need review context",
+            "override",
             "--next-step",
-            "add multiline reason review",
+            "override",
             "--risks",
             "none",
             "--command",
             "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
+        expect_code=2,
     )
-    _run_dock(
-        ["review", "add", "--reason", "line one\nline two", "--severity", "med"],
-        cwd=git_repo,
+    _assert_cli_error(failed, "Template field 'tests_run' must be bool or bool-like string")
+
+
+@pytest.mark.parametrize(
+    ("config_text", "expected_fragment"),
+    [
+        ("[review_heuristics\nfiles_changed_threshold = 4", "Invalid config TOML"),
+        ('review_heuristics = "bad-type"\n', "Config section review_heuristics must be a table."),
+        ('[review_heuristics]\nrisky_path_patterns = ["(^|/)[bad"]\n', "Invalid regex"),
+        ("[review_heuristics]\nchurn_threshold = -1\n", "Config field review_heuristics.churn_threshold must be >= 0."),
+    ],
+    ids=["malformed_toml", "section_type", "invalid_regex", "negative_threshold"],
+)
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
+def test_save_invalid_config_is_actionable(
+    git_repo: Path,
+    tmp_path: Path,
+    config_text: str,
+    expected_fragment: str,
+    run_cwd_kind: RunCwdKind,
+) -> None:
+    """Save should surface actionable config validation errors without tracebacks."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, config_text)
+
+    result = _invoke_dock(
+        _save_args(git_repo, "Invalid config case", "should fail before save", "fix config"),
+        cwd=_resolve_run_cwd(git_repo, tmp_path, run_cwd_kind),
         env=env,
+        expect_code=2,
     )
-
-    listed = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert "line one line two" in listed
-    assert "line one\nline two" not in listed
+    _assert_cli_error(result, expected_fragment)
 
 
-def test_review_list_falls_back_for_blank_metadata_fields(git_repo: Path, tmp_path: Path) -> None:
-    """Review list should show explicit fallbacks for blank row metadata."""
-    env = dict(os.environ)
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
+def test_unknown_config_sections_do_not_block_save(
+    git_repo: Path,
+    tmp_path: Path,
+    run_cwd_kind: RunCwdKind,
+) -> None:
+    """Unknown config sections should be ignored in save flow."""
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, UNKNOWN_SECTION_CONFIG_TOML)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Review fallback baseline",
-            "--decisions",
-            "Corrupt review row text fields",
-            "--next-step",
-            "run review list",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+    result = _invoke_dock(
+        _save_args(
+            git_repo,
+            "Unknown section config",
+            "save should succeed",
+            "run resume",
+        ),
+        cwd=_resolve_run_cwd(git_repo, tmp_path, run_cwd_kind),
         env=env,
     )
-    created = _run_dock(
-        ["review", "add", "--reason", "normal reason", "--severity", "med"],
+    assert "Saved checkpoint" in result.stdout
+
+
+def test_empty_review_heuristics_section_uses_default_save_behavior(
+    git_repo: Path,
+    tmp_path: Path,
+) -> None:
+    """Empty review_heuristics section should preserve default trigger behavior."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, "[review_heuristics]\n")
+
+    _write_text_creating_parents(git_repo / "security" / "guard.py", "print('guard')\n")
+
+    save_result = _invoke_dock(
+        _save_args(
+            git_repo,
+            "Empty review section defaults",
+            "Default risky-path trigger should still apply",
+            "Confirm auto review is still generated",
+            auto_review=True,
+        ),
         cwd=git_repo,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    assert "Created review item" in save_result.stdout
+    assert "Review triggers:" in save_result.stdout
+    _assert_no_traceback(save_result)
 
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        (
-            "UPDATE review_items "
-            "SET severity = ?, status = ?, repo_id = ?, branch = ?, reason = ? "
-            "WHERE id = ?"
+    review_list = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert "No review items." not in review_list
+
+
+def test_empty_review_heuristics_section_uses_default_save_behavior_outside_repo(
+    git_repo: Path,
+    tmp_path: Path,
+) -> None:
+    """Outside-repo save should preserve defaults with empty review_heuristics."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, "[review_heuristics]\n")
+
+    _write_text_creating_parents(git_repo / "security" / "guard.py", "print('guard')\n")
+
+    save_result = _invoke_dock(
+        _save_args(
+            git_repo,
+            "outside empty review section defaults",
+            "Default risky-path trigger should still apply",
+            "Confirm auto review is still generated",
+            auto_review=True,
         ),
-        ("   ", "   ", "   ", "   ", "   ", review_id),
+        cwd=tmp_path,
+        env=env,
     )
-    conn.commit()
-    conn.close()
+    assert "Created review item" in save_result.stdout
+    assert "Review triggers:" in save_result.stdout
+    _assert_no_traceback(save_result)
 
-    listed = _run_dock(["review", "--all"], cwd=tmp_path, env=env).stdout
-    assert "(unknown) | (unknown)" in listed
-    assert "(unknown)/(unknown)" in listed
-    assert "| (none)" in listed
+    review_list = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert "No review items." not in review_list
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_review_outputs_preserve_literal_markup_like_text(
+@pytest.mark.parametrize("command_name", ["s", "dock"])
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
+def test_save_alias_empty_review_heuristics_section_uses_default_behavior(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    run_cwd_kind: str,
 ) -> None:
-    """Review list/open output should preserve literal bracketed text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Save aliases should preserve defaults with empty review_heuristics."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, "[review_heuristics]\n")
 
-    _run_dock(
+    _write_text_creating_parents(git_repo / "security" / "guard.py", "print('guard')\n")
+
+    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
+    save_result = _invoke_dock(
+        _save_args(
+            git_repo,
+            f"{command_name} empty review section defaults",
+            "Default risky-path trigger should still apply",
+            "Confirm auto review is still generated",
+            command_name=command_name,
+            auto_review=True,
+        ),
+        cwd=run_cwd,
+        env=env,
+    )
+    assert "Created review item" in save_result.stdout
+    assert "Review triggers:" in save_result.stdout
+    _assert_no_traceback(save_result)
+
+    review_list = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert "No review items." not in review_list
+
+
+@pytest.mark.parametrize(
+    ("template_name", "template_bytes", "expected_fragment"),
+    [pytest.param(*case[1:], id=case[0]) for case in TEMPLATE_FILE_ERROR_CASES],
+)
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
+def test_template_file_errors_are_actionable(
+    git_repo: Path,
+    tmp_path: Path,
+    empty_dock_home: Path,
+    template_name: str,
+    template_bytes: bytes | None,
+    expected_fragment: str,
+    run_cwd_kind: RunCwdKind,
+) -> None:
+    """Unreadable, unparsable, or non-object template files should fail cleanly."""
+    template_path = tmp_path / template_name
+    if template_bytes is not None:
+        _write_fixture_bytes(template_path, template_bytes)
+
+    failed = _invoke_dock(
         [
-            command_name,
+            *_save_args(git_repo, "Template file error", "should fail before save", "fix template"),
+            "--template",
+            str(template_path),
+        ],
+        cwd=_resolve_run_cwd(git_repo, tmp_path, run_cwd_kind),
+        env=_dock_env(empty_dock_home),
+        expect_code=2,
+    )
+    _assert_cli_error(failed, expected_fragment)
+
+
+def test_save_template_error_precedes_store_and_git_checks(tmp_path: Path) -> None:
+    """Template errors should surface before Dockyard opens its store or inspects git."""
+    dock_home = tmp_path / ".dockyard_data"
+    failed = _invoke_dock(
+        [
+            *_save_args(tmp_path, "Template first", "should fail before git", "fix template"),
+            "--template",
+            str(tmp_path / "not-there.json"),
+        ],
+        cwd=tmp_path,
+        env=_dock_env(dock_home),
+        expect_code=2,
+    )
+    _assert_cli_error(failed, "Template not found")
+    assert "Not in a git repo" not in failed.stdout
+    assert not dock_home.exists()
+
+
+def test_template_type_validation_for_list_fields(
+    git_repo: Path,
+    tmp_path: Path,
+    empty_dock_home: Path,
+) -> None:
+    """Template schema errors should surface through `dock save` cleanly.
+
+    Per-field schema cases are covered in-process by
+    `test_validate_template_data_rejects_invalid_field_types`.
+    """
+    env = _dock_env(empty_dock_home)
+
+    bad_template = _write_json_template(
+        tmp_path / "bad_types.json",
+        {
+            "objective": "bad list shape",
+            "decisions": "invalid next_steps type",
+            "next_steps": "not-a-list",
+        },
+    )
+    result = _invoke_dock(
+        [
+            "save",
             "--root",
             str(git_repo),
+            "--template",
+            str(bad_template),
             "--no-prompt",
             "--objective",
-            f"Review literal text baseline ({command_name})",
+            "override",
             "--decisions",
-            "Need context for manual review add",
+            "override",
             "--next-step",
-            "create review with bracketed fields",
+            "override",
             "--risks",
             "none",
             "--command",
             "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
         ],
         cwd=git_repo,
         env=env,
+        expect_code=2,
     )
-    created = _run_dock(
+    _assert_cli_error(result, "Template field 'next_steps' must be an array of strings")
+
+
+def test_no_prompt_requires_risks_field(git_repo: Path, empty_dock_home: Path) -> None:
+    """No-prompt save should require non-empty risks/review notes."""
+    env = _dock_env(empty_dock_home)
+
+    result = _invoke_dock(
         [
-            "review",
-            "add",
-            "--reason",
-            "[red]urgent[/red]",
-            "--severity",
-            "low",
-            "--notes",
-            "[bold]needs eyes[/bold]",
-            "--file",
-            "[cyan]src/core.py[/cyan]",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
-
-    listed = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert "[red]urgent[/red]" in listed
-
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
-    assert "reason: [red]urgent[/red]" in opened
-    assert "notes: [bold]needs eyes[/bold]" in opened
-    assert "files: [cyan]src/core.py[/cyan]" in opened
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_review_open_compacts_multiline_metadata_fields(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Review open output should compact multiline metadata values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            command_name,
+            "save",
             "--root",
             str(git_repo),
             "--no-prompt",
             "--objective",
-            f"Review open compaction baseline ({command_name})",
+            "Missing risks field",
             "--decisions",
-            "Need review context",
+            "Should fail without risks",
             "--next-step",
-            "create multiline review metadata",
-            "--risks",
-            "none",
+            "add risks",
             "--command",
             "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
         ],
         cwd=git_repo,
         env=env,
+        expect_code=2,
     )
-    created = _run_dock(
-        [
-            "review",
-            "add",
-            "--reason",
-            "reason line one\nline two",
-            "--severity",
-            "med",
-            "--notes",
-            "notes line one\nline two",
-            "--file",
-            "src/one.py\nsrc/two.py",
-        ],
+    _assert_cli_error(result, "Risks / Review Needed is required.")
+
+
+def test_configured_heuristics_can_disable_default_review_trigger(
+    git_repo: Path,
+    tmp_path: Path,
+) -> None:
+    """Configured heuristics should influence auto-review creation behavior."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, HEURISTICS_SKIP_SECURITY_CONFIG_TOML)
+
+    _write_text_creating_parents(git_repo / "security" / "guard.py", "print('guard')\n")
+
+    save_result = _invoke_dock(
+        _save_args(
+            git_repo,
+            "Configurable review trigger behavior",
+            "Custom heuristic should skip default security trigger",
+            "Confirm no auto review generated",
+            auto_review=True,
+        ),
         cwd=git_repo,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    assert "Created review item" not in save_result.stdout
+    assert "Review triggers:" not in save_result.stdout
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
-    assert "reason: reason line one line two" in opened
-    assert "notes: notes line one line two" in opened
-    assert "files: src/one.py src/two.py" in opened
+    review_list = _invoke_dock(["review"], cwd=tmp_path, env=env)
+    assert "No review items." in review_list.stdout
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_review_open_falls_back_for_blank_metadata_fields(
+def test_configured_heuristics_can_force_review_trigger(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
 ) -> None:
-    """Review open should show explicit fallbacks for blank metadata."""
-    env = dict(os.environ)
+    """Configured thresholds should be able to force review creation."""
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, HEURISTICS_FORCE_REVIEW_CONFIG_TOML)
 
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Review open fallback baseline ({command_name})",
-            "--decisions",
-            "Mutate review row metadata to blanks",
-            "--next-step",
-            "run review open",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    created = _run_dock(
-        ["review", "add", "--reason", "normal reason", "--severity", "med"],
+    save_result = _invoke_dock(
+        _save_args(
+            git_repo,
+            "Configurable force review trigger behavior",
+            "Threshold override should force review creation",
+            "Confirm auto review generated",
+            auto_review=True,
+        ),
         cwd=git_repo,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    _assert_output_contains(save_result, "Created review item", "Review triggers:", "many_files_changed")
 
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        (
-            "UPDATE review_items "
-            "SET repo_id = ?, branch = ?, created_at = ?, severity = ?, status = ?, reason = ? "
-            "WHERE id = ?"
+    review_list = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert "No review items." not in review_list
+
+
+@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
+def test_save_alias_configured_heuristics_can_disable_default_review_trigger(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+    run_cwd_kind: str,
+) -> None:
+    """Configured heuristics should disable default review trigger across save aliases."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, HEURISTICS_SKIP_SECURITY_CONFIG_TOML)
+
+    _write_text_creating_parents(git_repo / "security" / "guard.py", "print('guard')\n")
+
+    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
+    save_result = _invoke_dock(
+        _save_args(
+            git_repo,
+            f"{command_name} configurable review trigger behavior",
+            "Custom heuristic should skip default security trigger",
+            "Confirm no auto review generated",
+            command_name=command_name,
+            auto_review=True,
         ),
-        ("   ", "   ", "   ", "   ", "   ", "   ", review_id),
+        cwd=run_cwd,
+        env=env,
     )
-    conn.commit()
-    conn.close()
+    assert "Created review item" not in save_result.stdout
+    assert "Review triggers:" not in save_result.stdout
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
-    assert "repo: (unknown)" in opened
-    assert "branch: (unknown)" in opened
-    assert "created_at: (unknown)" in opened
-    assert "checkpoint_id: (none)" in opened
-    assert "severity: (unknown)" in opened
-    assert "status: (unknown)" in opened
-    assert "reason: (none)" in opened
-    assert "notes: (none)" in opened
-    assert "files: (none)" in opened
+    review_list = _invoke_dock(["review"], cwd=tmp_path, env=env)
+    assert "No review items." in review_list.stdout
 
 
 @pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_review_open_handles_scalar_files_payload(
+@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
+def test_save_alias_configured_heuristics_can_force_review_trigger(
     git_repo: Path,
     tmp_path: Path,
     command_name: str,
+    run_cwd_kind: str,
 ) -> None:
-    """Review open should coerce scalar files payload to a single file string."""
-    env = dict(os.environ)
+    """Configured heuristics should force review trigger across save aliases."""
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
+    _write_dock_config(dock_home, HEURISTICS_FORCE_REVIEW_CONFIG_TOML)
 
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Scalar files payload baseline ({command_name})",
-            "--decisions",
-            "Mutate review files to scalar string",
-            "--next-step",
-            "run review open",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    created = _run_dock(
-        ["review", "add", "--reason", "files scalar", "--severity", "low"],
-        cwd=git_repo,
+    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
+    save_result = _invoke_dock(
+        _save_args(
+            git_repo,
+            f"{command_name} configurable force review trigger behavior",
+            "Threshold override should force review creation",
+            "Confirm auto review generated",
+            command_name=command_name,
+            auto_review=True,
+        ),
+        cwd=run_cwd,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    _assert_output_contains(save_result, "Created review item", "Review triggers:", "many_files_changed")
 
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE review_items SET files_json = ? WHERE id = ?",
-        (json.dumps("src/scalar.py"), review_id),
-    )
-    conn.commit()
-    conn.close()
+    review_list = _invoke_dock(["review"], cwd=tmp_path, env=env).stdout
+    assert "No review items." not in review_list
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
-    assert "files: src/scalar.py" in opened
 
+def test_cli_ls_and_search_filters(git_repo: Path, tmp_path: Path) -> None:
+    """CLI filters for harbor and search should narrow results correctly."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Filter target objective main",
+        decisions="main branch checkpoint",
+        next_steps=["run filters"],
+        resume_commands=["echo main"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    _checkout_new_branch(git_repo, "feature/filters")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Filter target objective feature",
+        decisions="feature branch checkpoint",
+        next_steps=["run feature filters"],
+        resume_commands=["echo feature"],
+        tags=["beta"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    tagged_alpha = _invoke_dock_json(["ls", "--tag", "alpha", "--json"], cwd=tmp_path, env=env)
+    assert len(tagged_alpha) == 1
+    assert tagged_alpha[0]["branch"] in {"main", "master"}
 
-def test_review_add_ignores_blank_file_entries(git_repo: Path, tmp_path: Path) -> None:
-    """Review add should drop blank file entries before persistence."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    tagged_beta = _invoke_dock_json(["ls", "--tag", "beta", "--json"], cwd=tmp_path, env=env)
+    assert len(tagged_beta) == 1
+    assert tagged_beta[0]["branch"] == "feature/filters"
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Review file normalization baseline",
-            "--decisions",
-            "Ensure blank --file values are ignored",
-            "--next-step",
-            "open created review",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    created = _run_dock(
+    db_path = dock_home / "db" / "index.sqlite"
+    _mutate_dock_db(
+        db_path,
         [
-            "review",
-            "add",
-            "--reason",
-            "file normalization",
-            "--severity",
-            "low",
-            "--file",
-            "   ",
-            "--file",
-            "src/real.py",
+            (
+                "UPDATE slips SET updated_at = ? WHERE branch = ?",
+                ("2000-01-01T00:00:00+00:00", "feature/filters"),
+            ),
         ],
-        cwd=git_repo,
-        env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
-    assert "files: src/real.py" in opened
-    assert "files: (none)" not in opened
+    stale_rows = _invoke_dock_json(["ls", "--stale", "1", "--json"], cwd=tmp_path, env=env)
+    assert len(stale_rows) == 1
+    assert stale_rows[0]["branch"] == "feature/filters"
 
+    search_branch = _invoke_dock(
+        ["search", "Filter target objective", "--branch", "feature/filters"],
+        cwd=tmp_path,
+        env=env,
+    )
+    assert "feature/filters" in search_branch.stdout
 
-def test_review_add_deduplicates_file_entries(git_repo: Path, tmp_path: Path) -> None:
-    """Review add should de-duplicate repeated file entries."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    search_repo_json = _invoke_dock_json(
+        ["search", "Filter target objective", "--repo", git_repo.name, "--json"],
+        cwd=tmp_path,
+        env=env,
+    )
+    assert len(search_repo_json) >= 1
+    assert {row["berth_name"] for row in search_repo_json} == {git_repo.name}
+    assert "feature/filters" in {row["branch"] for row in search_repo_json}
+    assert "berth_name" in search_repo_json[0]
+    assert {"id", "repo_id", "berth_name", "branch", "created_at", "snippet", "objective"} <= set(
+        search_repo_json[0].keys()
+    )
+    assert search_repo_json[0]["snippet"]
+    assert _invoke_dock_json(
+        ["search", "no-such-query", "--repo", git_repo.name, "--json"],
+        cwd=tmp_path,
+        env=env,
+    ) == []
 
-    _run_dock(
+    tag_filtered_json = _invoke_dock_json(
         [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Review file dedupe baseline",
-            "--decisions",
-            "Ensure repeated --file values are de-duplicated",
-            "--next-step",
-            "open created review",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            "search",
+            "Filter target objective",
+            "--tag",
+            "beta",
+            "--branch",
+            "feature/filters",
+            "--json",
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
     )
-    created = _run_dock(
+    assert len(tag_filtered_json) == 1
+    assert tag_filtered_json[0]["branch"] == "feature/filters"
+    tag_repo_branch_json = _invoke_dock_json(
         [
-            "review",
-            "add",
-            "--reason",
-            "file dedupe",
-            "--severity",
-            "low",
-            "--file",
-            " src/dup.py ",
-            "--file",
-            "src/dup.py",
-            "--file",
-            "src/other.py",
-            "--file",
-            "src/dup.py",
+            "search",
+            "Filter target objective",
+            "--tag",
+            "beta",
+            "--repo",
+            git_repo.name,
+            "--branch",
+            "feature/filters",
+            "--json",
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created.stdout)
-    assert review_match is not None
-    review_id = review_match.group(0)
+    assert len(tag_repo_branch_json) == 1
+    assert tag_repo_branch_json[0]["branch"] == "feature/filters"
 
-    opened = _run_dock(["review", "open", review_id], cwd=tmp_path, env=env).stdout
-    assert "files: src/dup.py, src/other.py" in opened
-    assert "src/dup.py, src/dup.py" not in opened
+
+def test_ls_json_ordering_prioritizes_open_review_count(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """Harbor ordering should place slips with more open reviews first."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    checkpoint = save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Main ordering baseline",
+        decisions="main branch context",
+        next_steps=["add review debt"],
+    )
+    add_review(
+        dock_home,
+        repo_id=checkpoint.repo_id,
+        branch=checkpoint.branch,
+        reason="ordering_high",
+        severity="high",
+    )
+
+    _checkout_new_branch(git_repo, "feature/no-review")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Feature ordering baseline",
+        decisions="feature branch context",
+        next_steps=["no review debt"],
+    )
+    _switch_branch(git_repo, base_branch)
+
+    rows = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
+    assert len(rows) >= 2
+    assert rows[0]["open_review_count"] >= rows[1]["open_review_count"]
+    assert rows[0]["branch"] == base_branch
 
 
-def test_save_with_template_no_prompt(git_repo: Path, tmp_path: Path) -> None:
-    """Template-based save should work in no-prompt mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_ls_json_ordering_uses_status_then_staleness_on_review_ties(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """Harbor ordering should use status then staleness when reviews tie."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
 
-    template_path = tmp_path / "save_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Template checkpoint objective",
-                "decisions": "Template decisions block",
-                "next_steps": ["Template next step 1", "Template next step 2"],
-                "risks_review": "Template risk notes",
-                "resume_commands": ["echo template-cmd"],
-                "tags": ["template", "mvp"],
-                "links": ["https://example.com/template-doc"],
-                "verification": {
-                    "tests_run": True,
-                    "tests_command": "pytest -q",
-                    "build_ok": True,
-                    "build_command": "echo build",
-                    "lint_ok": False,
-                    "smoke_ok": False,
-                },
-            }
-        ),
-        encoding="utf-8",
-    )
+    branch_names = [
+        "feature/order-red-old",
+        "feature/order-red-new",
+        "feature/order-yellow",
+        "feature/order-green",
+    ]
+    for branch in branch_names:
+        _checkout_new_branch(git_repo, branch)
+        save_checkpoint(
+            dock_home,
+            git_repo,
+            objective=f"Ordering checkpoint for {branch}",
+            decisions="ordering context",
+            next_steps=["inspect ordering"],
+        )
+        _switch_branch(git_repo, base_branch)
 
-    _run_dock(
+    slip_updates = [
+        ("red", "2000-01-01T00:00:00+00:00", "feature/order-red-old"),
+        ("red", "2005-01-01T00:00:00+00:00", "feature/order-red-new"),
+        ("yellow", "1990-01-01T00:00:00+00:00", "feature/order-yellow"),
+        ("green", "1980-01-01T00:00:00+00:00", "feature/order-green"),
+    ]
+    _mutate_dock_db(
+        dock_home / "db" / "index.sqlite",
         [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(template_path),
-            "--no-prompt",
-            "--no-auto-review",
+            ("UPDATE slips SET status = ?, updated_at = ? WHERE branch = ?", params)
+            for params in slip_updates
         ],
-        cwd=git_repo,
-        env=env,
     )
 
-    resume_payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert resume_payload["objective"] == "Template checkpoint objective"
-    assert resume_payload["next_steps"] == ["Template next step 1", "Template next step 2"]
-    assert resume_payload["verification"]["tests_run"] is True
-    assert resume_payload["verification"]["build_ok"] is True
-    assert resume_payload["verification"]["lint_ok"] is False
-
-    links_output = _run_dock(["links"], cwd=git_repo, env=env).stdout
-    assert "https://example.com/template-doc" in links_output
-    tagged_rows = json.loads(_run_dock(["ls", "--tag", "template", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(tagged_rows) == 1
-    assert tagged_rows[0]["branch"] == _git_current_branch(git_repo)
+    ordered_rows = _invoke_dock_json(["ls", "--json"], cwd=tmp_path, env=env)
+    ordered_branches = [row["branch"] for row in ordered_rows]
+    assert ordered_branches[:4] == [
+        "feature/order-red-old",
+        "feature/order-red-new",
+        "feature/order-yellow",
+        "feature/order-green",
+    ]
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_no_prompt_outside_repo_succeeds(
+def test_ls_limit_flag_restricts_result_count(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
+    git_template_branch: str,
 ) -> None:
-    """Template save aliases should succeed outside repo with explicit --root."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """CLI `ls --limit` should cap number of returned rows."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
 
-    template_path = tmp_path / f"{command_name}_outside_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": f"{command_name} outside template objective",
-                "decisions": f"{command_name} outside template decisions",
-                "next_steps": [f"run {command_name} outside template resume"],
-                "risks_review": "none",
-                "resume_commands": [f"echo {command_name}-outside-template"],
-                "tags": [f"{command_name}-outside-template"],
-                "verification": {
-                    "tests_run": True,
-                    "tests_command": "pytest -q",
-                    "build_ok": True,
-                    "build_command": "echo build",
-                    "lint_ok": False,
-                    "smoke_ok": False,
-                },
-            }
-        ),
-        encoding="utf-8",
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Limit baseline one",
+        decisions="main branch checkpoint",
+        next_steps=["create second branch checkpoint"],
     )
 
-    saved = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(template_path),
-            "--no-prompt",
-            "--no-auto-review",
-        ],
-        cwd=tmp_path,
-        env=env,
+    _checkout_new_branch(git_repo, "feature/limit-check")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Limit baseline two",
+        decisions="feature branch checkpoint",
+        next_steps=["run ls limit"],
     )
-    assert "Saved checkpoint" in saved.stdout
+    _switch_branch(git_repo, base_branch)
 
-    resume_payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert resume_payload["objective"] == f"{command_name} outside template objective"
-    tagged_rows = json.loads(
-        _run_dock(["ls", "--tag", f"{command_name}-outside-template", "--json"], cwd=tmp_path, env=env).stdout
-    )
-    assert len(tagged_rows) == 1
-    assert tagged_rows[0]["branch"] == _git_current_branch(git_repo)
+    rows = _invoke_dock_json(["ls", "--limit", "1", "--json"], cwd=tmp_path, env=env)
+    assert len(rows) == 1
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_toml_template_no_prompt_outside_repo_succeeds(
-    git_repo: Path,
+@pytest.mark.parametrize(
+    ("args", "expected_fragment"),
+    [pytest.param(*case[1:], id=case[0]) for case in LS_SEARCH_ARGUMENT_ERROR_CASES],
+)
+def test_ls_and_search_reject_invalid_arguments(
     tmp_path: Path,
-    command_name: str,
+    empty_dock_home: Path,
+    args: tuple[str, ...],
+    expected_fragment: str,
 ) -> None:
-    """TOML template save aliases should succeed outside repo with --root."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Invalid limit/stale values and blank query/filters should fail cleanly."""
+    failed = _invoke_dock(list(args), cwd=tmp_path, env=_dock_env(empty_dock_home), expect_code=2)
+    _assert_cli_error(failed, expected_fragment)
 
-    template_path = tmp_path / f"{command_name}_outside_template.toml"
-    template_path.write_text(
-        "\n".join(
-            [
-                f'objective = "{command_name} outside TOML objective"',
-                f'decisions = "{command_name} outside TOML decisions"',
-                'risks_review = "none"',
-                f'next_steps = ["run {command_name} outside TOML resume"]',
-                f'resume_commands = ["echo {command_name}-outside-toml"]',
-                f'tags = ["{command_name}-outside-toml"]',
-                "",
-                "[verification]",
-                "tests_run = true",
-                'tests_command = "pytest -q"',
-                "build_ok = true",
-                'build_command = "echo build"',
-                "lint_ok = false",
-                "smoke_ok = false",
-            ]
-        ),
-        encoding="utf-8",
-    )
 
-    saved = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(template_path),
-            "--no-prompt",
-            "--no-auto-review",
-        ],
-        cwd=tmp_path,
-        env=env,
+def test_ls_tag_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
+    """LS should resolve tag filters after whitespace trimming."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Trimmed ls tag objective",
+        decisions="Verify ls tag filter trimming",
+        next_steps=["run ls tag filter"],
+        tags=["alpha"],
     )
-    assert "Saved checkpoint" in saved.stdout
 
-    resume_payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert resume_payload["objective"] == f"{command_name} outside TOML objective"
-    tagged_rows = json.loads(_run_dock(["ls", "--tag", f"{command_name}-outside-toml", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(tagged_rows) == 1
-    assert tagged_rows[0]["branch"] == _git_current_branch(git_repo)
+    rows = _invoke_dock_json(["ls", "--tag", "  alpha  ", "--json"], cwd=tmp_path, env=env)
+    assert len(rows) >= 1
 
 
-def test_save_with_toml_template_no_prompt(git_repo: Path, tmp_path: Path) -> None:
-    """TOML template should be accepted by save --template."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_search_tag_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
+    """Search should resolve tag filters after whitespace trimming."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    template_path = tmp_path / "save_template.toml"
-    template_path.write_text(
-        "\n".join(
-            [
-                'objective = "TOML objective"',
-                'decisions = "TOML decisions"',
-                'risks_review = "TOML risk"',
-                'next_steps = ["TOML next"]',
-                'resume_commands = ["echo toml"]',
-                'tags = ["toml"]',
-                "",
-                "[verification]",
-                "tests_run = true",
-                'tests_command = "pytest -q"',
-                "build_ok = true",
-                'build_command = "echo build"',
-                "lint_ok = false",
-                "smoke_ok = false",
-            ]
-        ),
-        encoding="utf-8",
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Trimmed search tag objective",
+        decisions="Verify search tag filter trimming",
+        next_steps=["run search tag filter"],
+        tags=["alpha"],
     )
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(template_path),
-            "--no-prompt",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+    rows = _invoke_dock_json(
+        ["search", "Trimmed search tag objective", "--tag", "  alpha  ", "--json"],
+        cwd=tmp_path,
         env=env,
     )
-
-    resume_payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert resume_payload["objective"] == "TOML objective"
-    assert resume_payload["verification"]["tests_run"] is True
-    assert resume_payload["verification"]["build_ok"] is True
-    tagged_rows = json.loads(_run_dock(["ls", "--tag", "toml", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(tagged_rows) == 1
-    assert tagged_rows[0]["branch"] == _git_current_branch(git_repo)
+    assert len(rows) >= 1
+    assert rows[0]["objective"] == "Trimmed search tag objective"
 
 
-def test_save_template_path_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
-    """Save should resolve template path values after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_search_rejects_blank_branch_filter(git_repo: Path, tmp_path: Path) -> None:
+    """Search should reject blank branch filter values when provided."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    template_path = tmp_path / "trimmed_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Trimmed template objective",
-                "decisions": "Template path trimming behavior",
-                "next_steps": ["run resume"],
-                "risks_review": "none",
-                "resume_commands": ["echo trimmed-template"],
-            }
-        ),
-        encoding="utf-8",
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Blank branch filter objective",
+        decisions="Need search context",
+        next_steps=["run invalid branch search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            f"  {template_path}  ",
-            "--no-prompt",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+    failed = _invoke_dock(
+        ["search", "Blank branch filter objective", "--branch", "   "],
+        cwd=tmp_path,
         env=env,
+        expect_code=2,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["objective"] == "Trimmed template objective"
+    _assert_cli_error(failed, "--branch must be a non-empty string.")
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_path_accepts_trimmed_value_outside_repo(
+def test_search_branch_filter_accepts_trimmed_value(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
+    git_template_branch: str,
 ) -> None:
-    """Save aliases should trim template path values outside repo contexts."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Search should resolve branch filters after whitespace trimming."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    template_path = tmp_path / f"{command_name}_outside_trimmed_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": f"{command_name} outside trimmed template objective",
-                "decisions": "Template path trimming behavior outside repo",
-                "next_steps": ["run resume"],
-                "risks_review": "none",
-                "resume_commands": [f"echo {command_name}-outside-trimmed-template"],
-            }
-        ),
-        encoding="utf-8",
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Trimmed branch filter objective",
+        decisions="Search should match trimmed branch filters",
+        next_steps=["run branch search"],
     )
 
-    saved = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            f"  {template_path}  ",
-            "--no-prompt",
-            "--no-auto-review",
-        ],
+    rows = _invoke_dock_json(
+        ["search", "Trimmed branch filter objective", "--branch", f"  {branch}  ", "--json"],
         cwd=tmp_path,
         env=env,
     )
-    assert "Saved checkpoint" in saved.stdout
-
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["objective"] == f"{command_name} outside trimmed template objective"
-
-
-def test_save_rejects_blank_template_path(git_repo: Path, tmp_path: Path) -> None:
-    """Save should reject blank template option values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            "   ",
-            "--no-prompt",
-            "--objective",
-            "fallback objective",
-            "--decisions",
-            "fallback decisions",
-            "--next-step",
-            "fallback step",
-            "--risks",
-            "none",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--template must be a non-empty string." in output
-    assert "Traceback" not in output
+    assert len(rows) >= 1
+    assert {row["branch"] for row in rows} == {branch}
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize(
-    ("template_value", "expected_fragment"),
-    [
-        ("   ", "--template must be a non-empty string."),
-        ("__MISSING_TEMPLATE__", "Template not found"),
-        ("__DIRECTORY_TEMPLATE__", "Failed to read template:"),
-    ],
-)
-def test_save_alias_template_path_validation_outside_repo_is_actionable(
+def test_search_repo_and_branch_filters_accept_trimmed_values(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
-    template_value: str,
-    expected_fragment: str,
+    git_template_branch: str,
 ) -> None:
-    """Template-path validation should stay actionable outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Search should resolve trimmed repo+branch filters together."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    missing_template = tmp_path / f"{command_name}_outside_missing_template.json"
-    rendered_template = template_value
-    if template_value == "__MISSING_TEMPLATE__":
-        rendered_template = str(missing_template)
-    elif template_value == "__DIRECTORY_TEMPLATE__":
-        rendered_template = str(tmp_path)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Trimmed repo branch search objective",
+        decisions="Search should trim both repo and branch filters",
+        next_steps=["run combined search"],
+    )
 
-    failed = _run_dock(
+    rows = _invoke_dock_json(
         [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            rendered_template,
-            "--no-prompt",
-            "--objective",
-            f"{command_name} outside template path validation objective",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "fix template path",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
+            "search",
+            "Trimmed repo branch search objective",
+            "--repo",
+            f"  {git_repo.name}  ",
+            "--branch",
+            f"  {branch}  ",
+            "--json",
         ],
         cwd=tmp_path,
         env=env,
-        expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
+    assert len(rows) >= 1
+    assert {row["berth_name"] for row in rows} == {git_repo.name}
+    assert {row["branch"] for row in rows} == {branch}
 
 
-def test_save_template_directory_path_is_actionable(
+def test_search_repo_branch_filter_semantics_non_json(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
-    """Directory-valued template paths should fail with actionable error text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(
+    """Search should honor combined repo+branch filters in table mode."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    default_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="prb-default",
+        decisions="default branch checkpoint for primary repo+branch filtering",
+        next_steps=["run primary repo+branch filter"],
+        resume_commands=["echo default"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/primary-repo-branch-filter")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="prb-feature",
+        decisions="feature branch checkpoint for primary repo+branch filtering",
+        next_steps=["run primary repo+branch filter"],
+        resume_commands=["echo feature"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, default_branch)
+
+    filtered = _invoke_dock(
         [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(tmp_path),
-            "--no-prompt",
-            "--objective",
-            "fallback objective",
-            "--decisions",
-            "fallback decisions",
-            "--next-step",
-            "fallback step",
-            "--risks",
-            "none",
+            "search",
+            "prb",
+            "--repo",
+            git_repo.name,
+            "--branch",
+            "feature/primary-repo-branch-filter",
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Failed to read template:" in output
-    assert "Traceback" not in output
+    ).stdout
+    assert "prb-feature" in filtered
+    assert "prb-default" not in filtered
+    assert "Traceback" not in filtered
 
 
-def test_save_template_non_utf8_file_is_actionable(
+def test_search_alias_repo_filter_accepts_trimmed_berth_name(
     git_repo: Path,
     tmp_path: Path,
 ) -> None:
-    """Non-UTF8 template files should fail with actionable read error."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Search alias repo filter should accept trimmed berth name values."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    bad_template = tmp_path / "non_utf8_template.json"
-    bad_template.write_bytes(b"\xff\xfe\x00")
-    failed = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "fallback objective",
-            "--decisions",
-            "fallback decisions",
-            "--next-step",
-            "fallback step",
-            "--risks",
-            "none",
-        ],
-        cwd=git_repo,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias trimmed repo objective",
+        decisions="Alias repo filter should trim berth names",
+        next_steps=["run alias repo search"],
+    )
+
+    rows = _invoke_dock_json(
+        ["f", "Alias trimmed repo objective", "--repo", f"  {git_repo.name}  ", "--json"],
+        cwd=tmp_path,
         env=env,
-        expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Failed to read template:" in output
-    assert "Traceback" not in output
+    assert len(rows) >= 1
+    assert {row["berth_name"] for row in rows} == {git_repo.name}
 
 
-def test_template_bool_like_strings_are_coerced(git_repo: Path, tmp_path: Path) -> None:
-    """Template bool-like strings should coerce to verification booleans."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+def test_search_alias_tag_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
+    """Search alias should resolve tag filters after whitespace trimming."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    template_path = tmp_path / "bool_like_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Bool-like objective",
-                "decisions": "Use string booleans in template",
-                "next_steps": ["Run resume json"],
-                "risks_review": "none",
-                "verification": {
-                    "tests_run": "yes",
-                    "build_ok": "1",
-                    "lint_ok": "no",
-                    "smoke_ok": "false",
-                },
-            }
-        ),
-        encoding="utf-8",
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias trimmed tag objective",
+        decisions="Alias tag filter should trim values",
+        next_steps=["run alias search"],
+        tags=["alpha"],
     )
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(template_path),
-            "--no-prompt",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+    rows = _invoke_dock_json(
+        ["f", "Alias trimmed tag objective", "--tag", "  alpha  ", "--json"],
+        cwd=tmp_path,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["verification"]["tests_run"] is True
-    assert payload["verification"]["build_ok"] is True
-    assert payload["verification"]["lint_ok"] is False
-    assert payload["verification"]["smoke_ok"] is False
+    assert len(rows) >= 1
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_bool_like_strings_are_coerced_outside_repo(
+def test_search_alias_branch_filter_accepts_trimmed_value(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
+    git_template_branch: str,
 ) -> None:
-    """Bool-like template verification values should coerce outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Search alias should resolve branch filters after whitespace trimming."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    template_path = tmp_path / f"{command_name}_outside_bool_like_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": f"{command_name} outside bool-like objective",
-                "decisions": "Use string booleans in outside-repo alias template",
-                "next_steps": ["Run resume json"],
-                "risks_review": "none",
-                "verification": {
-                    "tests_run": "yes",
-                    "build_ok": "1",
-                    "lint_ok": "no",
-                    "smoke_ok": "false",
-                },
-            }
-        ),
-        encoding="utf-8",
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias trimmed branch objective",
+        decisions="Alias branch filter should trim values",
+        next_steps=["run alias branch search"],
     )
 
-    _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(template_path),
-            "--no-prompt",
-            "--no-auto-review",
-        ],
+    rows = _invoke_dock_json(
+        ["f", "Alias trimmed branch objective", "--branch", f"  {branch}  ", "--json"],
         cwd=tmp_path,
         env=env,
     )
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    assert payload["verification"]["tests_run"] is True
-    assert payload["verification"]["build_ok"] is True
-    assert payload["verification"]["lint_ok"] is False
-    assert payload["verification"]["smoke_ok"] is False
+    assert len(rows) >= 1
+    assert {row["branch"] for row in rows} == {branch}
 
 
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_template_verification_text_fields_are_normalized(
+def test_search_alias_repo_and_branch_filters_accept_trimmed_values(
     git_repo: Path,
     tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
+    git_template_branch: str,
 ) -> None:
-    """Template verification text fields should trim values and drop blanks."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    """Search alias should resolve trimmed repo+branch filters together."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    template_path = tmp_path / "verification_text_normalization_template.json"
-    template_path.write_text(
-        json.dumps(
-            {
-                "objective": "Template verification text normalization objective",
-                "decisions": "Trim verification command and note text from template values",
-                "next_steps": ["Inspect resume json"],
-                "risks_review": "none",
-                "verification": {
-                    "tests_run": "yes",
-                    "tests_command": "   ",
-                    "build_ok": "1",
-                    "build_command": "  make build  ",
-                    "lint_ok": "true",
-                    "lint_command": "  ruff check  ",
-                    "smoke_ok": "y",
-                    "smoke_notes": "  smoke passed  ",
-                },
-            }
-        ),
-        encoding="utf-8",
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias trimmed repo branch objective",
+        decisions="Alias filters should trim repo and branch together",
+        next_steps=["run alias repo branch search"],
     )
 
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    _run_dock(
+    rows = _invoke_dock_json(
         [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(template_path),
-            "--no-prompt",
-            "--no-auto-review",
+            "f",
+            "Alias trimmed repo branch objective",
+            "--repo",
+            f"  {git_repo.name}  ",
+            "--branch",
+            f"  {branch}  ",
+            "--json",
         ],
-        cwd=run_cwd,
+        cwd=tmp_path,
         env=env,
     )
-
-    payload = json.loads(_run_dock(["resume", "--json"], cwd=git_repo, env=env).stdout)
-    verification = payload["verification"]
-    assert verification["tests_run"] is True
-    assert verification["build_ok"] is True
-    assert verification["lint_ok"] is True
-    assert verification["smoke_ok"] is True
-    assert verification["tests_command"] is None
-    assert verification["build_command"] == "make build"
-    assert verification["lint_command"] == "ruff check"
-    assert verification["smoke_notes"] == "smoke passed"
+    assert len(rows) >= 1
+    assert {row["berth_name"] for row in rows} == {git_repo.name}
+    assert {row["branch"] for row in rows} == {branch}
 
 
-def test_template_bool_like_invalid_string_is_rejected(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Unknown bool-like strings in template verification should fail."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "bad_bool_like.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": "Invalid bool-like",
-                "decisions": "bad tests_run value",
-                "next_steps": ["step"],
-                "risks_review": "none",
-                "verification": {"tests_run": "maybe"},
-            }
-        ),
-        encoding="utf-8",
-    )
-    failed = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'tests_run' must be bool or bool-like string" in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_bool_like_invalid_string_is_rejected_outside_repo(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Unknown bool-like template values should fail cleanly outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_bad_bool_like.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": f"{command_name} outside invalid bool-like",
-                "decisions": "bad tests_run value outside repo",
-                "next_steps": ["step"],
-                "risks_review": "none",
-                "verification": {"tests_run": "maybe"},
-            }
-        ),
-        encoding="utf-8",
-    )
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'tests_run' must be bool or bool-like string" in output
-    assert "Traceback" not in output
-
-
-def test_invalid_config_produces_actionable_error(git_repo: Path, tmp_path: Path) -> None:
-    """Invalid config TOML should fail with concise actionable message."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "[review_heuristics\nfiles_changed_threshold = 4",
-        encoding="utf-8",
-    )
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Config parse failure case",
-            "--decisions",
-            "should fail before saving",
-            "--next-step",
-            "fix config",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Invalid config TOML" in output
-    assert "Traceback" not in output
-
-
-def test_invalid_regex_config_produces_actionable_error(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Invalid regex config should fail cleanly with actionable messaging."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[review_heuristics]",
-                'risky_path_patterns = ["(^|/)[bad"]',
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Regex config failure case",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "fix regex",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Invalid regex" in output
-    assert "Traceback" not in output
-
-
-def test_invalid_config_section_type_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Invalid config section type should surface actionable error."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        'review_heuristics = "bad-type"',
-        encoding="utf-8",
-    )
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Bad config section type",
-            "--decisions",
-            "should fail",
-            "--next-step",
-            "fix config",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Config section review_heuristics must be a table." in output
-    assert "Traceback" not in output
-
-
-def test_negative_threshold_config_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Negative heuristic thresholds should fail with actionable guidance."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[review_heuristics]",
-                "churn_threshold = -5",
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Negative threshold config",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "fix config",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Config field review_heuristics.churn_threshold must be >= 0." in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize(
-    ("config_text", "expected_fragment"),
-    [
-        ("[review_heuristics\nfiles_changed_threshold = 4", "Invalid config TOML"),
-        ('review_heuristics = "bad-type"\n', "Config section review_heuristics must be a table."),
-        ('[review_heuristics]\nrisky_path_patterns = ["(^|/)[bad"]\n', "Invalid regex"),
-        ("[review_heuristics]\nchurn_threshold = -1\n", "Config field review_heuristics.churn_threshold must be >= 0."),
-    ],
-)
-def test_save_invalid_config_is_actionable_outside_repo(
+def test_search_alias_json_respects_limit(
     git_repo: Path,
     tmp_path: Path,
-    config_text: str,
-    expected_fragment: str,
+    git_template_branch: str,
 ) -> None:
-    """Primary save should surface actionable config validation errors outside repo."""
-    env = dict(os.environ)
+    """Search alias JSON mode should honor --limit."""
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(config_text, encoding="utf-8")
-
-    failed = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "save outside invalid config case",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "fix config",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias limit objective one",
+        decisions="alias limit baseline one",
+        next_steps=["record first"],
+        resume_commands=["echo one"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/alias-limit")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Alias limit objective two",
+        decisions="alias limit baseline two",
+        next_steps=["record second"],
+        resume_commands=["echo two"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    rows = _invoke_dock_json(
+        ["f", "Alias limit objective", "--limit", "1", "--json"],
         cwd=tmp_path,
         env=env,
-        expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
+    assert len(rows) == 1
 
 
-@pytest.mark.parametrize("command_name", ["s", "dock"])
-@pytest.mark.parametrize(
-    ("config_text", "expected_fragment"),
-    [
-        ("[review_heuristics\nfiles_changed_threshold = 4", "Invalid config TOML"),
-        ('review_heuristics = "bad-type"\n', "Config section review_heuristics must be a table."),
-        ('[review_heuristics]\nrisky_path_patterns = ["(^|/)[bad"]\n', "Invalid regex"),
-        ("[review_heuristics]\nchurn_threshold = -1\n", "Config field review_heuristics.churn_threshold must be >= 0."),
-    ],
-)
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_alias_invalid_config_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    config_text: str,
-    expected_fragment: str,
-    run_cwd_kind: str,
-) -> None:
-    """Save aliases should surface actionable config validation errors."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(config_text, encoding="utf-8")
+@pytest.fixture(scope="module")
+def tag_limit_corpus(tmp_path_factory: pytest.TempPathFactory, git_repo_template: Path) -> Path:
+    """Return a read-only Dockyard home for the search `--tag` + `--limit` tests.
 
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    result = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias invalid config case",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "fix config",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=run_cwd,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-def test_unknown_config_sections_do_not_block_save(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Unknown config sections should be ignored in save flow."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[other_section]",
-                'foo = "bar"',
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Unknown section config",
-            "--decisions",
-            "save should succeed",
-            "--next-step",
-            "run resume",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    assert "Saved checkpoint" in result.stdout
-
-
-def test_unknown_config_sections_do_not_block_save_outside_repo(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Outside-repo save should ignore unknown config sections and succeed."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[other_section]",
-                'foo = "bar"',
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "outside unknown section config",
-            "--decisions",
-            "save should succeed",
-            "--next-step",
-            "run resume",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=tmp_path,
-        env=env,
-    )
-    assert "Saved checkpoint" in result.stdout
-
-
-@pytest.mark.parametrize("command_name", ["s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_alias_unknown_config_sections_do_not_block_save(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
-) -> None:
-    """Save aliases should ignore unknown config sections and succeed."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[other_section]",
-                'foo = "bar"',
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    result = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} unknown section config",
-            "--decisions",
-            "save should succeed",
-            "--next-step",
-            "run resume",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=run_cwd,
-        env=env,
-    )
-    assert "Saved checkpoint" in result.stdout
-
-
-def test_empty_review_heuristics_section_uses_default_save_behavior(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Empty review_heuristics section should preserve default trigger behavior."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text("[review_heuristics]\n", encoding="utf-8")
-
-    security_dir = git_repo / "security"
-    security_dir.mkdir(exist_ok=True)
-    (security_dir / "guard.py").write_text("print('guard')\n", encoding="utf-8")
-
-    save_result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Empty review section defaults",
-            "--decisions",
-            "Default risky-path trigger should still apply",
-            "--next-step",
-            "Confirm auto review is still generated",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    assert "Created review item" in save_result.stdout
-    assert "Review triggers:" in save_result.stdout
-    assert "Traceback" not in f"{save_result.stdout}\n{save_result.stderr}"
-
-    review_list = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert "No review items." not in review_list
-
-
-def test_empty_review_heuristics_section_uses_default_save_behavior_outside_repo(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Outside-repo save should preserve defaults with empty review_heuristics."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text("[review_heuristics]\n", encoding="utf-8")
-
-    security_dir = git_repo / "security"
-    security_dir.mkdir(exist_ok=True)
-    (security_dir / "guard.py").write_text("print('guard')\n", encoding="utf-8")
-
-    save_result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "outside empty review section defaults",
-            "--decisions",
-            "Default risky-path trigger should still apply",
-            "--next-step",
-            "Confirm auto review is still generated",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-        ],
-        cwd=tmp_path,
-        env=env,
-    )
-    assert "Created review item" in save_result.stdout
-    assert "Review triggers:" in save_result.stdout
-    assert "Traceback" not in f"{save_result.stdout}\n{save_result.stderr}"
-
-    review_list = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert "No review items." not in review_list
-
-
-@pytest.mark.parametrize("command_name", ["s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_alias_empty_review_heuristics_section_uses_default_behavior(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
-) -> None:
-    """Save aliases should preserve defaults with empty review_heuristics."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text("[review_heuristics]\n", encoding="utf-8")
-
-    security_dir = git_repo / "security"
-    security_dir.mkdir(exist_ok=True)
-    (security_dir / "guard.py").write_text("print('guard')\n", encoding="utf-8")
-
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    save_result = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} empty review section defaults",
-            "--decisions",
-            "Default risky-path trigger should still apply",
-            "--next-step",
-            "Confirm auto review is still generated",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-        ],
-        cwd=run_cwd,
-        env=env,
-    )
-    assert "Created review item" in save_result.stdout
-    assert "Review triggers:" in save_result.stdout
-    assert "Traceback" not in f"{save_result.stdout}\n{save_result.stderr}"
-
-    review_list = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert "No review items." not in review_list
-
-
-def test_missing_template_path_produces_actionable_error(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Missing save template path should fail with actionable error."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    missing_path = tmp_path / "not-there.json"
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(missing_path),
-            "--no-prompt",
-            "--objective",
-            "Missing template",
-            "--decisions",
-            "should not save",
-            "--next-step",
-            "fix path",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Template not found" in output
-    assert "Traceback" not in output
-
-
-def test_invalid_template_content_produces_actionable_error(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Malformed template should fail cleanly with parse error message."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "bad_template.toml"
-    bad_template.write_text("[broken\nvalue = 1", encoding="utf-8")
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "Invalid template",
-            "--decisions",
-            "should not save",
-            "--next-step",
-            "fix template",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Failed to parse template" in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize(
-    ("fixture_kind", "expected_fragment"),
-    [
-        ("bad_parse", "Failed to parse template"),
-        ("bad_schema", "Template must contain an object/table"),
-        ("unsupported", "Template must be .json or .toml"),
-        ("non_utf", "Failed to read template"),
-    ],
-)
-def test_save_alias_template_content_validation_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    fixture_kind: str,
-    expected_fragment: str,
-) -> None:
-    """Template content validation should stay actionable outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    if fixture_kind == "bad_parse":
-        template_path = tmp_path / f"{command_name}_outside_bad_parse_template.toml"
-        template_path.write_text("[broken\nvalue = 1", encoding="utf-8")
-    elif fixture_kind == "bad_schema":
-        template_path = tmp_path / f"{command_name}_outside_bad_schema_template.json"
-        template_path.write_text(json.dumps(["not", "an", "object"]), encoding="utf-8")
-    elif fixture_kind == "unsupported":
-        template_path = tmp_path / f"{command_name}_outside_bad_template.yaml"
-        template_path.write_text("objective: unsupported\n", encoding="utf-8")
-    else:
-        template_path = tmp_path / f"{command_name}_outside_non_utf_template.json"
-        template_path.write_bytes(b"\xff\xfe\x00")
-
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(template_path),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} outside template content validation objective",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "fix template content",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-def test_unsupported_template_extension_produces_actionable_error(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Unsupported template extension should fail with clear guidance."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "template.yaml"
-    bad_template.write_text("objective: bad extension\n", encoding="utf-8")
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "Unsupported template extension",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "use json or toml",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Template must be .json or .toml" in output
-    assert "Traceback" not in output
-
-
-def test_template_tml_extension_is_rejected(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """`.tml` template extension should be rejected as unsupported."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "template.tml"
-    bad_template.write_text('objective = "bad extension"\n', encoding="utf-8")
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "Unsupported template extension",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "use json or toml",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Template must be .json or .toml" in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_tml_extension_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Outside-repo `.tml` template extension should fail cleanly for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_template.tml"
-    bad_template.write_text('objective = "bad extension"\n', encoding="utf-8")
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "Unsupported template extension",
-            "--decisions",
-            "should fail before save",
-            "--next-step",
-            "use json or toml",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template must be .json or .toml" in output
-    assert "Traceback" not in output
-
-
-def test_template_type_validation_for_list_fields(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Template should reject invalid types for list-based fields."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "bad_types.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": "bad list shape",
-                "decisions": "invalid next_steps type",
-                "next_steps": "not-a-list",
-            }
-        ),
-        encoding="utf-8",
-    )
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Template field 'next_steps' must be an array of strings" in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_next_steps_list_shape_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Outside-repo next_steps list-shape validation should fail cleanly for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_bad_next_steps_shape.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": f"{command_name} bad list shape",
-                "decisions": "invalid next_steps type outside repo",
-                "next_steps": "not-a-list",
-            }
-        ),
-        encoding="utf-8",
-    )
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'next_steps' must be an array of strings" in output
-    assert "Traceback" not in output
-
-
-def test_template_must_be_object_or_table(git_repo: Path, tmp_path: Path) -> None:
-    """Template payload must be an object/table and not other JSON types."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "list_template.json"
-    bad_template.write_text(json.dumps(["not", "an", "object"]), encoding="utf-8")
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Template must contain an object/table" in output
-    assert "Traceback" not in output
-
-
-def test_template_type_validation_for_verification_fields(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Template should reject invalid types inside verification object."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "bad_verification.toml"
-    bad_template.write_text(
-        "\n".join(
-            [
-                'objective = "bad verification"',
-                'decisions = "verification section malformed"',
-                'next_steps = ["step"]',
-                "",
-                "[verification]",
-                "tests_run = 123",
-            ]
-        ),
-        encoding="utf-8",
-    )
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Template field 'tests_run' must be bool or bool-like string" in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_verification_bool_type_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Outside-repo TOML verification bool-type validation should fail cleanly for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_bad_verification.toml"
-    bad_template.write_text(
-        "\n".join(
-            [
-                f'objective = "{command_name} bad verification"',
-                'decisions = "verification section malformed outside repo"',
-                'next_steps = ["step"]',
-                "",
-                "[verification]",
-                "tests_run = 123",
-            ]
-        ),
-        encoding="utf-8",
-    )
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'tests_run' must be bool or bool-like string" in output
-    assert "Traceback" not in output
-
-
-def test_template_verification_section_must_be_object_or_table(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Template should reject non-object verification section payloads."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "bad_verification_shape.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": "bad verification shape",
-                "decisions": "verification section is not object-like",
-                "next_steps": ["step"],
-                "verification": "not-a-table",
-            }
-        ),
-        encoding="utf-8",
-    )
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Template field 'verification' must be a table/object" in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_verification_section_shape_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Non-object verification sections should fail cleanly outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_bad_verification_shape.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": f"{command_name} outside bad verification shape",
-                "decisions": "verification section is not object-like",
-                "next_steps": ["step"],
-                "verification": "not-a-table",
-            }
-        ),
-        encoding="utf-8",
-    )
-
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'verification' must be a table/object" in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize(
-    ("template_payload", "expected_fragment"),
-    [
-        (
-            {
-                "objective": 123,
-                "decisions": "invalid objective type",
-                "next_steps": ["step"],
-            },
-            "Template field 'objective' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid list item type",
-                "decisions": "resume_commands contains non-string",
-                "next_steps": ["step"],
-                "resume_commands": ["echo good", 7],
-            },
-            "Template field 'resume_commands' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid verification command type",
-                "decisions": "tests_command should be a string",
-                "next_steps": ["step"],
-                "verification": {"tests_command": 123},
-            },
-            "Template field 'tests_command' must be a string",
-        ),
-    ],
-)
-def test_template_type_validation_for_string_and_list_item_fields(
-    git_repo: Path,
-    tmp_path: Path,
-    template_payload: dict[str, Any],
-    expected_fragment: str,
-) -> None:
-    """Template should reject invalid string fields and list item types."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "bad_string_or_list_item_types.json"
-    bad_template.write_text(json.dumps(template_payload), encoding="utf-8")
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize(
-    ("template_payload", "expected_fragment"),
-    [
-        (
-            {
-                "objective": 123,
-                "decisions": "invalid objective type",
-                "next_steps": ["step"],
-            },
-            "Template field 'objective' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid list item type",
-                "decisions": "resume_commands contains non-string",
-                "next_steps": ["step"],
-                "resume_commands": ["echo good", 7],
-            },
-            "Template field 'resume_commands' must be an array of strings",
-        ),
-    ],
-)
-def test_save_alias_template_string_and_list_item_type_validation_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    template_payload: dict[str, Any],
-    expected_fragment: str,
-) -> None:
-    """String/list item type template errors should be actionable outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_bad_string_or_list_item_types.json"
-    bad_template.write_text(json.dumps(template_payload), encoding="utf-8")
-
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-def test_save_alias_template_verification_command_type_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Verification command type errors should remain actionable outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_bad_verification_command_type.json"
-    bad_template.write_text(
-        json.dumps(
-            {
-                "objective": f"{command_name} outside invalid verification command type",
-                "decisions": "tests_command should be a string outside repo",
-                "next_steps": ["step"],
-                "verification": {"tests_command": 123},
-            }
-        ),
-        encoding="utf-8",
-    )
-
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Template field 'tests_command' must be a string" in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize(
-    ("template_payload", "expected_fragment"),
-    [
-        (
-            {
-                "objective": "invalid risks type",
-                "decisions": "risks_review should be a string",
-                "next_steps": ["step"],
-                "risks_review": 123,
-            },
-            "Template field 'risks_review' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid tags list item type",
-                "decisions": "tags should contain only strings",
-                "next_steps": ["step"],
-                "tags": ["alpha", 7],
-            },
-            "Template field 'tags' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid links list item type",
-                "decisions": "links should contain only strings",
-                "next_steps": ["step"],
-                "links": ["https://example.invalid", 7],
-            },
-            "Template field 'links' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid build bool-like value",
-                "decisions": "build_ok should be bool-like",
-                "next_steps": ["step"],
-                "verification": {"build_ok": "maybe"},
-            },
-            "Template field 'build_ok' must be bool or bool-like string",
-        ),
-        (
-            {
-                "objective": "invalid lint bool-like value",
-                "decisions": "lint_ok should be bool-like",
-                "next_steps": ["step"],
-                "verification": {"lint_ok": "maybe"},
-            },
-            "Template field 'lint_ok' must be bool or bool-like string",
-        ),
-        (
-            {
-                "objective": "invalid smoke bool-like value",
-                "decisions": "smoke_ok should be bool-like",
-                "next_steps": ["step"],
-                "verification": {"smoke_ok": "perhaps"},
-            },
-            "Template field 'smoke_ok' must be bool or bool-like string",
-        ),
-        (
-            {
-                "objective": "invalid build command type",
-                "decisions": "build_command should be a string",
-                "next_steps": ["step"],
-                "verification": {"build_command": 123},
-            },
-            "Template field 'build_command' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid lint command type",
-                "decisions": "lint_command should be a string",
-                "next_steps": ["step"],
-                "verification": {"lint_command": 123},
-            },
-            "Template field 'lint_command' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid smoke notes type",
-                "decisions": "smoke_notes should be a string",
-                "next_steps": ["step"],
-                "verification": {"smoke_notes": 123},
-            },
-            "Template field 'smoke_notes' must be a string",
-        ),
-    ],
-)
-def test_template_type_validation_for_remaining_schema_fields(
-    git_repo: Path,
-    tmp_path: Path,
-    template_payload: dict[str, Any],
-    expected_fragment: str,
-) -> None:
-    """Template should reject invalid remaining schema field shapes/types."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "bad_remaining_schema_fields.json"
-    bad_template.write_text(json.dumps(template_payload), encoding="utf-8")
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize(
-    ("template_payload", "expected_fragment"),
-    [
-        (
-            {
-                "objective": "invalid tests bool-like value",
-                "decisions": "tests_run should be bool-like",
-                "next_steps": ["step"],
-                "verification": {"tests_run": "maybe"},
-            },
-            "Template field 'tests_run' must be bool or bool-like string",
-        ),
-        (
-            {
-                "objective": "invalid build bool-like value",
-                "decisions": "build_ok should be bool-like",
-                "next_steps": ["step"],
-                "verification": {"build_ok": "maybe"},
-            },
-            "Template field 'build_ok' must be bool or bool-like string",
-        ),
-        (
-            {
-                "objective": "invalid lint bool-like value",
-                "decisions": "lint_ok should be bool-like",
-                "next_steps": ["step"],
-                "verification": {"lint_ok": "maybe"},
-            },
-            "Template field 'lint_ok' must be bool or bool-like string",
-        ),
-        (
-            {
-                "objective": "invalid smoke bool-like value",
-                "decisions": "smoke_ok should be bool-like",
-                "next_steps": ["step"],
-                "verification": {"smoke_ok": "perhaps"},
-            },
-            "Template field 'smoke_ok' must be bool or bool-like string",
-        ),
-        (
-            {
-                "objective": "invalid build command type",
-                "decisions": "build_command should be a string",
-                "next_steps": ["step"],
-                "verification": {"build_command": 123},
-            },
-            "Template field 'build_command' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid lint command type",
-                "decisions": "lint_command should be a string",
-                "next_steps": ["step"],
-                "verification": {"lint_command": 123},
-            },
-            "Template field 'lint_command' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid smoke notes type",
-                "decisions": "smoke_notes should be a string",
-                "next_steps": ["step"],
-                "verification": {"smoke_notes": 123},
-            },
-            "Template field 'smoke_notes' must be a string",
-        ),
-    ],
-)
-def test_save_alias_template_type_validation_for_remaining_schema_fields_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    template_payload: dict[str, Any],
-    expected_fragment: str,
-) -> None:
-    """Remaining schema field type errors should be actionable outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_bad_remaining_schema_fields.json"
-    bad_template.write_text(json.dumps(template_payload), encoding="utf-8")
-
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize(
-    ("template_payload", "expected_fragment"),
-    [
-        (
-            {
-                "objective": "invalid decisions type",
-                "decisions": 123,
-                "next_steps": ["step"],
-            },
-            "Template field 'decisions' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid next steps list item type",
-                "decisions": "next_steps should contain only strings",
-                "next_steps": ["step", 7],
-            },
-            "Template field 'next_steps' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid resume_commands shape",
-                "decisions": "resume_commands must be a list",
-                "next_steps": ["step"],
-                "resume_commands": "echo not-a-list",
-            },
-            "Template field 'resume_commands' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid tags shape",
-                "decisions": "tags must be a list",
-                "next_steps": ["step"],
-                "tags": "alpha",
-            },
-            "Template field 'tags' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid links shape",
-                "decisions": "links must be a list",
-                "next_steps": ["step"],
-                "links": "https://example.invalid",
-            },
-            "Template field 'links' must be an array of strings",
-        ),
-    ],
-)
-def test_template_type_validation_for_additional_top_level_fields(
-    git_repo: Path,
-    tmp_path: Path,
-    template_payload: dict[str, Any],
-    expected_fragment: str,
-) -> None:
-    """Template should reject invalid remaining top-level schema field shapes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / "bad_additional_top_level_fields.json"
-    bad_template.write_text(json.dumps(template_payload), encoding="utf-8")
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize(
-    ("template_payload", "expected_fragment"),
-    [
-        (
-            {
-                "objective": "invalid decisions type",
-                "decisions": 123,
-                "next_steps": ["step"],
-            },
-            "Template field 'decisions' must be a string",
-        ),
-        (
-            {
-                "objective": "invalid next steps list item type",
-                "decisions": "next_steps should contain only strings",
-                "next_steps": ["step", 7],
-            },
-            "Template field 'next_steps' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid resume_commands shape",
-                "decisions": "resume_commands must be a list",
-                "next_steps": ["step"],
-                "resume_commands": "echo not-a-list",
-            },
-            "Template field 'resume_commands' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid tags shape",
-                "decisions": "tags must be a list",
-                "next_steps": ["step"],
-                "tags": "alpha",
-            },
-            "Template field 'tags' must be an array of strings",
-        ),
-        (
-            {
-                "objective": "invalid links shape",
-                "decisions": "links must be a list",
-                "next_steps": ["step"],
-                "links": "https://example.invalid",
-            },
-            "Template field 'links' must be an array of strings",
-        ),
-    ],
-)
-def test_save_alias_template_type_validation_for_additional_top_level_fields_outside_repo_is_actionable(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    template_payload: dict[str, Any],
-    expected_fragment: str,
-) -> None:
-    """Additional top-level field type errors should be actionable outside repo for aliases."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    bad_template = tmp_path / f"{command_name}_outside_bad_additional_top_level_fields.json"
-    bad_template.write_text(json.dumps(template_payload), encoding="utf-8")
-
-    failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--template",
-            str(bad_template),
-            "--no-prompt",
-            "--objective",
-            "override",
-            "--decisions",
-            "override",
-            "--next-step",
-            "override",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-        ],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert expected_fragment in output
-    assert "Traceback" not in output
-
-
-def test_no_prompt_requires_risks_field(git_repo: Path, tmp_path: Path) -> None:
-    """No-prompt save should require non-empty risks/review notes."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Missing risks field",
-            "--decisions",
-            "Should fail without risks",
-            "--next-step",
-            "add risks",
-            "--command",
-            "echo noop",
-        ],
-        cwd=git_repo,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{result.stdout}\n{result.stderr}"
-    assert "Risks / Review Needed is required." in output
-    assert "Traceback" not in output
-
-
-def test_configured_heuristics_can_disable_default_review_trigger(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Configured heuristics should influence auto-review creation behavior."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[review_heuristics]",
-                # Exclude default `security/` trigger; only `critical/` now.
-                'risky_path_patterns = ["(^|/)critical/"]',
-                # Keep other triggers intentionally high to avoid accidental matches.
-                "files_changed_threshold = 999",
-                "churn_threshold = 9999",
-                "non_trivial_files_threshold = 999",
-                "non_trivial_churn_threshold = 9999",
-                'branch_prefixes = ["urgent/"]',
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    security_dir = git_repo / "security"
-    security_dir.mkdir(exist_ok=True)
-    (security_dir / "guard.py").write_text("print('guard')\n", encoding="utf-8")
-
-    save_result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Configurable review trigger behavior",
-            "--decisions",
-            "Custom heuristic should skip default security trigger",
-            "--next-step",
-            "Confirm no auto review generated",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    assert "Created review item" not in save_result.stdout
-    assert "Review triggers:" not in save_result.stdout
-
-    review_list = _run_dock(["review"], cwd=tmp_path, env=env)
-    assert "No review items." in review_list.stdout
-
-
-def test_configured_heuristics_can_force_review_trigger(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Configured thresholds should be able to force review creation."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[review_heuristics]",
-                # Force trigger even on clean snapshots.
-                "files_changed_threshold = 0",
-                # Keep other trigger paths effectively disabled for clarity.
-                "churn_threshold = 9999",
-                "non_trivial_files_threshold = 999",
-                "non_trivial_churn_threshold = 9999",
-                'risky_path_patterns = ["(^|/)never-match/"]',
-                'branch_prefixes = ["never/"]',
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    save_result = _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Configurable force review trigger behavior",
-            "--decisions",
-            "Threshold override should force review creation",
-            "--next-step",
-            "Confirm auto review generated",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    output = f"{save_result.stdout}\n{save_result.stderr}"
-    assert "Created review item" in output
-    assert "Review triggers:" in output
-    assert "many_files_changed" in output
-    assert "Traceback" not in output
-
-    review_list = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert "No review items." not in review_list
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_alias_configured_heuristics_can_disable_default_review_trigger(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
-) -> None:
-    """Configured heuristics should disable default review trigger across save aliases."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[review_heuristics]",
-                'risky_path_patterns = ["(^|/)critical/"]',
-                "files_changed_threshold = 999",
-                "churn_threshold = 9999",
-                "non_trivial_files_threshold = 999",
-                "non_trivial_churn_threshold = 9999",
-                'branch_prefixes = ["urgent/"]',
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    security_dir = git_repo / "security"
-    security_dir.mkdir(exist_ok=True)
-    (security_dir / "guard.py").write_text("print('guard')\n", encoding="utf-8")
-
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    save_result = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} configurable review trigger behavior",
-            "--decisions",
-            "Custom heuristic should skip default security trigger",
-            "--next-step",
-            "Confirm no auto review generated",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-        ],
-        cwd=run_cwd,
-        env=env,
-    )
-    assert "Created review item" not in save_result.stdout
-    assert "Review triggers:" not in save_result.stdout
-
-    review_list = _run_dock(["review"], cwd=tmp_path, env=env)
-    assert "No review items." in review_list.stdout
-
-
-@pytest.mark.parametrize("command_name", ["save", "s", "dock"])
-@pytest.mark.parametrize("run_cwd_kind", ["repo", "tmp"], ids=["in_repo", "outside_repo"])
-def test_save_alias_configured_heuristics_can_force_review_trigger(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-    run_cwd_kind: str,
-) -> None:
-    """Configured heuristics should force review trigger across save aliases."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    dock_home.mkdir(parents=True, exist_ok=True)
-    (dock_home / "config.toml").write_text(
-        "\n".join(
-            [
-                "[review_heuristics]",
-                "files_changed_threshold = 0",
-                "churn_threshold = 9999",
-                "non_trivial_files_threshold = 999",
-                "non_trivial_churn_threshold = 9999",
-                'risky_path_patterns = ["(^|/)never-match/"]',
-                'branch_prefixes = ["never/"]',
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    run_cwd = git_repo if run_cwd_kind == "repo" else tmp_path
-    save_result = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"{command_name} configurable force review trigger behavior",
-            "--decisions",
-            "Threshold override should force review creation",
-            "--next-step",
-            "Confirm auto review generated",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-        ],
-        cwd=run_cwd,
-        env=env,
-    )
-    output = f"{save_result.stdout}\n{save_result.stderr}"
-    assert "Created review item" in output
-    assert "Review triggers:" in output
-    assert "many_files_changed" in output
-    assert "Traceback" not in output
-
-    review_list = _run_dock(["review"], cwd=tmp_path, env=env).stdout
-    assert "No review items." not in review_list
-
-
-def test_cli_ls_and_search_filters(git_repo: Path, tmp_path: Path) -> None:
-    """CLI filters for harbor and search should narrow results correctly."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Filter target objective main",
-            "--decisions",
-            "main branch checkpoint",
-            "--next-step",
-            "run filters",
-            "--risks",
-            "none",
-            "--command",
-            "echo main",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/filters"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Filter target objective feature",
-            "--decisions",
-            "feature branch checkpoint",
-            "--next-step",
-            "run feature filters",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
-            "--tag",
-            "beta",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    tagged_alpha = json.loads(_run_dock(["ls", "--tag", "alpha", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(tagged_alpha) == 1
-    assert tagged_alpha[0]["branch"] in {"main", "master"}
-
-    tagged_beta = json.loads(_run_dock(["ls", "--tag", "beta", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(tagged_beta) == 1
-    assert tagged_beta[0]["branch"] == "feature/filters"
-
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET updated_at = ? WHERE branch = ?",
-        ("2000-01-01T00:00:00+00:00", "feature/filters"),
-    )
-    conn.commit()
-    conn.close()
-
-    stale_rows = json.loads(_run_dock(["ls", "--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(stale_rows) == 1
-    assert stale_rows[0]["branch"] == "feature/filters"
-
-    search_branch = _run_dock(
-        ["search", "Filter target objective", "--branch", "feature/filters"],
-        cwd=tmp_path,
-        env=env,
-    )
-    assert "feature/filters" in search_branch.stdout
-
-    search_repo_name = _run_dock(
-        ["search", "Filter target objective", "--repo", git_repo.name],
-        cwd=tmp_path,
-        env=env,
-    )
-    assert "feature/filters" in search_repo_name.stdout
-    search_repo_json = json.loads(
-        _run_dock(
-            ["search", "Filter target objective", "--repo", git_repo.name, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(search_repo_json) >= 1
-    assert {row["berth_name"] for row in search_repo_json} == {git_repo.name}
-    assert "berth_name" in search_repo_json[0]
-    assert {"id", "repo_id", "berth_name", "branch", "created_at", "snippet", "objective"} <= set(
-        search_repo_json[0].keys()
-    )
-    assert search_repo_json[0]["snippet"]
-    assert json.loads(
-        _run_dock(
-            ["search", "no-such-query", "--repo", git_repo.name, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    ) == []
-
-    tag_filtered = _run_dock(
-        ["search", "Filter target objective", "--tag", "beta", "--branch", "feature/filters"],
-        cwd=tmp_path,
-        env=env,
-    )
-    assert "feature/filters" in tag_filtered.stdout
-    tag_filtered_json = json.loads(
-        _run_dock(
-            [
-                "search",
-                "Filter target objective",
-                "--tag",
-                "beta",
-                "--branch",
-                "feature/filters",
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(tag_filtered_json) == 1
-    assert tag_filtered_json[0]["branch"] == "feature/filters"
-    tag_repo_branch_table = _run_dock(
-        [
-            "search",
-            "Filter target objective",
-            "--tag",
-            "beta",
-            "--repo",
-            git_repo.name,
-            "--branch",
-            "feature/filters",
-        ],
-        cwd=tmp_path,
-        env=env,
-    ).stdout
-    assert "feature/filters" in tag_repo_branch_table
-    assert "No checkpoint matches found." not in tag_repo_branch_table
-    assert "Traceback" not in tag_repo_branch_table
-    tag_repo_branch_json = json.loads(
-        _run_dock(
-            [
-                "search",
-                "Filter target objective",
-                "--tag",
-                "beta",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                "feature/filters",
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(tag_repo_branch_json) == 1
-    assert tag_repo_branch_json[0]["branch"] == "feature/filters"
-
-
-def test_ls_json_ordering_prioritizes_open_review_count(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Harbor ordering should place slips with more open reviews first."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Main ordering baseline",
-            "--decisions",
-            "main branch context",
-            "--next-step",
-            "add review debt",
-            "--risks",
-            "none",
-            "--command",
-            "echo main",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    _run_dock(
-        ["review", "add", "--reason", "ordering_high", "--severity", "high"],
-        cwd=git_repo,
-        env=env,
-    )
-
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/no-review"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Feature ordering baseline",
-            "--decisions",
-            "feature branch context",
-            "--next-step",
-            "no review debt",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(rows) >= 2
-    assert rows[0]["open_review_count"] >= rows[1]["open_review_count"]
-    assert rows[0]["branch"] == base_branch
-
-
-def test_ls_json_ordering_uses_status_then_staleness_on_review_ties(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Harbor ordering should use status then staleness when reviews tie."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    base_branch = _git_current_branch(git_repo)
-
-    def _save_branch_checkpoint(objective: str) -> None:
-        _run_dock(
-            [
-                "save",
-                "--root",
-                str(git_repo),
-                "--no-prompt",
-                "--objective",
-                objective,
-                "--decisions",
-                "ordering context",
-                "--next-step",
-                "inspect ordering",
-                "--risks",
-                "none",
-                "--command",
-                "echo ordering",
-                "--tests-run",
-                "--tests-command",
-                "pytest -q",
-                "--build-ok",
-                "--build-command",
-                "echo build",
-                "--lint-fail",
-                "--smoke-fail",
-                "--no-auto-review",
-            ],
-            cwd=git_repo,
-            env=env,
-        )
-
-    branch_names = [
-        "feature/order-red-old",
-        "feature/order-red-new",
-        "feature/order-yellow",
-        "feature/order-green",
-    ]
-    for branch in branch_names:
-        subprocess.run(
-            ["git", "checkout", "-b", branch],
-            cwd=str(git_repo),
-            check=True,
-            capture_output=True,
-        )
-        _save_branch_checkpoint(f"Ordering checkpoint for {branch}")
-        subprocess.run(
-            ["git", "checkout", base_branch],
-            cwd=str(git_repo),
-            check=True,
-            capture_output=True,
-        )
-
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET status = ?, updated_at = ? WHERE branch = ?",
-        ("red", "2000-01-01T00:00:00+00:00", "feature/order-red-old"),
-    )
-    conn.execute(
-        "UPDATE slips SET status = ?, updated_at = ? WHERE branch = ?",
-        ("red", "2005-01-01T00:00:00+00:00", "feature/order-red-new"),
-    )
-    conn.execute(
-        "UPDATE slips SET status = ?, updated_at = ? WHERE branch = ?",
-        ("yellow", "1990-01-01T00:00:00+00:00", "feature/order-yellow"),
-    )
-    conn.execute(
-        "UPDATE slips SET status = ?, updated_at = ? WHERE branch = ?",
-        ("green", "1980-01-01T00:00:00+00:00", "feature/order-green"),
-    )
-    conn.commit()
-    conn.close()
-
-    ordered_rows = json.loads(_run_dock(["ls", "--json"], cwd=tmp_path, env=env).stdout)
-    ordered_branches = [row["branch"] for row in ordered_rows]
-    assert ordered_branches[:4] == [
-        "feature/order-red-old",
-        "feature/order-red-new",
-        "feature/order-yellow",
-        "feature/order-green",
-    ]
-
-
-def test_ls_limit_flag_restricts_result_count(git_repo: Path, tmp_path: Path) -> None:
-    """CLI `ls --limit` should cap number of returned rows."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Limit baseline one",
-            "--decisions",
-            "main branch checkpoint",
-            "--next-step",
-            "create second branch checkpoint",
-            "--risks",
-            "none",
-            "--command",
-            "echo one",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/limit-check"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Limit baseline two",
-            "--decisions",
-            "feature branch checkpoint",
-            "--next-step",
-            "run ls limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo two",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    rows = json.loads(_run_dock(["ls", "--limit", "1", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(rows) == 1
-
-
-def test_ls_and_search_validate_limit_arguments(tmp_path: Path) -> None:
-    """Limit/stale flags should reject invalid values with actionable errors."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    ls_bad = _run_dock(["ls", "--limit", "0"], cwd=tmp_path, env=env, expect_code=2)
-    ls_output = f"{ls_bad.stdout}\n{ls_bad.stderr}"
-    assert "--limit must be >= 1." in ls_output
-    assert "Traceback" not in ls_output
-
-    stale_bad = _run_dock(["ls", "--stale", "-1"], cwd=tmp_path, env=env, expect_code=2)
-    stale_output = f"{stale_bad.stdout}\n{stale_bad.stderr}"
-    assert "--stale must be >= 0." in stale_output
-    assert "Traceback" not in stale_output
-
-    search_bad = _run_dock(
-        ["search", "anything", "--limit", "0"],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    search_output = f"{search_bad.stdout}\n{search_bad.stderr}"
-    assert "--limit must be >= 1." in search_output
-    assert "Traceback" not in search_output
-
-
-def test_ls_rejects_blank_tag_filter(tmp_path: Path) -> None:
-    """LS should reject blank tag filter values when provided."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["ls", "--tag", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--tag must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
-def test_search_rejects_blank_tag_filter(tmp_path: Path) -> None:
-    """Search should reject blank tag filter values when provided."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["search", "query", "--tag", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--tag must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
-def test_ls_tag_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
-    """LS should resolve tag filters after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Trimmed ls tag objective",
-            "--decisions",
-            "Verify ls tag filter trimming",
-            "--next-step",
-            "run ls tag filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(_run_dock(["ls", "--tag", "  alpha  ", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(rows) >= 1
-
-
-def test_search_tag_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
-    """Search should resolve tag filters after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Trimmed search tag objective",
-            "--decisions",
-            "Verify search tag filter trimming",
-            "--next-step",
-            "run search tag filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            ["search", "Trimmed search tag objective", "--tag", "  alpha  ", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) >= 1
-    assert rows[0]["objective"] == "Trimmed search tag objective"
-
-
-def test_search_rejects_blank_branch_filter(git_repo: Path, tmp_path: Path) -> None:
-    """Search should reject blank branch filter values when provided."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Blank branch filter objective",
-            "--decisions",
-            "Need search context",
-            "--next-step",
-            "run invalid branch search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    failed = _run_dock(
-        ["search", "Blank branch filter objective", "--branch", "   "],
-        cwd=tmp_path,
-        env=env,
-        expect_code=2,
-    )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--branch must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
-def test_search_branch_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
-    """Search should resolve branch filters after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Trimmed branch filter objective",
-            "--decisions",
-            "Search should match trimmed branch filters",
-            "--next-step",
-            "run branch search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            ["search", "Trimmed branch filter objective", "--branch", f"  {branch}  ", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) >= 1
-    assert {row["branch"] for row in rows} == {branch}
-
-
-def test_search_repo_and_branch_filters_accept_trimmed_values(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Search should resolve trimmed repo+branch filters together."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Trimmed repo branch search objective",
-            "--decisions",
-            "Search should trim both repo and branch filters",
-            "--next-step",
-            "run combined search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            [
-                "search",
-                "Trimmed repo branch search objective",
-                "--repo",
-                f"  {git_repo.name}  ",
-                "--branch",
-                f"  {branch}  ",
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) >= 1
-    assert {row["berth_name"] for row in rows} == {git_repo.name}
-    assert {row["branch"] for row in rows} == {branch}
-
-
-def test_search_repo_branch_filter_semantics_non_json(git_repo: Path, tmp_path: Path) -> None:
-    """Search should honor combined repo+branch filters in table mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    default_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "prb-default",
-            "--decisions",
-            "default branch checkpoint for primary repo+branch filtering",
-            "--next-step",
-            "run primary repo+branch filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo default",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/primary-repo-branch-filter"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "prb-feature",
-            "--decisions",
-            "feature branch checkpoint for primary repo+branch filtering",
-            "--next-step",
-            "run primary repo+branch filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", default_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    filtered = _run_dock(
-        [
-            "search",
-            "prb",
-            "--repo",
-            git_repo.name,
-            "--branch",
-            "feature/primary-repo-branch-filter",
-        ],
-        cwd=tmp_path,
-        env=env,
-    ).stdout
-    assert "prb-feature" in filtered
-    assert "prb-default" not in filtered
-    assert "Traceback" not in filtered
-
-
-def test_search_alias_validates_limit_argument(tmp_path: Path) -> None:
-    """Search alias should enforce the same limit validation as search."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["f", "query", "--limit", "0"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--limit must be >= 1." in output
-    assert "Traceback" not in output
-
-
-def test_search_alias_rejects_blank_query(tmp_path: Path) -> None:
-    """Search alias should reject whitespace-only queries."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["f", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Query must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
-def test_search_alias_rejects_blank_tag_filter(tmp_path: Path) -> None:
-    """Search alias should reject blank tag filter values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["f", "query", "--tag", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--tag must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
-def test_search_alias_rejects_blank_repo_filter(tmp_path: Path) -> None:
-    """Search alias should reject blank repo filter values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["f", "query", "--repo", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--repo must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
-def test_search_alias_rejects_blank_branch_filter(tmp_path: Path) -> None:
-    """Search alias should reject blank branch filter values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["f", "query", "--branch", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--branch must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
-def test_search_alias_repo_filter_accepts_trimmed_berth_name(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Search alias repo filter should accept trimmed berth name values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias trimmed repo objective",
-            "--decisions",
-            "Alias repo filter should trim berth names",
-            "--next-step",
-            "run alias repo search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            ["f", "Alias trimmed repo objective", "--repo", f"  {git_repo.name}  ", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) >= 1
-    assert {row["berth_name"] for row in rows} == {git_repo.name}
-
-
-def test_search_alias_tag_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
-    """Search alias should resolve tag filters after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias trimmed tag objective",
-            "--decisions",
-            "Alias tag filter should trim values",
-            "--next-step",
-            "run alias search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(_run_dock(["f", "Alias trimmed tag objective", "--tag", "  alpha  ", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(rows) >= 1
-
-
-def test_search_alias_branch_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
-    """Search alias should resolve branch filters after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias trimmed branch objective",
-            "--decisions",
-            "Alias branch filter should trim values",
-            "--next-step",
-            "run alias branch search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            ["f", "Alias trimmed branch objective", "--branch", f"  {branch}  ", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) >= 1
-    assert {row["branch"] for row in rows} == {branch}
-
-
-def test_search_alias_repo_and_branch_filters_accept_trimmed_values(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Search alias should resolve trimmed repo+branch filters together."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias trimmed repo branch objective",
-            "--decisions",
-            "Alias filters should trim repo and branch together",
-            "--next-step",
-            "run alias repo branch search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            [
-                "f",
-                "Alias trimmed repo branch objective",
-                "--repo",
-                f"  {git_repo.name}  ",
-                "--branch",
-                f"  {branch}  ",
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) >= 1
-    assert {row["berth_name"] for row in rows} == {git_repo.name}
-    assert {row["branch"] for row in rows} == {branch}
-
-
-def test_search_alias_json_respects_limit(git_repo: Path, tmp_path: Path) -> None:
-    """Search alias JSON mode should honor --limit."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias limit objective one",
-            "--decisions",
-            "alias limit baseline one",
-            "--next-step",
-            "record first",
-            "--risks",
-            "none",
-            "--command",
-            "echo one",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/alias-limit"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias limit objective two",
-            "--decisions",
-            "alias limit baseline two",
-            "--next-step",
-            "record second",
-            "--risks",
-            "none",
-            "--command",
-            "echo two",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    rows = json.loads(_run_dock(["f", "Alias limit objective", "--limit", "1", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(rows) == 1
-
-
-def test_search_alias_limit_applies_after_tag_filter(git_repo: Path, tmp_path: Path) -> None:
-    """Search alias should apply --limit to tag-filtered result sets."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag-limit objective one",
-            "--decisions",
-            "alias tag-limit checkpoint one",
-            "--next-step",
-            "record first",
-            "--risks",
-            "none",
-            "--command",
-            "echo one",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/alias-tag-limit"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag-limit objective two",
-            "--decisions",
-            "alias tag-limit checkpoint two",
-            "--next-step",
-            "record second",
-            "--risks",
-            "none",
-            "--command",
-            "echo two",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            ["f", "Alias tag-limit objective", "--tag", "alpha", "--limit", "1", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) == 1
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_tag_filter_applies_before_limit_json(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Search JSON should apply tag filtering before truncating to --limit."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"tbf-tagged-{command_name}",
-            "--decisions",
-            "tagged baseline for filter-before-limit semantics",
-            "--next-step",
-            "run search tag+limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo tagged",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"tbf-untagged-{command_name}",
-            "--decisions",
-            "newer untagged record should be filtered before limit",
-            "--next-step",
-            "run search tag+limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo untagged",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            [command_name, "tbf-", "--tag", "alpha", "--limit", "1", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) == 1
-    assert rows[0]["objective"] == f"tbf-tagged-{command_name}"
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_tag_filter_applies_before_limit_non_json(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Search table output should apply tag filters before --limit truncation."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"tbn-tagged-{command_name}",
-            "--decisions",
-            "tagged baseline for table filter-before-limit semantics",
-            "--next-step",
-            "run table search tag+limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo tagged",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"tbn-untagged-{command_name}",
-            "--decisions",
-            "newer untagged record should be filtered before limit in table mode",
-            "--next-step",
-            "run table search tag+limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo untagged",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    output = _run_dock(
-        [command_name, "tbn-", "--tag", "alpha", "--limit", "1"],
-        cwd=tmp_path,
-        env=env,
-    ).stdout
-    assert f"tbn-tagged-{command_name}" in output
-    assert f"tbn-untagged-{command_name}" not in output
-    assert "No checkpoint matches found." not in output
-    assert "Traceback" not in output
-
-
-def test_search_alias_limit_applies_after_tag_filter_non_json(git_repo: Path, tmp_path: Path) -> None:
-    """Alias search table output should honor --tag + --limit together."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag-limit table objective one",
-            "--decisions",
-            "alias tag-limit table checkpoint one",
-            "--next-step",
-            "record first",
-            "--risks",
-            "none",
-            "--command",
-            "echo one",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/alias-tag-limit-table"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Alias tag-limit table objective two",
-            "--decisions",
-            "alias tag-limit table checkpoint two",
-            "--next-step",
-            "record second",
-            "--risks",
-            "none",
-            "--command",
-            "echo two",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    output = _run_dock(
-        ["f", "Alias tag-limit table objective", "--tag", "alpha", "--limit", "1"],
-        cwd=tmp_path,
-        env=env,
-    ).stdout
-    assert "Dockyard Search Results" in output
-    assert "No checkpoint matches found." not in output
-    assert "Traceback" not in output
-
-
-def test_search_limit_applies_after_tag_filter_non_json(git_repo: Path, tmp_path: Path) -> None:
-    """Primary search table output should honor --tag + --limit together."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "ptl-one",
-            "--decisions",
-            "primary tag-limit checkpoint one",
-            "--next-step",
-            "record first",
-            "--risks",
-            "none",
-            "--command",
-            "echo one",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/primary-tag-limit-table"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "ptl-two",
-            "--decisions",
-            "primary tag-limit checkpoint two",
-            "--next-step",
-            "record second",
-            "--risks",
-            "none",
-            "--command",
-            "echo two",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    Holds two `alpha`-tagged checkpoints on separate branches plus a newer
+    untagged one, so a limit of one can only pass if tag filtering runs first.
+    Built once per module; tests must not write to it.
+    """
+    base = tmp_path_factory.mktemp("tag_limit_corpus")
+    repo = copy_git_repo(git_repo_template, base / "repo")
+    dock_home = base / ".dockyard_data"
+    save_checkpoint(
+        dock_home,
+        repo,
+        objective="tlc-tagged-one",
+        decisions="tag-limit checkpoint one",
+        next_steps=["record first"],
+        resume_commands=["echo one"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(repo, "feature/tag-limit")
+    save_checkpoint(
+        dock_home,
+        repo,
+        objective="tlc-tagged-two",
+        decisions="tag-limit checkpoint two",
+        next_steps=["record second"],
+        resume_commands=["echo two"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    save_checkpoint(
+        dock_home,
+        repo,
+        objective="tlc-untagged",
+        decisions="newer untagged record should be filtered before limit",
+        next_steps=["record third"],
+        resume_commands=["echo untagged"],
+        verification=SAVE_VERIFICATION,
+    )
+    return dock_home
+
+
+def test_search_alias_limit_applies_after_tag_filter(
+    tag_limit_corpus: Path,
+    tmp_path: Path,
+) -> None:
+    """Search alias should apply --limit to tag-filtered result sets."""
+    rows = _invoke_dock_json(
+        ["f", "tlc", "--tag", "alpha", "--limit", "1", "--json"],
+        cwd=tmp_path,
+        env=_dock_env(tag_limit_corpus),
     )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
+    assert len(rows) == 1
+
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_tag_filter_applies_before_limit_json(
+    tag_limit_corpus: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Search JSON should apply tag filtering before truncating to --limit."""
+    rows = _invoke_dock_json(
+        [command_name, "tlc", "--tag", "alpha", "--limit", "1", "--json"],
+        cwd=tmp_path,
+        env=_dock_env(tag_limit_corpus),
     )
+    assert len(rows) == 1
+    assert rows[0]["objective"] in TAG_LIMIT_TAGGED_OBJECTIVES
 
-    output = _run_dock(
-        ["search", "ptl", "--tag", "alpha", "--limit", "1"],
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_tag_filter_applies_before_limit_non_json(
+    tag_limit_corpus: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Search table output should apply tag filters before --limit truncation."""
+    output = _invoke_dock(
+        [command_name, "tlc", "--tag", "alpha", "--limit", "1"],
         cwd=tmp_path,
-        env=env,
+        env=_dock_env(tag_limit_corpus),
+    ).stdout
+    assert any(objective in output for objective in TAG_LIMIT_TAGGED_OBJECTIVES)
+    assert "tlc-untagged" not in output
+    assert "No checkpoint matches found." not in output
+    assert "Traceback" not in output
+
+
+def test_search_alias_limit_applies_after_tag_filter_non_json(
+    tag_limit_corpus: Path,
+    tmp_path: Path,
+) -> None:
+    """Alias search table output should honor --tag + --limit together."""
+    output = _invoke_dock(
+        ["f", "tlc", "--tag", "alpha", "--limit", "1"],
+        cwd=tmp_path,
+        env=_dock_env(tag_limit_corpus),
+    ).stdout
+    assert "Dockyard Search Results" in output
+    assert "No checkpoint matches found." not in output
+    assert "Traceback" not in output
+
+
+def test_search_limit_applies_after_tag_filter_non_json(
+    tag_limit_corpus: Path,
+    tmp_path: Path,
+) -> None:
+    """Primary search table output should honor --tag + --limit together."""
+    output = _invoke_dock(
+        ["search", "tlc", "--tag", "alpha", "--limit", "1"],
+        cwd=tmp_path,
+        env=_dock_env(tag_limit_corpus),
     ).stdout
-    shows_one = "ptl-one" in output
-    shows_two = "ptl-two" in output
+    shows_one = "tlc-tagged-one" in output
+    shows_two = "tlc-tagged-two" in output
     assert shows_one ^ shows_two
     assert "Traceback" not in output
 
@@ -15820,41 +10347,22 @@ def test_search_table_long_snippet_render_is_truncated(
     command_name: str,
 ) -> None:
     """Search table output should truncate long snippet text for readability."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     long_risk = "long-snippet-token " + ("x" * 220)
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+    _invoke_dock(
+        _save_args(
+            git_repo,
             f"long-snippet-{command_name}",
-            "--decisions",
             "long snippet table rendering baseline",
-            "--next-step",
             "run search table",
-            "--risks",
-            long_risk,
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks=long_risk,
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    output = _run_dock([command_name, "long-snippet-token"], cwd=tmp_path, env=env).stdout
+    output = _invoke_dock([command_name, "long-snippet-token"], cwd=tmp_path, env=env).stdout
     assert "Dockyard Search Results" in output
     assert "long-snippet-token" in output
     assert long_risk not in output
@@ -15862,133 +10370,86 @@ def test_search_table_long_snippet_render_is_truncated(
     assert "Traceback" not in output
 
 
-def test_harbor_alias_validates_limit_argument(tmp_path: Path) -> None:
-    """Harbor alias should enforce the same limit validation as ls."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["harbor", "--limit", "0"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--limit must be >= 1." in output
-    assert "Traceback" not in output
-
-
-def test_harbor_alias_validates_stale_argument(tmp_path: Path) -> None:
-    """Harbor alias should enforce stale lower bound."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["harbor", "--stale", "-1"], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--stale must be >= 0." in output
-    assert "Traceback" not in output
-
-
-def test_harbor_alias_rejects_blank_tag_filter(tmp_path: Path) -> None:
-    """Harbor alias should reject blank tag filter values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["harbor", "--tag", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--tag must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
 def test_harbor_alias_tag_filter_accepts_trimmed_value(git_repo: Path, tmp_path: Path) -> None:
     """Harbor alias should resolve tag filters after whitespace trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Harbor trimmed tag objective",
-            "--decisions",
-            "Harbor tag filter should trim values",
-            "--next-step",
-            "run harbor filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Harbor trimmed tag objective",
+        decisions="Harbor tag filter should trim values",
+        next_steps=["run harbor filter"],
+        tags=["alpha"],
     )
 
-    rows = json.loads(_run_dock(["harbor", "--tag", "  alpha  ", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json(["harbor", "--tag", "  alpha  ", "--json"], cwd=tmp_path, env=env)
     assert len(rows) >= 1
 
 
-def test_harbor_alias_renders_unknown_status_text(git_repo: Path, tmp_path: Path) -> None:
+def test_harbor_alias_renders_unknown_status_text(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Harbor alias should render unknown slip statuses as raw text."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Unknown status harbor baseline",
-            "--decisions",
-            "Render non-standard status token",
-            "--next-step",
-            "run harbor",
-            "--risks",
-            "none",
-            "--command",
-            "echo harbor",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Unknown status harbor baseline",
+        decisions="Render non-standard status token",
+        next_steps=["run harbor"],
+        resume_commands=["echo harbor"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET status = ? WHERE branch = ?",
-        ("paused", branch),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE slips SET status = ? WHERE branch = ?", ("paused", branch))])
 
-    output = _run_dock(["harbor"], cwd=tmp_path, env=env).stdout
+    output = _invoke_dock(["harbor"], cwd=tmp_path, env=env).stdout
     assert "paused" in output
-    json_rows = json.loads(_run_dock(["harbor", "--json"], cwd=tmp_path, env=env).stdout)
+    json_rows = _invoke_dock_json(["harbor", "--json"], cwd=tmp_path, env=env)
     assert len(json_rows) == 1
     assert json_rows[0]["status"] == "paused"
 
 
+@pytest.fixture(scope="module")
+def status_slip_home(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    git_repo_template: Path,
+    git_template_branch: str,
+) -> tuple[Path, str]:
+    """Return a read-only Dockyard home whose only slip has status `request.param`.
+
+    Parametrized indirectly by status value, so each value is seeded once per
+    module and shared by every dashboard command path that renders it.
+    Tests must not write to the returned home.
+    """
+    status_value = request.param
+    dock_home = tmp_path_factory.mktemp("status_slip") / ".dockyard_data"
+    save_checkpoint(
+        dock_home,
+        git_repo_template,
+        objective="Dashboard status token baseline",
+        decisions="Render stored status tokens across dashboard paths",
+        next_steps=["run dashboard paths"],
+        resume_commands=["echo dashboard"],
+        verification=SAVE_VERIFICATION,
+    )
+    _mutate_dock_db(
+        dock_home / "db" / "index.sqlite",
+        [("UPDATE slips SET status = ? WHERE branch = ?", (status_value, git_template_branch))],
+    )
+    return dock_home, status_value
+
+
+@pytest.mark.parametrize("status_slip_home", ["paused"], indirect=True)
 @pytest.mark.parametrize(
     ("command_prefix", "label"),
     [
@@ -15998,118 +10459,55 @@ def test_harbor_alias_renders_unknown_status_text(git_repo: Path, tmp_path: Path
     ],
 )
 def test_dashboard_paths_render_unknown_status_text(
-    git_repo: Path,
+    status_slip_home: tuple[Path, str],
     tmp_path: Path,
     command_prefix: list[str],
     label: str,
 ) -> None:
     """Dashboard command paths should preserve unknown status tokens."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Dashboard {label} unknown status baseline",
-            "--decisions",
-            "Render non-standard status token across dashboard paths",
-            "--next-step",
-            "run dashboard views",
-            "--risks",
-            "none",
-            "--command",
-            "echo dashboard",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET status = ? WHERE branch = ?",
-        ("paused", branch),
-    )
-    conn.commit()
-    conn.close()
+    dock_home, status_value = status_slip_home
+    env = _dock_env(dock_home)
 
     table_output = _run_dock(command_prefix, cwd=tmp_path, env=env)
     assert "paused" in table_output.stdout
-    assert "Traceback" not in f"{table_output.stdout}\n{table_output.stderr}"
+    _assert_no_traceback(table_output)
 
-    json_rows = json.loads(_run_dock([*command_prefix, "--json"], cwd=tmp_path, env=env).stdout)
+    json_rows = _run_dock_json([*command_prefix, "--json"], cwd=tmp_path, env=env)
     assert len(json_rows) == 1
-    assert json_rows[0]["status"] == "paused"
+    assert json_rows[0]["status"] == status_value
 
 
-def test_harbor_alias_maps_short_status_token(git_repo: Path, tmp_path: Path) -> None:
+def test_harbor_alias_maps_short_status_token(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Harbor alias should map short status token values to known badges."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Harbor short status token baseline",
-            "--decisions",
-            "Map short status tokens in harbor rendering",
-            "--next-step",
-            "run harbor",
-            "--risks",
-            "none",
-            "--command",
-            "echo harbor",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Harbor short status token baseline",
+        decisions="Map short status tokens in harbor rendering",
+        next_steps=["run harbor"],
+        resume_commands=["echo harbor"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET status = ? WHERE branch = ?",
-        (" y ", branch),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE slips SET status = ? WHERE branch = ?", (" y ", branch))])
 
-    output = _run_dock(["harbor"], cwd=tmp_path, env=env).stdout
+    output = _invoke_dock(["harbor"], cwd=tmp_path, env=env).stdout
     assert " Y " in f" {output} "
-    json_rows = json.loads(_run_dock(["harbor", "--json"], cwd=tmp_path, env=env).stdout)
+    json_rows = _invoke_dock_json(["harbor", "--json"], cwd=tmp_path, env=env)
     assert len(json_rows) == 1
     assert json_rows[0]["status"] == " y "
 
 
+@pytest.mark.parametrize("status_slip_home", [" y "], ids=["padded_short_token"], indirect=True)
 @pytest.mark.parametrize(
     ("command_prefix", "label"),
     [
@@ -16119,70 +10517,30 @@ def test_harbor_alias_maps_short_status_token(git_repo: Path, tmp_path: Path) ->
     ],
 )
 def test_dashboard_paths_map_short_status_token(
-    git_repo: Path,
-    tmp_path: Path,
-    command_prefix: list[str],
-    label: str,
-) -> None:
-    """Dashboard command paths should map known short status tokens."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Dashboard {label} short status token baseline",
-            "--decisions",
-            "Map short status token across dashboard paths",
-            "--next-step",
-            "run dashboard paths",
-            "--risks",
-            "none",
-            "--command",
-            "echo dashboard",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET status = ? WHERE branch = ?",
-        (" y ", branch),
-    )
-    conn.commit()
-    conn.close()
+    status_slip_home: tuple[Path, str],
+    tmp_path: Path,
+    command_prefix: list[str],
+    label: str,
+) -> None:
+    """Dashboard command paths should map known short status tokens."""
+    dock_home, status_value = status_slip_home
+    env = _dock_env(dock_home)
 
     output = _run_dock(command_prefix, cwd=tmp_path, env=env).stdout
     assert " Y " in f" {output} "
-    json_rows = json.loads(_run_dock([*command_prefix, "--json"], cwd=tmp_path, env=env).stdout)
+    json_rows = _run_dock_json([*command_prefix, "--json"], cwd=tmp_path, env=env)
     assert len(json_rows) == 1
-    assert json_rows[0]["status"] == " y "
+    assert json_rows[0]["status"] == status_value
 
 
 @pytest.mark.parametrize(
-    ("status_value", "expected_table_fragment"),
+    ("status_slip_home", "expected_table_fragment"),
     [
         ("  paused  ", "paused"),
         ("paused\nreview", "paused review"),
     ],
     ids=["trimmed_unknown_status", "multiline_unknown_status"],
+    indirect=["status_slip_home"],
 )
 @pytest.mark.parametrize(
     ("command_prefix", "label"),
@@ -16193,114 +10551,54 @@ def test_dashboard_paths_map_short_status_token(
     ],
 )
 def test_dashboard_paths_normalize_unknown_status_text(
-    git_repo: Path,
+    status_slip_home: tuple[Path, str],
     tmp_path: Path,
-    status_value: str,
     expected_table_fragment: str,
     command_prefix: list[str],
     label: str,
 ) -> None:
     """Dashboard command paths should normalize unknown status text in tables."""
-    env = dict(os.environ)
-    dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Dashboard {label} normalized unknown status baseline",
-            "--decisions",
-            "Normalize unknown status text across dashboard paths",
-            "--next-step",
-            "run dashboard paths",
-            "--risks",
-            "none",
-            "--command",
-            "echo dashboard",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET status = ? WHERE branch = ?",
-        (status_value, branch),
-    )
-    conn.commit()
-    conn.close()
+    dock_home, status_value = status_slip_home
+    env = _dock_env(dock_home)
 
     output = _run_dock(command_prefix, cwd=tmp_path, env=env).stdout
     assert expected_table_fragment in output
     assert "Traceback" not in output
 
-    json_rows = json.loads(_run_dock([*command_prefix, "--json"], cwd=tmp_path, env=env).stdout)
+    json_rows = _run_dock_json([*command_prefix, "--json"], cwd=tmp_path, env=env)
     assert len(json_rows) == 1
     assert json_rows[0]["status"] == status_value
 
 
-def test_harbor_alias_compacts_multiline_branch_text(git_repo: Path, tmp_path: Path) -> None:
+def test_harbor_alias_compacts_multiline_branch_text(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Harbor alias should compact multiline branch values in table output."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Harbor multiline branch baseline",
-            "--decisions",
-            "Normalize multiline branch text in harbor output",
-            "--next-step",
-            "run harbor",
-            "--risks",
-            "none",
-            "--command",
-            "echo harbor",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Harbor multiline branch baseline",
+        decisions="Normalize multiline branch text in harbor output",
+        next_steps=["run harbor"],
+        resume_commands=["echo harbor"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET branch = ? WHERE branch = ?",
-        ("feature/\nharbor", branch),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE slips SET branch = ? WHERE branch = ?", ("feature/\nharbor", branch)),
+        ],
     )
-    conn.commit()
-    conn.close()
 
-    output = _run_dock(["harbor"], cwd=tmp_path, env=env).stdout
+    output = _invoke_dock(["harbor"], cwd=tmp_path, env=env).stdout
     assert "feature/ harbor" in output
 
 
@@ -16317,156 +10615,94 @@ def test_dashboard_paths_compact_multiline_branch_text(
     tmp_path: Path,
     command_prefix: list[str],
     label: str,
+    git_template_branch: str,
 ) -> None:
     """Dashboard command paths should compact multiline branch values in tables."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"dmb-{label}",
-            "--decisions",
-            "Normalize multiline branch text across dashboard output paths",
-            "--next-step",
-            "run dashboard path",
-            "--risks",
-            "none",
-            "--command",
-            "echo dashboard",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"dmb-{label}",
+        decisions="Normalize multiline branch text across dashboard output paths",
+        next_steps=["run dashboard path"],
+        resume_commands=["echo dashboard"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET branch = ? WHERE branch = ?",
-        ("feature/\nharbor", branch),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE slips SET branch = ? WHERE branch = ?", ("feature/\nharbor", branch)),
+        ],
     )
-    conn.commit()
-    conn.close()
 
     output = _run_dock(command_prefix, cwd=tmp_path, env=env).stdout
     assert "feature/ harbor" in output
-    rows = json.loads(_run_dock([*command_prefix, "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _run_dock_json([*command_prefix, "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert rows[0]["branch"] == "feature/\nharbor"
 
 
-def test_harbor_alias_falls_back_for_blank_branch_text(git_repo: Path, tmp_path: Path) -> None:
+def test_harbor_alias_falls_back_for_blank_branch_text(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Harbor alias should show unknown label when slip branch is blank."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Harbor blank branch baseline",
-            "--decisions",
-            "Fallback branch rendering should remain explicit",
-            "--next-step",
-            "run harbor",
-            "--risks",
-            "none",
-            "--command",
-            "echo harbor",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Harbor blank branch baseline",
+        decisions="Fallback branch rendering should remain explicit",
+        next_steps=["run harbor"],
+        resume_commands=["echo harbor"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET branch = ? WHERE branch = ?",
-        ("   ", branch),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE slips SET branch = ? WHERE branch = ?", ("   ", branch))])
 
-    output = _run_dock(["harbor"], cwd=tmp_path, env=env).stdout
+    output = _invoke_dock(["harbor"], cwd=tmp_path, env=env).stdout
     assert "(unknown)" in output
 
 
-def test_harbor_alias_falls_back_for_blank_timestamp(git_repo: Path, tmp_path: Path) -> None:
+def test_harbor_alias_falls_back_for_blank_timestamp(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Harbor alias should show unknown age when slip timestamp is blank."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Harbor blank timestamp baseline",
-            "--decisions",
-            "Fallback timestamp rendering should remain explicit",
-            "--next-step",
-            "run harbor",
-            "--risks",
-            "none",
-            "--command",
-            "echo harbor",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Harbor blank timestamp baseline",
+        decisions="Fallback timestamp rendering should remain explicit",
+        next_steps=["run harbor"],
+        resume_commands=["echo harbor"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET updated_at = ? WHERE branch = ?",
-        ("   ", branch),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE slips SET updated_at = ? WHERE branch = ?", ("   ", branch)),
+        ],
     )
-    conn.commit()
-    conn.close()
 
-    output = _run_dock(["harbor"], cwd=tmp_path, env=env).stdout
+    output = _invoke_dock(["harbor"], cwd=tmp_path, env=env).stdout
     assert "unknown" in output
 
 
@@ -16483,56 +10719,30 @@ def test_dashboard_paths_fallback_for_blank_branch_text(
     tmp_path: Path,
     command_prefix: list[str],
     label: str,
+    git_template_branch: str,
 ) -> None:
     """Dashboard command paths should show unknown label for blank branch text."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"dbbb-{label}",
-            "--decisions",
-            "Fallback branch rendering should remain explicit across dashboard paths",
-            "--next-step",
-            "run dashboard path",
-            "--risks",
-            "none",
-            "--command",
-            "echo dashboard",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"dbbb-{label}",
+        decisions="Fallback branch rendering should remain explicit across dashboard paths",
+        next_steps=["run dashboard path"],
+        resume_commands=["echo dashboard"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET branch = ? WHERE branch = ?",
-        ("   ", branch),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE slips SET branch = ? WHERE branch = ?", ("   ", branch))])
 
     output = _run_dock(command_prefix, cwd=tmp_path, env=env).stdout
     assert "(unknown)" in output
     assert "Traceback" not in output
-    rows = json.loads(_run_dock([*command_prefix, "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _run_dock_json([*command_prefix, "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert rows[0]["branch"].strip() == ""
 
@@ -16550,469 +10760,269 @@ def test_dashboard_paths_fallback_for_blank_updated_timestamp(
     tmp_path: Path,
     command_prefix: list[str],
     label: str,
+    git_template_branch: str,
 ) -> None:
     """Dashboard command paths should show unknown age for blank timestamps."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"dbbt-{label}",
-            "--decisions",
-            "Fallback timestamp rendering should remain explicit across dashboard paths",
-            "--next-step",
-            "run dashboard path",
-            "--risks",
-            "none",
-            "--command",
-            "echo dashboard",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET updated_at = ? WHERE branch = ?",
-        ("   ", branch),
-    )
-    conn.commit()
-    conn.close()
-
-    output = _run_dock(command_prefix, cwd=tmp_path, env=env).stdout
-    assert "unknown" in output
-    assert "Traceback" not in output
-    rows = json.loads(_run_dock([*command_prefix, "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(rows) == 1
-    assert rows[0]["updated_at"].strip() == ""
-
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-def test_ls_stale_zero_is_accepted(git_repo: Path, tmp_path: Path) -> None:
-    """Stale threshold of zero days should be valid input."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Stale zero baseline",
-            "--decisions",
-            "Need one slip to query",
-            "--next-step",
-            "run ls stale 0",
-            "--risks",
-            "none",
-            "--command",
-            "echo stale",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"dbbt-{label}",
+        decisions="Fallback timestamp rendering should remain explicit across dashboard paths",
+        next_steps=["run dashboard path"],
+        resume_commands=["echo dashboard"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    db_path = dock_home / "db" / "index.sqlite"
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE slips SET updated_at = ? WHERE branch = ?", ("   ", branch)),
         ],
-        cwd=git_repo,
-        env=env,
     )
-    result = _run_dock(["ls", "--stale", "0", "--json"], cwd=tmp_path, env=env)
+
+    output = _run_dock(command_prefix, cwd=tmp_path, env=env).stdout
+    assert "unknown" in output
+    assert "Traceback" not in output
+    rows = _run_dock_json([*command_prefix, "--json"], cwd=tmp_path, env=env)
+    assert len(rows) == 1
+    assert rows[0]["updated_at"].strip() == ""
+
+
+def test_ls_stale_zero_is_accepted(git_repo: Path, tmp_path: Path) -> None:
+    """Stale threshold of zero days should be valid input."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Stale zero baseline",
+        decisions="Need one slip to query",
+        next_steps=["run ls stale 0"],
+        resume_commands=["echo stale"],
+        verification=SAVE_VERIFICATION,
+    )
+    result = _invoke_dock(["ls", "--stale", "0", "--json"], cwd=tmp_path, env=env)
     rows = json.loads(result.stdout)
     assert len(rows) >= 1
 
 
 def test_harbor_stale_zero_is_accepted(git_repo: Path, tmp_path: Path) -> None:
     """Harbor alias should accept stale threshold of zero days."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Harbor stale zero baseline",
-            "--decisions",
-            "Need one slip for harbor stale 0",
-            "--next-step",
-            "run harbor stale 0",
-            "--risks",
-            "none",
-            "--command",
-            "echo stale",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Harbor stale zero baseline",
+        decisions="Need one slip for harbor stale 0",
+        next_steps=["run harbor stale 0"],
+        resume_commands=["echo stale"],
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(_run_dock(["harbor", "--stale", "0", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json(["harbor", "--stale", "0", "--json"], cwd=tmp_path, env=env)
     assert len(rows) >= 1
 
 
-def test_ls_stale_handles_naive_updated_timestamp(git_repo: Path, tmp_path: Path) -> None:
+def test_ls_stale_handles_naive_updated_timestamp(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Stale filtering should handle naive updated timestamps without crashing."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Naive stale timestamp baseline",
-            "--decisions",
-            "Ensure stale filter supports naive timestamps",
-            "--next-step",
-            "run ls stale 1",
-            "--risks",
-            "none",
-            "--command",
-            "echo stale",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Naive stale timestamp baseline",
+        decisions="Ensure stale filter supports naive timestamps",
+        next_steps=["run ls stale 1"],
+        resume_commands=["echo stale"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET updated_at = ? WHERE branch = ?",
-        ("2000-01-01T00:00:00", branch),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE slips SET updated_at = ? WHERE branch = ?", ("2000-01-01T00:00:00", branch)),
+        ],
     )
-    conn.commit()
-    conn.close()
 
-    rows = json.loads(_run_dock(["ls", "--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json(["ls", "--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert rows[0]["branch"] == branch
-    harbor_rows = json.loads(_run_dock(["harbor", "--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    harbor_rows = _invoke_dock_json(["harbor", "--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert len(harbor_rows) == 1
     assert harbor_rows[0]["branch"] == branch
-    callback_rows = json.loads(_run_dock(["--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    callback_rows = _invoke_dock_json(["--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert len(callback_rows) == 1
     assert callback_rows[0]["branch"] == branch
 
 
-def test_ls_stale_skips_invalid_updated_timestamp(git_repo: Path, tmp_path: Path) -> None:
+def test_ls_stale_skips_invalid_updated_timestamp(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Stale filtering should skip slips with invalid updated_at timestamps."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Invalid stale timestamp baseline",
-            "--decisions",
-            "Ensure invalid stale timestamps are skipped",
-            "--next-step",
-            "run ls stale 1",
-            "--risks",
-            "none",
-            "--command",
-            "echo stale",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Invalid stale timestamp baseline",
+        decisions="Ensure invalid stale timestamps are skipped",
+        next_steps=["run ls stale 1"],
+        resume_commands=["echo stale"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET updated_at = ? WHERE branch = ?",
-        ("not-a-timestamp", branch),
+    _mutate_dock_db(
+        db_path,
+        [
+            ("UPDATE slips SET updated_at = ? WHERE branch = ?", ("not-a-timestamp", branch)),
+        ],
     )
-    conn.commit()
-    conn.close()
 
-    ls_rows = json.loads(_run_dock(["ls", "--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    ls_rows = _invoke_dock_json(["ls", "--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert ls_rows == []
-    harbor_rows = json.loads(_run_dock(["harbor", "--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    harbor_rows = _invoke_dock_json(["harbor", "--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert harbor_rows == []
-    callback_rows = json.loads(_run_dock(["--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    callback_rows = _invoke_dock_json(["--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert callback_rows == []
 
 
-def test_ls_stale_skips_non_string_updated_timestamp(git_repo: Path, tmp_path: Path) -> None:
+def test_ls_stale_skips_non_string_updated_timestamp(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Stale filtering should skip slips with non-string updated_at values."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
-    branch = _git_current_branch(git_repo)
+    env = _dock_env(dock_home)
+    branch = git_template_branch
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Numeric stale timestamp baseline",
-            "--decisions",
-            "Ensure non-string stale timestamps are skipped",
-            "--next-step",
-            "run harbor stale 1",
-            "--risks",
-            "none",
-            "--command",
-            "echo stale",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Numeric stale timestamp baseline",
+        decisions="Ensure non-string stale timestamps are skipped",
+        next_steps=["run harbor stale 1"],
+        resume_commands=["echo stale"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE slips SET updated_at = ? WHERE branch = ?",
-        (0, branch),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE slips SET updated_at = ? WHERE branch = ?", (0, branch))])
 
-    ls_rows = json.loads(_run_dock(["ls", "--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    ls_rows = _invoke_dock_json(["ls", "--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert ls_rows == []
-    harbor_rows = json.loads(_run_dock(["harbor", "--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    harbor_rows = _invoke_dock_json(["harbor", "--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert harbor_rows == []
-    callback_rows = json.loads(_run_dock(["--stale", "1", "--json"], cwd=tmp_path, env=env).stdout)
+    callback_rows = _invoke_dock_json(["--stale", "1", "--json"], cwd=tmp_path, env=env)
     assert callback_rows == []
 
 
-def test_ls_json_limit_and_tag_combination(git_repo: Path, tmp_path: Path) -> None:
+def test_ls_json_limit_and_tag_combination(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Combined ls filters should still obey limit and tag constraints."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "ls-tag-limit-alpha-one",
-            "--decisions",
-            "alpha branch context",
-            "--next-step",
-            "seed alpha tag",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/alpha-two"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "ls-tag-limit-alpha-two",
-            "--decisions",
-            "alpha second branch context",
-            "--next-step",
-            "seed second alpha tag",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha-two",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    rows = json.loads(
-        _run_dock(["ls", "--tag", "alpha", "--limit", "1", "--json"], cwd=tmp_path, env=env).stdout
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="ls-tag-limit-alpha-one",
+        decisions="alpha branch context",
+        next_steps=["seed alpha tag"],
+        resume_commands=["echo alpha"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    _checkout_new_branch(git_repo, "feature/alpha-two")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="ls-tag-limit-alpha-two",
+        decisions="alpha second branch context",
+        next_steps=["seed second alpha tag"],
+        resume_commands=["echo alpha-two"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    rows = _invoke_dock_json(
+        ["ls", "--tag", "alpha", "--limit", "1", "--json"], cwd=tmp_path, env=env
     )
     assert len(rows) == 1
     assert "alpha" in rows[0]["tags"]
-    table_output = _run_dock(["ls", "--tag", "alpha", "--limit", "1"], cwd=tmp_path, env=env).stdout
+    table_output = _invoke_dock(
+        ["ls", "--tag", "alpha", "--limit", "1"], cwd=tmp_path, env=env
+    ).stdout
     shows_base_branch = base_branch in table_output
     shows_feature_branch = "feature/alpha-two" in table_output
     assert shows_base_branch ^ shows_feature_branch
     assert "No checkpoints yet." not in table_output
-    assert "Traceback" not in table_output
-
-
-def test_search_rejects_blank_query(tmp_path: Path) -> None:
-    """Search should reject whitespace-only query strings."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    failed = _run_dock(["search", "   "], cwd=tmp_path, env=env, expect_code=2)
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "Query must be a non-empty string." in output
-    assert "Traceback" not in output
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_no_matches_is_informative(tmp_path: Path, command_name: str) -> None:
-    """Search aliases should display explicit no-match message when empty."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    result = _run_dock([command_name, "nothing-will-match"], cwd=tmp_path, env=env)
-    assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_filtered_no_matches_is_informative(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Search aliases should keep no-match guidance when filters eliminate results."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Filtered no-match objective",
-            "--decisions",
-            "Filtered no-match decisions",
-            "--next-step",
-            "run filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "present-tag",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    assert "Traceback" not in table_output
+
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_no_matches_is_informative(tmp_path: Path, command_name: str) -> None:
+    """Search aliases should display explicit no-match message when empty."""
+    env = _dock_env(tmp_path / ".dockyard_data")
+
+    result = _invoke_dock([command_name, "nothing-will-match"], cwd=tmp_path, env=env)
+    assert "No checkpoint matches found." in result.stdout
+    _assert_no_traceback(result)
+
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_filtered_no_matches_is_informative(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Search aliases should keep no-match guidance when filters eliminate results."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Filtered no-match objective",
+        decisions="Filtered no-match decisions",
+        next_steps=["run filtered search"],
+        tags=["present-tag"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Filtered no-match objective", "--tag", "missing-tag"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17022,48 +11032,26 @@ def test_search_filtered_limit_no_matches_is_informative(
     command_name: str,
 ) -> None:
     """Search aliases should keep no-match guidance for filtered+limit misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Filtered limit no-match objective",
-            "--decisions",
-            "Filtered limit no-match decisions",
-            "--next-step",
-            "run filtered limit search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "present-tag",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Filtered limit no-match objective",
+        decisions="Filtered limit no-match decisions",
+        next_steps=["run filtered limit search"],
+        tags=["present-tag"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Filtered limit no-match objective", "--tag", "missing-tag", "--limit", "1"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_output_falls_back_for_blank_timestamp(
@@ -17071,47 +11059,22 @@ def test_search_output_falls_back_for_blank_timestamp(
     tmp_path: Path,
 ) -> None:
     """Search output should show unknown timestamp when created_at is blank."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Search blank timestamp objective",
-            "--decisions",
-            "Verify fallback timestamp rendering for search",
-            "--next-step",
-            "run search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Search blank timestamp objective",
+        decisions="Verify fallback timestamp rendering for search",
+        next_steps=["run search"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute("UPDATE checkpoints SET created_at = ?", ("   ",))
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE checkpoints SET created_at = ?", ("   ",))])
 
-    result = _run_dock(["search", "Search blank timestamp objective"], cwd=tmp_path, env=env)
+    result = _invoke_dock(["search", "Search blank timestamp objective"], cwd=tmp_path, env=env)
     assert "(unknown)" in result.stdout
 
 
@@ -17120,59 +11083,33 @@ def test_search_output_falls_back_for_blank_branch(
     tmp_path: Path,
 ) -> None:
     """Search output should show unknown branch when checkpoint branch is blank."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Search blank branch objective",
-            "--decisions",
-            "Verify fallback branch rendering for search",
-            "--next-step",
-            "run search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Search blank branch objective",
+        decisions="Verify fallback branch rendering for search",
+        next_steps=["run search"],
+        verification=SAVE_VERIFICATION,
     )
 
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute("UPDATE checkpoints SET branch = ?", ("   ",))
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE checkpoints SET branch = ?", ("   ",))])
 
-    result = _run_dock(["search", "Search blank branch objective"], cwd=tmp_path, env=env)
+    result = _invoke_dock(["search", "Search blank branch objective"], cwd=tmp_path, env=env)
     assert "(unknown)" in result.stdout
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
 def test_search_no_matches_json_returns_empty_array(tmp_path: Path, command_name: str) -> None:
     """JSON search aliases should remain machine-parseable when empty."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    result = _run_dock([command_name, "nothing-will-match", "--json"], cwd=tmp_path, env=env)
+    result = _invoke_dock([command_name, "nothing-will-match", "--json"], cwd=tmp_path, env=env)
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17182,48 +11119,26 @@ def test_search_filtered_no_matches_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Filtered JSON search aliases should remain [] when no rows survive."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Filtered no-match json objective",
-            "--decisions",
-            "Filtered no-match json decisions",
-            "--next-step",
-            "run filtered search json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "present-tag",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Filtered no-match json objective",
+        decisions="Filtered no-match json decisions",
+        next_steps=["run filtered search json"],
+        tags=["present-tag"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Filtered no-match json objective", "--tag", "missing-tag", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17233,48 +11148,26 @@ def test_search_filtered_limit_no_matches_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Filtered+limit JSON search aliases should remain [] when no rows survive."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Filtered limit no-match json objective",
-            "--decisions",
-            "Filtered limit no-match json decisions",
-            "--next-step",
-            "run filtered limit search json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "present-tag",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Filtered limit no-match json objective",
+        decisions="Filtered limit no-match json decisions",
+        next_steps=["run filtered limit search json"],
+        tags=["present-tag"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Filtered limit no-match json objective", "--tag", "missing-tag", "--limit", "1", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17284,46 +11177,25 @@ def test_search_repo_filter_no_match_is_informative(
     command_name: str,
 ) -> None:
     """Search aliases should show no-match guidance for repo filter misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo filter no-match objective",
-            "--decisions",
-            "Repo filter no-match decisions",
-            "--next-step",
-            "run repo filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Repo filter no-match objective",
+        decisions="Repo filter no-match decisions",
+        next_steps=["run repo filtered search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Repo filter no-match objective", "--repo", "missing-berth"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17333,95 +11205,53 @@ def test_search_repo_filter_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases should return [] for repo-filtered no-match JSON paths."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo filter no-match json objective",
-            "--decisions",
-            "Repo filter no-match json decisions",
-            "--next-step",
-            "run repo filtered search json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    result = _run_dock(
-        [command_name, "Repo filter no-match json objective", "--repo", "missing-berth", "--json"],
-        cwd=tmp_path,
-        env=env,
-    )
-    assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_repo_filter_limit_no_match_is_informative(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Search aliases should keep no-match guidance for repo+limit misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo filter limit message objective",
-            "--decisions",
-            "Repo filter limit message decisions",
-            "--next-step",
-            "run repo limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Repo filter no-match json objective",
+        decisions="Repo filter no-match json decisions",
+        next_steps=["run repo filtered search json"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
+        [command_name, "Repo filter no-match json objective", "--repo", "missing-berth", "--json"],
+        cwd=tmp_path,
         env=env,
     )
+    assert json.loads(result.stdout) == []
+    _assert_no_traceback(result)
 
-    result = _run_dock(
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_repo_filter_limit_no_match_is_informative(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Search aliases should keep no-match guidance for repo+limit misses."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Repo filter limit message objective",
+        decisions="Repo filter limit message decisions",
+        next_steps=["run repo limit filtered search"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
         [command_name, "Repo filter limit message objective", "--repo", "missing-berth", "--limit", "1"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17431,46 +11261,25 @@ def test_search_repo_filter_limit_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases JSON should return [] for repo+limit no-match paths."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo filter limit no-match json objective",
-            "--decisions",
-            "Repo filter limit no-match json decisions",
-            "--next-step",
-            "run repo limit filtered search json",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Repo filter limit no-match json objective",
+        decisions="Repo filter limit no-match json decisions",
+        next_steps=["run repo limit filtered search json"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Repo filter limit no-match json objective", "--repo", "missing-berth", "--limit", "1", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17480,40 +11289,19 @@ def test_search_repo_branch_filter_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases should return [] for combined repo+branch filter misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo branch filter no-match objective",
-            "--decisions",
-            "Repo branch filter no-match decisions",
-            "--next-step",
-            "run repo branch filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Repo branch filter no-match objective",
+        decisions="Repo branch filter no-match decisions",
+        next_steps=["run repo branch filtered search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             command_name,
             "Repo branch filter no-match objective",
@@ -17527,7 +11315,7 @@ def test_search_repo_branch_filter_no_match_json_returns_empty_array(
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17537,40 +11325,19 @@ def test_search_repo_branch_filter_limit_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases JSON should return [] for repo+branch+limit misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo branch filter limit no-match objective",
-            "--decisions",
-            "Repo branch filter limit no-match decisions",
-            "--next-step",
-            "run repo branch limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Repo branch filter limit no-match objective",
+        decisions="Repo branch filter limit no-match decisions",
+        next_steps=["run repo branch limit filtered search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             command_name,
             "Repo branch filter limit no-match objective",
@@ -17586,7 +11353,7 @@ def test_search_repo_branch_filter_limit_no_match_json_returns_empty_array(
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17596,40 +11363,19 @@ def test_search_repo_branch_filter_no_match_is_informative(
     command_name: str,
 ) -> None:
     """Search aliases should show no-match guidance for repo+branch misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo branch filter message objective",
-            "--decisions",
-            "Repo branch filter message decisions",
-            "--next-step",
-            "run repo branch filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Repo branch filter message objective",
+        decisions="Repo branch filter message decisions",
+        next_steps=["run repo branch filtered search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             command_name,
             "Repo branch filter message objective",
@@ -17642,7 +11388,7 @@ def test_search_repo_branch_filter_no_match_is_informative(
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -17652,40 +11398,19 @@ def test_search_repo_branch_filter_limit_no_match_is_informative(
     command_name: str,
 ) -> None:
     """Search aliases should keep no-match guidance for repo+branch+limit misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Repo branch filter limit message objective",
-            "--decisions",
-            "Repo branch filter limit message decisions",
-            "--next-step",
-            "run repo branch limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Repo branch filter limit message objective",
+        decisions="Repo branch filter limit message decisions",
+        next_steps=["run repo branch limit filtered search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             command_name,
             "Repo branch filter limit message objective",
@@ -17700,50 +11425,26 @@ def test_search_repo_branch_filter_limit_no_match_is_informative(
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 def test_search_repo_filter_accepts_trimmed_berth_name(git_repo: Path, tmp_path: Path) -> None:
     """Search repo filter should accept berth names with surrounding spaces."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Trimmed repo filter objective",
-            "--decisions",
-            "Search should resolve trimmed berth-name filters",
-            "--next-step",
-            "run search repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Trimmed repo filter objective",
+        decisions="Search should resolve trimmed berth-name filters",
+        next_steps=["run search repo filter"],
     )
 
-    rows = json.loads(
-        _run_dock(
-            ["search", "Trimmed repo filter objective", "--repo", f"  {git_repo.name}  ", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    rows = _invoke_dock_json(
+        ["search", "Trimmed repo filter objective", "--repo", f"  {git_repo.name}  ", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(rows) >= 1
     assert {row["berth_name"] for row in rows} == {git_repo.name}
@@ -17751,144 +11452,63 @@ def test_search_repo_filter_accepts_trimmed_berth_name(git_repo: Path, tmp_path:
 
 def test_search_rejects_blank_repo_filter(git_repo: Path, tmp_path: Path) -> None:
     """Search should reject blank repo filter values when provided."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Blank repo filter validation objective",
-            "--decisions",
-            "Need context for search command",
-            "--next-step",
-            "run invalid search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Blank repo filter validation objective",
+        decisions="Need context for search command",
+        next_steps=["run invalid search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    failed = _run_dock(
+    failed = _invoke_dock(
         ["search", "Blank repo filter validation objective", "--repo", "   "],
         cwd=tmp_path,
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "--repo must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "--repo must be a non-empty string.")
 
 
 def test_search_repo_filter_semantics_non_json_across_multiple_berths(
     git_repo: Path,
+    git_repo_template: Path,
     tmp_path: Path,
 ) -> None:
     """Search should keep repo-filtered table output scoped to one berth."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "psrf-target",
-            "--decisions",
-            "target berth checkpoint for repo filter semantics",
-            "--next-step",
-            "run primary repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo target",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    other_repo = tmp_path / "other-repo"
-    other_repo.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "dockyard@example.com"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Dockyard Test"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", "git@github.com:org/other.git"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="psrf-target",
+        decisions="target berth checkpoint for repo filter semantics",
+        next_steps=["run primary repo filter"],
+        resume_commands=["echo target"],
+        verification=SAVE_VERIFICATION,
     )
-    (other_repo / "README.md").write_text("seed\n", encoding="utf-8")
-    subprocess.run(["git", "add", "README.md"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=str(other_repo), check=True, capture_output=True)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(other_repo),
-            "--no-prompt",
-            "--objective",
-            "psrf-other",
-            "--decisions",
-            "other berth checkpoint for repo filter semantics",
-            "--next-step",
-            "run primary repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo other",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=other_repo,
-        env=env,
+    other_repo = _copy_git_repo_template(
+        git_repo_template,
+        tmp_path / "other-repo",
+        "git@github.com:org/other.git",
     )
 
-    table_output = _run_dock(
+    save_checkpoint(
+        dock_home,
+        other_repo,
+        objective="psrf-other",
+        decisions="other berth checkpoint for repo filter semantics",
+        next_steps=["run primary repo filter"],
+        resume_commands=["echo other"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    table_output = _invoke_dock(
         ["search", "psrf", "--repo", git_repo.name],
         cwd=tmp_path,
         env=env,
@@ -17897,12 +11517,10 @@ def test_search_repo_filter_semantics_non_json_across_multiple_berths(
     assert "psrf-other" not in table_output
     assert "Traceback" not in table_output
 
-    rows = json.loads(
-        _run_dock(
-            ["search", "psrf", "--repo", git_repo.name, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    rows = _invoke_dock_json(
+        ["search", "psrf", "--repo", git_repo.name, "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(rows) == 1
     assert rows[0]["objective"] == "psrf-target"
@@ -17922,12 +11540,10 @@ def test_search_repo_filter_semantics_non_json_across_multiple_berths(
     conn.commit()
     conn.close()
 
-    repo_id_rows = json.loads(
-        _run_dock(
-            ["search", "psrf", "--repo", target_repo_id, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    repo_id_rows = _invoke_dock_json(
+        ["search", "psrf", "--repo", target_repo_id, "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(repo_id_rows) == 1
     assert repo_id_rows[0]["repo_id"] == target_repo_id
@@ -17936,98 +11552,40 @@ def test_search_repo_filter_semantics_non_json_across_multiple_berths(
 
 def test_search_alias_repo_filter_semantics_non_json_across_multiple_berths(
     git_repo: Path,
+    git_repo_template: Path,
     tmp_path: Path,
 ) -> None:
     """Alias search should keep repo-filtered output scoped to one berth."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "asrf-target",
-            "--decisions",
-            "target berth checkpoint for alias repo filter semantics",
-            "--next-step",
-            "run alias repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo target",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="asrf-target",
+        decisions="target berth checkpoint for alias repo filter semantics",
+        next_steps=["run alias repo filter"],
+        resume_commands=["echo target"],
+        verification=SAVE_VERIFICATION,
     )
 
-    other_repo = tmp_path / "other-repo-alias"
-    other_repo.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "dockyard@example.com"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
+    other_repo = _copy_git_repo_template(
+        git_repo_template,
+        tmp_path / "other-repo-alias",
+        "git@github.com:org/other-alias.git",
     )
-    subprocess.run(
-        ["git", "config", "user.name", "Dockyard Test"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", "git@github.com:org/other-alias.git"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    (other_repo / "README.md").write_text("seed\n", encoding="utf-8")
-    subprocess.run(["git", "add", "README.md"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=str(other_repo), check=True, capture_output=True)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(other_repo),
-            "--no-prompt",
-            "--objective",
-            "asrf-other",
-            "--decisions",
-            "other berth checkpoint for alias repo filter semantics",
-            "--next-step",
-            "run alias repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo other",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=other_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        other_repo,
+        objective="asrf-other",
+        decisions="other berth checkpoint for alias repo filter semantics",
+        next_steps=["run alias repo filter"],
+        resume_commands=["echo other"],
+        verification=SAVE_VERIFICATION,
     )
 
-    table_output = _run_dock(
+    table_output = _invoke_dock(
         ["f", "asrf", "--repo", git_repo.name],
         cwd=tmp_path,
         env=env,
@@ -18036,12 +11594,8 @@ def test_search_alias_repo_filter_semantics_non_json_across_multiple_berths(
     assert "asrf-other" not in table_output
     assert "Traceback" not in table_output
 
-    rows = json.loads(
-        _run_dock(
-            ["f", "asrf", "--repo", git_repo.name, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    rows = _invoke_dock_json(
+        ["f", "asrf", "--repo", git_repo.name, "--json"], cwd=tmp_path, env=env
     )
     assert len(rows) == 1
     assert rows[0]["objective"] == "asrf-target"
@@ -18061,12 +11615,10 @@ def test_search_alias_repo_filter_semantics_non_json_across_multiple_berths(
     conn.commit()
     conn.close()
 
-    repo_id_rows = json.loads(
-        _run_dock(
-            ["f", "asrf", "--repo", target_repo_id, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    repo_id_rows = _invoke_dock_json(
+        ["f", "asrf", "--repo", target_repo_id, "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(repo_id_rows) == 1
     assert repo_id_rows[0]["repo_id"] == target_repo_id
@@ -18076,295 +11628,136 @@ def test_search_alias_repo_filter_semantics_non_json_across_multiple_berths(
 @pytest.mark.parametrize("command_name", ["search", "f"])
 def test_search_tag_repo_filter_semantics_across_multiple_berths(
     git_repo: Path,
+    git_repo_template: Path,
     tmp_path: Path,
     command_name: str,
 ) -> None:
     """Search tag+repo filters should stay scoped to the selected berth."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"mtr-target-{command_name}",
-            "--decisions",
-            "target berth checkpoint for multi-berth tag+repo semantics",
-            "--next-step",
-            "run tag+repo search",
-            "--risks",
-            "none",
-            "--command",
-            "echo target",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    other_repo = tmp_path / f"multi-tag-repo-{command_name}"
-    other_repo.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "dockyard@example.com"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Dockyard Test"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", f"git@github.com:org/{command_name}-multi-tag.git"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    (other_repo / "README.md").write_text("seed\n", encoding="utf-8")
-    subprocess.run(["git", "add", "README.md"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=str(other_repo), check=True, capture_output=True)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(other_repo),
-            "--no-prompt",
-            "--objective",
-            f"mtr-other-{command_name}",
-            "--decisions",
-            "other berth checkpoint for multi-berth tag+repo semantics",
-            "--next-step",
-            "run tag+repo search",
-            "--risks",
-            "none",
-            "--command",
-            "echo other",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=other_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            [command_name, "mtr-", "--tag", "alpha", "--repo", git_repo.name, "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) == 1
-    assert rows[0]["objective"] == f"mtr-target-{command_name}"
-    assert rows[0]["berth_name"] == git_repo.name
-
-    table_output = _run_dock(
-        [command_name, "mtr-", "--tag", "alpha", "--repo", git_repo.name],
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"mtr-target-{command_name}",
+        decisions="target berth checkpoint for multi-berth tag+repo semantics",
+        next_steps=["run tag+repo search"],
+        resume_commands=["echo target"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    other_repo = _copy_git_repo_template(
+        git_repo_template,
+        tmp_path / f"multi-tag-repo-{command_name}",
+        f"git@github.com:org/{command_name}-multi-tag.git",
+    )
+
+    save_checkpoint(
+        dock_home,
+        other_repo,
+        objective=f"mtr-other-{command_name}",
+        decisions="other berth checkpoint for multi-berth tag+repo semantics",
+        next_steps=["run tag+repo search"],
+        resume_commands=["echo other"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    rows = _invoke_dock_json(
+        [command_name, "mtr-", "--tag", "alpha", "--repo", git_repo.name, "--json"],
         cwd=tmp_path,
         env=env,
-    ).stdout
-    assert f"mtr-target-{command_name}" in table_output
-    assert f"mtr-other-{command_name}" not in table_output
-    assert "Traceback" not in table_output
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_tag_repo_branch_filter_semantics_across_multi_branch_matches(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Combined tag+repo+branch filters should isolate target-branch rows."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-    target_branch = "feature/matrix-target"
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"mtrbtoken tm-{command_name}",
-            "--decisions",
-            "target main checkpoint for combined filter matrix",
-            "--next-step",
-            "run combined filter matrix",
-            "--risks",
-            "none",
-            "--command",
-            "echo target-main",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", target_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"mtrbtoken tf-{command_name}",
-            "--decisions",
-            "target feature checkpoint for combined filter matrix",
-            "--next-step",
-            "run combined filter matrix",
-            "--risks",
-            "none",
-            "--command",
-            "echo target-feature",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
     )
+    assert len(rows) == 1
+    assert rows[0]["objective"] == f"mtr-target-{command_name}"
+    assert rows[0]["berth_name"] == git_repo.name
 
-    other_repo = tmp_path / f"multi-tag-repo-branch-{command_name}"
-    other_repo.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "dockyard@example.com"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Dockyard Test"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", f"git@github.com:org/{command_name}-multi-tag-branch.git"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    (other_repo / "README.md").write_text("seed\n", encoding="utf-8")
-    subprocess.run(["git", "add", "README.md"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "checkout", "-b", target_branch],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
+    table_output = _invoke_dock(
+        [command_name, "mtr-", "--tag", "alpha", "--repo", git_repo.name],
+        cwd=tmp_path,
+        env=env,
+    ).stdout
+    assert f"mtr-target-{command_name}" in table_output
+    assert f"mtr-other-{command_name}" not in table_output
+    assert "Traceback" not in table_output
+
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_tag_repo_branch_filter_semantics_across_multi_branch_matches(
+    git_repo: Path,
+    git_repo_template: Path,
+    tmp_path: Path,
+    command_name: str,
+    git_template_branch: str,
+) -> None:
+    """Combined tag+repo+branch filters should isolate target-branch rows."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+    target_branch = "feature/matrix-target"
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"mtrbtoken tm-{command_name}",
+        decisions="target main checkpoint for combined filter matrix",
+        next_steps=["run combined filter matrix"],
+        resume_commands=["echo target-main"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, target_branch)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"mtrbtoken tf-{command_name}",
+        decisions="target feature checkpoint for combined filter matrix",
+        next_steps=["run combined filter matrix"],
+        resume_commands=["echo target-feature"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    other_repo = _copy_git_repo_template(
+        git_repo_template,
+        tmp_path / f"multi-tag-repo-branch-{command_name}",
+        f"git@github.com:org/{command_name}-multi-tag-branch.git",
+        branch=target_branch,
+    )
+    save_checkpoint(
+        dock_home,
+        other_repo,
+        objective=f"mtrbtoken of-{command_name}",
+        decisions="other repo feature checkpoint for combined filter matrix",
+        next_steps=["run combined filter matrix"],
+        resume_commands=["echo other-feature"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    rows = _invoke_dock_json(
         [
-            "save",
-            "--root",
-            str(other_repo),
-            "--no-prompt",
-            "--objective",
-            f"mtrbtoken of-{command_name}",
-            "--decisions",
-            "other repo feature checkpoint for combined filter matrix",
-            "--next-step",
-            "run combined filter matrix",
-            "--risks",
-            "none",
-            "--command",
-            "echo other-feature",
+            command_name,
+                "mtrbtoken",
             "--tag",
             "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            "--repo",
+            git_repo.name,
+            "--branch",
+            target_branch,
+            "--json",
         ],
-        cwd=other_repo,
+        cwd=tmp_path,
         env=env,
     )
-
-    rows = json.loads(
-        _run_dock(
-            [
-                command_name,
-                    "mtrbtoken",
-                "--tag",
-                "alpha",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                target_branch,
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
     assert len(rows) == 1
     assert rows[0]["objective"] == f"mtrbtoken tf-{command_name}"
     assert rows[0]["berth_name"] == git_repo.name
     assert rows[0]["branch"] == target_branch
 
-    table_output = _run_dock(
+    table_output = _invoke_dock(
         [
             command_name,
             "mtrbtoken",
@@ -18387,177 +11780,58 @@ def test_search_tag_repo_branch_filter_semantics_across_multi_branch_matches(
 @pytest.mark.parametrize("command_name", ["search", "f"])
 def test_search_tag_repo_branch_limit_semantics_across_multi_branch_matches(
     git_repo: Path,
+    git_repo_template: Path,
     tmp_path: Path,
     command_name: str,
+    git_template_branch: str,
 ) -> None:
     """Combined filters should apply --limit after tag/repo/branch narrowing."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
     target_branch = "feature/matrix-target-limit"
 
-    subprocess.run(
-        ["git", "checkout", "-b", target_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"mtrbltoken one-{command_name}",
-            "--decisions",
-            "target feature checkpoint one for combined limit matrix",
-            "--next-step",
-            "run combined filter matrix with limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo one",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"mtrbltoken two-{command_name}",
-            "--decisions",
-            "target feature checkpoint two for combined limit matrix",
-            "--next-step",
-            "run combined filter matrix with limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo two",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    other_repo = tmp_path / f"multi-tag-repo-branch-limit-{command_name}"
-    other_repo.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "dockyard@example.com"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Dockyard Test"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", f"git@github.com:org/{command_name}-multi-tag-branch-limit.git"],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    (other_repo / "README.md").write_text("seed\n", encoding="utf-8")
-    subprocess.run(["git", "add", "README.md"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "initial"], cwd=str(other_repo), check=True, capture_output=True)
-    subprocess.run(
-        ["git", "checkout", "-b", target_branch],
-        cwd=str(other_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(other_repo),
-            "--no-prompt",
-            "--objective",
-            f"mtrbltoken other-{command_name}",
-            "--decisions",
-            "other repo feature checkpoint for combined limit matrix",
-            "--next-step",
-            "run combined filter matrix with limit",
-            "--risks",
-            "none",
-            "--command",
-            "echo other",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=other_repo,
-        env=env,
-    )
-
-    rows = json.loads(
-        _run_dock(
-            [
-                command_name,
-                "mtrbltoken",
-                "--tag",
-                "alpha",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                target_branch,
-                "--limit",
-                "1",
-                "--json",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(rows) == 1
-    assert rows[0]["berth_name"] == git_repo.name
-    assert rows[0]["branch"] == target_branch
-    assert rows[0]["objective"] in {f"mtrbltoken one-{command_name}", f"mtrbltoken two-{command_name}"}
-
-    table_output = _run_dock(
+    _checkout_new_branch(git_repo, target_branch)
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"mtrbltoken one-{command_name}",
+        decisions="target feature checkpoint one for combined limit matrix",
+        next_steps=["run combined filter matrix with limit"],
+        resume_commands=["echo one"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"mtrbltoken two-{command_name}",
+        decisions="target feature checkpoint two for combined limit matrix",
+        next_steps=["run combined filter matrix with limit"],
+        resume_commands=["echo two"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    other_repo = _copy_git_repo_template(
+        git_repo_template,
+        tmp_path / f"multi-tag-repo-branch-limit-{command_name}",
+        f"git@github.com:org/{command_name}-multi-tag-branch-limit.git",
+        branch=target_branch,
+    )
+    save_checkpoint(
+        dock_home,
+        other_repo,
+        objective=f"mtrbltoken other-{command_name}",
+        decisions="other repo feature checkpoint for combined limit matrix",
+        next_steps=["run combined filter matrix with limit"],
+        resume_commands=["echo other"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    rows = _invoke_dock_json(
         [
             command_name,
             "mtrbltoken",
@@ -18569,103 +11843,77 @@ def test_search_tag_repo_branch_limit_semantics_across_multi_branch_matches(
             target_branch,
             "--limit",
             "1",
+            "--json",
         ],
         cwd=tmp_path,
         env=env,
-    ).stdout
-    assert f"other-{command_name}" not in table_output
-    assert "No checkpoint matches found." not in table_output
-    assert "Traceback" not in table_output
-
-
-def test_search_branch_filter_semantics_non_json(git_repo: Path, tmp_path: Path) -> None:
-    """Search should honor branch filters in non-JSON table output."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    default_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "psbf-default",
-            "--decisions",
-            "default branch checkpoint for primary branch filtering",
-            "--next-step",
-            "run primary branch filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo default",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/primary-branch-filter"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
     )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "psbf-feature",
-            "--decisions",
-            "feature branch checkpoint for primary branch filtering",
-            "--next-step",
-            "run primary branch filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+    assert len(rows) == 1
+    assert rows[0]["berth_name"] == git_repo.name
+    assert rows[0]["branch"] == target_branch
+    assert rows[0]["objective"] in {f"mtrbltoken one-{command_name}", f"mtrbltoken two-{command_name}"}
+
+    table_output = _invoke_dock(
+        [
+            command_name,
+            "mtrbltoken",
+            "--tag",
+            "alpha",
+            "--repo",
+            git_repo.name,
+            "--branch",
+            target_branch,
+            "--limit",
+            "1",
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", default_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    ).stdout
+    assert f"other-{command_name}" not in table_output
+    assert "No checkpoint matches found." not in table_output
+    assert "Traceback" not in table_output
 
-    rows = json.loads(
-        _run_dock(
-            ["search", "psbf", "--branch", "feature/primary-branch-filter", "--json"],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+
+def test_search_branch_filter_semantics_non_json(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """Search should honor branch filters in non-JSON table output."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    default_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="psbf-default",
+        decisions="default branch checkpoint for primary branch filtering",
+        next_steps=["run primary branch filter"],
+        resume_commands=["echo default"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/primary-branch-filter")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="psbf-feature",
+        decisions="feature branch checkpoint for primary branch filtering",
+        next_steps=["run primary branch filter"],
+        resume_commands=["echo feature"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, default_branch)
+
+    rows = _invoke_dock_json(
+        ["search", "psbf", "--branch", "feature/primary-branch-filter", "--json"],
+        cwd=tmp_path,
+        env=env,
     )
     assert len(rows) == 1
     assert rows[0]["branch"] == "feature/primary-branch-filter"
 
-    output = _run_dock(
+    output = _invoke_dock(
         ["search", "psbf", "--branch", "feature/primary-branch-filter"],
         cwd=tmp_path,
         env=env,
@@ -18682,46 +11930,25 @@ def test_search_branch_filter_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases JSON should return [] for branch-filter no-match results."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Branch filter no-match objective",
-            "--decisions",
-            "Branch filter no-match decisions",
-            "--next-step",
-            "run branch filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Branch filter no-match objective",
+        decisions="Branch filter no-match decisions",
+        next_steps=["run branch filtered search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Branch filter no-match objective", "--branch", "missing/branch", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -18731,46 +11958,25 @@ def test_search_branch_filter_limit_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases JSON should return [] for branch+limit no-match paths."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Branch filter limit no-match objective",
-            "--decisions",
-            "Branch filter limit no-match decisions",
-            "--next-step",
-            "run branch limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Branch filter limit no-match objective",
+        decisions="Branch filter limit no-match decisions",
+        next_steps=["run branch limit filtered search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Branch filter limit no-match objective", "--branch", "missing/branch", "--limit", "1", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -18780,46 +11986,25 @@ def test_search_branch_filter_no_match_is_informative(
     command_name: str,
 ) -> None:
     """Search aliases should show no-match guidance for branch filter misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Branch filter no-match message objective",
-            "--decisions",
-            "Branch filter no-match message decisions",
-            "--next-step",
-            "run branch filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Branch filter no-match message objective",
+        decisions="Branch filter no-match message decisions",
+        next_steps=["run branch filtered search"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Branch filter no-match message objective", "--branch", "missing/branch"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -18828,216 +12013,105 @@ def test_search_branch_filter_limit_no_match_is_informative(
     tmp_path: Path,
     command_name: str,
 ) -> None:
-    """Search aliases should keep no-match guidance for branch+limit misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Branch filter limit message objective",
-            "--decisions",
-            "Branch filter limit message decisions",
-            "--next-step",
-            "run branch limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    result = _run_dock(
-        [command_name, "Branch filter limit message objective", "--branch", "missing/branch", "--limit", "1"],
-        cwd=tmp_path,
-        env=env,
-    )
-    assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
-
-
-def test_search_tag_repo_filter_semantics_non_json(git_repo: Path, tmp_path: Path) -> None:
-    """Search should honor combined tag+repo filters in table mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "primary-tag-repo-alpha-token",
-            "--decisions",
-            "alpha-tag checkpoint for primary tag+repo filtering",
-            "--next-step",
-            "run primary tag+repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo alpha",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "primary-tag-repo-beta-token",
-            "--decisions",
-            "beta-tag checkpoint for primary tag+repo filtering",
-            "--next-step",
-            "run primary tag+repo filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo beta",
-            "--tag",
-            "beta",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    filtered = _run_dock(
-        [
-            "search",
-            "primary-tag-repo",
-            "--tag",
-            "beta",
-            "--repo",
-            git_repo.name,
-        ],
-        cwd=tmp_path,
-        env=env,
-    ).stdout
-    assert "primary-tag-repo-beta-token" in filtered
-    assert "primary-tag-repo-alpha-token" not in filtered
-    assert "Traceback" not in filtered
-
-
-def test_search_tag_branch_filter_semantics_non_json(git_repo: Path, tmp_path: Path) -> None:
-    """Search should honor combined tag+branch filters in table mode."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    default_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "ptb-default",
-            "--decisions",
-            "default branch checkpoint for primary tag+branch filtering",
-            "--next-step",
-            "run primary tag+branch filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo default",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    """Search aliases should keep no-match guidance for branch+limit misses."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Branch filter limit message objective",
+        decisions="Branch filter limit message decisions",
+        next_steps=["run branch limit filtered search"],
+        verification=SAVE_VERIFICATION,
     )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/primary-tag-branch-filter"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
+
+    result = _invoke_dock(
+        [command_name, "Branch filter limit message objective", "--branch", "missing/branch", "--limit", "1"],
+        cwd=tmp_path,
+        env=env,
     )
-    _run_dock(
+    assert "No checkpoint matches found." in result.stdout
+    _assert_no_traceback(result)
+
+
+def test_search_tag_repo_filter_semantics_non_json(git_repo: Path, tmp_path: Path) -> None:
+    """Search should honor combined tag+repo filters in table mode."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="primary-tag-repo-alpha-token",
+        decisions="alpha-tag checkpoint for primary tag+repo filtering",
+        next_steps=["run primary tag+repo filter"],
+        resume_commands=["echo alpha"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="primary-tag-repo-beta-token",
+        decisions="beta-tag checkpoint for primary tag+repo filtering",
+        next_steps=["run primary tag+repo filter"],
+        resume_commands=["echo beta"],
+        tags=["beta"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    filtered = _invoke_dock(
         [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "ptb-feature",
-            "--decisions",
-            "feature branch checkpoint for primary tag+branch filtering",
-            "--next-step",
-            "run primary tag+branch filter",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
+            "search",
+            "primary-tag-repo",
             "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            "beta",
+            "--repo",
+            git_repo.name,
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", default_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    ).stdout
+    assert "primary-tag-repo-beta-token" in filtered
+    assert "primary-tag-repo-alpha-token" not in filtered
+    assert "Traceback" not in filtered
 
-    filtered = _run_dock(
+
+def test_search_tag_branch_filter_semantics_non_json(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """Search should honor combined tag+branch filters in table mode."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    default_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="ptb-default",
+        decisions="default branch checkpoint for primary tag+branch filtering",
+        next_steps=["run primary tag+branch filter"],
+        resume_commands=["echo default"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/primary-tag-branch-filter")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="ptb-feature",
+        decisions="feature branch checkpoint for primary tag+branch filtering",
+        next_steps=["run primary tag+branch filter"],
+        resume_commands=["echo feature"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, default_branch)
+
+    filtered = _invoke_dock(
         [
             "search",
             "ptb",
@@ -19061,48 +12135,26 @@ def test_search_tag_repo_filter_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases JSON should return [] when tag+repo filters miss."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Tag repo filter no-match objective",
-            "--decisions",
-            "Tag repo filter no-match decisions",
-            "--next-step",
-            "run tag repo filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Tag repo filter no-match objective",
+        decisions="Tag repo filter no-match decisions",
+        next_steps=["run tag repo filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Tag repo filter no-match objective", "--tag", "alpha", "--repo", "missing-berth", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -19112,48 +12164,26 @@ def test_search_tag_repo_filter_limit_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases JSON should return [] for tag+repo+limit no-match paths."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Tag repo filter limit no-match objective",
-            "--decisions",
-            "Tag repo filter limit no-match decisions",
-            "--next-step",
-            "run tag repo limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Tag repo filter limit no-match objective",
+        decisions="Tag repo filter limit no-match decisions",
+        next_steps=["run tag repo limit filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Tag repo filter limit no-match objective", "--tag", "alpha", "--repo", "missing-berth", "--limit", "1", "--json"],
         cwd=tmp_path,
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -19163,48 +12193,26 @@ def test_search_tag_repo_filter_no_match_is_informative(
     command_name: str,
 ) -> None:
     """Search aliases should keep no-match guidance for tag+repo misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Tag repo filter message objective",
-            "--decisions",
-            "Tag repo filter message decisions",
-            "--next-step",
-            "run tag repo filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Tag repo filter message objective",
+        decisions="Tag repo filter message decisions",
+        next_steps=["run tag repo filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Tag repo filter message objective", "--tag", "alpha", "--repo", "missing-berth"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -19214,150 +12222,84 @@ def test_search_tag_repo_filter_limit_no_match_is_informative(
     command_name: str,
 ) -> None:
     """Search aliases should keep no-match guidance for tag+repo+limit misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Tag repo filter limit message objective",
-            "--decisions",
-            "Tag repo filter limit message decisions",
-            "--next-step",
-            "run tag repo limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Tag repo filter limit message objective",
+        decisions="Tag repo filter limit message decisions",
+        next_steps=["run tag repo limit filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [command_name, "Tag repo filter limit message objective", "--tag", "alpha", "--repo", "missing-berth", "--limit", "1"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_tag_branch_filter_no_match_json_returns_empty_array(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Search aliases JSON should return [] when tag+branch filters miss."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Tag branch filter no-match objective",
-            "--decisions",
-            "Tag branch filter no-match decisions",
-            "--next-step",
-            "run tag branch filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    result = _run_dock(
-        [command_name, "Tag branch filter no-match objective", "--tag", "alpha", "--branch", "missing/branch", "--json"],
-        cwd=tmp_path,
-        env=env,
-    )
-    assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_tag_branch_filter_no_match_is_informative(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Search aliases should keep no-match guidance for tag+branch misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    _assert_no_traceback(result)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Tag branch filter message objective",
-            "--decisions",
-            "Tag branch filter message decisions",
-            "--next-step",
-            "run tag branch filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_tag_branch_filter_no_match_json_returns_empty_array(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Search aliases JSON should return [] when tag+branch filters miss."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Tag branch filter no-match objective",
+        decisions="Tag branch filter no-match decisions",
+        next_steps=["run tag branch filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
+        [command_name, "Tag branch filter no-match objective", "--tag", "alpha", "--branch", "missing/branch", "--json"],
+        cwd=tmp_path,
         env=env,
     )
+    assert json.loads(result.stdout) == []
+    _assert_no_traceback(result)
 
-    result = _run_dock(
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_tag_branch_filter_no_match_is_informative(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Search aliases should keep no-match guidance for tag+branch misses."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Tag branch filter message objective",
+        decisions="Tag branch filter message decisions",
+        next_steps=["run tag branch filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    result = _invoke_dock(
         [command_name, "Tag branch filter message objective", "--tag", "alpha", "--branch", "missing/branch"],
         cwd=tmp_path,
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -19367,42 +12309,20 @@ def test_search_tag_repo_branch_filter_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Search aliases JSON should return [] when tag+repo+branch filters miss."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Tag repo branch filter no-match objective",
-            "--decisions",
-            "Tag repo branch filter no-match decisions",
-            "--next-step",
-            "run tag repo branch filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Tag repo branch filter no-match objective",
+        decisions="Tag repo branch filter no-match decisions",
+        next_steps=["run tag repo branch filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             command_name,
             "Tag repo branch filter no-match objective",
@@ -19418,7 +12338,7 @@ def test_search_tag_repo_branch_filter_no_match_json_returns_empty_array(
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -19428,42 +12348,20 @@ def test_search_tag_repo_branch_filter_no_match_is_informative(
     command_name: str,
 ) -> None:
     """Search aliases should keep no-match guidance for tag+repo+branch misses."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Tag repo branch filter message objective",
-            "--decisions",
-            "Tag repo branch filter message decisions",
-            "--next-step",
-            "run tag repo branch filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Tag repo branch filter message objective",
+        decisions="Tag repo branch filter message decisions",
+        next_steps=["run tag repo branch filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             command_name,
             "Tag repo branch filter message objective",
@@ -19478,7 +12376,7 @@ def test_search_tag_repo_branch_filter_no_match_is_informative(
         env=env,
     )
     assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -19488,42 +12386,20 @@ def test_search_tag_repo_branch_limit_no_match_json_returns_empty_array(
     command_name: str,
 ) -> None:
     """Combined tag+repo+branch+limit JSON misses should return [] cleanly."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Tag repo branch limit no-match objective ({command_name})",
-            "--decisions",
-            "Tag repo branch limit no-match decisions",
-            "--next-step",
-            "run tag repo branch limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"Tag repo branch limit no-match objective ({command_name})",
+        decisions="Tag repo branch limit no-match decisions",
+        next_steps=["run tag repo branch limit filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             command_name,
             f"Tag repo branch limit no-match objective ({command_name})",
@@ -19541,7 +12417,7 @@ def test_search_tag_repo_branch_limit_no_match_json_returns_empty_array(
         env=env,
     )
     assert json.loads(result.stdout) == []
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
+    _assert_no_traceback(result)
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
@@ -19551,42 +12427,20 @@ def test_search_tag_repo_branch_limit_no_match_is_informative(
     command_name: str,
 ) -> None:
     """Combined tag+repo+branch+limit misses should keep no-match guidance."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            f"Tag repo branch limit message objective ({command_name})",
-            "--decisions",
-            "Tag repo branch limit message decisions",
-            "--next-step",
-            "run tag repo branch limit filtered search",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tag",
-            "alpha",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective=f"Tag repo branch limit message objective ({command_name})",
+        decisions="Tag repo branch limit message decisions",
+        next_steps=["run tag repo branch limit filtered search"],
+        tags=["alpha"],
+        verification=SAVE_VERIFICATION,
     )
 
-    result = _run_dock(
+    result = _invoke_dock(
         [
             command_name,
             f"Tag repo branch limit message objective ({command_name})",
@@ -19602,195 +12456,90 @@ def test_search_tag_repo_branch_limit_no_match_is_informative(
         cwd=tmp_path,
         env=env,
     )
-    assert "No checkpoint matches found." in result.stdout
-    assert "Traceback" not in f"{result.stdout}\n{result.stderr}"
-
-
-@pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_json_snippet_includes_risk_match(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Search command aliases should surface snippets from risks text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Risk snippet objective",
-            "--decisions",
-            "generic decisions text",
-            "--next-step",
-            "generic next step",
-            "--risks",
-            "Requires risktoken validation before deploy",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    rows = json.loads(_run_dock([command_name, "risktoken", "--json"], cwd=tmp_path, env=env).stdout)
-    assert len(rows) == 1
-    assert "risktoken" in rows[0]["snippet"].lower()
-
-
-def test_search_json_parser_error_query_honors_repo_branch_filters(
-    git_repo: Path,
-    tmp_path: Path,
-) -> None:
-    """Parser-error fallback path should preserve repo/branch filter semantics."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "pf-target security/path",
-            "--decisions",
-            "Keep fallback query filters stable",
-            "--next-step",
-            "Validate parser fallback filter semantics",
-            "--risks",
-            "none",
-            "--command",
-            "echo main",
-            "--tag",
-            "parser-fallback",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/parser-fallback-other"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "pf-sibling security/path",
-            "--decisions",
-            "Other branch record should be filtered out",
-            "--next-step",
-            "Ensure branch filter is honored",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
-            "--tag",
-            "parser-fallback",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
+    assert "No checkpoint matches found." in result.stdout
+    _assert_no_traceback(result)
 
-    rows = json.loads(
-        _run_dock(
-            [
-                "search",
-                "security/path",
-                "--json",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                base_branch,
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+
+@pytest.mark.parametrize("command_name", ["search", "f"])
+def test_search_json_snippet_includes_risk_match(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Search command aliases should surface snippets from risks text."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Risk snippet objective",
+        decisions="generic decisions text",
+        next_steps=["generic next step"],
+        risks_review="Requires risktoken validation before deploy",
+        verification=SAVE_VERIFICATION,
     )
+
+    rows = _invoke_dock_json([command_name, "risktoken", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
-    assert rows[0]["objective"] == "pf-target security/path"
-    tagged_rows = json.loads(
-        _run_dock(
-            [
-                "search",
-                "security/path",
-                "--json",
-                "--tag",
-                "parser-fallback",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                base_branch,
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(tagged_rows) == 1
-    assert tagged_rows[0]["objective"] == "pf-target security/path"
-    tagged_limit_rows = json.loads(
-        _run_dock(
-            [
-                "search",
-                "security/path",
-                "--json",
-                "--tag",
-                "parser-fallback",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                base_branch,
-                "--limit",
-                "1",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
+    assert "risktoken" in rows[0]["snippet"].lower()
+
+
+def test_search_json_parser_error_query_honors_repo_branch_filters(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
+    """Parser-error fallback path should preserve repo/branch filter semantics."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="pf-target security/path",
+        decisions="Keep fallback query filters stable",
+        next_steps=["Validate parser fallback filter semantics"],
+        resume_commands=["echo main"],
+        tags=["parser-fallback"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    _checkout_new_branch(git_repo, "feature/parser-fallback-other")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="pf-sibling security/path",
+        decisions="Other branch record should be filtered out",
+        next_steps=["Ensure branch filter is honored"],
+        resume_commands=["echo feature"],
+        tags=["parser-fallback"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    rows = _invoke_dock_json(
+        [
+            "search",
+            "security/path",
+            "--json",
+            "--repo",
+            git_repo.name,
+            "--branch",
+            base_branch,
+        ],
+        cwd=tmp_path,
+        env=env,
     )
-    assert len(tagged_limit_rows) == 1
-    assert tagged_limit_rows[0]["objective"] == "pf-target security/path"
-    table_output = _run_dock(
+    assert len(rows) == 1
+    assert rows[0]["objective"] == "pf-target security/path"
+    tagged_rows = _invoke_dock_json(
         [
             "search",
             "security/path",
+            "--json",
+            "--tag",
+            "parser-fallback",
             "--repo",
             git_repo.name,
             "--branch",
@@ -19798,28 +12547,29 @@ def test_search_json_parser_error_query_honors_repo_branch_filters(
         ],
         cwd=tmp_path,
         env=env,
-    ).stdout
-    assert "pf-target" in table_output
-    assert "pf-sibling" not in table_output
-    assert "Traceback" not in table_output
-    tagged_table_output = _run_dock(
+    )
+    assert len(tagged_rows) == 1
+    assert tagged_rows[0]["objective"] == "pf-target security/path"
+    tagged_limit_rows = _invoke_dock_json(
         [
             "search",
             "security/path",
+            "--json",
             "--tag",
             "parser-fallback",
             "--repo",
             git_repo.name,
             "--branch",
             base_branch,
+            "--limit",
+            "1",
         ],
         cwd=tmp_path,
         env=env,
-    ).stdout
-    assert "pf-target" in tagged_table_output
-    assert "pf-sibling" not in tagged_table_output
-    assert "Traceback" not in tagged_table_output
-    tagged_limit_table_output = _run_dock(
+    )
+    assert len(tagged_limit_rows) == 1
+    assert tagged_limit_rows[0]["objective"] == "pf-target security/path"
+    tagged_limit_table_output = _invoke_dock(
         [
             "search",
             "security/path",
@@ -19843,143 +12593,58 @@ def test_search_json_parser_error_query_honors_repo_branch_filters(
 def test_search_alias_parser_error_query_honors_repo_branch_filters(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Search alias parser fallback should keep repo/branch filters intact."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "apf-target security/path",
-            "--decisions",
-            "Keep alias fallback query filters stable",
-            "--next-step",
-            "Validate alias parser fallback filter semantics",
-            "--risks",
-            "none",
-            "--command",
-            "echo main",
-            "--tag",
-            "parser-fallback-alias",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/parser-fallback-alias-other"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="apf-target security/path",
+        decisions="Keep alias fallback query filters stable",
+        next_steps=["Validate alias parser fallback filter semantics"],
+        resume_commands=["echo main"],
+        tags=["parser-fallback-alias"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    _checkout_new_branch(git_repo, "feature/parser-fallback-alias-other")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="apf-sibling security/path",
+        decisions="Other branch alias record should be filtered out",
+        next_steps=["Ensure alias branch filter is honored"],
+        resume_commands=["echo feature"],
+        tags=["parser-fallback-alias"],
+        verification=SAVE_VERIFICATION,
+    )
+
+    rows = _invoke_dock_json(
         [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "apf-sibling security/path",
-            "--decisions",
-            "Other branch alias record should be filtered out",
-            "--next-step",
-            "Ensure alias branch filter is honored",
-            "--risks",
-            "none",
-            "--command",
-            "echo feature",
-            "--tag",
-            "parser-fallback-alias",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
+            "f",
+            "security/path",
+            "--json",
+            "--repo",
+            git_repo.name,
+            "--branch",
+            base_branch,
         ],
-        cwd=git_repo,
+        cwd=tmp_path,
         env=env,
     )
-
-    rows = json.loads(
-        _run_dock(
-            [
-                "f",
-                "security/path",
-                "--json",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                base_branch,
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
     assert len(rows) == 1
     assert rows[0]["objective"] == "apf-target security/path"
-    tagged_rows = json.loads(
-        _run_dock(
-            [
-                "f",
-                "security/path",
-                "--json",
-                "--tag",
-                "parser-fallback-alias",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                base_branch,
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(tagged_rows) == 1
-    assert tagged_rows[0]["objective"] == "apf-target security/path"
-    tagged_limit_rows = json.loads(
-        _run_dock(
-            [
-                "f",
-                "security/path",
-                "--json",
-                "--tag",
-                "parser-fallback-alias",
-                "--repo",
-                git_repo.name,
-                "--branch",
-                base_branch,
-                "--limit",
-                "1",
-            ],
-            cwd=tmp_path,
-            env=env,
-        ).stdout
-    )
-    assert len(tagged_limit_rows) == 1
-    assert tagged_limit_rows[0]["objective"] == "apf-target security/path"
-    table_output = _run_dock(
+    tagged_rows = _invoke_dock_json(
         [
             "f",
             "security/path",
+            "--json",
+            "--tag",
+            "parser-fallback-alias",
             "--repo",
             git_repo.name,
             "--branch",
@@ -19987,28 +12652,29 @@ def test_search_alias_parser_error_query_honors_repo_branch_filters(
         ],
         cwd=tmp_path,
         env=env,
-    ).stdout
-    assert "apf-target" in table_output
-    assert "apf-sibling" not in table_output
-    assert "Traceback" not in table_output
-    tagged_table_output = _run_dock(
+    )
+    assert len(tagged_rows) == 1
+    assert tagged_rows[0]["objective"] == "apf-target security/path"
+    tagged_limit_rows = _invoke_dock_json(
         [
             "f",
             "security/path",
+            "--json",
             "--tag",
             "parser-fallback-alias",
             "--repo",
             git_repo.name,
             "--branch",
             base_branch,
+            "--limit",
+            "1",
         ],
         cwd=tmp_path,
         env=env,
-    ).stdout
-    assert "apf-target" in tagged_table_output
-    assert "apf-sibling" not in tagged_table_output
-    assert "Traceback" not in tagged_table_output
-    tagged_limit_table_output = _run_dock(
+    )
+    assert len(tagged_limit_rows) == 1
+    assert tagged_limit_rows[0]["objective"] == "apf-target security/path"
+    tagged_limit_table_output = _invoke_dock(
         [
             "f",
             "security/path",
@@ -20036,40 +12702,20 @@ def test_search_json_snippet_includes_next_step_match(
     command_name: str,
 ) -> None:
     """Search command aliases should surface snippets from next-step text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Next-step snippet objective",
-            "--decisions",
-            "generic decisions text",
-            "--next-step",
-            "Run nexttoken verification before handoff",
-            "--risks",
-            "generic risks",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Next-step snippet objective",
+        decisions="generic decisions text",
+        next_steps=["Run nexttoken verification before handoff"],
+        risks_review="generic risks",
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(_run_dock([command_name, "nexttoken", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json([command_name, "nexttoken", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert "nexttoken" in rows[0]["snippet"].lower()
 
@@ -20081,89 +12727,45 @@ def test_search_json_snippet_includes_decisions_match(
     command_name: str,
 ) -> None:
     """Search command aliases should surface snippets from decisions text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Decisions snippet objective",
-            "--decisions",
-            "Need decisiontoken guardrails before merge",
-            "--next-step",
-            "generic next step",
-            "--risks",
-            "generic risks",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Decisions snippet objective",
+        decisions="Need decisiontoken guardrails before merge",
+        next_steps=["generic next step"],
+        risks_review="generic risks",
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(
-        _run_dock([command_name, "decisiontoken", "--json"], cwd=tmp_path, env=env).stdout
-    )
+    rows = _invoke_dock_json([command_name, "decisiontoken", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert "decisiontoken" in rows[0]["snippet"].lower()
 
 
 @pytest.mark.parametrize("command_name", ["search", "f"])
-def test_search_json_snippet_includes_objective_match(
-    git_repo: Path,
-    tmp_path: Path,
-    command_name: str,
-) -> None:
-    """Search command aliases should surface snippets from objective text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "Objectivetoken milestone",
-            "--decisions",
-            "generic decisions",
-            "--next-step",
-            "generic next step",
-            "--risks",
-            "generic risks",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
+def test_search_json_snippet_includes_objective_match(
+    git_repo: Path,
+    tmp_path: Path,
+    command_name: str,
+) -> None:
+    """Search command aliases should surface snippets from objective text."""
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    rows = json.loads(
-        _run_dock([command_name, "objectivetoken", "--json"], cwd=tmp_path, env=env).stdout
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="Objectivetoken milestone",
+        decisions="generic decisions",
+        next_steps=["generic next step"],
+        risks_review="generic risks",
+        verification=SAVE_VERIFICATION,
     )
+
+    rows = _invoke_dock_json([command_name, "objectivetoken", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert "objectivetoken" in rows[0]["snippet"].lower()
 
@@ -20175,40 +12777,20 @@ def test_search_json_snippet_normalizes_objective_whitespace(
     command_name: str,
 ) -> None:
     """Search aliases should normalize repeated objective whitespace in snippets."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "token   with\t\tspace",
-            "--decisions",
-            "generic decisions",
-            "--next-step",
-            "generic next step",
-            "--risks",
-            "generic risks",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="token   with\t\tspace",
+        decisions="generic decisions",
+        next_steps=["generic next step"],
+        risks_review="generic risks",
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(_run_dock([command_name, "token", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json([command_name, "token", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert rows[0]["snippet"] == "token with space"
 
@@ -20220,40 +12802,20 @@ def test_search_json_snippet_prioritizes_objective_when_all_fields_match(
     command_name: str,
 ) -> None:
     """Search aliases should prefer objective snippets when all fields match."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
 
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "prioritytoken objective text",
-            "--decisions",
-            "prioritytoken decisions text",
-            "--next-step",
-            "prioritytoken next step text",
-            "--risks",
-            "prioritytoken risks text",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="prioritytoken objective text",
+        decisions="prioritytoken decisions text",
+        next_steps=["prioritytoken next step text"],
+        risks_review="prioritytoken risks text",
+        verification=SAVE_VERIFICATION,
     )
 
-    rows = json.loads(_run_dock([command_name, "prioritytoken", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json([command_name, "prioritytoken", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert rows[0]["snippet"] == "prioritytoken objective text"
 
@@ -20265,41 +12827,22 @@ def test_search_json_snippet_is_bounded(
     command_name: str,
 ) -> None:
     """Search command aliases should keep snippets within bounded length."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     long_risk = "boundtoken " + ("x" * 400)
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+    _invoke_dock(
+        _save_args(
+            git_repo,
             "Bounded snippet objective",
-            "--decisions",
             "generic decisions",
-            "--next-step",
             "generic next step",
-            "--risks",
-            long_risk,
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks=long_risk,
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    rows = json.loads(_run_dock([command_name, "boundtoken", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json([command_name, "boundtoken", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert len(rows[0]["snippet"]) <= 140
 
@@ -20311,43 +12854,22 @@ def test_search_json_multiline_snippet_remains_parseable(
     command_name: str,
 ) -> None:
     """Search aliases should keep multiline snippets parseable in JSON."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     multiline_risk = "line1\nmultilinetoken line2\nline3"
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+    _invoke_dock(
+        _save_args(
+            git_repo,
             "Multiline snippet objective",
-            "--decisions",
             "generic decisions",
-            "--next-step",
             "generic next step",
-            "--risks",
-            multiline_risk,
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks=multiline_risk,
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    rows = json.loads(
-        _run_dock([command_name, "multilinetoken", "--json"], cwd=tmp_path, env=env).stdout
-    )
+    rows = _invoke_dock_json([command_name, "multilinetoken", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert "multilinetoken" in rows[0]["snippet"]
     assert "\n" not in rows[0]["snippet"]
@@ -20361,153 +12883,85 @@ def test_search_json_preserves_unicode_snippets(
     command_name: str,
 ) -> None:
     """Search aliases should preserve unicode text in snippets."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     unicode_risk = "Needs façade review before merge"
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
+    _invoke_dock(
+        _save_args(
+            git_repo,
             "Unicode snippet objective",
-            "--decisions",
             "generic decisions",
-            "--next-step",
             "generic next step",
-            "--risks",
-            unicode_risk,
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            risks=unicode_risk,
+        ),
         cwd=git_repo,
         env=env,
     )
 
-    rows = json.loads(_run_dock([command_name, "façade", "--json"], cwd=tmp_path, env=env).stdout)
+    rows = _invoke_dock_json([command_name, "façade", "--json"], cwd=tmp_path, env=env)
     assert len(rows) == 1
     assert "façade" in rows[0]["snippet"]
 
 
-def test_search_json_respects_limit(git_repo: Path, tmp_path: Path) -> None:
+def test_search_json_respects_limit(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Search JSON mode should honor --limit constraint."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
-    base_branch = _git_current_branch(git_repo)
-
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "JSON limit objective one",
-            "--decisions",
-            "Search JSON limit baseline one",
-            "--next-step",
-            "Collect first result",
-            "--risks",
-            "none",
-            "--command",
-            "echo one",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
-        env=env,
-    )
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/json-limit"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    _run_dock(
-        [
-            "save",
-            "--root",
-            str(git_repo),
-            "--no-prompt",
-            "--objective",
-            "JSON limit objective two",
-            "--decisions",
-            "Search JSON limit baseline two",
-            "--next-step",
-            "Collect second result",
-            "--risks",
-            "none",
-            "--command",
-            "echo two",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
-        cwd=git_repo,
+    dock_home = tmp_path / ".dockyard_data"
+    env = _dock_env(dock_home)
+    base_branch = git_template_branch
+
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="JSON limit objective one",
+        decisions="Search JSON limit baseline one",
+        next_steps=["Collect first result"],
+        resume_commands=["echo one"],
+        verification=SAVE_VERIFICATION,
+    )
+    _checkout_new_branch(git_repo, "feature/json-limit")
+    save_checkpoint(
+        dock_home,
+        git_repo,
+        objective="JSON limit objective two",
+        decisions="Search JSON limit baseline two",
+        next_steps=["Collect second result"],
+        resume_commands=["echo two"],
+        verification=SAVE_VERIFICATION,
+    )
+    _switch_branch(git_repo, base_branch)
+
+    rows = _invoke_dock_json(
+        ["search", "JSON limit objective", "--limit", "1", "--json"],
+        cwd=tmp_path,
         env=env,
     )
-    subprocess.run(
-        ["git", "checkout", base_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-
-    rows = json.loads(_run_dock(["search", "JSON limit objective", "--limit", "1", "--json"], cwd=tmp_path, env=env).stdout)
     assert len(rows) == 1
 
 
-def test_links_are_branch_scoped_and_persist(git_repo: Path, tmp_path: Path) -> None:
+def test_links_are_branch_scoped_and_persist(
+    git_repo: Path,
+    tmp_path: Path,
+    git_template_branch: str,
+) -> None:
     """Links should remain scoped by branch across context switches."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    main_branch = _git_current_branch(git_repo)
+    main_branch = git_template_branch
     _run_dock(["link", "https://example.com/main-link"], cwd=git_repo, env=env)
     main_links = _run_dock(["links"], cwd=git_repo, env=env).stdout
     assert "https://example.com/main-link" in main_links
 
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/links-scope"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _checkout_new_branch(git_repo, "feature/links-scope")
     _run_dock(["link", "https://example.com/feature-link"], cwd=git_repo, env=env)
     feature_links = _run_dock(["links"], cwd=git_repo, env=env).stdout
     assert "https://example.com/feature-link" in feature_links
     assert "https://example.com/main-link" not in feature_links
 
-    subprocess.run(
-        ["git", "checkout", main_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _switch_branch(git_repo, main_branch)
     main_links_again = _run_dock(["links"], cwd=git_repo, env=env).stdout
     assert "https://example.com/main-link" in main_links_again
     assert "https://example.com/feature-link" not in main_links_again
@@ -20518,8 +12972,7 @@ def test_link_commands_support_root_override_outside_repo(
     tmp_path: Path,
 ) -> None:
     """Link and links commands should work from outside repo with --root."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     _run_dock(
         ["link", "https://example.com/root-override", "--root", str(git_repo)],
@@ -20533,12 +12986,12 @@ def test_link_commands_support_root_override_outside_repo(
 def test_link_branch_scoping_with_root_override_outside_repo(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Root-override link flows should remain branch-scoped outside repo cwd."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
-    main_branch = _git_current_branch(git_repo)
+    main_branch = git_template_branch
     _run_dock(
         ["link", "https://example.com/root-main-link", "--root", str(git_repo)],
         cwd=tmp_path,
@@ -20547,12 +13000,7 @@ def test_link_branch_scoping_with_root_override_outside_repo(
     main_links = _run_dock(["links", "--root", str(git_repo)], cwd=tmp_path, env=env).stdout
     assert "https://example.com/root-main-link" in main_links
 
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/root-override-links-scope"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _checkout_new_branch(git_repo, "feature/root-override-links-scope")
     _run_dock(
         ["link", "https://example.com/root-feature-link", "--root", str(git_repo)],
         cwd=tmp_path,
@@ -20562,12 +13010,7 @@ def test_link_branch_scoping_with_root_override_outside_repo(
     assert "https://example.com/root-feature-link" in feature_links
     assert "https://example.com/root-main-link" not in feature_links
 
-    subprocess.run(
-        ["git", "checkout", main_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _switch_branch(git_repo, main_branch)
     restored_main_links = _run_dock(["links", "--root", str(git_repo)], cwd=tmp_path, env=env).stdout
     assert "https://example.com/root-main-link" in restored_main_links
     assert "https://example.com/root-feature-link" not in restored_main_links
@@ -20578,8 +13021,7 @@ def test_link_and_links_accept_trimmed_root_override(
     tmp_path: Path,
 ) -> None:
     """Link and links should resolve root override values after trimming."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     trimmed_root = f"  {git_repo}  "
 
     _run_dock(
@@ -20594,12 +13036,12 @@ def test_link_and_links_accept_trimmed_root_override(
 def test_link_branch_scoping_with_trimmed_root_override_outside_repo(
     git_repo: Path,
     tmp_path: Path,
+    git_template_branch: str,
 ) -> None:
     """Trimmed root-override link flows should remain branch-scoped."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     trimmed_root = f"  {git_repo}  "
-    main_branch = _git_current_branch(git_repo)
+    main_branch = git_template_branch
 
     _run_dock(
         ["link", "https://example.com/trimmed-root-main-link", "--root", trimmed_root],
@@ -20609,12 +13051,7 @@ def test_link_branch_scoping_with_trimmed_root_override_outside_repo(
     main_links = _run_dock(["links", "--root", trimmed_root], cwd=tmp_path, env=env).stdout
     assert "https://example.com/trimmed-root-main-link" in main_links
 
-    subprocess.run(
-        ["git", "checkout", "-b", "feature/trimmed-root-links-scope"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _checkout_new_branch(git_repo, "feature/trimmed-root-links-scope")
     _run_dock(
         ["link", "https://example.com/trimmed-root-feature-link", "--root", trimmed_root],
         cwd=tmp_path,
@@ -20624,12 +13061,7 @@ def test_link_branch_scoping_with_trimmed_root_override_outside_repo(
     assert "https://example.com/trimmed-root-feature-link" in feature_links
     assert "https://example.com/trimmed-root-main-link" not in feature_links
 
-    subprocess.run(
-        ["git", "checkout", main_branch],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _switch_branch(git_repo, main_branch)
     restored_main_links = _run_dock(["links", "--root", trimmed_root], cwd=tmp_path, env=env).stdout
     assert "https://example.com/trimmed-root-main-link" in restored_main_links
     assert "https://example.com/trimmed-root-feature-link" not in restored_main_links
@@ -20637,8 +13069,7 @@ def test_link_branch_scoping_with_trimmed_root_override_outside_repo(
 
 def test_link_and_links_reject_blank_root_override(tmp_path: Path) -> None:
     """Link and links should reject blank root override values."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     link_failed = _run_dock(
         ["link", "https://example.com/no-root", "--root", "   "],
@@ -20663,8 +13094,7 @@ def test_link_and_links_reject_blank_root_override(tmp_path: Path) -> None:
 
 def test_link_rejects_blank_url(git_repo: Path, tmp_path: Path) -> None:
     """Link command should reject blank URL values with actionable error."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         ["link", "   "],
@@ -20672,15 +13102,12 @@ def test_link_rejects_blank_url(git_repo: Path, tmp_path: Path) -> None:
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "URL must be a non-empty string." in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "URL must be a non-empty string.")
 
 
 def test_link_output_compacts_multiline_url_text(git_repo: Path, tmp_path: Path) -> None:
     """Link success output should compact multiline URL text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     multiline_url = "https://example.com/line-one\nline-two"
     linked = _run_dock(["link", multiline_url], cwd=git_repo, env=env).stdout
@@ -20693,8 +13120,7 @@ def test_link_trims_surrounding_whitespace_from_url_input(
     tmp_path: Path,
 ) -> None:
     """Link command should trim outer whitespace from URL input."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     linked = _run_dock(["link", "  https://example.com/trimmed  "], cwd=git_repo, env=env).stdout
     assert "https://example.com/trimmed" in linked
@@ -20707,8 +13133,7 @@ def test_link_trims_surrounding_whitespace_from_url_input(
 
 def test_links_output_compacts_multiline_url_text(git_repo: Path, tmp_path: Path) -> None:
     """Links list should compact multiline URL text into one-line previews."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     multiline_url = "https://example.com/line-one\nline-two"
     _run_dock(["link", multiline_url], cwd=git_repo, env=env)
@@ -20720,19 +13145,12 @@ def test_links_output_compacts_multiline_url_text(git_repo: Path, tmp_path: Path
 
 def test_links_output_falls_back_for_blank_fields(git_repo: Path, tmp_path: Path) -> None:
     """Links output should show explicit fallbacks for blank row fields."""
-    env = dict(os.environ)
     dock_home = tmp_path / ".dockyard_data"
-    env["DOCKYARD_HOME"] = str(dock_home)
+    env = _dock_env(dock_home)
 
     _run_dock(["link", "https://example.com/base-link"], cwd=git_repo, env=env)
     db_path = dock_home / "db" / "index.sqlite"
-    conn = sqlite3.connect(db_path)
-    conn.execute(
-        "UPDATE links SET created_at = ?, url = ?",
-        ("   ", "   "),
-    )
-    conn.commit()
-    conn.close()
+    _mutate_dock_db(db_path, [("UPDATE links SET created_at = ?, url = ?", ("   ", "   "))])
 
     listed = _run_dock(["links"], cwd=git_repo, env=env).stdout
     assert "(unknown) | (unknown)" in listed
@@ -20740,8 +13158,7 @@ def test_links_output_falls_back_for_blank_fields(git_repo: Path, tmp_path: Path
 
 def test_link_outputs_preserve_literal_markup_like_urls(git_repo: Path, tmp_path: Path) -> None:
     """Link command output should preserve literal bracketed URL text."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     literal_url = "https://example.com/[red]literal[/red]"
     linked = _run_dock(["link", literal_url], cwd=git_repo, env=env).stdout
@@ -20753,8 +13170,7 @@ def test_link_outputs_preserve_literal_markup_like_urls(git_repo: Path, tmp_path
 
 def test_link_outside_repo_without_root_is_actionable(tmp_path: Path) -> None:
     """Link command outside repo should fail unless root override is provided."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         ["link", "https://example.com/no-root"],
@@ -20762,15 +13178,12 @@ def test_link_outside_repo_without_root_is_actionable(tmp_path: Path) -> None:
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "not inside a git repository" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "not inside a git repository")
 
 
 def test_links_outside_repo_without_root_is_actionable(tmp_path: Path) -> None:
     """Links command outside repo should fail unless root override is provided."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     failed = _run_dock(
         ["links"],
@@ -20778,15 +13191,12 @@ def test_links_outside_repo_without_root_is_actionable(tmp_path: Path) -> None:
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "not inside a git repository" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "not inside a git repository")
 
 
 def test_links_in_repo_with_no_items_is_informative(git_repo: Path, tmp_path: Path) -> None:
     """Links command should print informative message when none are attached."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
 
     output = _run_dock(["links"], cwd=git_repo, env=env).stdout
     assert "No links for current slip." in output
@@ -20795,44 +13205,23 @@ def test_links_in_repo_with_no_items_is_informative(git_repo: Path, tmp_path: Pa
 @pytest.mark.parametrize("command_name", ["save", "s", "dock"])
 def test_save_alias_non_git_root_is_actionable(tmp_path: Path, command_name: str) -> None:
     """Save aliases should fail clearly when --root points to non-git directory."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     non_git_root = tmp_path / "not_a_repo"
     non_git_root.mkdir()
 
     failed = _run_dock(
-        [
-            command_name,
-            "--root",
-            str(non_git_root),
-            "--no-prompt",
-            "--objective",
+        _save_args(
+            non_git_root,
             f"{command_name} non-git root validation objective",
-            "--decisions",
             "Ensure actionable root validation error",
-            "--next-step",
             "do not write checkpoint",
-            "--risks",
-            "none",
-            "--command",
-            "echo noop",
-            "--tests-run",
-            "--tests-command",
-            "pytest -q",
-            "--build-ok",
-            "--build-command",
-            "echo build",
-            "--lint-fail",
-            "--smoke-fail",
-            "--no-auto-review",
-        ],
+            command_name=command_name,
+        ),
         cwd=tmp_path,
         env=env,
         expect_code=2,
     )
-    output = f"{failed.stdout}\n{failed.stderr}"
-    assert "git repository" in output
-    assert "Traceback" not in output
+    _assert_cli_error(failed, "git repository")
 
 
 @pytest.mark.parametrize(
@@ -20849,8 +13238,7 @@ def test_link_commands_reject_non_git_root_override(
     args: list[str],
 ) -> None:
     """Link/links commands should fail clearly for non-git root overrides."""
-    env = dict(os.environ)
-    env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
+    env = _dock_env(tmp_path / ".dockyard_data")
     non_git_root = tmp_path / "not_a_repo_for_links"
     non_git_root.mkdir()
 
@@ -10,6 +10,7 @@ from dockyard.config import (
     DockyardPaths,
     default_runtime_config,
     load_runtime_config,
+    resolve_paths,
 )
 from dockyard.errors import DockyardError
 
@@ -28,6 +29,16 @@ def _paths(base: Path) -> DockyardPaths:
     )
 
 
+def test_resolve_paths_accepts_explicit_base_dir(tmp_path: Path, monkeypatch) -> None:
+    """Explicit base directory should take precedence over DOCKYARD_HOME."""
+    monkeypatch.setenv("DOCKYARD_HOME", str(tmp_path / "from_env"))
+    paths = resolve_paths(tmp_path / "explicit")
+    assert paths.base_dir == tmp_path / "explicit"
+    assert paths.db_path == tmp_path / "explicit" / "db" / "index.sqlite"
+    assert paths.checkpoints_dir.is_dir()
+    assert not (tmp_path / "from_env").exists()
+
+
 def test_load_runtime_config_defaults_when_missing(tmp_path: Path) -> None:
     """Missing config file should return default values."""
     paths = _paths(tmp_path)
@@ -13,6 +13,21 @@ from dockyard.errors import NotGitRepositoryError
 from dockyard.git_info import detect_repo_root, inspect_repository
 
 
+def _git(repo: Path, *args: str) -> None:
+    """Run a git setup command in `repo`, discarding its stdout.
+
+    Only stderr is piped, so a failing command still raises
+    `CalledProcessError` with git's message attached.
+    """
+    subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
 def test_detect_repo_root(git_repo: Path) -> None:
     """Repo root should resolve to initialized git directory."""
     nested = git_repo / "a" / "b"
@@ -45,24 +60,19 @@ def test_detached_head_uses_expected_naming(git_repo: Path) -> None:
     """Detached HEAD should map to DETACHED@sha pattern."""
     sha = subprocess.run(
         ["git", "rev-parse", "--short", "HEAD"],
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=True,
         capture_output=True,
         text=True,
     ).stdout.strip()
-    subprocess.run(["git", "checkout", "--detach"], cwd=str(git_repo), check=True, capture_output=True)
+    _git(git_repo, "checkout", "--detach")
     snapshot = inspect_repository(root_override=str(git_repo))
     assert snapshot.branch == f"DETACHED@{sha}"
 
 
 def test_repo_id_falls_back_to_path_hash_without_remote(git_repo: Path) -> None:
     """Repo id should remain stable when origin remote is missing."""
-    subprocess.run(
-        ["git", "remote", "remove", "origin"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "remote", "remove", "origin")
     first = inspect_repository(root_override=str(git_repo))
     second = inspect_repository(root_override=str(git_repo))
     assert first.remote_url is None
@@ -71,19 +81,9 @@ def test_repo_id_falls_back_to_path_hash_without_remote(git_repo: Path) -> None:
 
 def test_repo_id_uses_non_origin_remote_when_available(git_repo: Path) -> None:
     """Repo id should use an available non-origin remote URL when present."""
-    subprocess.run(
-        ["git", "remote", "remove", "origin"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "remote", "remove", "origin")
     upstream_url = "https://example.com/team/upstream.git"
-    subprocess.run(
-        ["git", "remote", "add", "upstream", upstream_url],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "remote", "add", "upstream", upstream_url)
 
     snapshot = inspect_repository(root_override=str(git_repo))
 
@@ -93,26 +93,11 @@ def test_repo_id_uses_non_origin_remote_when_available(git_repo: Path) -> None:
 
 def test_repo_id_non_origin_remote_selection_is_deterministic(git_repo: Path) -> None:
     """Repo id fallback should select remotes deterministically."""
-    subprocess.run(
-        ["git", "remote", "remove", "origin"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "remote", "remove", "origin")
     alpha_url = "https://example.com/team/alpha.git"
     zeta_url = "https://example.com/team/zeta.git"
-    subprocess.run(
-        ["git", "remote", "add", "zeta", zeta_url],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "alpha", alpha_url],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "remote", "add", "zeta", zeta_url)
+    _git(git_repo, "remote", "add", "alpha", alpha_url)
 
     snapshot = inspect_repository(root_override=str(git_repo))
 
@@ -124,17 +109,12 @@ def test_repo_id_prefers_origin_remote_when_multiple_remotes_exist(git_repo: Pat
     """Repo id should continue preferring origin when multiple remotes exist."""
     origin_url = subprocess.run(
         ["git", "config", "--get", "remote.origin.url"],
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=True,
         capture_output=True,
         text=True,
     ).stdout.strip()
-    subprocess.run(
-        ["git", "remote", "add", "upstream", "https://example.com/team/upstream.git"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "remote", "add", "upstream", "https://example.com/team/upstream.git")
 
     snapshot = inspect_repository(root_override=str(git_repo))
 
@@ -144,32 +124,12 @@ def test_repo_id_prefers_origin_remote_when_multiple_remotes_exist(git_repo: Pat
 
 def test_repo_id_ignores_empty_non_origin_remote_urls(git_repo: Path) -> None:
     """Repo id fallback should skip remotes with empty configured URLs."""
-    subprocess.run(
-        ["git", "remote", "remove", "origin"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "remote", "add", "alpha", "https://example.com/team/alpha.git"],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "remote", "remove", "origin")
+    _git(git_repo, "remote", "add", "alpha", "https://example.com/team/alpha.git")
     # Simulate malformed config where remote URL exists but is blank.
-    subprocess.run(
-        ["git", "config", "remote.alpha.url", ""],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "config", "remote.alpha.url", "")
     beta_url = "https://example.com/team/beta.git"
-    subprocess.run(
-        ["git", "remote", "add", "beta", beta_url],
-        cwd=str(git_repo),
-        check=True,
-        capture_output=True,
-    )
+    _git(git_repo, "remote", "add", "beta", beta_url)
 
     snapshot = inspect_repository(root_override=str(git_repo))
 
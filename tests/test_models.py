@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from dockyard.models import Checkpoint, VerificationState, checkpoint_to_jsonable
+from dockyard.models import (
+    Checkpoint,
+    ReviewItem,
+    VerificationState,
+    checkpoint_to_jsonable,
+    review_item_to_jsonable,
+)
 
 
 def test_checkpoint_to_jsonable_includes_project_name_and_verification() -> None:
@@ -143,3 +149,34 @@ def test_checkpoint_to_jsonable_includes_full_expected_shape() -> None:
     assert payload["touched_files"] == ["a.py", "b.py"]
     assert payload["tags"] == ["mvp", "release"]
     assert payload["verification"]["lint_ok"] is True
+
+
+def test_review_item_to_jsonable_includes_full_expected_shape() -> None:
+    """Review JSON projection should expose every review item field."""
+    item = ReviewItem(
+        id="rev_model_shape",
+        repo_id="repo_shape",
+        branch="feature/model-shape",
+        checkpoint_id=None,
+        created_at="2026-01-01T00:00:00+00:00",
+        reason="shape_reason",
+        severity="high",
+        status="open",
+        notes="shape notes",
+        files=["a.py", "b.py"],
+    )
+
+    payload = review_item_to_jsonable(item)
+
+    assert payload == {
+        "id": "rev_model_shape",
+        "repo_id": "repo_shape",
+        "branch": "feature/model-shape",
+        "checkpoint_id": None,
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "reason": "shape_reason",
+        "severity": "high",
+        "status": "open",
+        "notes": "shape notes",
+        "files": ["a.py", "b.py"],
+    }
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import json
-import os
 import re
 import sqlite3
 import subprocess
+import sys
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,8 +15,11 @@ from typing import Literal
 
 import pytest
 
+from tests.conftest import cli_base_env
 from tests.metadata_utils import case_ids, pair_scope_cases_with_context
 
+pytestmark = pytest.mark.integration
+
 RunCommand = Sequence[str]
 CommandMatrix = list[RunCommand]
 ResumeReadCommandBuilder = Callable[[Path], CommandMatrix]
@@ -28,7 +31,10 @@ SaveCommandName = Literal["save", "s", "dock"]
 DashboardCommandName = Literal["ls", "harbor"]
 SearchCommandName = Literal["search", "f"]
 RunScopeVariantId = Literal["default", "berth", "branch", "berth_branch"]
-DOCKYARD_COMMAND_PREFIX: tuple[str, ...] = ("python3", "-m", "dockyard")
+# The running interpreter is resolved once here, so CLI subprocesses skip a
+# PATH lookup per call and always import the dockyard under test.
+DOCKYARD_COMMAND_PREFIX: tuple[str, ...] = (sys.executable, "-m", "dockyard")
+REVIEW_ID_PATTERN: re.Pattern[str] = re.compile(r"rev_[a-f0-9]+")
 
 
 @dataclass(frozen=True)
@@ -613,7 +619,7 @@ def _run(command: RunCommand, cwd: Path, env: dict[str, str] | None = None) -> s
     """Run subprocess command and return stdout."""
     result = subprocess.run(
         command,
-        cwd=str(cwd),
+        cwd=cwd,
         check=True,
         capture_output=True,
         text=True,
@@ -669,7 +675,7 @@ def _dockyard_env(tmp_path: Path) -> dict[str, str]:
     Returns:
         Environment variables with DOCKYARD_HOME configured.
     """
-    env = dict(os.environ)
+    env = cli_base_env()
     env["DOCKYARD_HOME"] = str(tmp_path / ".dockyard_data")
     return env
 
@@ -743,9 +749,7 @@ def _save_checkpoint(
         extra_args: Optional additional CLI args appended to save command.
     """
     save_command = [
-        "python3",
-        "-m",
-        "dockyard",
+        *DOCKYARD_COMMAND_PREFIX,
         "save",
         "--root",
         str(git_repo),
@@ -1184,7 +1188,7 @@ def _assert_review_link_commands_do_not_modify_repo(
     _assert_repo_clean(git_repo)
     _run_commands(metadata_commands, cwd=run_cwd, env=env)
     review_output = _run(review_add_command, cwd=run_cwd, env=env)
-    review_match = re.search(r"rev_[a-f0-9]+", review_output)
+    review_match = REVIEW_ID_PATTERN.search(review_output)
     assert review_match is not None
     review_id = review_match.group(0)
     _run(_dockyard_command("review", "open", review_id), cwd=run_cwd, env=env)
@@ -1200,7 +1204,7 @@ def _dockyard_command(*args: str) -> RunCommand:
 def test_dockyard_command_includes_shared_prefix() -> None:
     """Dockyard command helper should prepend shared Python module prefix."""
     assert _dockyard_command("review", "list") == [
-        "python3",
+        sys.executable,
         "-m",
         "dockyard",
         "review",
@@ -1210,7 +1214,7 @@ def test_dockyard_command_includes_shared_prefix() -> None:
 
 def test_dockyard_command_supports_empty_suffix() -> None:
     """Dockyard command helper should support empty command suffix."""
-    assert _dockyard_command() == ["python3", "-m", "dockyard"]
+    assert _dockyard_command() == [sys.executable, "-m", "dockyard"]
 
 
 def test_dockyard_command_returns_fresh_list_each_call() -> None:
@@ -1219,7 +1223,7 @@ def test_dockyard_command_returns_fresh_list_each_call() -> None:
     second = _dockyard_command("links")
 
     first.append("--json")
-    assert second == ["python3", "-m", "dockyard", "links"]
+    assert second == [sys.executable, "-m", "dockyard", "links"]
 
 
 def _build_link_command(url: str, *, root: Path | None = None) -> RunCommand:
@@ -1299,9 +1303,7 @@ def test_build_review_add_command_omits_optional_scope_args() -> None:
     command = _build_review_add_command(reason="manual")
 
     assert command == [
-        "python3",
-        "-m",
-        "dockyard",
+        *DOCKYARD_COMMAND_PREFIX,
         "review",
         "add",
         "--reason",
@@ -1321,9 +1323,7 @@ def test_build_review_add_command_includes_optional_scope_args() -> None:
     )
 
     assert command == [
-        "python3",
-        "-m",
-        "dockyard",
+        *DOCKYARD_COMMAND_PREFIX,
         "review",
         "add",
         "--reason",
@@ -1347,9 +1347,7 @@ def test_build_review_add_command_supports_partial_optional_scope_args() -> None
     )
 
     assert command == [
-        "python3",
-        "-m",
-        "dockyard",
+        *DOCKYARD_COMMAND_PREFIX,
         "review",
         "add",
         "--reason",
@@ -1563,9 +1561,7 @@ def test_save_no_prompt_flows_do_not_modify_repo(
     _assert_repo_clean(git_repo)
     _run(
         [
-            "python3",
-            "-m",
-            "dockyard",
+            *DOCKYARD_COMMAND_PREFIX,
             case.command_name,
             "--root",
             str(git_repo),
@@ -1798,7 +1794,7 @@ def test_review_listing_commands_with_items_keep_repo_clean(
         cwd=tmp_path,
         env=env,
     )
-    open_match = re.search(r"rev_[a-f0-9]+", open_created)
+    open_match = REVIEW_ID_PATTERN.search(open_created)
     assert open_match is not None
     open_review_id = open_match.group(0)
 
@@ -1811,7 +1807,7 @@ def test_review_listing_commands_with_items_keep_repo_clean(
         cwd=tmp_path,
         env=env,
     )
-    resolved_match = re.search(r"rev_[a-f0-9]+", resolved_created)
+    resolved_match = REVIEW_ID_PATTERN.search(resolved_created)
     assert resolved_match is not None
     resolved_review_id = resolved_match.group(0)
 
@@ -2393,7 +2389,7 @@ def test_review_lifecycle_status_recompute_dashboard_reads_keep_repo_clean(
         cwd=git_repo,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", added)
+    review_match = REVIEW_ID_PATTERN.search(added)
     assert review_match is not None
     review_id = review_match.group(0)
 
@@ -2542,9 +2538,7 @@ def test_save_editor_flows_do_not_modify_repo(
     _assert_repo_clean(git_repo)
     _run(
         [
-            "python3",
-            "-m",
-            "dockyard",
+            *DOCKYARD_COMMAND_PREFIX,
             case.command_name,
             "--root",
             str(git_repo),
@@ -2592,9 +2586,7 @@ def test_save_template_flows_do_not_modify_repo(
     _assert_repo_clean(git_repo)
     _run(
         [
-            "python3",
-            "-m",
-            "dockyard",
+            *DOCKYARD_COMMAND_PREFIX,
             case.command_name,
             "--root",
             str(git_repo),
@@ -2627,9 +2619,7 @@ def test_save_template_flows_outside_repo_do_not_modify_repo(
     _assert_repo_clean(git_repo)
     _run(
         [
-            "python3",
-            "-m",
-            "dockyard",
+            *DOCKYARD_COMMAND_PREFIX,
             case.command_name,
             "--root",
             str(git_repo),
@@ -2677,9 +2667,7 @@ def test_save_toml_template_flows_outside_repo_do_not_modify_repo(
     _assert_repo_clean(git_repo)
     _run(
         [
-            "python3",
-            "-m",
-            "dockyard",
+            *DOCKYARD_COMMAND_PREFIX,
             command_name,
             "--root",
             str(git_repo),
@@ -2724,9 +2712,7 @@ def test_save_template_bool_like_values_outside_repo_keep_repo_clean(
     _assert_repo_clean(git_repo)
     _run(
         [
-            "python3",
-            "-m",
-            "dockyard",
+            *DOCKYARD_COMMAND_PREFIX,
             command_name,
             "--root",
             str(git_repo),
@@ -2784,9 +2770,7 @@ def test_save_template_verification_text_normalization_paths_keep_repo_clean(
     _assert_repo_clean(git_repo)
     _run(
         [
-            "python3",
-            "-m",
-            "dockyard",
+            *DOCKYARD_COMMAND_PREFIX,
             command_name,
             "--root",
             str(git_repo),
@@ -3377,7 +3361,7 @@ def test_review_open_after_save_alias_with_linked_checkpoint_keeps_repo_clean(
         cwd=tmp_path,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created)
+    review_match = REVIEW_ID_PATTERN.search(created)
     assert review_match is not None
     review_id = review_match.group(0)
 
@@ -3447,7 +3431,7 @@ def test_review_open_after_save_alias_with_missing_checkpoint_keeps_repo_clean(
         cwd=tmp_path,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created)
+    review_match = REVIEW_ID_PATTERN.search(created)
     assert review_match is not None
     review_id = review_match.group(0)
 
@@ -3522,7 +3506,7 @@ def test_review_open_after_save_alias_with_file_and_notes_keeps_repo_clean(
         cwd=tmp_path,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created)
+    review_match = REVIEW_ID_PATTERN.search(created)
     assert review_match is not None
     review_id = review_match.group(0)
 
@@ -3591,7 +3575,7 @@ def test_review_open_after_save_alias_with_scalar_files_payload_keeps_repo_clean
         cwd=tmp_path,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created)
+    review_match = REVIEW_ID_PATTERN.search(created)
     assert review_match is not None
     review_id = review_match.group(0)
 
@@ -3668,7 +3652,7 @@ def test_review_open_after_save_alias_with_blank_metadata_keeps_repo_clean(
         cwd=tmp_path,
         env=env,
     )
-    review_match = re.search(r"rev_[a-f0-9]+", created)
+    review_match = REVIEW_ID_PATTERN.search(created)
     assert review_match is not None
     review_id = review_match.group(0)
 
@@ -3987,7 +3971,7 @@ def test_bare_dock_invalid_flag_validation_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4023,7 +4007,7 @@ def test_bare_dock_invalid_flag_validation_outside_repo_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4061,7 +4045,7 @@ def test_dashboard_invalid_flag_validation_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, *args),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4099,7 +4083,7 @@ def test_dashboard_invalid_flag_validation_outside_repo_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, *args),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4154,7 +4138,7 @@ def test_search_invalid_flag_validation_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, *args),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4209,7 +4193,7 @@ def test_search_invalid_flag_validation_outside_repo_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, *args),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4282,7 +4266,7 @@ def test_review_add_invalid_validation_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4359,7 +4343,7 @@ def test_review_add_invalid_validation_outside_repo_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4393,7 +4377,7 @@ def test_review_open_done_invalid_id_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4427,7 +4411,7 @@ def test_review_open_done_invalid_id_outside_repo_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4460,7 +4444,7 @@ def test_link_invalid_validation_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4493,7 +4477,7 @@ def test_link_invalid_validation_outside_repo_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4533,7 +4517,7 @@ def test_save_blank_root_validation_does_not_modify_repo(
             "--command",
             "echo noop",
         ),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4573,7 +4557,7 @@ def test_save_blank_root_validation_outside_repo_does_not_modify_repo(
             "--command",
             "echo noop",
         ),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4615,7 +4599,7 @@ def test_save_non_git_root_validation_does_not_modify_repo(
             "--command",
             "echo noop",
         ),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4657,7 +4641,7 @@ def test_save_non_git_root_validation_outside_repo_does_not_modify_repo(
             "--command",
             "echo noop",
         ),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4682,7 +4666,7 @@ def test_resume_blank_root_validation_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, "--root", "   "),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4707,7 +4691,7 @@ def test_resume_blank_root_validation_outside_repo_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, "--root", "   "),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4732,7 +4716,7 @@ def test_resume_blank_branch_validation_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, "--branch", "   "),
-        cwd=str(git_repo),
+        cwd=git_repo,
         check=False,
         capture_output=True,
         text=True,
@@ -4757,7 +4741,7 @@ def test_resume_blank_branch_validation_outside_repo_does_not_modify_repo(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, "--branch", "   "),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4789,7 +4773,7 @@ def test_resume_blank_berth_validation_does_not_modify_repo(
         args.append(output_flag)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(git_repo if run_cwd_kind == "repo" else tmp_path),
+        cwd=git_repo if run_cwd_kind == "repo" else tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4821,7 +4805,7 @@ def test_resume_unknown_berth_validation_does_not_modify_repo(
         args.append(output_flag)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(git_repo if run_cwd_kind == "repo" else tmp_path),
+        cwd=git_repo if run_cwd_kind == "repo" else tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -4853,7 +4837,7 @@ def test_resume_unknown_berth_literal_markup_error_does_not_modify_repo(
         args.append(output_flag)
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(git_repo if run_cwd_kind == "repo" else tmp_path),
+        cwd=git_repo if run_cwd_kind == "repo" else tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -5094,7 +5078,7 @@ def test_save_template_validation_failures_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(git_repo),
+            cwd=git_repo,
             check=False,
             capture_output=True,
             text=True,
@@ -5217,7 +5201,7 @@ def test_save_template_validation_failures_outside_repo_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(tmp_path),
+            cwd=tmp_path,
             check=False,
             capture_output=True,
             text=True,
@@ -5342,7 +5326,7 @@ def test_save_alias_template_validation_failures_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(git_repo),
+            cwd=git_repo,
             check=False,
             capture_output=True,
             text=True,
@@ -5467,7 +5451,7 @@ def test_save_alias_template_validation_failures_outside_repo_do_not_modify_repo
                 "--command",
                 "echo noop",
             ),
-            cwd=str(tmp_path),
+            cwd=tmp_path,
             check=False,
             capture_output=True,
             text=True,
@@ -5619,7 +5603,7 @@ def test_save_alias_template_additional_type_validation_paths_keep_repo_clean(
             "--command",
             "echo noop",
         ),
-        cwd=str(run_cwd),
+        cwd=run_cwd,
         check=False,
         capture_output=True,
         text=True,
@@ -5705,7 +5689,7 @@ def test_save_alias_template_additional_validation_variants_keep_repo_clean(
             "--command",
             "echo noop",
         ),
-        cwd=str(run_cwd),
+        cwd=run_cwd,
         check=False,
         capture_output=True,
         text=True,
@@ -5811,7 +5795,7 @@ def test_save_required_field_validation_failures_do_not_modify_repo(
                 "--no-prompt",
                 *args_suffix,
             ),
-            cwd=str(git_repo),
+            cwd=git_repo,
             check=False,
             capture_output=True,
             text=True,
@@ -5917,7 +5901,7 @@ def test_save_required_field_validation_failures_outside_repo_do_not_modify_repo
                 "--no-prompt",
                 *args_suffix,
             ),
-            cwd=str(tmp_path),
+            cwd=tmp_path,
             check=False,
             capture_output=True,
             text=True,
@@ -5966,7 +5950,7 @@ def test_save_template_path_validation_failures_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(git_repo),
+            cwd=git_repo,
             check=False,
             capture_output=True,
             text=True,
@@ -6015,7 +5999,7 @@ def test_save_template_path_validation_failures_outside_repo_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(tmp_path),
+            cwd=tmp_path,
             check=False,
             capture_output=True,
             text=True,
@@ -6152,7 +6136,7 @@ def test_save_alias_required_field_validation_failures_do_not_modify_repo(
                 "--no-prompt",
                 *args_suffix,
             ),
-            cwd=str(git_repo),
+            cwd=git_repo,
             check=False,
             capture_output=True,
             text=True,
@@ -6260,7 +6244,7 @@ def test_save_alias_required_field_validation_failures_outside_repo_do_not_modif
                 "--no-prompt",
                 *args_suffix,
             ),
-            cwd=str(tmp_path),
+            cwd=tmp_path,
             check=False,
             capture_output=True,
             text=True,
@@ -6310,7 +6294,7 @@ def test_save_invalid_config_failures_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(git_repo),
+            cwd=git_repo,
             check=False,
             capture_output=True,
             text=True,
@@ -6360,7 +6344,7 @@ def test_save_invalid_config_failures_outside_repo_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(tmp_path),
+            cwd=tmp_path,
             check=False,
             capture_output=True,
             text=True,
@@ -6412,7 +6396,7 @@ def test_save_alias_invalid_config_failures_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(git_repo),
+            cwd=git_repo,
             check=False,
             capture_output=True,
             text=True,
@@ -6464,7 +6448,7 @@ def test_save_alias_invalid_config_failures_outside_repo_do_not_modify_repo(
                 "--command",
                 "echo noop",
             ),
-            cwd=str(tmp_path),
+            cwd=tmp_path,
             check=False,
             capture_output=True,
             text=True,
@@ -6999,7 +6983,7 @@ def test_run_with_missing_berth_root_keeps_repo_clean(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, git_repo.name, "--run"),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -7067,7 +7051,7 @@ def test_run_with_branch_and_missing_berth_root_keeps_repo_clean(
     _assert_repo_clean(git_repo)
     completed = subprocess.run(
         _dockyard_command(command_name, git_repo.name, "--branch", branch, "--run"),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,
@@ -7128,7 +7112,7 @@ def test_unknown_explicit_berth_branch_resume_errors_keep_repo_clean(
 
     completed = subprocess.run(
         _dockyard_command(*args),
-        cwd=str(tmp_path),
+        cwd=tmp_path,
         check=False,
         capture_output=True,
         text=True,